@@ -299,6 +299,102 @@ else()
     endif()
 endif()
 
+#-------------------------------------------------------------------------------
+message( STATUS "Checking for CBLAS batched gemm (cblas_dgemm_batch)" )
+
+try_run(
+    run_result compile_result ${CMAKE_CURRENT_BINARY_DIR}
+    SOURCES
+        "${CMAKE_CURRENT_SOURCE_DIR}/config/cblas_gemm_batch.cc"
+    LINK_LIBRARIES
+        ${BLAS_LIBRARIES} ${openmp_lib} # not "..." quoted; screws up OpenMP
+    COMPILE_DEFINITIONS
+        ${blaspp_defs_}
+    COMPILE_OUTPUT_VARIABLE
+        compile_output
+    RUN_OUTPUT_VARIABLE
+        run_output
+)
+# For cross-compiling, assume if it links, the run is okay.
+if (CMAKE_CROSSCOMPILING AND compile_result)
+    message( DEBUG "cross: cblas_gemm_batch" )
+    set( run_result "0"  CACHE STRING "" FORCE )
+    set( run_output "ok" CACHE STRING "" FORCE )
+endif()
+debug_try_run( "cblas_gemm_batch.cc" "${compile_result}" "${compile_output}"
+                                     "${run_result}" "${run_output}" )
+
+if (compile_result AND "${run_output}" MATCHES "ok")
+    message( "${blue}   Found cblas_gemm_batch${plain}" )
+    list( APPEND blaspp_defs_ "-DBLAS_HAVE_CBLAS_GEMM_BATCH" )
+else()
+    message( "${blue}   cblas_gemm_batch not found; CPU batch gemm loops over gemm${plain}" )
+endif()
+
+#-------------------------------------------------------------------------------
+message( STATUS "Checking for CBLAS strided batched gemm (cblas_dgemm_batch_strided)" )
+
+try_run(
+    run_result compile_result ${CMAKE_CURRENT_BINARY_DIR}
+    SOURCES
+        "${CMAKE_CURRENT_SOURCE_DIR}/config/cblas_gemm_batch_strided.cc"
+    LINK_LIBRARIES
+        ${BLAS_LIBRARIES} ${openmp_lib} # not "..." quoted; screws up OpenMP
+    COMPILE_DEFINITIONS
+        ${blaspp_defs_}
+    COMPILE_OUTPUT_VARIABLE
+        compile_output
+    RUN_OUTPUT_VARIABLE
+        run_output
+)
+# For cross-compiling, assume if it links, the run is okay.
+if (CMAKE_CROSSCOMPILING AND compile_result)
+    message( DEBUG "cross: cblas_gemm_batch_strided" )
+    set( run_result "0"  CACHE STRING "" FORCE )
+    set( run_output "ok" CACHE STRING "" FORCE )
+endif()
+debug_try_run( "cblas_gemm_batch_strided.cc" "${compile_result}" "${compile_output}"
+                                             "${run_result}" "${run_output}" )
+
+if (compile_result AND "${run_output}" MATCHES "ok")
+    message( "${blue}   Found cblas_gemm_batch_strided${plain}" )
+    list( APPEND blaspp_defs_ "-DBLAS_HAVE_CBLAS_GEMM_BATCH_STRIDED" )
+else()
+    message( "${blue}   cblas_gemm_batch_strided not found; CPU strided batch gemm loops over gemm${plain}" )
+endif()
+
+#-------------------------------------------------------------------------------
+message( STATUS "Checking for CBLAS strided batched trsm (cblas_dtrsm_batch_strided)" )
+
+try_run(
+    run_result compile_result ${CMAKE_CURRENT_BINARY_DIR}
+    SOURCES
+        "${CMAKE_CURRENT_SOURCE_DIR}/config/cblas_trsm_batch_strided.cc"
+    LINK_LIBRARIES
+        ${BLAS_LIBRARIES} ${openmp_lib} # not "..." quoted; screws up OpenMP
+    COMPILE_DEFINITIONS
+        ${blaspp_defs_}
+    COMPILE_OUTPUT_VARIABLE
+        compile_output
+    RUN_OUTPUT_VARIABLE
+        run_output
+)
+# For cross-compiling, assume if it links, the run is okay.
+if (CMAKE_CROSSCOMPILING AND compile_result)
+    message( DEBUG "cross: cblas_trsm_batch_strided" )
+    set( run_result "0"  CACHE STRING "" FORCE )
+    set( run_output "ok" CACHE STRING "" FORCE )
+endif()
+debug_try_run( "cblas_trsm_batch_strided.cc" "${compile_result}" "${compile_output}"
+                                             "${run_result}" "${run_output}" )
+
+if (compile_result AND "${run_output}" MATCHES "ok")
+    message( "${blue}   Found cblas_trsm_batch_strided${plain}" )
+    list( APPEND blaspp_defs_ "-DBLAS_HAVE_CBLAS_TRSM_BATCH_STRIDED" )
+else()
+    message( "${blue}   cblas_trsm_batch_strided not found; CPU strided batch trsm loops over trsm${plain}" )
+endif()
+
 endif() # run_
 #===============================================================================
 
@@ -0,0 +1,138 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+// Micro-benchmark of BLAS dgemm, dgemv, and ddot, used by blas=fastest
+// to choose among BLAS libraries. Prints lines "routine n gflops",
+// then "score gflops", the geometric mean of the rates.
+
+#include <stdio.h>
+#include <math.h>
+#include <vector>
+#include <chrono>
+
+#include "config.h"
+
+//------------------------------------------------------------------------------
+#define BLAS_ddot       FORTRAN_NAME( ddot,  DDOT  )
+#define BLAS_dgemv_base FORTRAN_NAME( dgemv, DGEMV )
+#define BLAS_dgemm_base FORTRAN_NAME( dgemm, DGEMM )
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+double BLAS_ddot(
+    const blas_int* n,
+    const double* x, const blas_int* incx,
+    const double* y, const blas_int* incy );
+
+void BLAS_dgemv_base(
+    const char* trans, const blas_int* m, const blas_int* n,
+    const double* alpha,
+    const double* A, const blas_int* lda,
+    const double* x, const blas_int* incx,
+    const double* beta,
+    double* y, const blas_int* incy
+    #ifdef BLAS_FORTRAN_STRLEN_END
+    , size_t trans_len
+    #endif
+    );
+
+void BLAS_dgemm_base(
+    const char* transA, const char* transB,
+    const blas_int* m, const blas_int* n, const blas_int* k,
+    const double* alpha,
+    const double* A, const blas_int* lda,
+    const double* B, const blas_int* ldb,
+    const double* beta,
+    double* C, const blas_int* ldc
+    #ifdef BLAS_FORTRAN_STRLEN_END
+    , size_t transA_len, size_t transB_len
+    #endif
+    );
+
+#ifdef __cplusplus
+}
+#endif
+
+#ifdef BLAS_FORTRAN_STRLEN_END
+    #define BLAS_dgemv( ... ) BLAS_dgemv_base( __VA_ARGS__, 1 )
+    #define BLAS_dgemm( ... ) BLAS_dgemm_base( __VA_ARGS__, 1, 1 )
+#else
+    #define BLAS_dgemv( ... ) BLAS_dgemv_base( __VA_ARGS__ )
+    #define BLAS_dgemm( ... ) BLAS_dgemm_base( __VA_ARGS__ )
+#endif
+
+//------------------------------------------------------------------------------
+// Returns seconds per call of f, repeating until at least 0.1 s elapses.
+// The first call is a warmup and isn't timed.
+template <typename Func>
+double time_call( Func f )
+{
+    using clock = std::chrono::steady_clock;
+    f();
+    int count = 0;
+    auto start = clock::now();
+    double elapsed = 0;
+    do {
+        f();
+        ++count;
+        elapsed = std::chrono::duration<double>( clock::now() - start ).count();
+    } while (elapsed < 0.1);
+    return elapsed / count;
+}
+
+//------------------------------------------------------------------------------
+int main()
+{
+    double alpha = 1, beta = 1, log_sum = 0;
+    blas_int ione = 1;
+    int ntests = 0;
+
+    // dgemm, flops = 2 n^3
+    blas_int gemm_sizes[] = { 128, 256, 512 };
+    for (blas_int n : gemm_sizes) {
+        std::vector<double> A( n*n, 0.5 ), B( n*n, 0.25 ), C( n*n, 0 );
+        double t = time_call( [&]() {
+            BLAS_dgemm( "n", "n", &n, &n, &n, &alpha, A.data(), &n,
+                        B.data(), &n, &beta, C.data(), &n );
+        });
+        double gflops = 2. * n * n * n / t * 1e-9;
+        printf( "dgemm %lld %.3f\n", (long long) n, gflops );
+        log_sum += log( gflops );
+        ++ntests;
+    }
+
+    // dgemv, flops = 2 n^2
+    {
+        blas_int n = 2000;
+        std::vector<double> A( n*n, 0.5 ), x( n, 0.25 ), y( n, 0 );
+        double t = time_call( [&]() {
+            BLAS_dgemv( "n", &n, &n, &alpha, A.data(), &n,
+                        x.data(), &ione, &beta, y.data(), &ione );
+        });
+        double gflops = 2. * n * n / t * 1e-9;
+        printf( "dgemv %lld %.3f\n", (long long) n, gflops );
+        log_sum += log( gflops );
+        ++ntests;
+    }
+
+    // ddot, flops = 2 n
+    {
+        blas_int n = 1000000;
+        std::vector<double> x( n, 0.5 ), y( n, 0.25 );
+        volatile double result = 0;
+        double t = time_call( [&]() {
+            result = BLAS_ddot( &n, x.data(), &ione, y.data(), &ione );
+        });
+        double gflops = 2. * n / t * 1e-9;
+        printf( "ddot %lld %.3f\n", (long long) n, gflops );
+        log_sum += log( gflops );
+        ++ntests;
+    }
+
+    printf( "score %.3f\n", exp( log_sum / ntests ) );
+    return 0;
+}
@@ -0,0 +1,88 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+// Reports how BLAS and OpenMP are threaded, for configure's blas_threading():
+//     lib <path>          each shared library loaded, e.g., libgomp, libiomp5,
+//                         libmkl_gnu_thread, libtbb;
+//     openblas_parallel N OpenBLAS threading: 0 sequential, 1 pthreads, 2 OpenMP;
+//     blis_openmp N       BLIS threading, if enabled;
+//     blis_pthreads N
+// Vendor functions are found with dlsym, so this links with any BLAS.
+
+#ifndef _GNU_SOURCE
+#define _GNU_SOURCE
+#endif
+
+#include <stdio.h>
+#include <dlfcn.h>
+
+#if defined( __APPLE__ )
+    #include <mach-o/dyld.h>
+#else
+    #include <link.h>
+#endif
+
+#ifdef _OPENMP
+    #include <omp.h>
+#endif
+
+#include "config.h"
+
+//------------------------------------------------------------------------------
+#define BLAS_ddot FORTRAN_NAME( ddot, DDOT )
+
+#ifdef __cplusplus
+extern "C"
+#endif
+double BLAS_ddot( const blas_int* n,
+                  const double* x, const blas_int* incx,
+                  const double* y, const blas_int* incy );
+
+//------------------------------------------------------------------------------
+#if ! defined( __APPLE__ )
+int print_lib( struct dl_phdr_info* info, size_t size, void* data )
+{
+    if (info->dlpi_name && info->dlpi_name[ 0 ])
+        printf( "lib %s\n", info->dlpi_name );
+    return 0;
+}
+#endif
+
+//------------------------------------------------------------------------------
+int main()
+{
+    // Use BLAS and OpenMP, so both are linked and loaded.
+    blas_int n = 3, ione = 1;
+    double x[] = { 1, 2, 3 };
+    double result = BLAS_ddot( &n, x, &ione, x, &ione );
+    printf( "ddot %.1f\n", result );
+
+    #ifdef _OPENMP
+        printf( "omp_max_threads %d\n", omp_get_max_threads() );
+    #endif
+
+    #if defined( __APPLE__ )
+        for (uint32_t i = 0; i < _dyld_image_count(); ++i)
+            printf( "lib %s\n", _dyld_get_image_name( i ) );
+    #else
+        dl_iterate_phdr( print_lib, nullptr );
+    #endif
+
+    typedef int (*int_func)();
+    int_func func;
+    func = (int_func) dlsym( RTLD_DEFAULT, "openblas_get_parallel" );
+    if (func)
+        printf( "openblas_parallel %d\n", func() );
+
+    func = (int_func) dlsym( RTLD_DEFAULT, "bli_info_get_enable_openmp" );
+    if (func)
+        printf( "blis_openmp %d\n", func() );
+
+    func = (int_func) dlsym( RTLD_DEFAULT, "bli_info_get_enable_pthreads" );
+    if (func)
+        printf( "blis_pthreads %d\n", func() );
+
+    return 0;
+}
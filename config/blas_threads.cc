@@ -0,0 +1,106 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+// Benchmark of two dgemm workloads, used by blas_threaded=measure to
+// choose between threaded and sequential BLAS libraries:
+//   large: one large gemm, which benefits from threaded BLAS;
+//   batch: many small gemms in an OpenMP parallel loop, as in
+//          blas::batch::gemm, where threaded BLAS can oversubscribe cores.
+// Prints lines "workload size gflops".
+
+#include <stdio.h>
+#include <vector>
+#include <chrono>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+#include "config.h"
+
+//------------------------------------------------------------------------------
+#define BLAS_dgemm_base FORTRAN_NAME( dgemm, DGEMM )
+
+#ifdef __cplusplus
+extern "C"
+#endif
+void BLAS_dgemm_base(
+    const char* transA, const char* transB,
+    const blas_int* m, const blas_int* n, const blas_int* k,
+    const double* alpha,
+    const double* A, const blas_int* lda,
+    const double* B, const blas_int* ldb,
+    const double* beta,
+    double* C, const blas_int* ldc
+    #ifdef BLAS_FORTRAN_STRLEN_END
+    , size_t transA_len, size_t transB_len
+    #endif
+    );
+
+#ifdef BLAS_FORTRAN_STRLEN_END
+    #define BLAS_dgemm( ... ) BLAS_dgemm_base( __VA_ARGS__, 1, 1 )
+#else
+    #define BLAS_dgemm( ... ) BLAS_dgemm_base( __VA_ARGS__ )
+#endif
+
+//------------------------------------------------------------------------------
+// Returns seconds per call of f, repeating until at least 0.2 s elapses.
+// The first call is a warmup and isn't timed.
+template <typename Func>
+double time_call( Func f )
+{
+    using clock = std::chrono::steady_clock;
+    f();
+    int count = 0;
+    auto start = clock::now();
+    double elapsed = 0;
+    do {
+        f();
+        ++count;
+        elapsed = std::chrono::duration<double>( clock::now() - start ).count();
+    } while (elapsed < 0.2);
+    return elapsed / count;
+}
+
+//------------------------------------------------------------------------------
+int main()
+{
+    double alpha = 1, beta = 1;
+
+    #ifdef _OPENMP
+        printf( "threads %d\n", omp_get_max_threads() );
+    #else
+        printf( "threads 1\n" );
+    #endif
+
+    // large gemm
+    {
+        blas_int n = 1000;
+        std::vector<double> A( n*n, 0.5 ), B( n*n, 0.25 ), C( n*n, 0 );
+        double t = time_call( [&]() {
+            BLAS_dgemm( "n", "n", &n, &n, &n, &alpha, A.data(), &n,
+                        B.data(), &n, &beta, C.data(), &n );
+        });
+        printf( "large %lld %.3f\n", (long long) n, 2. * n * n * n / t * 1e-9 );
+    }
+
+    // batch of small gemms, each in its own OpenMP task
+    {
+        blas_int n = 32;
+        int batch = 2000;
+        std::vector<double> A( n*n*batch, 0.5 ), B( n*n*batch, 0.25 ),
+                            C( n*n*batch, 0 );
+        double t = time_call( [&]() {
+            #pragma omp parallel for schedule( dynamic )
+            for (int i = 0; i < batch; ++i) {
+                BLAS_dgemm( "n", "n", &n, &n, &n, &alpha, &A[ i*n*n ], &n,
+                            &B[ i*n*n ], &n, &beta, &C[ i*n*n ], &n );
+            }
+        });
+        printf( "batch %lldx%d %.3f\n", (long long) n, batch,
+                2. * n * n * n * batch / t * 1e-9 );
+    }
+    return 0;
+}
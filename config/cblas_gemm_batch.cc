@@ -0,0 +1,102 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+// Checks for the group batched gemm in MKL and OpenBLAS (>= 0.3.27),
+// cblas_[sdcz]gemm_batch, used by blas::batch::gemm on the CPU.
+// Declares the routines here, as src/batch_gemm.cc does, instead of
+// including cblas.h, since not every cblas.h declares them.
+
+#include <stdio.h>
+#include <complex>
+
+#include "config.h"
+
+//------------------------------------------------------------------------------
+// CBLAS enums are passed as int: CblasColMajor = 102, CblasNoTrans = 111.
+extern "C" {
+
+void cblas_sgemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    float const* alpha,
+    float const** A, blas_int const* lda,
+    float const** B, blas_int const* ldb,
+    float const* beta,
+    float** C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size );
+
+void cblas_dgemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    double const* alpha,
+    double const** A, blas_int const* lda,
+    double const** B, blas_int const* ldb,
+    double const* beta,
+    double** C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size );
+
+void cblas_cgemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    void const* alpha,
+    void const** A, blas_int const* lda,
+    void const** B, blas_int const* ldb,
+    void const* beta,
+    void** C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size );
+
+void cblas_zgemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    void const* alpha,
+    void const** A, blas_int const* lda,
+    void const** B, blas_int const* ldb,
+    void const* beta,
+    void** C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size );
+
+}  // extern "C"
+
+//------------------------------------------------------------------------------
+int main()
+{
+    // Two groups: 2 items of 2x2 C = A B, then 1 item of 1x1 C = 2 A B.
+    int layout = 102;
+    int trans[] = { 111, 111 };
+    blas_int m[] = { 2, 1 }, n[] = { 2, 1 }, k[] = { 2, 1 };
+    blas_int ld[] = { 2, 1 }, group_size[] = { 2, 1 };
+    double alpha[] = { 1, 2 }, beta[] = { 0, 0 };
+
+    double A0[] = { 1, 2, 3, 4 }, B0[] = { 1, 0, 0, 1 }, C0[ 4 ];
+    double A1[] = { 1, 1, 1, 1 }, B1[] = { 1, 2, 3, 4 }, C1[ 4 ];
+    double A2[] = { 3 },          B2[] = { 5 },          C2[ 1 ];
+    double const* A[] = { A0, A1, A2 };
+    double const* B[] = { B0, B1, B2 };
+    double*       C[] = { C0, C1, C2 };
+
+    cblas_dgemm_batch( layout, trans, trans, m, n, k,
+                       alpha, A, ld, B, ld, beta, C, ld, 2, group_size );
+
+    printf( "C0 = [ %.1f %.1f %.1f %.1f ]; should be [ 1 2 3 4 ]\n",
+            C0[0], C0[1], C0[2], C0[3] );
+    printf( "C1 = [ %.1f %.1f %.1f %.1f ]; should be [ 3 3 7 7 ]\n",
+            C1[0], C1[1], C1[2], C1[3] );
+    printf( "C2 = [ %.1f ]; should be [ 30 ]\n", C2[0] );
+
+    bool okay = (C0[0] == 1 && C0[1] == 2 && C0[2] == 3 && C0[3] == 4
+              && C1[0] == 3 && C1[1] == 3 && C1[2] == 7 && C1[3] == 7
+              && C2[0] == 30);
+
+    // Other precisions need only link.
+    void (*funcs[])() = {
+        (void (*)()) cblas_sgemm_batch,
+        (void (*)()) cblas_cgemm_batch,
+        (void (*)()) cblas_zgemm_batch,
+    };
+    okay = okay && funcs[0] && funcs[1] && funcs[2];
+
+    printf( "%s\n", okay ? "ok" : "failed" );
+    return ! okay;
+}
@@ -0,0 +1,90 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+// Checks for the strided batched gemm in MKL,
+// cblas_[sdcz]gemm_batch_strided, used by blas::batch::gemm_strided.
+// Declares the routines here, as src/batch_gemm_strided.cc does.
+
+#include <stdio.h>
+#include <complex>
+
+#include "config.h"
+
+//------------------------------------------------------------------------------
+// CBLAS enums are passed as int: CblasColMajor = 102, CblasNoTrans = 111.
+extern "C" {
+
+void cblas_sgemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    float alpha,
+    float const* A, blas_int lda, blas_int strideA,
+    float const* B, blas_int ldb, blas_int strideB,
+    float beta,
+    float*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size );
+
+void cblas_dgemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    double alpha,
+    double const* A, blas_int lda, blas_int strideA,
+    double const* B, blas_int ldb, blas_int strideB,
+    double beta,
+    double*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size );
+
+void cblas_cgemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    void const* alpha,
+    void const* A, blas_int lda, blas_int strideA,
+    void const* B, blas_int ldb, blas_int strideB,
+    void const* beta,
+    void*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size );
+
+void cblas_zgemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    void const* alpha,
+    void const* A, blas_int lda, blas_int strideA,
+    void const* B, blas_int ldb, blas_int strideB,
+    void const* beta,
+    void*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size );
+
+}  // extern "C"
+
+//------------------------------------------------------------------------------
+int main()
+{
+    // Two 2x2 items, C_i = A_i B, with B shared (strideB = 0).
+    double A[] = { 1, 2, 3, 4,   1, 1, 1, 1 };
+    double B[] = { 1, 2, 3, 4 };
+    double C[ 8 ];
+
+    cblas_dgemm_batch_strided( 102, 111, 111, 2, 2, 2,
+                               1.0, A, 2, 4, B, 2, 0, 0.0, C, 2, 4, 2 );
+
+    printf( "C0 = [ %.1f %.1f %.1f %.1f ]; should be [ 7 10 15 22 ]\n",
+            C[0], C[1], C[2], C[3] );
+    printf( "C1 = [ %.1f %.1f %.1f %.1f ]; should be [ 3 3 7 7 ]\n",
+            C[4], C[5], C[6], C[7] );
+
+    bool okay = (C[0] ==  7 && C[1] == 10 && C[2] == 15 && C[3] == 22
+              && C[4] ==  3 && C[5] ==  3 && C[6] ==  7 && C[7] ==  7);
+
+    // Other precisions need only link.
+    void (*funcs[])() = {
+        (void (*)()) cblas_sgemm_batch_strided,
+        (void (*)()) cblas_cgemm_batch_strided,
+        (void (*)()) cblas_zgemm_batch_strided,
+    };
+    okay = okay && funcs[0] && funcs[1] && funcs[2];
+
+    printf( "%s\n", okay ? "ok" : "failed" );
+    return ! okay;
+}
@@ -0,0 +1,79 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+// Checks for the strided batched trsm in MKL,
+// cblas_[sdcz]trsm_batch_strided, used by blas::batch::trsm_strided.
+// Declares the routines here, as src/batch_trsm_strided.cc does.
+
+#include <stdio.h>
+#include <complex>
+
+#include "config.h"
+
+//------------------------------------------------------------------------------
+// CBLAS enums are passed as int: CblasColMajor = 102, CblasLeft = 141,
+// CblasLower = 122, CblasNoTrans = 111, CblasNonUnit = 131.
+extern "C" {
+
+void cblas_strsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    float alpha,
+    float const* A, blas_int lda, blas_int strideA,
+    float*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size );
+
+void cblas_dtrsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    double alpha,
+    double const* A, blas_int lda, blas_int strideA,
+    double*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size );
+
+void cblas_ctrsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    void const* alpha,
+    void const* A, blas_int lda, blas_int strideA,
+    void*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size );
+
+void cblas_ztrsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    void const* alpha,
+    void const* A, blas_int lda, blas_int strideA,
+    void*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size );
+
+}  // extern "C"
+
+//------------------------------------------------------------------------------
+int main()
+{
+    // Two items, solve A_i X_i = B_i with lower triangular 2x2 A_i.
+    double A[] = { 2, 1, -1, 1,   1, 3, -1, 2 };  // -1 is not referenced
+    double B[] = { 2, 3,   2, 7 };
+
+    cblas_dtrsm_batch_strided( 102, 141, 122, 111, 131, 2, 1,
+                               1.0, A, 2, 4, B, 2, 2, 2 );
+
+    printf( "X0 = [ %.1f %.1f ]; should be [ 1 2 ]\n", B[0], B[1] );
+    printf( "X1 = [ %.1f %.1f ]; should be [ 2 0.5 ]\n", B[2], B[3] );
+
+    bool okay = (B[0] == 1 && B[1] == 2 && B[2] == 2 && B[3] == 0.5);
+
+    // Other precisions need only link.
+    void (*funcs[])() = {
+        (void (*)()) cblas_strsm_batch_strided,
+        (void (*)()) cblas_ctrsm_batch_strided,
+        (void (*)()) cblas_ztrsm_batch_strided,
+    };
+    okay = okay && funcs[0] && funcs[1] && funcs[2];
+
+    printf( "%s\n", okay ? "ok" : "failed" );
+    return ! okay;
+}
@@ -16,6 +16,11 @@ import re
 import tarfile
 import argparse
 import shutil
+import io
+import tempfile
+import atexit
+import json
+import hashlib
 
 # This relative import syntax works in both python2 and 3.
 from .ansicodes import font
@@ -63,6 +68,25 @@ def debug( value=None ):
     return debug_
 # end
 
+# ------------------------------------------------------------------------------
+jobs_ = None
+
+def jobs( value=None ):
+    '''
+    Returns number of probes to run concurrently; see parallel_map().
+    Set by the jobs=N option; default is the number of CPUs.
+    '''
+    global jobs_
+    if (value is not None):
+        jobs_ = value
+    if (jobs_ is None):
+        try:
+            jobs_ = int( environ['jobs'] or os.cpu_count() or 1 )
+        except ValueError:
+            raise Error( 'jobs must be an integer: ' + environ['jobs'] )
+    return jobs_
+# end
+
 # ------------------------------------------------------------------------------
 namespace_ = None
 
@@ -145,6 +169,9 @@ def print_header( header ):
     '''
     Prints a header, with bold font, both to console and the log.
     '''
+    global subhead_
+    sections_.append( (header, time.time()) )
+    subhead_ = ''
     txt = font.bold( header )
     print( '\n' + '-'*80 +
            '\n' + txt, file=log )
@@ -156,6 +183,8 @@ def print_subhead( subhead ):
     '''
     Prints a subhead, both to console and the log.
     '''
+    global subhead_
+    subhead_ = subhead.split( '\n' )[0]
     print( '-'*40 + '\n' +
            subhead, file=log )
     print( subhead )
@@ -189,7 +218,9 @@ def print_test( label ):
     If no label is given, does nothing. This simplifies functions like
     compile_obj that take an optional label to print.
     '''
+    global label_
     if (label):
+        label_ = label.strip()
         print( '-'*20 + '\n' + label, file=log )
         print( '%-72s' % label, end='' )
         sys.stdout.flush()
@@ -373,15 +404,17 @@ def choose( prompt, choices ):
 # end
 
 #-------------------------------------------------------------------------------
-def run( cmd, env=None ):
+def run( cmd, env=None, kind='command' ):
     '''
     Runs the command cmd.
     cmd can be a string or a nested list.
     Pushes env beforehand and pops afterward.
     stdout and stderr are written to the log.
+    The wall time is recorded with kind (e.g., compile, link, run);
+    see record_timing().
     Returns (return_code, stdout, stderr) from the command.
 
-    Ex: run( ['gcc', '-c', 'file.c'], {'CPATH': '/opt/include'} )
+    Ex: run( ['gcc', '-c', 'file.c'], {'CPATH': '/opt/include'}, 'compile' )
     runs: gcc -c file.c
     '''
     environ.push( env )
@@ -391,6 +424,7 @@ def run( cmd, env=None ):
 
     print( '>>>', cmd, file=log )
     cmd_list = shlex.split( cmd )
+    start = time.time()
     try:
         proc = subprocess.Popen( cmd_list, stdout=PIPE, stderr=PIPE )
         (stdout, stderr) = proc.communicate()
@@ -407,11 +441,435 @@ def run( cmd, env=None ):
         rc = -1
         stdout = ''
         stderr = str(ex)
+    record_timing( cmd, kind, rc, start, time.time() - start )
 
     environ.pop()
     return (rc, stdout, stderr)
 # end
 
+#-------------------------------------------------------------------------------
+# Timing profile.
+# run() records each command's wall time in timings_ and writes it as a JSON
+# line to config/log.jsonl; print_timing_summary() reports the slowest
+# commands and the time per section.
+start_time_  = time.time()
+timing_log   = None  # config/log.jsonl, opened by init()
+timings_     = []    # records from record_timing()
+sections_    = []    # (header, start time) from print_header()
+subhead_     = ''    # last subhead from print_subhead()
+label_       = ''    # last label from print_test()
+
+def record_timing( cmd, kind, rc, start, seconds ):
+    '''
+    Records a command run by run(), with the current section (header),
+    subhead, and label, in timings_ and config/log.jsonl.
+
+    Ex: a log.jsonl line:
+    {"start": 1.234, "seconds": 0.512, "kind": "run", "rc": 0,
+     "section": "BLAS library", "subhead": "OpenBLAS",
+     "label": "-DBLAS_FORTRAN_ADD_", "cmd": "config/build-x/blas"}
+    '''
+    record = {
+        'start':   round( start - start_time_, 3 ),
+        'seconds': round( seconds, 4 ),
+        'kind':    kind,
+        'rc':      rc,
+        'section': sections_[-1][0] if sections_ else '',
+        'subhead': subhead_,
+        'label':   label_,
+        'cmd':     cmd,
+    }
+    timings_.append( record )
+    if (timing_log):
+        timing_log.write( json.dumps( record ) + '\n' )
+# end
+
+#-------------------------------------------------------------------------------
+def print_timing_summary( top=10 ):
+    '''
+    Prints the wall time of each section (from one print_header() to the next,
+    including cached probes), and the top slowest commands from run(),
+    both to console and the log.
+    '''
+    now = time.time()
+    ends = [ t for (header, t) in sections_[1:] ] + [ now ]
+    times = [ (header, end - t) for ((header, t), end) in zip( sections_, ends ) ]
+
+    print_header( 'Configure time' )
+    print_msg( 'Time per section (seconds):' )
+    for (header, seconds) in times:
+        print_msg( '    %-60s %8.2f' % (header, seconds) )
+    print_msg( '    %-60s %8.2f' % ('total', now - start_time_) )
+
+    slowest = sorted( timings_, key=lambda r: -r['seconds'] )[ 0:top ]
+    if (slowest):
+        print_msg( 'Slowest commands (seconds), of %d; see %s:'
+                   % (len( timings_ ), 'config/log.jsonl') )
+        for r in slowest:
+            where = ' / '.join( [ x for x in (r['section'], r['subhead'], r['label'])
+                                  if x ] )
+            print_msg( '    %8.2f  %-7s  %s' % (r['seconds'], r['kind'], where) )
+# end
+
+#-------------------------------------------------------------------------------
+# Temporary directory where probes are built; see build_dir().
+build_dir_ = None
+
+def build_dir():
+    '''
+    Returns the temporary directory where object files and exes are built,
+    creating it if needed. Each configure run gets its own directory, removed
+    at exit, so several configures in the same source tree don't clobber
+    each other. parallel_map() gives each concurrent probe its own directory.
+    '''
+    global build_dir_
+    if (build_dir_ is None):
+        build_dir_ = make_build_dir()
+        atexit.register( remove_build_dir, build_dir_, os.getpid() )
+    return build_dir_
+# end
+
+#-------------------------------------------------------------------------------
+def make_build_dir():
+    '''
+    Creates and returns a new, uniquely named build directory.
+    It is in the config directory rather than /tmp, which may be mounted
+    noexec, preventing probes from running.
+    '''
+    return tempfile.mkdtemp( prefix='build-',
+                             dir=os.path.dirname( os.path.abspath( __file__ ) ) )
+# end
+
+#-------------------------------------------------------------------------------
+def remove_build_dir( path, pid=None ):
+    '''
+    Removes the build directory path. If pid is given, only that process
+    removes it, not forked children that inherit the atexit handler.
+    '''
+    if (pid is None or pid == os.getpid()):
+        shutil.rmtree( path, ignore_errors=True )
+# end
+
+#-------------------------------------------------------------------------------
+def output_base( src ):
+    '''
+    Returns (base, ext) for source file src, where base is the path of the
+    exe and base + '.o' the path of the object file, in build_dir().
+
+    Ex: output_base( 'config/blas.cc' ) returns ('config/build-xyz/blas', '.cc'),
+    with an absolute path.
+    '''
+    (base, ext) = os.path.splitext( os.path.basename( src ) )
+    return (os.path.join( build_dir(), base ), ext)
+# end
+
+#-------------------------------------------------------------------------------
+# Probe cache.
+# Results of compile_obj(), compile_exe(), compile_run(), and run_exe()
+# are saved in config/cache.json, so re-running configure doesn't repeat
+# probes. The key hashes the probe source (and its local includes), the
+# resolved compiler path and version, flags, LDFLAGS, LIBS, relevant
+# environment variables, and the paths and mtimes of the libraries in LIBS,
+# so changing the compiler or a library invalidates entries.
+# The value is the return code, stdout, and stderr.
+# Disable with --no-cache.
+
+cache_file_ = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ),
+                            'cache.json' )
+cache_      = None   # dict of key => entry, loaded by cache_load()
+cache_new_  = {}     # entries added in this process, to save
+cache_hits_ = 0
+cache_probes_ = 0
+cache_depth_  = 0    # nested calls (compile_exe => compile_obj) aren't cached
+
+# For run_exe(), the key and environment of the last compile_exe() for src.
+cache_builds_ = {}
+
+# Environment variables that affect compiling, linking, or running.
+cache_env_vars = ['CPATH', 'C_INCLUDE_PATH', 'CPLUS_INCLUDE_PATH',
+                  'LIBRARY_PATH', 'LD_LIBRARY_PATH', 'DYLD_LIBRARY_PATH']
+
+#-------------------------------------------------------------------------------
+use_cache_ = True
+
+def use_cache( value=None ):
+    '''
+    Returns whether the probe cache is enabled. Set by --no-cache.
+    '''
+    global use_cache_
+    if (value is not None):
+        use_cache_ = value
+    return use_cache_
+# end
+
+#-------------------------------------------------------------------------------
+def cache_load():
+    '''
+    Returns the probe cache, loading config/cache.json if needed.
+    '''
+    global cache_
+    if (cache_ is None):
+        cache_ = {}
+        try:
+            with open( cache_file_ ) as f:
+                cache_ = json.load( f )
+        except (IOError, OSError, ValueError):
+            pass
+    return cache_
+# end
+
+#-------------------------------------------------------------------------------
+def cache_save( pid=None ):
+    '''
+    Merges entries added in this run into config/cache.json.
+    Re-reads the file first, in case another configure updated it.
+    If pid is given, only that process saves, not forked children.
+    '''
+    if (not cache_new_ or (pid is not None and pid != os.getpid())):
+        return
+    cache = {}
+    try:
+        with open( cache_file_ ) as f:
+            cache = json.load( f )
+    except (IOError, OSError, ValueError):
+        pass
+    cache.update( cache_new_ )
+    tmp = cache_file_ + '.' + str( os.getpid() )
+    try:
+        with open( tmp, 'w' ) as f:
+            json.dump( cache, f, indent=1, sort_keys=True )
+        os.replace( tmp, cache_file_ )
+    except (IOError, OSError):
+        pass
+# end
+
+atexit.register( cache_save, os.getpid() )
+
+#-------------------------------------------------------------------------------
+hash_files_ = {}
+
+def hash_source( src ):
+    '''
+    Returns hash of source file src and files it includes with
+    #include "file" from the same directory, recursively.
+    '''
+    if (src in hash_files_):
+        return hash_files_[ src ]
+    h = hashlib.sha256()
+    hash_files_[ src ] = ''  # guard against recursive includes
+    try:
+        txt = read( src )
+        h.update( txt.encode( 'utf-8' ) )
+        for inc in re.findall( r'^\s*#\s*include\s+"([^"]+)"', txt, re.M ):
+            path = os.path.join( os.path.dirname( src ), inc )
+            if (os.path.exists( path )):
+                h.update( hash_source( path ).encode() )
+    except (IOError, OSError):
+        pass
+    hash_files_[ src ] = h.hexdigest()
+    return hash_files_[ src ]
+# end
+
+#-------------------------------------------------------------------------------
+compiler_ids_ = {}
+
+def compiler_id( compiler ):
+    '''
+    Returns string identifying compiler: resolved path, mtime, and output of
+    `compiler --version`. Also returns its library search directories.
+    '''
+    if (compiler not in compiler_ids_):
+        words = shlex.split( compiler ) or ['']
+        path  = shutil.which( words[0] ) or words[0]
+        txt   = path
+        dirs  = []
+        try:
+            txt += ' ' + str( os.path.getmtime( path ) )
+            proc = subprocess.Popen( words + ['--version'],
+                                     stdout=PIPE, stderr=PIPE )
+            txt += ' ' + proc.communicate()[0].decode( 'utf-8' )
+            proc = subprocess.Popen( words + ['-print-search-dirs'],
+                                     stdout=PIPE, stderr=PIPE )
+            out = proc.communicate()[0].decode( 'utf-8' )
+            s = re.search( r'^libraries: =?(.*)$', out, re.M )
+            if (s):
+                dirs = s.group(1).split( os.pathsep )
+        except (IOError, OSError):
+            pass
+        compiler_ids_[ compiler ] = (txt, dirs)
+    return compiler_ids_[ compiler ]
+# end
+
+#-------------------------------------------------------------------------------
+def find_libraries( compiler, ldflags, libs ):
+    '''
+    Returns list of (word, path) for each library in libs (-lname or path),
+    found in -L directories in ldflags and libs, LIBRARY_PATH,
+    LD_LIBRARY_PATH, and the compiler's search directories.
+    path is None if the library isn't found. Other words in libs,
+    such as -framework, are skipped.
+
+    Ex: find_libraries( 'g++', '', '-lopenblas -lm' )
+    returns [('-lopenblas', '/usr/lib/libopenblas.so'), ('-lm', '/usr/lib/libm.so')]
+    '''
+    words = shlex.split( ldflags + ' ' + libs )
+    dirs  = [ w[2:] for w in words if w.startswith( '-L' ) ]
+    for var in ('LIBRARY_PATH', 'LD_LIBRARY_PATH', 'DYLD_LIBRARY_PATH'):
+        dirs += [ d for d in environ[ var ].split( os.pathsep ) if d ]
+    dirs += compiler_id( compiler )[1]
+    dirs += ['/usr/local/lib', '/usr/local/lib64', '/usr/lib', '/usr/lib64']
+
+    found = []
+    for w in shlex.split( libs ):
+        paths = []
+        if (w.startswith( '-l' )):
+            for d in dirs:
+                for ext in ('.so', '.dylib', '.a', '.tbd'):
+                    paths.append( os.path.join( d, 'lib' + w[2:] + ext ) )
+        elif (not w.startswith( '-' )):
+            paths.append( w )
+        for path in paths:
+            if (os.path.exists( path )):
+                found.append( (w, path) )
+                break
+        else:
+            if (paths):
+                found.append( (w, None) )
+    # end
+    return found
+# end
+
+#-------------------------------------------------------------------------------
+def library_stamp( compiler, ldflags, libs ):
+    '''
+    Returns string with the path and mtime of each library in libs,
+    found by find_libraries(), or "name missing" if not found.
+    '''
+    stamp = []
+    for (w, path) in find_libraries( compiler, ldflags, libs ):
+        if (path):
+            stamp.append( path + ' ' + str( os.path.getmtime( path ) ) )
+        else:
+            stamp.append( w + ' missing' )
+    # end
+    return '\n'.join( stamp )
+# end
+
+#-------------------------------------------------------------------------------
+# Cache of path => (mtime, symbols) for library_symbols().
+library_symbols_ = {}
+
+def library_symbols( path ):
+    '''
+    Returns set of global symbols defined in library path, using nm:
+    the dynamic symbols of a shared library, or the symbols of a static
+    library. On macOS, the leading underscore is removed.
+    Returns None if nm isn't available or fails, e.g., on linker scripts.
+
+    Ex: 'ddot_' in library_symbols( '/usr/lib/libblas.so' )
+    '''
+    mtime = os.path.getmtime( path )
+    if (path in library_symbols_ and library_symbols_[ path ][0] == mtime):
+        return library_symbols_[ path ][1]
+
+    if (path.endswith( '.a' )):
+        cmds = [['nm', '-g', '--defined-only', path]]
+    else:
+        cmds = [['nm', '-D', '--defined-only', path]]
+    cmds.append( ['nm', '-gU', path] )  # macOS nm
+    symbols = None
+    for cmd in cmds:
+        try:
+            proc = subprocess.Popen( cmd, stdout=PIPE, stderr=PIPE )
+            out = proc.communicate()[0].decode( 'utf-8', 'replace' )
+        except (IOError, OSError):
+            break  # nm not found
+        if (proc.returncode == 0):
+            symbols = set()
+            for line in out.splitlines():
+                words = line.split()
+                # Lines are "address type name"; skip archive member headers.
+                if (len( words ) >= 2 and len( words[-2] ) == 1):
+                    name = words[-1].split( '@' )[0]
+                    if (sys.platform == 'darwin' and name.startswith( '_' )):
+                        name = name[1:]
+                    symbols.add( name )
+            break
+    # end
+    print( '>>> nm', path, ':', 'failed' if symbols is None
+           else '%d symbols' % len( symbols ), file=log )
+    library_symbols_[ path ] = (mtime, symbols)
+    return symbols
+# end
+
+#-------------------------------------------------------------------------------
+def cache_key( kind, src, base_key='' ):
+    '''
+    Returns cache key for a probe of the given kind (obj, exe, run) of
+    source file src, in the current environment.
+    '''
+    (base, ext) = os.path.splitext( src )
+    lang     = lang_map[ ext ]
+    compiler = environ[ lang ]
+    ldflags  = environ['LDFLAGS']
+    libs     = environ['LIBS'] or environ['LDLIBS']
+    parts = [ kind, src, base_key, hash_source( src ),
+              compiler_id( compiler )[0],
+              environ[ flag_map[ lang ]], ldflags, libs,
+              library_stamp( compiler, ldflags, libs ) ]
+    parts += [ var + '=' + environ[ var ] for var in cache_env_vars ]
+    return hashlib.sha256( '\n'.join( parts ).encode( 'utf-8' ) ).hexdigest()
+# end
+
+#-------------------------------------------------------------------------------
+def cached( kind, src, func, key=None ):
+    '''
+    Returns (return_code, stdout, stderr) of the probe func(),
+    from the cache if possible; otherwise runs func() and caches its result.
+    Only the outermost probe is cached; nested probes (compile_obj within
+    compile_exe) run directly, as their output files are needed.
+    '''
+    global cache_depth_, cache_hits_, cache_probes_
+    if (not use_cache() or cache_depth_ > 0):
+        cache_depth_ += 1
+        try:
+            return func()
+        finally:
+            cache_depth_ -= 1
+    # end
+
+    if (key is None):
+        key = cache_key( kind, src )
+    cache_probes_ += 1
+    entry = cache_load().get( key )
+    if (entry):
+        cache_hits_ += 1
+        print( '>>> cached', kind, src + ':', 'exit status = %d' % entry['rc'],
+               file=log )
+        return (entry['rc'], entry['stdout'], entry['stderr'])
+
+    cache_depth_ += 1
+    try:
+        (rc, stdout, stderr) = func()
+    finally:
+        cache_depth_ -= 1
+    entry = {'kind': kind, 'src': src, 'rc': rc,
+             'stdout': stdout, 'stderr': stderr, 'time': time.time()}
+    cache_load()[ key ] = entry
+    cache_new_[ key ] = entry
+    return (rc, stdout, stderr)
+# end
+
+#-------------------------------------------------------------------------------
+def print_cache_summary():
+    '''
+    Prints how many probes came from the probe cache.
+    '''
+    if (use_cache()):
+        print( 'probe cache: %d of %d probes cached in %s; use --no-cache to re-run'
+               % (cache_hits_, cache_probes_, os.path.relpath( cache_file_ )) )
+# end
+
 #-------------------------------------------------------------------------------
 def compile_obj( src, env=None, label=None ):
     '''
@@ -426,12 +884,13 @@ def compile_obj( src, env=None, label=None ):
     environ.push( env )
 
     print_test( label )
-    (base, ext) = os.path.splitext( src )
+    (base, ext) = output_base( src )
     obj      = base + '.o'
     lang     = lang_map[ ext ]
     compiler = environ[ lang ]
     flags    = environ[ flag_map[ lang ]]
-    (rc, stdout, stderr) = run([ compiler, flags, '-c', src, '-o', obj ])
+    (rc, stdout, stderr) = cached( 'obj', src,
+        lambda: run([ compiler, flags, '-c', src, '-o', obj ], kind='compile') )
     print_result( label, rc )
 
     environ.pop()
@@ -447,19 +906,23 @@ def link_exe( src, env=None, label=None ):
     If label is given, prints label & result.
     Returns (return_code, stdout, stderr) from the compiler.
 
+    Not cached, since it depends on the object file, which a cached
+    compile_obj() doesn't create.
+
     Ex: link_exe( 'foo.c', {'CC': 'gcc'}, 'Test foo' )
     runs: gcc $LDFLAGS $LIBS foo.o -o foo
     '''
     environ.push( env )
 
     print_test( label )
-    (base, ext) = os.path.splitext( src )
+    (base, ext) = output_base( src )
     obj      = base + '.o'
     lang     = lang_map[ ext ]
     compiler = environ[ lang ]
     LDFLAGS  = environ['LDFLAGS']
     LIBS     = environ['LIBS'] or environ['LDLIBS']
-    (rc, stdout, stderr) = run([ compiler, obj, '-o', base, LDFLAGS, LIBS ])
+    (rc, stdout, stderr) = run([ compiler, obj, '-o', base, LDFLAGS, LIBS ],
+                               kind='link' )
     print_result( label, rc )
 
     environ.pop()
@@ -479,15 +942,26 @@ def compile_exe( src, env=None, label=None ):
     environ.push( env )
 
     print_test( label )
-    (base, ext) = os.path.splitext( src )
+    (base, ext) = output_base( src )
     obj      = base + '.o'
     lang     = lang_map[ ext ]
     compiler = environ[ lang ]
     LDFLAGS  = environ['LDFLAGS']
     LIBS     = environ['LIBS'] or environ['LDLIBS']
-    (rc, stdout, stderr) = compile_obj( src )
-    if (rc == 0):
-        (rc, stdout, stderr) = run([ compiler, obj, '-o', base, LDFLAGS, LIBS ])
+    def build():
+        (rc, stdout, stderr) = compile_obj( src )
+        if (rc == 0):
+            (rc, stdout, stderr) = run([ compiler, obj, '-o', base, LDFLAGS, LIBS ],
+                                       kind='link' )
+        return (rc, stdout, stderr)
+    # end
+    key = cache_key( 'exe', src ) if (use_cache() and cache_depth_ == 0) else None
+    (rc, stdout, stderr) = cached( 'exe', src, build, key )
+    if (key):
+        # Save key and environment for run_exe().
+        env2 = { var: environ[ var ]
+                 for var in (lang, flag_map[ lang ], 'LDFLAGS', 'LIBS', 'LDLIBS') }
+        cache_builds_[ src ] = (key, env2)
     print_result( label, rc )
 
     environ.pop()
@@ -510,10 +984,14 @@ def compile_run( src, env=None, label=None ):
     environ.push( env )
 
     print_test( label )
-    (base, ext) = os.path.splitext( src )
-    (rc, stdout, stderr) = compile_exe( src )
-    if (rc == 0):
-        (rc, stdout, stderr) = run( './' + base )
+    (base, ext) = output_base( src )
+    def build_run():
+        (rc, stdout, stderr) = compile_exe( src )
+        if (rc == 0):
+            (rc, stdout, stderr) = run( base, kind='run' )
+        return (rc, stdout, stderr)
+    # end
+    (rc, stdout, stderr) = cached( 'run', src, build_run )
     print_result( label, rc )
 
     environ.pop()
@@ -525,6 +1003,8 @@ def run_exe( src, env=None, label=None ):
     '''
     Runs the exe associated with src.
     Assumes compile_exe( src ) was called previously to generate the exe.
+    If that compile_exe() result came from the cache, the exe doesn't exist,
+    so if this run isn't cached either, the exe is first rebuilt.
 
     Ex: run_exe( 'foo.c', {'CC': 'gcc'}, 'Test foo' )
     runs: ./foo
@@ -532,14 +1012,133 @@ def run_exe( src, env=None, label=None ):
     environ.push( env )
 
     print_test( label )
-    (base, ext) = os.path.splitext( src )
-    (rc, stdout, stderr) = run( './' + base )
+    (base, ext) = output_base( src )
+    def rebuild_run():
+        if (not os.path.exists( base ) and src in cache_builds_):
+            environ.push()
+            for (var, value) in cache_builds_[ src ][1].items():
+                environ[ var ] = value
+            compile_exe( src )
+            environ.pop()
+        return run( base, kind='run' )
+    # end
+    if (use_cache() and src in cache_builds_):
+        key = cache_key( 'run', src, cache_builds_[ src ][0] )
+        (rc, stdout, stderr) = cached( 'run', src, rebuild_run, key )
+    else:
+        (rc, stdout, stderr) = run( base, kind='run' )
     print_result( label, rc )
 
     environ.pop()
     return (rc, stdout, stderr)
 # end
 
+#-------------------------------------------------------------------------------
+# Function and items for parallel_map(), inherited by forked worker processes,
+# so they need not be pickled (e.g., lambdas).
+parallel_func_  = None
+parallel_items_ = []
+
+# True in worker processes, to avoid nested pools.
+parallel_worker_ = False
+
+def parallel_worker( i ):
+    '''
+    Runs probe i for parallel_map() in a worker process.
+    Builds in its own temporary directory, which is removed afterwards.
+    Captures its console and log output.
+    Returns (result, exception, stdout, log, cache, timings) of
+    parallel_func_( *item ), where cache has new probe cache entries and counts,
+    and timings has records from record_timing().
+    '''
+    global log, build_dir_, parallel_worker_, timing_log, timings_, \
+           cache_new_, cache_hits_, cache_probes_
+    timing_log    = None
+    timings_      = []
+    cache_new_    = {}
+    cache_hits_   = 0
+    cache_probes_ = 0
+    stdout     = sys.stdout
+    sys.stdout = io.StringIO()
+    log        = io.StringIO()
+    build_dir_ = make_build_dir()
+    parallel_worker_ = True
+    result     = None
+    exception  = None
+    try:
+        result = parallel_func_( *parallel_items_[ i ] )
+    except Exception as ex:
+        exception = ex
+    remove_build_dir( build_dir_ )
+    txt = sys.stdout.getvalue()
+    sys.stdout = stdout
+    cache = (cache_new_, cache_hits_, cache_probes_)
+    return (result, exception, txt, log.getvalue(), cache, timings_)
+# end
+
+#-------------------------------------------------------------------------------
+def parallel_map( func, items ):
+    '''
+    Runs func( *args ) for each tuple args in items, up to jobs() at a time
+    in a pool of forked processes. Yields results in the order of items,
+    so the preference order of probes is deterministic. Each probe's console
+    and log output is captured and printed when its result is yielded, so
+    output stays grouped per probe, exactly as when run serially.
+    Probes must not modify environ; they return what they found instead.
+    When the caller stops iterating (e.g., break on the first probe
+    that passes), remaining probes are terminated.
+    Runs serially if jobs=1, within a worker, or if fork is not available
+    (e.g., Windows).
+
+    Ex: for (rc, env) in parallel_map( probe, [(env1,), (env2,)] ): ...
+    '''
+    global parallel_func_, parallel_items_, cache_hits_, cache_probes_
+    items = list( items )
+    pool = None
+    if (jobs() > 1 and len( items ) > 1 and not parallel_worker_):
+        try:
+            import multiprocessing
+            ctx = multiprocessing.get_context( 'fork' )
+            # Flush so children don't inherit and repeat buffered output.
+            sys.stdout.flush()
+            log.flush()
+            if (timing_log):
+                timing_log.flush()
+            parallel_func_  = func
+            parallel_items_ = items
+            pool = ctx.Pool( min( jobs(), len( items ) ) )
+        except (ImportError, ValueError, OSError):
+            pool = None
+    # end
+
+    if (pool is None):
+        for args in items:
+            yield func( *args )
+        return
+
+    try:
+        for (result, exception, txt, log_txt, cache, timings) in pool.imap(
+                parallel_worker, range( len( items ) ) ):
+            sys.stdout.write( txt )
+            sys.stdout.flush()
+            log.write( log_txt )
+            for record in timings:
+                timings_.append( record )
+                if (timing_log):
+                    timing_log.write( json.dumps( record ) + '\n' )
+            (entries, hits, probes) = cache
+            cache_load().update( entries )
+            cache_new_.update( entries )
+            cache_hits_   += hits
+            cache_probes_ += probes
+            if (exception is not None):
+                raise exception
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+# end
+
 #-------------------------------------------------------------------------------
 def prog_cxx( choices=['g++', 'c++', 'CC', 'cxx', 'icpc', 'xlc++', 'clang++'] ):
     '''
@@ -616,11 +1215,181 @@ def openmp( flags=['-fopenmp', '-qopenmp', '-openmp', '-omp', ''] ):
 # end
 
 #-------------------------------------------------------------------------------
-def cublas_library():
+def threads( flags=['-pthread', ''] ):
+    '''
+    Tests for C++ threads (std::thread) with one of the given flags,
+    as CMake's Threads::Threads does. Host queues run on threads.
+    If a flag works, it is added to both CXXFLAGS and LDFLAGS.
+    '''
+    print_header( 'C++ threads' )
+    src = 'config/threads.cc'
+    for flag in flags:
+        print_test( flag )
+        env = {'CXXFLAGS': flag, 'LDFLAGS': flag}
+        (rc, out, err) = compile_run( src, env )
+        print_result( flag, rc )
+        if (rc == 0):
+            environ.merge( env )
+            break
+    # end
+# end
+
+#-------------------------------------------------------------------------------
+def tune_cxx_flags( src, levels=['-O2', '-O3'],
+                    extras=['-march=native', '-funroll-loops', '-flto',
+                            '-fno-plt'] ):
+    '''
+    If tune_flags is set, chooses optimization flags by benchmarking src,
+    which must print a line "score value", where higher is better.
+    First the fastest of the optimization levels is chosen, then each extra
+    flag is kept if it improves the score by more than 5%, to ignore noise.
+    tune_flags=1 uses the given levels and extras; otherwise it is a
+    comma-separated list of flags to try, where -O flags are levels
+    and others are extras.
+    With portable=1, -march=native is refused, so the library runs
+    on other CPUs.
+    The chosen flags replace -O levels in CXXFLAGS; -flto is also added
+    to LDFLAGS, since it is needed when linking. Measurements are recorded
+    in the log and in make.inc comments (tune_flags_benchmark variable).
+
+    Ex: tune_cxx_flags( 'config/tune_flags.cc' )
+    with tune_flags=1 might choose -O3 -march=native.
+    '''
+    tune_flags = environ['tune_flags'].strip()
+    if (not tune_flags or tune_flags.lower() in ('0', 'n', 'no', 'false', 'off')):
+        return
+    if (tune_flags.lower() not in ('1', 'y', 'yes', 'true', 'on')):
+        flags  = tune_flags.replace( ',', ' ' ).split()
+        levels = [ flag for flag in flags if     flag.startswith( '-O' ) ] or levels
+        extras = [ flag for flag in flags if not flag.startswith( '-O' ) ]
+
+    print_header( 'Tune optimization flags (score in Gflop/s)' )
+    portable = environ['portable'].lower() in ('1', 'y', 'yes', 'true', 'on')
+    if (portable and '-march=native' in extras):
+        print_warn( 'Refusing -march=native since portable=1.' )
+        extras = [ flag for flag in extras if flag != '-march=native' ]
+
+    # Timings depend on this machine's load, so don't cache them.
+    cache = use_cache()
+    use_cache( False )
+
+    def score( flags ):
+        print_test( '    ' + ' '.join( flags ) )
+        txt = ' '.join( flags )
+        ldflags = ' '.join( [ flag for flag in flags
+                              if flag.startswith( '-flto' ) ] )
+        (rc, out, err) = compile_run( src, {'CXXFLAGS': txt, 'LDFLAGS': ldflags} )
+        # assume a mention of a flag in stderr means it isn't supported
+        if (any( [ flag in err for flag in flags ] )):
+            rc = 1
+        value = 0
+        if (rc == 0):
+            for line in out.splitlines():
+                words = line.split()
+                if (len( words ) == 2 and words[0] == 'score'):
+                    value = float( words[1] )
+        print_result( txt, value == 0, '(%.2f)' % value )
+        return value
+    # end
+
+    comments = '# tune_flags benchmark of ' + src + ', Gflop/s (higher is better):\n'
+    best = []
+    best_score = 0
+    for level in levels:
+        value = score( [ level ] )
+        comments += '#   %s: %.2f\n' % (level, value)
+        if (value > best_score):
+            (best, best_score) = ([ level ], value)
+    # end
+    for flag in extras:
+        value = score( best + [ flag ] )
+        comments += '#   %s: %.2f\n' % (' '.join( best + [ flag ] ), value)
+        if (value > 1.05 * best_score):
+            (best, best_score) = (best + [ flag ], value)
+    # end
+    use_cache( cache )
+
+    if (not best):
+        print_warn( 'No flags could be benchmarked; keeping CXXFLAGS.' )
+        return
+    print_msg( 'Chose ' + ' '.join( best ) )
+    comments += '#   chose: ' + ' '.join( best ) + '\n'
+    environ['tune_flags_benchmark'] = comments
+
+    cxxflags = re.sub( r'(^| )-O\w*(?= |$)', '', environ['CXXFLAGS'] )
+    environ['CXXFLAGS'] = cxxflags.strip() + ' ' + ' '.join( best )
+    for flag in best:
+        if (flag.startswith( '-flto' )):
+            environ.append( 'LDFLAGS', flag )
+# end
+
+#-------------------------------------------------------------------------------
+# x86 vector instruction sets checked by cpu_isa():
+# (name, compiler flag, /proc/cpuinfo flag).
+isa_list = [
+    ('SSE42',      '-msse4.2',     'sse4_2'),
+    ('AVX2',       '-mavx2',       'avx2'),
+    ('AVX512F',    '-mavx512f',    'avx512f'),
+    ('AVX512FP16', '-mavx512fp16', 'avx512_fp16'),
+    ('AMX',        '-mamx-tile',   'amx_tile'),
+]
+
+def cpu_isa():
+    '''
+    Detects vector instruction sets (ISA) in isa_list, recording them for
+    "#undef" substitution in output_files(), e.g., in defines.h:
+        <namespace>_HAVE_<isa>: the compiler can generate code for the ISA,
+            given its flag, e.g., -mavx2. Code can use it with
+            __attribute__((target(...))) and dispatch at runtime.
+        <namespace>_HOST_<isa>: the build host CPU supports the ISA,
+            from /proc/cpuinfo (Linux only).
+    The ISAs aren't added to CXXFLAGS, so the library stays portable.
+
+    Ex: on a Skylake server with g++,
+    defines BLAS_HAVE_AVX2, BLAS_HAVE_AVX512F, BLAS_HOST_AVX2, BLAS_HOST_AVX512F, etc.
+    '''
+    print_header( 'CPU instruction sets' )
+
+    print_subhead( 'Compiler support:' )
+    for (name, flag, cpuinfo_flag) in isa_list:
+        print_test( '    ' + flag )
+        (rc, out, err) = compile_obj(
+            'config/cpu_isa.cc', {'CXXFLAGS': flag + ' -DISA_' + name} )
+        print_result( flag, rc )
+        if (rc == 0):
+            defines[ namespace_ + '_HAVE_' + name ] = ''
+    # end
+
+    print_subhead( 'Build host CPU (/proc/cpuinfo):' )
+    host_flags = None
+    try:
+        with open( '/proc/cpuinfo' ) as f:
+            for line in f:
+                if (line.startswith( 'flags' )):
+                    host_flags = line.split( ':', 1 )[1].split()
+                    break
+    except IOError:
+        pass
+    if (host_flags is None):
+        print_msg( '    unknown' )
+        return
+
+    for (name, flag, cpuinfo_flag) in isa_list:
+        print_test( '    ' + cpuinfo_flag )
+        rc = 0 if (cpuinfo_flag in host_flags) else 1
+        print_result( cpuinfo_flag, rc )
+        if (rc == 0):
+            defines[ namespace_ + '_HOST_' + name ] = ''
+    # end
+# end
+
+#-------------------------------------------------------------------------------
+def cublas_probe():
     '''
     Tests for linking CUDA and cuBLAS libraries.
     Does not actually run the resulting exe, to allow compiling with CUDA on a
     machine without GPUs.
+    Returns (return_code, env), where env has the flags to use.
     '''
     # Find CUDA to add -I, -L, -rpath flags.
     # CUDA_PATH is used in NVIDIA Getting Started documentation;
@@ -656,6 +1425,16 @@ def cublas_library():
     env = {'CXXFLAGS': cxxflags, 'LDFLAGS': ldflags, 'LIBS': libs}
     (rc, out, err) = compile_exe( 'config/cublas.cc', env )
     print_result( libs, rc )
+    return (rc, env)
+# end
+
+#-------------------------------------------------------------------------------
+def cublas_library():
+    '''
+    Tests for linking CUDA and cuBLAS libraries; see cublas_probe().
+    If found, adds flags to the environment; otherwise raises Error.
+    '''
+    (rc, env) = cublas_probe()
     if (rc == 0):
         environ.merge( env )
     else:
@@ -663,11 +1442,12 @@ def cublas_library():
 # end
 
 #-------------------------------------------------------------------------------
-def rocblas_library():
+def rocblas_probe():
     '''
     Tests for linking ROCm/HIP and rocBLAS libraries.
     Does not actually run the resulting exe, to allow compiling with ROCm on a
     machine without GPUs.
+    Returns (return_code, env), where env has the flags to use.
     '''
     # Find ROCm to add -I, -L, -rpath flags.
     # ROCM_PATH is used in hipcc and Spack ROCm package;
@@ -702,6 +1482,16 @@ def rocblas_library():
     env = {'CXXFLAGS': cxxflags, 'LDFLAGS': ldflags, 'LIBS': libs}
     (rc, out, err) = compile_exe( 'config/rocblas.cc', env )
     print_result( libs, rc )
+    return (rc, env)
+# end
+
+#-------------------------------------------------------------------------------
+def rocblas_library():
+    '''
+    Tests for linking ROCm/HIP and rocBLAS libraries; see rocblas_probe().
+    If found, adds flags to the environment; otherwise raises Error.
+    '''
+    (rc, env) = rocblas_probe()
     if (rc == 0):
         environ.merge( env )
     else:
@@ -709,11 +1499,12 @@ def rocblas_library():
 # end
 
 #-------------------------------------------------------------------------------
-def sycl_onemkl_library():
+def sycl_onemkl_probe():
     '''
     Tests for linking SYCL and oneMKL library.
     Does not actually run the resulting exe, to allow compiling on a
     machine without GPUs.
+    Returns (return_code, env), where env has the flags to use.
     '''
     libs = '-lmkl_sycl -lsycl -lOpenCL'
     print_subhead( 'SYCL and oneMKL libraries' )
@@ -730,6 +1521,16 @@ def sycl_onemkl_library():
            + ' -fsycl -Wno-deprecated-declarations'}
     (rc, out, err) = compile_exe( 'config/onemkl.cc', env )
     print_result( libs, rc )
+    return (rc, env)
+# end
+
+#-------------------------------------------------------------------------------
+def sycl_onemkl_library():
+    '''
+    Tests for linking SYCL and oneMKL libraries; see sycl_onemkl_probe().
+    If found, adds flags to the environment; otherwise raises Error.
+    '''
+    (rc, env) = sycl_onemkl_probe()
     if (rc == 0):
         environ.merge( env )
     else:
@@ -746,39 +1547,29 @@ def gpu_blas():
     test_rocm   = re.search( r'\b(hip|rocm)\b', gpu_backend ) or test_auto
     test_sycl   = re.search( r'\b(sycl)\b',     gpu_backend ) or test_auto
 
-    #----- CUDA
-    gpu_blas_found = False
-    if (test_cuda):
-        try:
-            cublas_library()
-            gpu_blas_found = True
-        except Error as ex:
-            if (gpu_backend == 'cuda'):
-                raise ex  # fatal
-    else:
-        print_msg( font.red( 'skipping CUDA search' ) )
-
-    #----- ROCm
-    if (not gpu_blas_found and test_rocm):
-        try:
-            rocblas_library()
-            gpu_blas_found = True
-        except Error as ex:
-            if (gpu_backend in ('hip', 'rocm')):
-                raise ex  # fatal
-    else:
-        print_msg( font.red( 'skipping HIP/ROCm search' ) )
+    # Probe backends concurrently; results come back in preference order:
+    # CUDA, ROCm, SYCL. The first found is used.
+    backends = [
+        ('CUDA',     test_cuda, cublas_probe,      'cuBLAS not found', ('cuda',)),
+        ('HIP/ROCm', test_rocm, rocblas_probe,     'rocBLAS not found', ('hip', 'rocm')),
+        ('SYCL',     test_sycl, sycl_onemkl_probe, 'oneMKL not found', ('sycl',)),
+    ]
+    results = parallel_map( lambda probe: probe(),
+                            [ (b[2],) for b in backends if b[1] ] )
 
-    #----- SYCL
-    if (not gpu_blas_found and test_sycl):
-        try:
-            sycl_onemkl_library()
+    gpu_blas_found = False
+    for (name, test, probe, msg, fatal) in backends:
+        if (gpu_blas_found or not test):
+            print_msg( font.red( 'skipping ' + name + ' search' ) )
+            continue
+        (rc, env) = next( results )
+        if (rc == 0):
+            environ.merge( env )
             gpu_blas_found = True
-        except Error as ex:
-            if (gpu_backend == 'sycl'):
-                raise ex  # fatal
-    else:
-        print_msg( font.red( 'skipping SYCL search' ) )
+        elif (gpu_backend in fatal):
+            raise Error( msg )  # fatal
+    # end
+    results.close()
 
     if (not gpu_blas_found):
         print_warn( 'No GPU BLAS library found' )
@@ -812,7 +1603,7 @@ def get_package( name, directories, repo_url, tar_url, tar_filename ):
         if (not interactive() or i in ('', 'y', 'yes')):
             cmd = 'git clone '+ repo_url +' '+ directory
             print_test( 'download: ' + cmd )
-            (err, stdout, stderr) = run( cmd )
+            (err, stdout, stderr) = run( cmd, kind='download' )
             print_result( 'download', err )
             if (not err):
                 return directory
@@ -981,6 +1772,9 @@ def parse_args():
                          help='Use ANSI colors: yes, no, or auto; default %(default)s.' )
     parser.add_argument( '--debug', action='store_true',
                          help='Enable debugging output.' )
+    parser.add_argument( '--no-cache', action='store_true',
+                         help='Re-run all probes, ignoring results cached'
+                             +' in config/cache.json.' )
     parser.add_argument( '-h', '--help', action='store_true',
                          help='Print help and exit.' )
     parser.add_argument( 'options', nargs=argparse.REMAINDER,
@@ -1007,6 +1801,7 @@ def parse_args():
         interactive( True )
 
     debug( opts.debug )
+    use_cache( not opts.no_cache )
 # end
 
 #-------------------------------------------------------------------------------
@@ -1015,7 +1810,7 @@ def init( namespace, prefix='/usr/local' ):
     Initializes config.
     Opens the logfile and deals with OS-specific issues.
     '''
-    global log, namespace_
+    global log, namespace_, timing_log
 
     namespace_ = namespace
 
@@ -1027,6 +1822,7 @@ def init( namespace, prefix='/usr/local' ):
     logfile = 'config/log.txt'
     print( 'opening log file ' + logfile + '\n' )
     log = open( logfile, 'w' )
+    timing_log = open( 'config/log.jsonl', 'w' )
 
     #--------------------
     # Workaround if MacOS SIP may have prevented inheriting DYLD_LIBRARY_PATH.
@@ -0,0 +1,60 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+// Checks that the compiler can generate code for the instruction set
+// selected by -DISA_*, compiled with its -m flag, e.g.,
+//     CXX -mavx2 -DISA_AVX2 -c cpu_isa.cc
+// This is only compiled, not run, since the build host may lack the ISA.
+
+#include <immintrin.h>
+
+#if defined( ISA_SSE42 )
+    #ifndef __SSE4_2__
+        #error "SSE 4.2 not enabled"
+    #endif
+    unsigned isa_test( unsigned crc, unsigned x )
+    {
+        return _mm_crc32_u32( crc, x );
+    }
+
+#elif defined( ISA_AVX2 )
+    #ifndef __AVX2__
+        #error "AVX2 not enabled"
+    #endif
+    __m256i isa_test( __m256i x, __m256i y )
+    {
+        return _mm256_add_epi32( x, y );
+    }
+
+#elif defined( ISA_AVX512F )
+    #ifndef __AVX512F__
+        #error "AVX-512F not enabled"
+    #endif
+    __m512d isa_test( __m512d x, __m512d y )
+    {
+        return _mm512_add_pd( x, y );
+    }
+
+#elif defined( ISA_AVX512FP16 )
+    #ifndef __AVX512FP16__
+        #error "AVX-512-FP16 not enabled"
+    #endif
+    __m512h isa_test( __m512h x, __m512h y )
+    {
+        return _mm512_add_ph( x, y );
+    }
+
+#elif defined( ISA_AMX )
+    #ifndef __AMX_TILE__
+        #error "AMX not enabled"
+    #endif
+    void isa_test()
+    {
+        _tile_release();
+    }
+
+#else
+    #error "unknown ISA"
+#endif
@@ -77,6 +77,99 @@ def get_int_sizes():
     return int_sizes
 # end
 
+#-------------------------------------------------------------------------------
+def blas_symbols( env ):
+    '''
+    Returns (symbols, libs, complete) for the libraries in env's LIBS, where
+    symbols is the set of symbols defined in them, via
+    config.library_symbols(); libs is the list of library words; and complete
+    is whether all libraries were inspected (nm fails on linker scripts,
+    such as libm.so on some systems). symbols is None if no library
+    could be inspected or a library isn't found.
+
+    Ex: blas_symbols( {'LIBS': '-lopenblas'} )
+    returns ({'ddot_', 'openblas_get_config', ...}, ['-lopenblas'], True)
+    '''
+    config.environ.push( env )
+    found = config.find_libraries( config.environ['CXX'],
+                                   config.environ['LDFLAGS'],
+                                   config.environ['LIBS'] )
+    config.environ.pop()
+
+    symbols  = None
+    complete = True
+    for (word, path) in found:
+        if (path is None):
+            return (None, [], False)
+        syms = config.library_symbols( path )
+        if (syms is None):
+            complete = False
+        else:
+            symbols = (symbols or set()) | syms
+    # end
+    return (symbols, [ word for (word, path) in found ], complete)
+# end
+
+#-------------------------------------------------------------------------------
+# Mangling define => ddot symbol, for mangling_from_symbols().
+mangling_symbols = [
+    ('FORTRAN_ADD_',  'ddot_'),
+    ('FORTRAN_LOWER', 'ddot' ),
+    ('FORTRAN_UPPER', 'DDOT' ),
+]
+
+def mangling_from_symbols( env, manglings, int_sizes ):
+    '''
+    Fast path for compile_with_manglings(): inspects the symbols exported
+    by the libraries in env, instead of compiling and running a test for
+    each mangling and integer size.
+    Narrows manglings to the first whose ddot symbol exists, and int_sizes
+    by ILP64 markers in library names:
+        ilp64 or 6464 (e.g., -lmkl_gf_ilp64, -lessl6464) => int64;
+        lp64 (e.g., -lmkl_gf_lp64) or -lessl             => int.
+    Otherwise, int size is found by running, as before.
+    Returns (manglings, int_sizes), which are both empty if the libraries
+    don't have ddot, or unchanged if that can't be determined,
+    e.g., nm isn't available or no libraries are given.
+
+    Ex: mangling_from_symbols( {'LIBS': '-lopenblas'}, manglings, int_sizes )
+    returns (['-D<name>_FORTRAN_ADD_'], ['', '-D<name>_ILP64'])
+    '''
+    (symbols, libs, complete) = blas_symbols( env )
+    if (symbols is None):
+        return (manglings, int_sizes)
+
+    symbol_map = { define( name ): sym for (name, sym) in mangling_symbols
+                   if (sym in symbols) }
+    found = [ m for m in manglings if (m in symbol_map) ]
+    if (not found):
+        if (complete):
+            if ('ddot_64_' in symbols):
+                print_msg( '    nm: only ddot_64_ found; '
+                           + 'suffixed ILP64 symbols are not supported' )
+            else:
+                print_msg( '    nm: ddot not found' )
+            return ([], [])
+        return (manglings, int_sizes)
+    # end
+
+    symbol = symbol_map[ found[0] ]
+    lib_names = ' '.join( libs )
+    ilp64 = define('ILP64')
+    if (re.search( r'ilp64|6464', lib_names )):
+        sizes = [ ilp64 ]
+    elif (re.search( r'lp64|-lessl\b', lib_names )):
+        sizes = [ '' ]
+    else:
+        sizes = [ '', ilp64 ]
+    sizes = [ size for size in int_sizes if (size in sizes) ]
+
+    print_msg( '    nm: ' + symbol + '; int sizes: '
+               + (', '.join( [ 'int64' if size else 'int' for size in sizes ] )
+                  or 'none') )
+    return (found[ 0:1 ], sizes)
+# end
+
 #-------------------------------------------------------------------------------
 def compile_with_manglings( src, env, manglings, int_sizes ):
     '''
@@ -134,12 +227,17 @@ def blas():
     Checks FORTRAN_ADD_, FORTRAN_LOWER, FORTRAN_UPPER.
     Checks int (LP64) and int64 (ILP64).
     Setting one or more of:
-        blas = {mkl, acml, essl, openblas, accelerate, generic};
+        blas = {mkl, acml, essl, openblas, accelerate, generic, fastest};
         blas_int = {int, int64};
-        blas_threaded = {y, n};
+        blas_threaded = {y, n, measure};
+        blas_workload = {large, batch, balanced};
         blas_fortran = {gfortran, ifort};
         fortran_mangling = {add_, lower, upper}
     in the environment or on the command line, limits the search space.
+    With blas=fastest, all libraries that pass are benchmarked and the
+    fastest is chosen; see blas_fastest().
+    With blas_threaded=measure, threaded and sequential variants of a
+    library are benchmarked and chosen by blas_workload; see blas_threads().
     '''
     print_header( 'BLAS library' )
     print_msg( 'Also detects Fortran name mangling and BLAS integer size.' )
@@ -151,6 +249,7 @@ def blas():
     blas_fortran   = config.environ['blas_fortran'].lower()
     blas_int       = config.environ['blas_int'].lower()
     blas_threaded  = config.environ['blas_threaded'].lower()
+    blas_workload  = config.environ['blas_workload'].lower()
 
     #-------------------- BLAS_LIBRARIES
     # If testing BLAS_LIBRARIES, ignore other flags (blas, ...).
@@ -166,6 +265,11 @@ def blas():
              + "test_blas_libraries = ", test_blas_libraries, "\n" )
 
     #-------------------- blas
+    # fastest can be combined with a list of libraries, e.g.,
+    # blas=fastest,openblas,mkl, to benchmark only those.
+    test_fastest = re.search( r'\b(fastest)\b', blas ) is not None
+    blas = re.sub( r'\bfastest\b', '', blas ).strip( ' ,' )
+
     test_all        = (not blas or blas == 'auto')
     test_acml       = re.search( r'\b(acml)\b',                blas ) is not None
     test_accelerate = re.search( r'\b(apple|accelerate)\b',    blas ) is not None
@@ -184,7 +288,8 @@ def blas():
              + "test_mkl            = ", test_mkl,            "\n"
              + "test_openblas       = ", test_openblas,       "\n"
              + "test_generic        = ", test_generic,        "\n"
-             + "test_all            = ", test_all,            "\n" )
+             + "test_all            = ", test_all,            "\n"
+             + "test_fastest        = ", test_fastest,        "\n" )
 
     #-------------------- blas_fortran
     test_gfortran = re.search( r'\b(gfortran)\b', blas_fortran ) is not None
@@ -211,16 +316,26 @@ def blas():
              + "test_int64          = ", test_int64,   "\n" )
 
     #-------------------- blas_threaded
+    # measure tests both, then benchmarks them; see blas_threads().
+    test_measure    = (blas_threaded == 'measure')
     test_threaded   = re.search( r'\b(y|yes|true|on|1)\b',  blas_threaded ) is not None
     test_sequential = re.search( r'\b(n|no|false|off|0)\b', blas_threaded ) is not None
-    if (not blas_threaded or blas_threaded == 'auto'):
+    if (not blas_threaded or blas_threaded in ('auto', 'measure')):
         test_threaded   = True
         test_sequential = True
 
+    if (not blas_workload):
+        blas_workload = 'balanced'
+    if (blas_workload not in ('large', 'batch', 'balanced')):
+        raise Error( "Unknown blas_workload '" + blas_workload
+                     + "'; expected large, batch, or balanced." )
+
     if (config.debug()):
         print( "blas_threaded       = '" + blas_threaded + "'\n"
              + "test_threaded       = ", test_threaded,     "\n"
-             + "test_sequential     = ", test_sequential,   "\n" )
+             + "test_sequential     = ", test_sequential,   "\n"
+             + "test_measure        = ", test_measure,      "\n"
+             + "blas_workload       = '" + blas_workload + "'\n" )
 
     #----------------------------------------
     # Build list of libraries to check.
@@ -371,24 +486,224 @@ def blas():
     int_sizes = get_int_sizes()
     passed = []
     print_subhead( 'BLAS (ddot) in:' )
-    for (label, env) in choices:
+
+    def probe( label, env ):
         title = label
         if ('LIBS' in env):
             title += '\n    ' + env['LIBS']
         print_subhead( title )
-        (rc, out, err, env2) = compile_with_manglings(
-            'config/blas.cc', env, manglings, int_sizes )
+        (m, i) = mangling_from_symbols( env, manglings, int_sizes )
+        if (not (m and i)):
+            return (-1, '', '', env)
+        result = compile_with_manglings( 'config/blas.cc', env, m, i )
+        if (result[0] != 0 and (m, i) != (manglings, int_sizes)):
+            # Confirmation failed; fall back to searching all.
+            result = compile_with_manglings(
+                'config/blas.cc', env, manglings, int_sizes )
+        return result
+    # end
+
+    # Choices are probed concurrently, but results and output come back
+    # in order, so the first choice that passes is preferred.
+    results = config.parallel_map( probe, choices )
+    for ((label, env), (rc, out, err, env2)) in zip( choices, results ):
         if (rc == 0):
             passed.append( (label, env2) )
-            if (not config.interactive()):
+            if (not (config.interactive() or test_fastest or test_measure)):
                 break
     # end
+    results.close()
+
+    if (test_measure and passed):
+        # Without fastest or interactive, only the first library is used,
+        # so measure only its variants.
+        all_families = test_fastest or config.interactive()
+        passed = blas_threads( passed, blas_workload, all_families )
+
+    if (test_fastest and passed):
+        passed = blas_fastest( passed )
 
     labels = map( lambda c: c[0], passed )
     i = config.choose( 'Choose BLAS library:', labels )
     config.environ.merge( passed[i][1] )
 # end blas
 
+#-------------------------------------------------------------------------------
+def blas_benchmark( env, src='config/blas_bench.cc' ):
+    '''
+    Builds and runs src, by default config/blas_bench.cc, a micro-benchmark
+    of dgemm, dgemv, and ddot, with the BLAS library in env.
+    Returns (score, rates), where rates is a list of (routine, n, gflops),
+    and score is their geometric mean in Gflop/s, or 0 if it failed
+    or src doesn't print a score.
+    '''
+    # Timings depend on this machine's load, so don't cache them.
+    use_cache = config.use_cache()
+    config.use_cache( False )
+    (rc, out, err) = config.compile_run( src, env )
+    config.use_cache( use_cache )
+
+    score = 0
+    rates = []
+    if (rc == 0):
+        for line in out.splitlines():
+            words = line.split()
+            if (len( words ) == 3):
+                rates.append( (words[0], words[1], float( words[2] )) )
+            elif (len( words ) == 2 and words[0] == 'score'):
+                score = float( words[1] )
+    return (score, rates)
+# end
+
+#-------------------------------------------------------------------------------
+def blas_fastest( passed ):
+    '''
+    For blas=fastest, benchmarks each BLAS library in passed, a list of
+    (label, env), with blas_benchmark(). Records the measurements in the
+    log and in make.inc comments (blas_benchmark variable).
+    In interactive mode, returns passed sorted fastest first, with rates
+    in the labels, for the user to choose; otherwise returns only the fastest.
+    Benchmarks are run serially, so they don't compete for the CPU.
+    '''
+    print_subhead( 'BLAS benchmark (Gflop/s):' )
+    results = []
+    comments = '# blas=fastest benchmark, Gflop/s (higher is better):\n'
+    for (label, env) in passed:
+        print_test( '    ' + label )
+        (score, rates) = blas_benchmark( env )
+        rates_txt = ', '.join( [ '%s %s: %.2f' % r for r in rates ] )
+        print_result( label, score == 0, '(%.2f)' % score )
+        if (rates_txt):
+            print_msg( '        ' + rates_txt )
+        comments += '#   %s: score %.2f; %s\n' % (label, score, rates_txt)
+        results.append( (score, label, env) )
+    # end
+
+    results.sort( key=lambda r: -r[0] )
+    (score, label, env) = results[0]
+    print_msg( 'Fastest BLAS: ' + label )
+    comments += '#   chose: ' + label + '\n'
+    config.environ['blas_benchmark'] = comments
+
+    if (config.interactive()):
+        return [ ('%s (%.2f Gflop/s)' % (label, score), env)
+                 for (score, label, env) in results ]
+    else:
+        return [ (label, env) ]
+# end
+
+#-------------------------------------------------------------------------------
+def threading_family( label ):
+    '''
+    Returns label without its threaded or sequential designation,
+    so variants of the same library compare equal.
+
+    Ex: threading_family( 'Intel MKL (int, GNU Fortran conventions, threaded)' )
+    returns 'Intel MKL (int, GNU Fortran conventions)'
+    '''
+    label = re.sub( r' \((threaded|sequential)\)', '', label )
+    label = re.sub( r', (threaded|sequential)\b',    '', label )
+    return label
+# end
+
+#-------------------------------------------------------------------------------
+def blas_threads( passed, workload, all_families=True ):
+    '''
+    For blas_threaded=measure, benchmarks the threaded and sequential
+    variants of each BLAS library in passed, a list of (label, env),
+    with config/blas_threads.cc on two workloads:
+        large: one large dgemm, where threaded BLAS usually wins;
+        batch: many small dgemm in an OpenMP loop, as in blas::batch::gemm,
+               where threaded BLAS can oversubscribe cores.
+    The variant chosen depends on workload:
+        large, batch: fastest on that workload;
+        balanced:     highest geometric mean of both.
+    Records the measurements in the log and in make.inc comments
+    (blas_threads variable).
+    Libraries with only one variant are not benchmarked. If all_families
+    is false, only variants of the first library in passed are measured.
+    In interactive mode, returns passed with each library's variants sorted
+    best first, with rates in the labels; otherwise returns passed with each
+    library's variants replaced by the chosen one.
+    '''
+    # Group variants by library, keeping the order that libraries passed.
+    families = []
+    variants = {}
+    for (label, env) in passed:
+        family = threading_family( label )
+        if (family not in variants):
+            families.append( family )
+            variants[ family ] = []
+        variants[ family ].append( (label, env) )
+    # end
+    if (not all_families):
+        families = families[ 0:1 ]
+
+    print_subhead( 'BLAS threaded vs. sequential, blas_workload=' + workload
+                   + ' (Gflop/s):' )
+    comments = ('# blas_threaded=measure, blas_workload=' + workload
+                + ', Gflop/s (higher is better):\n')
+    chosen = {}
+    for family in families:
+        if (len( variants[ family ] ) < 2):
+            print_msg( '    ' + family + ': only one variant; not measured' )
+            continue
+
+        results = []
+        for (label, env) in variants[ family ]:
+            print_test( '    ' + label )
+            (score, rates) = blas_benchmark( env, 'config/blas_threads.cc' )
+            rate = { r[0]: r[2] for r in rates }
+            large = rate.get( 'large', 0 )
+            batch = rate.get( 'batch', 0 )
+            if (workload == 'large'):
+                score = large
+            elif (workload == 'batch'):
+                score = batch
+            else:
+                score = (large * batch)**0.5
+            rates_txt = ', '.join( [ '%s %s: %.2f' % r for r in rates ] )
+            print_result( label, score == 0, '(%.2f)' % score )
+            if (rates_txt):
+                print_msg( '        ' + rates_txt )
+            comments += '#   %s: %s\n' % (label, rates_txt)
+            results.append( (score, label, env, large, batch) )
+        # end
+
+        # Report the tradeoff as threaded relative to sequential.
+        threaded   = [ r for r in results if 'threaded'   in r[1] ]
+        sequential = [ r for r in results if 'sequential' in r[1] ]
+        if (threaded and sequential and sequential[0][3] and sequential[0][4]):
+            tradeoff = ('threaded / sequential: large %.2fx, batch %.2fx'
+                        % (threaded[0][3] / sequential[0][3],
+                           threaded[0][4] / sequential[0][4]))
+            print_msg( '    ' + tradeoff )
+            comments += '#   ' + tradeoff + '\n'
+
+        results.sort( key=lambda r: -r[0] )
+        print_msg( 'Chose ' + results[0][1] )
+        comments += '#   chose: ' + results[0][1] + '\n'
+        if (config.interactive()):
+            chosen[ family ] = [
+                ('%s (large %.2f, batch %.2f Gflop/s)' % (label, large, batch), env)
+                for (score, label, env, large, batch) in results ]
+        else:
+            chosen[ family ] = [ results[0][1:3] ]
+    # end
+    config.environ['blas_threads'] = comments
+
+    # Replace measured variants, keeping other libraries in place.
+    result = []
+    for (label, env) in passed:
+        family = threading_family( label )
+        if (family not in chosen):
+            result.append( (label, env) )
+        elif (chosen[ family ]):
+            result.extend( chosen[ family ] )
+            chosen[ family ] = []
+    return result
+# end
+
 #-------------------------------------------------------------------------------
 def cblas():
     '''
@@ -668,6 +983,169 @@ def openblas_version():
         config.print_result( 'OpenBLAS', rc )
 # end
 
+#-------------------------------------------------------------------------------
+# OpenMP runtime library name prefixes => name used in defines.h.
+openmp_runtimes = [
+    ('libgomp',  'libgomp'),   # GNU
+    ('libiomp5', 'libiomp5'),  # Intel
+    ('libomp.',  'libomp'),    # LLVM
+    ('libxlsmp', 'libxlsmp'),  # IBM XL
+]
+
+def blas_threading():
+    '''
+    Detects how the BLAS library is threaded (sequential, openmp, pthreads,
+    or tbb) and which OpenMP runtimes are loaded, by running
+    config/blas_threading.cc. Warns if more than one OpenMP runtime is loaded
+    (e.g., libgomp from g++ and libiomp5 from mkl_intel_thread), since their
+    thread pools don't know about each other.
+    Records for "#undef" substitution in defines.h:
+        BLAS_THREADING          "sequential", "openmp", "pthreads", "tbb",
+                                or "unknown";
+        BLAS_OPENMP_RUNTIME     OpenMP runtime, e.g., "libgomp", if found;
+        BLAS_PIN_INNER_THREADS  if BLAS is threaded (or unknown) and OpenMP
+                                is used, so BLAS++ limits BLAS to one thread
+                                inside its own parallel regions, such as
+                                batch routines.
+    '''
+    print_header( 'BLAS threading' )
+    src = 'config/blas_threading.cc'
+    (rc, out, err) = config.compile_run( src, {}, 'BLAS threading layer' )
+    if (rc != 0):
+        # Older glibc has dlsym in libdl.
+        (rc, out, err) = config.compile_run( src, {'LIBS': '-ldl'},
+                                             'BLAS threading layer (-ldl)' )
+    if (rc != 0):
+        print_msg( 'Could not determine BLAS threading; check log.' )
+        return
+
+    libs = []
+    info = {}
+    for line in out.splitlines():
+        words = line.split( None, 1 )
+        if (len( words ) == 2 and words[0] == 'lib'):
+            libs.append( words[1] )
+        elif (len( words ) == 2):
+            info[ words[0] ] = words[1]
+    # end
+    names = [ os.path.basename( lib ) for lib in libs ]
+
+    runtimes = []
+    for (prefix, runtime) in openmp_runtimes:
+        if ([ name for name in names if name.startswith( prefix ) ]):
+            runtimes.append( runtime )
+    # end
+
+    def loaded( prefix ):
+        return [ name for name in names if name.startswith( prefix ) ] != []
+
+    threading = 'unknown'
+    if (loaded( 'libmkl_sequential' )):
+        threading = 'sequential'
+    elif (loaded( 'libmkl_gnu_thread' ) or loaded( 'libmkl_intel_thread' )):
+        threading = 'openmp'
+    elif (loaded( 'libmkl_tbb_thread' )):
+        threading = 'tbb'
+    elif ('openblas_parallel' in info):
+        threading = {'0': 'sequential', '1': 'pthreads',
+                     '2': 'openmp'}.get( info['openblas_parallel'], 'unknown' )
+    elif ('blis_openmp' in info or 'blis_pthreads' in info):
+        if (info.get( 'blis_openmp' ) == '1'):
+            threading = 'openmp'
+        elif (info.get( 'blis_pthreads' ) == '1'):
+            threading = 'pthreads'
+        else:
+            threading = 'sequential'
+    elif (loaded( 'libesslsmp' ) or loaded( 'libacml_mp' )):
+        threading = 'openmp'
+    elif (loaded( 'libessl' ) or loaded( 'libacml' )):
+        threading = 'sequential'
+    else:
+        # E.g., Debian's /usr/lib/.../openblas-pthread/libblas.so.3
+        for lib in libs:
+            s = re.search( r'openblas-(pthread|openmp|serial)', lib )
+            if (s):
+                threading = {'pthread': 'pthreads', 'openmp': 'openmp',
+                             'serial': 'sequential'}[ s.group(1) ]
+                break
+    # end
+
+    print_msg( '    BLAS threading:  ' + threading )
+    print_msg( '    OpenMP runtimes: ' + (', '.join( runtimes ) or 'none') )
+    config.defines[ 'BLAS_THREADING' ] = '"' + threading + '"'
+    if (runtimes):
+        config.defines[ 'BLAS_OPENMP_RUNTIME' ] = '"' + runtimes[0] + '"'
+
+    if (len( runtimes ) > 1):
+        print_warn( 'Multiple OpenMP runtimes are loaded: '
+                    + ', '.join( runtimes ) + '. They may oversubscribe cores'
+                    + ' or conflict; link BLAS with the OpenMP runtime of'
+                    + ' the compiler (e.g., -lmkl_gnu_thread with g++).' )
+
+    has_openmp = config.environ['HAS_OPENMP']
+    if (has_openmp and threading != 'sequential'):
+        config.defines[ 'BLAS_PIN_INNER_THREADS' ] = ''
+        flags = config.environ['CXXFLAGS']
+        if (not re.search( r'HAVE_(MKL|OPENBLAS)\b', flags )
+                and threading != 'openmp'):
+            print_warn( 'BLAS is threaded (' + threading + '), but BLAS++ can'
+                        + ' set its number of threads only for MKL and'
+                        + ' OpenBLAS. Inside BLAS++ batch routines, BLAS'
+                        + ' threads may oversubscribe cores; consider'
+                        + ' sequential BLAS, or setting, e.g.,'
+                        + ' OPENBLAS_NUM_THREADS=1.' )
+# end
+
+#-------------------------------------------------------------------------------
+# Header for checks of vendor CBLAS batch routines.
+cblas_batch_header = 'CBLAS batch routines'
+
+#-------------------------------------------------------------------------------
+def cblas_gemm_batch():
+    '''
+    Check for group batched gemm, cblas_[sdcz]gemm_batch, in found BLAS
+    library (MKL, OpenBLAS >= 0.3.27). If found, blas::batch::gemm on the CPU
+    groups items with identical parameters and calls it, instead of
+    looping over blas::gemm.
+    '''
+    print_header( cblas_batch_header )
+    (rc, out, err) = config.compile_run( 'config/cblas_gemm_batch.cc', {},
+                                         'CBLAS batched gemm (cblas_dgemm_batch) in BLAS library' )
+    if (rc == 0):
+        config.environ.append( 'CXXFLAGS', define('HAVE_CBLAS_GEMM_BATCH') )
+# end
+
+#-------------------------------------------------------------------------------
+def cblas_batch_strided():
+    '''
+    Check for strided batched gemm and trsm, cblas_[sdcz]gemm_batch_strided
+    and cblas_[sdcz]trsm_batch_strided, in found BLAS library (MKL).
+    If found, blas::batch::gemm_strided and trsm_strided call them,
+    instead of looping over blas::gemm and blas::trsm.
+    Shares the header of cblas_gemm_batch(), if run right after it.
+    '''
+    if (not config.sections_ or config.sections_[-1][0] != cblas_batch_header):
+        print_header( cblas_batch_header )
+    (rc, out, err) = config.compile_run( 'config/cblas_gemm_batch_strided.cc', {},
+                                         'CBLAS strided batched gemm (cblas_dgemm_batch_strided) in BLAS library' )
+    if (rc == 0):
+        config.environ.append( 'CXXFLAGS', define('HAVE_CBLAS_GEMM_BATCH_STRIDED') )
+
+    (rc, out, err) = config.compile_run( 'config/cblas_trsm_batch_strided.cc', {},
+                                         'CBLAS strided batched trsm (cblas_dtrsm_batch_strided) in BLAS library' )
+    if (rc == 0):
+        config.environ.append( 'CXXFLAGS', define('HAVE_CBLAS_TRSM_BATCH_STRIDED') )
+# end
+
+#-------------------------------------------------------------------------------
+# Symbol that identifies each vendor's library => function to get its version.
+vendor_symbols = [
+    ('MKL_Get_Version',     mkl_version),
+    ('acmlversion',         acml_version),
+    ('iessl',               essl_version),
+    ('openblas_get_config', openblas_version),
+]
+
 #-------------------------------------------------------------------------------
 def vendor_version():
     '''
@@ -688,9 +1166,14 @@ def vendor_version():
     elif ('-framework Accelerate' in LIBS):
         pass
     else:
-        mkl_version()
-        acml_version()
-        essl_version()
-        openblas_version()
+        # E.g., -lblas may be OpenBLAS or MKL installed as the system BLAS,
+        # so check the vendor's symbols to know which version to get.
+        (symbols, libs, complete) = blas_symbols( {} )
+        vendors = [ func for (sym, func) in vendor_symbols
+                    if (symbols is not None and sym in symbols) ]
+        if (not vendors and not (symbols is not None and complete)):
+            vendors = [ func for (sym, func) in vendor_symbols ]
+        for func in vendors:
+            func()
     # end
 # end
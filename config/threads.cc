@@ -0,0 +1,18 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include <thread>
+#include <stdio.h>
+
+int main()
+{
+    int result = 0;
+    std::thread thread( [&result]() { result = 42; } );
+    thread.join();
+    printf( "result %d\n", result );
+    if (result == 42)
+        printf( "ok\n" );
+    return (result == 42 ? 0 : 1);
+}
@@ -0,0 +1,176 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+// Benchmark of compiled kernels representative of BLAS++'s own code,
+// used by tune_flags to choose compiler optimization flags:
+//   axpy, dot: templated Level 1 loops, as in blas/axpy.hh, blas/dot.hh;
+//   gemv:      templated Level 2 loop, as in blas/gemv.hh;
+//   batch:     OpenMP loop over a batch of small problems, as in batch_*.cc.
+// Prints lines "kernel n gflops", then "score gflops",
+// the geometric mean of the rates.
+
+#include <stdio.h>
+#include <math.h>
+#include <stdint.h>
+#include <complex>
+#include <vector>
+#include <chrono>
+
+//------------------------------------------------------------------------------
+// Prevents the compiler from optimizing away results.
+volatile double sink = 0;
+
+//------------------------------------------------------------------------------
+// Returns seconds per call of f, the best of 3 rounds that each repeat
+// until at least 0.05 s elapses, to reduce noise from other processes.
+// The first call is a warmup and isn't timed.
+template <typename Func>
+double time_call( Func f )
+{
+    using clock = std::chrono::steady_clock;
+    f();
+    double best = 0;
+    for (int round = 0; round < 3; ++round) {
+        int count = 0;
+        auto start = clock::now();
+        double elapsed = 0;
+        do {
+            f();
+            ++count;
+            elapsed = std::chrono::duration<double>( clock::now() - start ).count();
+        } while (elapsed < 0.05);
+        if (round == 0 || elapsed / count < best)
+            best = elapsed / count;
+    }
+    return best;
+}
+
+//------------------------------------------------------------------------------
+template <typename T>
+void axpy( int64_t n, T alpha, T const* x, int64_t incx, T* y, int64_t incy )
+{
+    if (incx == 1 && incy == 1) {
+        for (int64_t i = 0; i < n; ++i)
+            y[i] += alpha*x[i];
+    }
+    else {
+        int64_t ix = (incx > 0 ? 0 : (-n + 1)*incx);
+        int64_t iy = (incy > 0 ? 0 : (-n + 1)*incy);
+        for (int64_t i = 0; i < n; ++i) {
+            y[iy] += alpha * x[ix];
+            ix += incx;
+            iy += incy;
+        }
+    }
+}
+
+//------------------------------------------------------------------------------
+template <typename T>
+T dot( int64_t n, T const* x, int64_t incx, T const* y, int64_t incy )
+{
+    T result = 0;
+    if (incx == 1 && incy == 1) {
+        for (int64_t i = 0; i < n; ++i)
+            result += std::conj( x[i] ) * y[i];
+    }
+    else {
+        int64_t ix = (incx > 0 ? 0 : (-n + 1)*incx);
+        int64_t iy = (incy > 0 ? 0 : (-n + 1)*incy);
+        for (int64_t i = 0; i < n; ++i) {
+            result += std::conj( x[ix] ) * y[iy];
+            ix += incx;
+            iy += incy;
+        }
+    }
+    return result;
+}
+
+//------------------------------------------------------------------------------
+// y += alpha A x, column-major A.
+template <typename T>
+void gemv( int64_t m, int64_t n, T alpha, T const* A, int64_t lda,
+           T const* x, T* y )
+{
+    for (int64_t j = 0; j < n; ++j) {
+        T tmp = alpha*x[j];
+        for (int64_t i = 0; i < m; ++i)
+            y[i] += tmp * A[i + j*lda];
+    }
+}
+
+//------------------------------------------------------------------------------
+// C += A B, column-major.
+template <typename T>
+void gemm( int64_t n, T const* A, T const* B, T* C )
+{
+    for (int64_t j = 0; j < n; ++j) {
+        for (int64_t l = 0; l < n; ++l) {
+            T tmp = B[l + j*n];
+            for (int64_t i = 0; i < n; ++i)
+                C[i + j*n] += A[i + l*n] * tmp;
+        }
+    }
+}
+
+//------------------------------------------------------------------------------
+int main()
+{
+    double log_sum = 0;
+    int ntests = 0;
+    auto report = [&]( const char* kernel, int64_t n, double gflops ) {
+        printf( "%s %lld %.3f\n", kernel, (long long) n, gflops );
+        log_sum += log( gflops );
+        ++ntests;
+    };
+
+    // complex axpy, flops = 8 n
+    {
+        typedef std::complex<float> T;
+        int64_t n = 100000;
+        std::vector<T> x( n, T( 0.5, 0.25 ) ), y( n, 0 );
+        double t = time_call( [&]() {
+            axpy( n, T( 1e-3, 1e-3 ), x.data(), 1, y.data(), 1 );
+        });
+        report( "caxpy", n, 8. * n / t * 1e-9 );
+    }
+
+    // complex dot, flops = 8 n
+    {
+        typedef std::complex<double> T;
+        int64_t n = 100000;
+        std::vector<T> x( n, T( 0.5, 0.25 ) ), y( n, T( 0.25, 0.5 ) );
+        double t = time_call( [&]() {
+            sink = std::real( dot( n, x.data(), 1, y.data(), 1 ) );
+        });
+        report( "zdot", n, 8. * n / t * 1e-9 );
+    }
+
+    // double gemv, flops = 2 n^2
+    {
+        int64_t n = 1000;
+        std::vector<double> A( n*n, 0.5 ), x( n, 0.25 ), y( n, 0 );
+        double t = time_call( [&]() {
+            gemv( n, n, 1e-3, A.data(), n, x.data(), y.data() );
+        });
+        report( "dgemv", n, 2. * n * n / t * 1e-9 );
+    }
+
+    // batch of small double gemm, flops = 2 n^3 batch
+    {
+        int64_t n = 16, batch = 1000;
+        std::vector<double> A( n*n*batch, 0.5 ), B( n*n*batch, 0.25 ),
+                            C( n*n*batch, 0 );
+        double t = time_call( [&]() {
+            #pragma omp parallel for schedule( dynamic )
+            for (int64_t i = 0; i < batch; ++i) {
+                gemm( n, &A[ i*n*n ], &B[ i*n*n ], &C[ i*n*n ] );
+            }
+        });
+        report( "batch_dgemm", n, 2. * n * n * n * batch / t * 1e-9 );
+    }
+
+    printf( "score %.3f\n", exp( log_sum / ntests ) );
+    return 0;
+}
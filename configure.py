@@ -58,12 +58,23 @@ def main():
    #config.prog_cxx_flag( '-Werror' )
 
     config.openmp()
+    config.threads()
+
+    # Optional: tune_flags=1 benchmarks -O3, -march=native, etc.
+    # Done after OpenMP, since batch kernels use it, and before other probes,
+    # so they are compiled with the chosen flags.
+    config.tune_cxx_flags( 'config/tune_flags.cc' )
+
+    config.cpu_isa()
 
     config.lapack.blas()
     print()
     config.lapack.blas_float_return()
     config.lapack.blas_complex_return()
     config.lapack.vendor_version()
+    config.lapack.blas_threading()
+    config.lapack.cblas_gemm_batch()
+    config.lapack.cblas_batch_strided()
 
     # Must test mkl_version before cblas and lapacke, to define HAVE_MKL.
     try:
@@ -89,6 +100,8 @@ def main():
 
     config.extract_defines_from_flags( 'CXXFLAGS', 'blaspp_header_defines' )
     config.output_files( ['make.inc', 'include/blas/defines.h'] )
+    config.print_timing_summary()
+    config.print_cache_summary()
     print( 'log in config/log.txt' )
 
     print( '-'*80 )
@@ -8,6 +8,9 @@
 
 #include "blas/defines.h"
 
+#include <cstdint>
+#include <limits>
+
 // Version is updated by make_release.py; DO NOT EDIT.
 // Version 2023.08.25
 #define BLASPP_VERSION 20230825
@@ -17,6 +20,69 @@ namespace blas {
 int blaspp_version();
 const char* blaspp_id();
 
+//------------------------------------------------------------------------------
+/// Vector instruction sets supported by the CPU and operating system
+/// that the code is running on; see cpu_features().
+struct CPUFeatures {
+    bool sse42      = false;  ///< SSE 4.2
+    bool avx2       = false;  ///< AVX2
+    bool avx512f    = false;  ///< AVX-512 Foundation
+    bool avx512fp16 = false;  ///< AVX-512 half precision (FP16) arithmetic
+    bool amx        = false;  ///< AMX tiles
+};
+
+const CPUFeatures& cpu_features();
+
+//------------------------------------------------------------------------------
+/// Host gemm, gemv, and axpy with all dimensions at most small_size()
+/// use built-in kernels instead of calling the vendor BLAS, whose fixed
+/// per-call overhead dominates tiny problems; see set_small_size().
+int64_t small_size();
+void set_small_size( int64_t size );
+
+//------------------------------------------------------------------------------
+/// Opt-in tracing of host BLAS calls, for profiling which routines and
+/// shapes an application uses; see trace::set_enabled() and trace::flush(),
+/// or set environment variable BLASPP_TRACE=trace.json.
+namespace trace {
+
+bool enabled();
+void set_enabled( bool enabled );
+void flush( const char* filename = nullptr );
+void clear();
+
+}  // namespace trace
+
+namespace batch {
+
+//------------------------------------------------------------------------------
+/// Scheduling policy for CPU batch routines; see batch::set_policy().
+/// It doesn't apply when a batch routine calls the vendor's batched
+/// routine instead, which schedules items and threads itself:
+/// batch::gemm with cblas_?gemm_batch (MKL, OpenBLAS >= 0.3.27), and
+/// batch::gemm_strided and trsm_strided with cblas_?gemm_batch_strided
+/// and cblas_?trsm_batch_strided (MKL).
+struct Policy {
+    /// Items with at least this many Gflop are large: they run one after
+    /// another, each using all threads of a threaded BLAS. Smaller items
+    /// run in parallel; BLAS++ limits MKL and OpenBLAS to one thread
+    /// for them, while other threaded BLAS may oversubscribe cores.
+    /// Infinity runs all items in parallel. The initial policy
+    /// (see get_policy) uses 0.25 Gflop (about a 500^3 dgemm) if BLAS is
+    /// threaded, as detected by configure or, for MKL and OpenBLAS,
+    /// at runtime; otherwise, and in a default-constructed Policy, infinity.
+    double large_gflop = std::numeric_limits<double>::infinity();
+
+    /// Whether to start small items in order of decreasing flops,
+    /// so long items don't end up last on one thread.
+    bool sort = true;
+};
+
+const Policy& get_policy();
+void set_policy( const Policy& policy );
+
+}  // namespace batch
+
 }  // namespace blas
 
 #include "blas/wrappers.hh"
@@ -21,6 +21,20 @@ T extract(std::vector<T> const &ivector, const int64_t index)
     return (ivector.size() == 1) ? ivector[0] : ivector[index];
 }
 
+// -----------------------------------------------------------------------------
+/// @return true if every vector has one entry, so all batch items share the
+/// same parameters (a uniform batch). A uniform batch's parameters need to
+/// be checked only once, and its per-item loop extracts only the pointers.
+///
+/// Ex:
+///     if (is_uniform( transA, transB, m, n, k, lda, ldb, ldc )) { ... }
+///
+template <typename... Vectors>
+bool is_uniform(Vectors const&... params)
+{
+    return ((params.size() == 1) && ...);
+}
+
 // -----------------------------------------------------------------------------
 // batch gemm check
 template <typename T>
@@ -70,16 +84,20 @@ void gemm_check(
                 )
              );
 
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( transA, transB, m, n, k, lda, ldb, ldc );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
     int64_t* internal_info;
     if (info.size() == 1) {
-        internal_info = new int64_t[batchCount];
+        internal_info = new int64_t[ncheck];
     }
     else {
         internal_info = &info[0];
     }
 
     #pragma omp parallel for schedule(dynamic)
-    for (size_t i = 0; i < batchCount; ++i) {
+    for (size_t i = 0; i < ncheck; ++i) {
         Op transA_ = extract<Op>(transA, i);
         Op transB_ = extract<Op>(transB, i);
 
@@ -114,11 +132,16 @@ void gemm_check(
         else if (ldc_ < nrowC_) internal_info[i] = -14;
     }
 
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
     if (info.size() == 1) {
         // do a reduction that finds the first argument to encounter an error
         int64_t lerror = INTERNAL_INFO_DEFAULT;
         #pragma omp parallel for reduction(max:lerror)
-        for (size_t i = 0; i < batchCount; ++i) {
+        for (size_t i = 0; i < ncheck; ++i) {
             if (internal_info[i] == 0)
                 continue;    // skip problems that passed error checks
             lerror = std::max(lerror, internal_info[i]);
@@ -186,16 +209,20 @@ void trsm_check(
                                       alpha.size() > 1 || A.size()    > 1 ||
                                       lda.size()   > 1 || ldb.size()  > 1 ));
 
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( side, uplo, trans, diag, m, n, lda, ldb );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
     int64_t* internal_info;
     if (info.size() == 1) {
-        internal_info = new int64_t[batchCount];
+        internal_info = new int64_t[ncheck];
     }
     else {
         internal_info = &info[0];
     }
 
     #pragma omp parallel for schedule(dynamic)
-    for (size_t i = 0; i < batchCount; ++i) {
+    for (size_t i = 0; i < ncheck; ++i) {
         Side  side_ = extract<Side>( side,  i );
         Uplo  uplo_ = extract<Uplo>( uplo,  i );
         Op   trans_ = extract<Op  >( trans, i );
@@ -229,11 +256,16 @@ void trsm_check(
         else if (ldb_ < nrowB_) internal_info[i] = -12;
     }
 
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
     if (info.size() == 1) {
         // do a reduction that finds the first argument to encounter an error
         int64_t lerror = INTERNAL_INFO_DEFAULT;
         #pragma omp parallel for reduction(max:lerror)
-        for (size_t i = 0; i < batchCount; ++i) {
+        for (size_t i = 0; i < ncheck; ++i) {
             if (internal_info[i] == 0)
                 continue;    // skip problems that passed error checks
             lerror = std::max(lerror, internal_info[i]);
@@ -301,16 +333,20 @@ void trmm_check(
                                       alpha.size() > 1 || A.size()    > 1 ||
                                       lda.size()   > 1 || ldb.size()  > 1 ));
 
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( side, uplo, trans, diag, m, n, lda, ldb );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
     int64_t* internal_info;
     if (info.size() == 1) {
-        internal_info = new int64_t[batchCount];
+        internal_info = new int64_t[ncheck];
     }
     else {
         internal_info = &info[0];
     }
 
     #pragma omp parallel for schedule(dynamic)
-    for (size_t i = 0; i < batchCount; ++i) {
+    for (size_t i = 0; i < ncheck; ++i) {
         Side  side_ = extract<Side>( side,  i );
         Uplo  uplo_ = extract<Uplo>( uplo,  i );
         Op   trans_ = extract<Op  >( trans, i );
@@ -344,11 +380,16 @@ void trmm_check(
         else if (ldb_ < nrowB_) internal_info[i] = -12;
     }
 
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
     if (info.size() == 1) {
         // do a reduction that finds the first argument to encounter an error
         int64_t lerror = INTERNAL_INFO_DEFAULT;
         #pragma omp parallel for reduction(max:lerror)
-        for (size_t i = 0; i < batchCount; ++i) {
+        for (size_t i = 0; i < ncheck; ++i) {
             if (internal_info[i] == 0)
                 continue;    // skip problems that passed error checks
             lerror = std::max(lerror, internal_info[i]);
@@ -431,16 +472,20 @@ void hemm_check(
                    beta.size()  > 1 ||
                    ldc.size()   > 1 ));
 
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( side, uplo, m, n, lda, ldb, ldc );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
     int64_t* internal_info;
     if (info.size() == 1) {
-        internal_info = new int64_t[batchCount];
+        internal_info = new int64_t[ncheck];
     }
     else {
         internal_info = &info[0];
     }
 
     #pragma omp parallel for schedule(dynamic)
-    for (size_t i = 0; i < batchCount; ++i) {
+    for (size_t i = 0; i < ncheck; ++i) {
         Side  side_ = extract<Side>( side, i );
         Uplo  uplo_ = extract<Uplo>( uplo, i );
 
@@ -469,11 +514,16 @@ void hemm_check(
         else if (ldc_ < nrowC_) internal_info[i] = -13;
     }
 
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
     if (info.size() == 1) {
         // do a reduction that finds the first argument to encounter an error
         int64_t lerror = INTERNAL_INFO_DEFAULT;
         #pragma omp parallel for reduction(max:lerror)
-        for (size_t i = 0; i < batchCount; ++i) {
+        for (size_t i = 0; i < ncheck; ++i) {
             if (internal_info[i] == 0)
                 continue;    // skip problems that passed error checks
             lerror = std::max(lerror, internal_info[i]);
@@ -546,16 +596,20 @@ void herk_check(
                    beta.size()  > 1 ||
                    ldc.size()   > 1 ));
 
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( uplo, trans, n, k, lda, ldc );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
     int64_t* internal_info;
     if (info.size() == 1) {
-        internal_info = new int64_t[batchCount];
+        internal_info = new int64_t[ncheck];
     }
     else {
         internal_info = &info[0];
     }
 
     #pragma omp parallel for schedule(dynamic)
-    for (size_t i = 0; i < batchCount; ++i) {
+    for (size_t i = 0; i < ncheck; ++i) {
         Uplo  uplo_ = extract<Uplo>( uplo,  i );
         Op   trans_ = extract<Op>  ( trans, i );
 
@@ -580,11 +634,16 @@ void herk_check(
         else if (ldc_ < n_) internal_info[i] = -11;
     }
 
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
     if (info.size() == 1) {
         // do a reduction that finds the first argument to encounter an error
         int64_t lerror = INTERNAL_INFO_DEFAULT;
         #pragma omp parallel for reduction(max:lerror)
-        for (size_t i = 0; i < batchCount; ++i) {
+        for (size_t i = 0; i < ncheck; ++i) {
             if (internal_info[i] == 0)
                 continue;    // skip problems that passed error checks
             lerror = std::max(lerror, internal_info[i]);
@@ -676,16 +735,20 @@ void syrk_check(
                    beta.size()  > 1 ||
                    ldc.size()   > 1 ));
 
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( uplo, trans, n, k, lda, ldc );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
     int64_t* internal_info;
     if (info.size() == 1) {
-        internal_info = new int64_t[batchCount];
+        internal_info = new int64_t[ncheck];
     }
     else {
         internal_info = &info[0];
     }
 
     #pragma omp parallel for schedule(dynamic)
-    for (size_t i = 0; i < batchCount; ++i) {
+    for (size_t i = 0; i < ncheck; ++i) {
         Uplo  uplo_ = extract<Uplo>( uplo,  i );
         Op   trans_ = extract<Op>  ( trans, i );
 
@@ -710,11 +773,16 @@ void syrk_check(
         else if (ldc_ < n_) internal_info[i] = -11;
     }
 
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
     if (info.size() == 1) {
         // do a reduction that finds the first argument to encounter an error
         int64_t lerror = INTERNAL_INFO_DEFAULT;
         #pragma omp parallel for reduction(max:lerror)
-        for (size_t i = 0; i < batchCount; ++i) {
+        for (size_t i = 0; i < ncheck; ++i) {
             if (internal_info[i] == 0)
                 continue;    // skip problems that passed error checks
             lerror = std::max(lerror, internal_info[i]);
@@ -798,16 +866,20 @@ void her2k_check(
                    beta.size()  > 1 ||
                    ldc.size()   > 1 ));
 
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( uplo, trans, n, k, lda, ldb, ldc );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
     int64_t* internal_info;
     if (info.size() == 1) {
-        internal_info = new int64_t[batchCount];
+        internal_info = new int64_t[ncheck];
     }
     else {
         internal_info = &info[0];
     }
 
     #pragma omp parallel for schedule(dynamic)
-    for (size_t i = 0; i < batchCount; ++i) {
+    for (size_t i = 0; i < ncheck; ++i) {
         Uplo  uplo_ = extract<Uplo>( uplo,  i );
         Op   trans_ = extract<Op>  ( trans, i );
 
@@ -835,11 +907,16 @@ void her2k_check(
         else if (ldc_ < n_) internal_info[i] = -13;
     }
 
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
     if (info.size() == 1) {
         // do a reduction that finds the first argument to encounter an error
         int64_t lerror = INTERNAL_INFO_DEFAULT;
         #pragma omp parallel for reduction(max:lerror)
-        for (size_t i = 0; i < batchCount; ++i) {
+        for (size_t i = 0; i < ncheck; ++i) {
             if (internal_info[i] == 0)
                 continue;    // skip problems that passed error checks
             lerror = std::max(lerror, internal_info[i]);
@@ -923,16 +1000,20 @@ void syr2k_check(
                    beta.size()  > 1 ||
                    ldc.size()   > 1 ));
 
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( uplo, trans, n, k, lda, ldb, ldc );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
     int64_t* internal_info;
     if (info.size() == 1) {
-        internal_info = new int64_t[batchCount];
+        internal_info = new int64_t[ncheck];
     }
     else {
         internal_info = &info[0];
     }
 
     #pragma omp parallel for schedule(dynamic)
-    for (size_t i = 0; i < batchCount; ++i) {
+    for (size_t i = 0; i < ncheck; ++i) {
         Uplo  uplo_ = extract<Uplo>( uplo,  i );
         Op   trans_ = extract<Op>  ( trans, i );
 
@@ -960,11 +1041,534 @@ void syr2k_check(
         else if (ldc_ < n_) internal_info[i] = -13;
     }
 
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
+    if (info.size() == 1) {
+        // do a reduction that finds the first argument to encounter an error
+        int64_t lerror = INTERNAL_INFO_DEFAULT;
+        #pragma omp parallel for reduction(max:lerror)
+        for (size_t i = 0; i < ncheck; ++i) {
+            if (internal_info[i] == 0)
+                continue;    // skip problems that passed error checks
+            lerror = std::max(lerror, internal_info[i]);
+        }
+        info[0] = (lerror == INTERNAL_INFO_DEFAULT) ? 0 : lerror;
+
+        // delete the internal vector
+        delete[] internal_info;
+
+        // throw an exception if needed
+        blas_error_if_msg( info[0] != 0, "info = %lld", llong( info[0] ) );
+    }
+    else {
+        int64_t info_ = 0;
+        #pragma omp parallel for reduction(+:info_)
+        for (size_t i = 0; i < batchCount; ++i) {
+            info_ += info[i];
+        }
+        blas_error_if_msg( info_ != 0, "One or more non-zero entry in vector info");
+    }
+}
+
+// -----------------------------------------------------------------------------
+// batch axpy check
+template <typename T>
+void axpy_check(
+        std::vector<int64_t> const &n,
+        std::vector<T >      const &alpha,
+        std::vector<T*>      const &x, std::vector<int64_t> const &incx,
+        std::vector<T*>      const &y, std::vector<int64_t> const &incy,
+        const size_t batchCount, std::vector<int64_t> &info)
+{
+    // size error checking
+    blas_error_if( (n.size()     != 1 && n.size()     != batchCount) );
+    blas_error_if( (alpha.size() != 1 && alpha.size() != batchCount) );
+    blas_error_if( (incx.size()  != 1 && incx.size()  != batchCount) );
+    blas_error_if( (incy.size()  != 1 && incy.size()  != batchCount) );
+
+    blas_error_if( (x.size() != 1 && x.size() < batchCount) );
+    blas_error_if( (y.size() < batchCount) );
+
+    blas_error_if( x.size() == 1 && (n.size() > 1 || incx.size() > 1) );
+    blas_error_if( y.size() == 1 &&
+               (n.size()    > 1 || alpha.size() > 1 ||
+                incx.size() > 1 || incy.size()  > 1 || x.size() > 1) );
+
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( n, incx, incy );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
+    int64_t* internal_info;
+    if (info.size() == 1) {
+        internal_info = new int64_t[ncheck];
+    }
+    else {
+        internal_info = &info[0];
+    }
+
+    #pragma omp parallel for schedule(dynamic)
+    for (size_t i = 0; i < ncheck; ++i) {
+        int64_t n_    = extract<int64_t>(n, i);
+        int64_t incx_ = extract<int64_t>(incx, i);
+        int64_t incy_ = extract<int64_t>(incy, i);
+
+        internal_info[i] = 0;
+        if (n_ < 0) internal_info[i] = -1;
+        else if (incx_ == 0) internal_info[i] = -4;
+        else if (incy_ == 0) internal_info[i] = -6;
+    }
+
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
+    if (info.size() == 1) {
+        // do a reduction that finds the first argument to encounter an error
+        int64_t lerror = INTERNAL_INFO_DEFAULT;
+        #pragma omp parallel for reduction(max:lerror)
+        for (size_t i = 0; i < ncheck; ++i) {
+            if (internal_info[i] == 0)
+                continue;    // skip problems that passed error checks
+            lerror = std::max(lerror, internal_info[i]);
+        }
+        info[0] = (lerror == INTERNAL_INFO_DEFAULT) ? 0 : lerror;
+
+        // delete the internal vector
+        delete[] internal_info;
+
+        // throw an exception if needed
+        blas_error_if_msg( info[0] != 0, "info = %lld", llong( info[0] ) );
+    }
+    else {
+        int64_t info_ = 0;
+        #pragma omp parallel for reduction(+:info_)
+        for (size_t i = 0; i < batchCount; ++i) {
+            info_ += info[i];
+        }
+        blas_error_if_msg( info_ != 0, "One or more non-zero entry in vector info");
+    }
+}
+
+// -----------------------------------------------------------------------------
+// batch dot check
+template <typename T>
+void dot_check(
+        std::vector<int64_t> const &n,
+        std::vector<T*>      const &x, std::vector<int64_t> const &incx,
+        std::vector<T*>      const &y, std::vector<int64_t> const &incy,
+        std::vector<T*>      const &result,
+        const size_t batchCount, std::vector<int64_t> &info)
+{
+    // size error checking
+    blas_error_if( (n.size()    != 1 && n.size()    != batchCount) );
+    blas_error_if( (incx.size() != 1 && incx.size() != batchCount) );
+    blas_error_if( (incy.size() != 1 && incy.size() != batchCount) );
+
+    blas_error_if( (x.size() != 1 && x.size() < batchCount) );
+    blas_error_if( (y.size() != 1 && y.size() < batchCount) );
+    // Each item writes its own result.
+    blas_error_if( (result.size() < batchCount) );
+
+    blas_error_if( x.size() == 1 && (n.size() > 1 || incx.size() > 1) );
+    blas_error_if( y.size() == 1 && (n.size() > 1 || incy.size() > 1) );
+
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( n, incx, incy );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
+    int64_t* internal_info;
+    if (info.size() == 1) {
+        internal_info = new int64_t[ncheck];
+    }
+    else {
+        internal_info = &info[0];
+    }
+
+    #pragma omp parallel for schedule(dynamic)
+    for (size_t i = 0; i < ncheck; ++i) {
+        int64_t n_    = extract<int64_t>(n, i);
+        int64_t incx_ = extract<int64_t>(incx, i);
+        int64_t incy_ = extract<int64_t>(incy, i);
+
+        internal_info[i] = 0;
+        if (n_ < 0) internal_info[i] = -1;
+        else if (incx_ == 0) internal_info[i] = -3;
+        else if (incy_ == 0) internal_info[i] = -5;
+    }
+
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
+    if (info.size() == 1) {
+        // do a reduction that finds the first argument to encounter an error
+        int64_t lerror = INTERNAL_INFO_DEFAULT;
+        #pragma omp parallel for reduction(max:lerror)
+        for (size_t i = 0; i < ncheck; ++i) {
+            if (internal_info[i] == 0)
+                continue;    // skip problems that passed error checks
+            lerror = std::max(lerror, internal_info[i]);
+        }
+        info[0] = (lerror == INTERNAL_INFO_DEFAULT) ? 0 : lerror;
+
+        // delete the internal vector
+        delete[] internal_info;
+
+        // throw an exception if needed
+        blas_error_if_msg( info[0] != 0, "info = %lld", llong( info[0] ) );
+    }
+    else {
+        int64_t info_ = 0;
+        #pragma omp parallel for reduction(+:info_)
+        for (size_t i = 0; i < batchCount; ++i) {
+            info_ += info[i];
+        }
+        blas_error_if_msg( info_ != 0, "One or more non-zero entry in vector info");
+    }
+}
+
+// -----------------------------------------------------------------------------
+// batch nrm2 check
+template <typename T>
+void nrm2_check(
+        std::vector<int64_t> const &n,
+        std::vector<T*>      const &x, std::vector<int64_t> const &incx,
+        std::vector< real_type<T>* > const &result,
+        const size_t batchCount, std::vector<int64_t> &info)
+{
+    // size error checking
+    blas_error_if( (n.size()    != 1 && n.size()    != batchCount) );
+    blas_error_if( (incx.size() != 1 && incx.size() != batchCount) );
+
+    blas_error_if( (x.size() != 1 && x.size() < batchCount) );
+    // Each item writes its own result.
+    blas_error_if( (result.size() < batchCount) );
+
+    blas_error_if( x.size() == 1 && (n.size() > 1 || incx.size() > 1) );
+
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( n, incx );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
+    int64_t* internal_info;
+    if (info.size() == 1) {
+        internal_info = new int64_t[ncheck];
+    }
+    else {
+        internal_info = &info[0];
+    }
+
+    #pragma omp parallel for schedule(dynamic)
+    for (size_t i = 0; i < ncheck; ++i) {
+        int64_t n_    = extract<int64_t>(n, i);
+        int64_t incx_ = extract<int64_t>(incx, i);
+
+        internal_info[i] = 0;
+        if (n_ < 0) internal_info[i] = -1;
+        else if (incx_ <= 0) internal_info[i] = -3;
+    }
+
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
+    if (info.size() == 1) {
+        // do a reduction that finds the first argument to encounter an error
+        int64_t lerror = INTERNAL_INFO_DEFAULT;
+        #pragma omp parallel for reduction(max:lerror)
+        for (size_t i = 0; i < ncheck; ++i) {
+            if (internal_info[i] == 0)
+                continue;    // skip problems that passed error checks
+            lerror = std::max(lerror, internal_info[i]);
+        }
+        info[0] = (lerror == INTERNAL_INFO_DEFAULT) ? 0 : lerror;
+
+        // delete the internal vector
+        delete[] internal_info;
+
+        // throw an exception if needed
+        blas_error_if_msg( info[0] != 0, "info = %lld", llong( info[0] ) );
+    }
+    else {
+        int64_t info_ = 0;
+        #pragma omp parallel for reduction(+:info_)
+        for (size_t i = 0; i < batchCount; ++i) {
+            info_ += info[i];
+        }
+        blas_error_if_msg( info_ != 0, "One or more non-zero entry in vector info");
+    }
+}
+
+// -----------------------------------------------------------------------------
+// batch scal check
+template <typename T>
+void scal_check(
+        std::vector<int64_t> const &n,
+        std::vector<T >      const &alpha,
+        std::vector<T*>      const &x, std::vector<int64_t> const &incx,
+        const size_t batchCount, std::vector<int64_t> &info)
+{
+    // size error checking
+    blas_error_if( (n.size()     != 1 && n.size()     != batchCount) );
+    blas_error_if( (alpha.size() != 1 && alpha.size() != batchCount) );
+    blas_error_if( (incx.size()  != 1 && incx.size()  != batchCount) );
+
+    blas_error_if( (x.size() < batchCount) );
+
+    blas_error_if( x.size() == 1 &&
+               (n.size() > 1 || alpha.size() > 1 || incx.size() > 1) );
+
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( n, incx );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
+    int64_t* internal_info;
+    if (info.size() == 1) {
+        internal_info = new int64_t[ncheck];
+    }
+    else {
+        internal_info = &info[0];
+    }
+
+    #pragma omp parallel for schedule(dynamic)
+    for (size_t i = 0; i < ncheck; ++i) {
+        int64_t n_    = extract<int64_t>(n, i);
+        int64_t incx_ = extract<int64_t>(incx, i);
+
+        internal_info[i] = 0;
+        if (n_ < 0) internal_info[i] = -1;
+        else if (incx_ <= 0) internal_info[i] = -4;
+    }
+
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
+    if (info.size() == 1) {
+        // do a reduction that finds the first argument to encounter an error
+        int64_t lerror = INTERNAL_INFO_DEFAULT;
+        #pragma omp parallel for reduction(max:lerror)
+        for (size_t i = 0; i < ncheck; ++i) {
+            if (internal_info[i] == 0)
+                continue;    // skip problems that passed error checks
+            lerror = std::max(lerror, internal_info[i]);
+        }
+        info[0] = (lerror == INTERNAL_INFO_DEFAULT) ? 0 : lerror;
+
+        // delete the internal vector
+        delete[] internal_info;
+
+        // throw an exception if needed
+        blas_error_if_msg( info[0] != 0, "info = %lld", llong( info[0] ) );
+    }
+    else {
+        int64_t info_ = 0;
+        #pragma omp parallel for reduction(+:info_)
+        for (size_t i = 0; i < batchCount; ++i) {
+            info_ += info[i];
+        }
+        blas_error_if_msg( info_ != 0, "One or more non-zero entry in vector info");
+    }
+}
+
+// -----------------------------------------------------------------------------
+// batch gemv check
+template <typename T>
+void gemv_check(
+        blas::Layout                 layout,
+        std::vector<blas::Op> const &trans,
+        std::vector<int64_t>  const &m,
+        std::vector<int64_t>  const &n,
+        std::vector<T >       const &alpha,
+        std::vector<T*>       const &A, std::vector<int64_t> const &lda,
+        std::vector<T*>       const &x, std::vector<int64_t> const &incx,
+        std::vector<T >       const &beta,
+        std::vector<T*>       const &y, std::vector<int64_t> const &incy,
+        const size_t batchCount, std::vector<int64_t> &info)
+{
+    // size error checking
+    blas_error_if( (trans.size() != 1 && trans.size() != batchCount) );
+
+    blas_error_if( (m.size() != 1 && m.size() != batchCount) );
+    blas_error_if( (n.size() != 1 && n.size() != batchCount) );
+
+    blas_error_if( (alpha.size() != 1 && alpha.size() != batchCount) );
+    blas_error_if( (beta.size()  != 1 && beta.size()  != batchCount) );
+
+    blas_error_if( (lda.size()  != 1 && lda.size()  != batchCount) );
+    blas_error_if( (incx.size() != 1 && incx.size() != batchCount) );
+    blas_error_if( (incy.size() != 1 && incy.size() != batchCount) );
+
+    blas_error_if( (A.size() != 1 && A.size() < batchCount) );
+    blas_error_if( (x.size() != 1 && x.size() < batchCount) );
+    blas_error_if( (y.size() < batchCount) );
+
+    blas_error_if( A.size() == 1 && (m.size() > 1 || n.size() > 1 || lda.size() > 1) );
+    blas_error_if( x.size() == 1 &&
+               (trans.size() > 1 || m.size() > 1 || n.size() > 1 ||
+                incx.size()  > 1) );
+    blas_error_if( y.size() == 1 &&
+               (trans.size() > 1 || m.size()    > 1 || n.size()    > 1 ||
+                alpha.size() > 1 || beta.size() > 1 ||
+                lda.size()   > 1 || incx.size() > 1 || incy.size() > 1 ||
+                A.size()     > 1 || x.size()    > 1
+                )
+             );
+
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( trans, m, n, lda, incx, incy );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
+    int64_t* internal_info;
+    if (info.size() == 1) {
+        internal_info = new int64_t[ncheck];
+    }
+    else {
+        internal_info = &info[0];
+    }
+
+    #pragma omp parallel for schedule(dynamic)
+    for (size_t i = 0; i < ncheck; ++i) {
+        Op trans_ = extract<Op>(trans, i);
+
+        int64_t m_ = extract<int64_t>(m, i);
+        int64_t n_ = extract<int64_t>(n, i);
+
+        int64_t lda_  = extract<int64_t>(lda, i);
+        int64_t incx_ = extract<int64_t>(incx, i);
+        int64_t incy_ = extract<int64_t>(incy, i);
+
+        int64_t nrowA_ = (layout == Layout::ColMajor) ? m_ : n_;
+
+        internal_info[i] = 0;
+        if (trans_ != Op::NoTrans &&
+            trans_ != Op::Trans   &&
+            trans_ != Op::ConjTrans) {
+            internal_info[i] = -2;
+        }
+        else if (m_ < 0) internal_info[i] = -3;
+        else if (n_ < 0) internal_info[i] = -4;
+        else if (lda_ < nrowA_) internal_info[i] = -7;
+        else if (incx_ == 0) internal_info[i] = -9;
+        else if (incy_ == 0) internal_info[i] = -12;
+    }
+
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
     if (info.size() == 1) {
         // do a reduction that finds the first argument to encounter an error
         int64_t lerror = INTERNAL_INFO_DEFAULT;
         #pragma omp parallel for reduction(max:lerror)
+        for (size_t i = 0; i < ncheck; ++i) {
+            if (internal_info[i] == 0)
+                continue;    // skip problems that passed error checks
+            lerror = std::max(lerror, internal_info[i]);
+        }
+        info[0] = (lerror == INTERNAL_INFO_DEFAULT) ? 0 : lerror;
+
+        // delete the internal vector
+        delete[] internal_info;
+
+        // throw an exception if needed
+        blas_error_if_msg( info[0] != 0, "info = %lld", llong( info[0] ) );
+    }
+    else {
+        int64_t info_ = 0;
+        #pragma omp parallel for reduction(+:info_)
         for (size_t i = 0; i < batchCount; ++i) {
+            info_ += info[i];
+        }
+        blas_error_if_msg( info_ != 0, "One or more non-zero entry in vector info");
+    }
+}
+
+// -----------------------------------------------------------------------------
+// batch ger check
+template <typename T>
+void ger_check(
+        blas::Layout                 layout,
+        std::vector<int64_t>  const &m,
+        std::vector<int64_t>  const &n,
+        std::vector<T >       const &alpha,
+        std::vector<T*>       const &x, std::vector<int64_t> const &incx,
+        std::vector<T*>       const &y, std::vector<int64_t> const &incy,
+        std::vector<T*>       const &A, std::vector<int64_t> const &lda,
+        const size_t batchCount, std::vector<int64_t> &info)
+{
+    // size error checking
+    blas_error_if( (m.size() != 1 && m.size() != batchCount) );
+    blas_error_if( (n.size() != 1 && n.size() != batchCount) );
+
+    blas_error_if( (alpha.size() != 1 && alpha.size() != batchCount) );
+
+    blas_error_if( (incx.size() != 1 && incx.size() != batchCount) );
+    blas_error_if( (incy.size() != 1 && incy.size() != batchCount) );
+    blas_error_if( (lda.size()  != 1 && lda.size()  != batchCount) );
+
+    blas_error_if( (x.size() != 1 && x.size() < batchCount) );
+    blas_error_if( (y.size() != 1 && y.size() < batchCount) );
+    blas_error_if( (A.size() < batchCount) );
+
+    blas_error_if( x.size() == 1 && (m.size() > 1 || incx.size() > 1) );
+    blas_error_if( y.size() == 1 && (n.size() > 1 || incy.size() > 1) );
+    blas_error_if( A.size() == 1 &&
+               (m.size()    > 1 || n.size()    > 1 || alpha.size() > 1 ||
+                incx.size() > 1 || incy.size() > 1 || lda.size()   > 1 ||
+                x.size()    > 1 || y.size()    > 1
+                )
+             );
+
+    // A uniform batch has one set of parameters, so check it only once.
+    bool uniform = is_uniform( m, n, incx, incy, lda );
+    size_t ncheck = uniform ? std::min( batchCount, size_t( 1 ) ) : batchCount;
+
+    int64_t* internal_info;
+    if (info.size() == 1) {
+        internal_info = new int64_t[ncheck];
+    }
+    else {
+        internal_info = &info[0];
+    }
+
+    #pragma omp parallel for schedule(dynamic)
+    for (size_t i = 0; i < ncheck; ++i) {
+        int64_t m_ = extract<int64_t>(m, i);
+        int64_t n_ = extract<int64_t>(n, i);
+
+        int64_t incx_ = extract<int64_t>(incx, i);
+        int64_t incy_ = extract<int64_t>(incy, i);
+        int64_t lda_  = extract<int64_t>(lda, i);
+
+        int64_t nrowA_ = (layout == Layout::ColMajor) ? m_ : n_;
+
+        internal_info[i] = 0;
+        if (m_ < 0) internal_info[i] = -2;
+        else if (n_ < 0) internal_info[i] = -3;
+        else if (incx_ == 0) internal_info[i] = -6;
+        else if (incy_ == 0) internal_info[i] = -8;
+        else if (lda_ < nrowA_) internal_info[i] = -10;
+    }
+
+    if (uniform && info.size() > 1 && batchCount > 0) {
+        // All items have the same parameters, hence the same info.
+        std::fill( info.begin() + 1, info.begin() + batchCount, info[0] );
+    }
+
+    if (info.size() == 1) {
+        // do a reduction that finds the first argument to encounter an error
+        int64_t lerror = INTERNAL_INFO_DEFAULT;
+        #pragma omp parallel for reduction(max:lerror)
+        for (size_t i = 0; i < ncheck; ++i) {
             if (internal_info[i] == 0)
                 continue;    // skip problems that passed error checks
             lerror = std::max(lerror, internal_info[i]);
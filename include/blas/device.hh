@@ -13,6 +13,9 @@
     || defined( BLAS_HAVE_ROCBLAS ) \
     || defined( BLAS_HAVE_SYCL )
     #define BLAS_HAVE_DEVICE
+#else
+    // No GPU: Queue runs routines asynchronously on host CPU threads.
+    #define BLAS_HAVE_HOST_QUEUE
 #endif
 
 #ifdef BLAS_HAVE_CUBLAS
@@ -45,6 +48,11 @@
     #include <sycl/detail/cl.h>  // For CL version
     #include <sycl.hpp>
 
+#else
+    #include <cstdlib>
+    #include <cstring>
+    #include <functional>
+
 #endif
 
 namespace blas {
@@ -61,7 +69,7 @@ typedef int Device;
 #elif defined(BLAS_HAVE_SYCL)
     typedef std::int64_t         device_blas_int;
 #else
-    typedef int                  device_blas_int;
+    typedef std::int64_t         device_blas_int;
 #endif
 
 // -----------------------------------------------------------------------------
@@ -125,19 +133,52 @@ enum class MemcpyKind : device_blas_int {
 // constants
 const int MaxBatchChunk = 50000;
 
-#if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+#if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS ) \
+    || defined( BLAS_HAVE_HOST_QUEUE )
     const int MaxForkSize = 10;
 #else
-    // SYCL and no GPU code doesn't support fork mode.
+    // SYCL doesn't support fork mode.
     const int MaxForkSize = 1;
 #endif
 
+#if defined( BLAS_HAVE_HOST_QUEUE )
+namespace internal {
+
+// Host streams and events; see src/host_queue.cc.
+class HostStream;
+class HostEvent;
+
+void host_enqueue( HostStream* stream, std::function<void ()> task );
+void host_synchronize( HostStream* stream );
+
+}  // namespace internal
+#endif
+
 //==============================================================================
 /// Queue for executing GPU device routines.
 /// This wraps CUDA stream and cuBLAS handle,
 /// HIP stream and rocBLAS handle,
 /// or SYCL queue.
 ///
+/// Without GPU support (BLAS_HAVE_HOST_QUEUE), the queue's streams are
+/// in-order task queues, executed by a pool of host CPU threads.
+/// Routines taking a queue, including batch routines, run CPU BLAS
+/// asynchronously with respect to the calling thread, as they would on
+/// a GPU; "device" memory is ordinary host memory. As with GPU streams,
+/// arrays passed to routines must remain valid until the queue is
+/// synchronized. As with copies from pageable host memory on a GPU,
+/// device_memcpy and the device_copy functions wait for the stream's
+/// earlier tasks, then copy before returning, so their source may be
+/// freed right after the call.
+///
+/// All host queues share one pool of BLASPP_HOST_QUEUE_THREADS threads,
+/// by default OMP_NUM_THREADS (or the number of hardware threads without
+/// OpenMP). Each pool thread runs its tasks with OMP_NUM_THREADS divided
+/// by the pool size as OpenMP and BLAS threads, at least 1, so streams
+/// running concurrently don't oversubscribe cores. For instance, with
+/// OMP_NUM_THREADS=16 and BLASPP_HOST_QUEUE_THREADS=4, up to 4 tasks run
+/// at once, each with 4 threads.
+///
 class Queue
 {
 public:
@@ -157,7 +198,8 @@ public:
 
     #else
         // No GPU code.
-        using stream_t = void*;  // unused
+        using stream_t = internal::HostStream*;
+        using event_t  = internal::HostEvent*;
     #endif
 
     Queue();
@@ -217,7 +259,8 @@ public:
 
     stream_t& stream()
     {
-        #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+        #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS ) \
+            || defined( BLAS_HAVE_HOST_QUEUE )
             return streams_[ current_stream_index_ ];
         #else
             return streams_[ 0 ];
@@ -235,7 +278,10 @@ private:
     #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
         // Associated device BLAS handle.
         handle_t handle_;
+    #endif
 
+    #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS ) \
+        || defined( BLAS_HAVE_HOST_QUEUE )
         event_t events_[ MaxForkSize ];
 
         // The number of streams the queue is currently using for
@@ -247,7 +293,9 @@ private:
 
         // Whether the queue owns the BLAS handle and default stream,
         // or the user provided them.
-        bool own_handle_;
+        #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+            bool own_handle_;
+        #endif
         bool own_default_stream_;
     #endif
 
@@ -453,8 +501,7 @@ T* device_malloc(
         throw blas::Error( "unsupported function for sycl backend", __func__ );
 
     #else
-
-        throw blas::Error( "device BLAS not available", __func__ );
+        ptr = (T*) std::malloc( nelements * sizeof(T) );
     #endif
     return ptr;
 }
@@ -491,7 +538,7 @@ T* device_malloc(
             ptr = (T*)sycl::malloc_shared( nelements*sizeof(T), queue.stream() ) );
 
     #else
-        throw blas::Error( "device BLAS not available", __func__ );
+        ptr = (T*) std::malloc( nelements * sizeof(T) );
     #endif
     return ptr;
 }
@@ -524,7 +571,7 @@ T* device_malloc_pinned(
         throw blas::Error( "unsupported function for sycl backend", __func__ );
 
     #else
-        throw blas::Error( "device BLAS not available", __func__ );
+        ptr = (T*) std::malloc( nelements * sizeof(T) );
     #endif
     return ptr;
 }
@@ -563,7 +610,7 @@ T* host_malloc_pinned(
             ptr = (T*)sycl::malloc_host( nelements*sizeof(T), queue.stream() ) );
 
     #else
-        throw blas::Error( "device BLAS not available", __func__ );
+        ptr = (T*) std::malloc( nelements * sizeof(T) );
     #endif
     return ptr;
 }
@@ -621,7 +668,10 @@ void device_memset(
             queue.stream().memset( ptr, value, nelements * sizeof(T) ) );
 
     #else
-        throw blas::Error( "device BLAS not available", __func__ );
+        size_t nbytes = nelements * sizeof(T);
+        internal::host_enqueue( queue.stream(), [=]() {
+            std::memset( ptr, value, nbytes );
+        } );
     #endif
 }
 
@@ -664,7 +714,10 @@ void device_memcpy(
             queue.stream().memcpy( dst, src, sizeof(T)*nelements ) );
 
     #else
-        throw blas::Error( "device BLAS not available", __func__ );
+        // All memory is host memory; kind is ignored. src is read before
+        // returning, after the stream's earlier tasks that may write it.
+        internal::host_synchronize( queue.stream() );
+        std::memcpy( dst, src, sizeof(T)*nelements );
     #endif
 }
 
@@ -753,7 +806,13 @@ void device_memcpy_2d(
             }
         }
     #else
-        throw blas::Error( "device BLAS not available", __func__ );
+        // All memory is host memory; kind is ignored. src is read before
+        // returning, after the stream's earlier tasks that may write it.
+        internal::host_synchronize( queue.stream() );
+        for (int64_t i = 0; i < height; ++i) {
+            std::memcpy( dst + i*dst_pitch, src + i*src_pitch,
+                         width*sizeof(T) );
+        }
     #endif
 }
 
@@ -7,6 +7,7 @@
 #define BLAS_GEMM_HH
 
 #include "blas/util.hh"
+#include "blas/gemm_packed.hh"
 
 #include <limits>
 
@@ -24,7 +25,8 @@ namespace blas {
 /// alpha and beta are scalars, and A, B, and C are matrices, with
 /// $op(A)$ an m-by-k matrix, $op(B)$ a k-by-n matrix, and C an m-by-n matrix.
 ///
-/// Generic implementation for arbitrary data types.
+/// Generic implementation for arbitrary data types, packed and
+/// cache-blocked, and parallel with OpenMP; see impl::gemm_packed.
 ///
 /// @param[in] layout
 ///     Matrix storage, Layout::ColMajor or Layout::RowMajor.
@@ -164,105 +166,24 @@ void gemm(
     }
 
     // alpha != zero
-    if (transA == Op::NoTrans) {
-        if (transB == Op::NoTrans) {
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i)
-                    C(i, j) *= beta;
-                for (int64_t l = 0; l < k; ++l) {
-                    scalar_t alpha_Blj = alpha*B(l, j);
-                    for (int64_t i = 0; i < m; ++i)
-                        C(i, j) += A(i, l)*alpha_Blj;
-                }
-            }
-        }
-        else if (transB == Op::Trans) {
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i)
-                    C(i, j) *= beta;
-                for (int64_t l = 0; l < k; ++l) {
-                    scalar_t alpha_Bjl = alpha*B(j, l);
-                    for (int64_t i = 0; i < m; ++i)
-                        C(i, j) += A(i, l)*alpha_Bjl;
-                }
-            }
-        }
-        else { // transB == Op::ConjTrans
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i)
-                    C(i, j) *= beta;
-                for (int64_t l = 0; l < k; ++l) {
-                    scalar_t alpha_Bjl = alpha*conj(B(j, l));
-                    for (int64_t i = 0; i < m; ++i)
-                        C(i, j) += A(i, l)*alpha_Bjl;
-                }
-            }
-        }
-    }
-    else if (transA == Op::Trans) {
-        if (transB == Op::NoTrans) {
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i) {
-                    scalar_t sum = zero;
-                    for (int64_t l = 0; l < k; ++l)
-                        sum += A(l, i)*B(l, j);
-                    C(i, j) = alpha*sum + beta*C(i, j);
-                }
-            }
-        }
-        else if (transB == Op::Trans) {
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i) {
-                    scalar_t sum = zero;
-                    for (int64_t l = 0; l < k; ++l)
-                        sum += A(l, i)*B(j, l);
-                    C(i, j) = alpha*sum + beta*C(i, j);
-                }
-            }
-        }
-        else { // transB == Op::ConjTrans
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i) {
-                    scalar_t sum = zero;
-                    for (int64_t l = 0; l < k; ++l)
-                        sum += A(l, i)*conj(B(j, l));
-                    C(i, j) = alpha*sum + beta*C(i, j);
-                }
-            }
-        }
-    }
-    else { // transA == Op::ConjTrans
-        if (transB == Op::NoTrans) {
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i) {
-                    scalar_t sum = zero;
-                    for (int64_t l = 0; l < k; ++l)
-                        sum += conj(A(l, i))*B(l, j);
-                    C(i, j) = alpha*sum + beta*C(i, j);
-                }
-            }
-        }
-        else if (transB == Op::Trans) {
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i) {
-                    scalar_t sum = zero;
-                    for (int64_t l = 0; l < k; ++l)
-                        sum += conj(A(l, i))*B(j, l);
-                    C(i, j) = alpha*sum + beta*C(i, j);
-                }
-            }
-        }
-        else { // transB == Op::ConjTrans
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i) {
-                    scalar_t sum = zero;
-                    for (int64_t l = 0; l < k; ++l)
-                        sum += A(l, i)*B(j, l); // little improvement here
-                    C(i, j) = alpha*conj(sum) + beta*C(i, j);
-                }
-            }
-        }
-    }
+    auto opA = [&]( int64_t i, int64_t l ) -> scalar_t {
+        if (transA == Op::NoTrans)
+            return A(i, l);
+        else if (transA == Op::Trans)
+            return A(l, i);
+        else
+            return conj( A(l, i) );
+    };
+    auto opB = [&]( int64_t l, int64_t j ) -> scalar_t {
+        if (transB == Op::NoTrans)
+            return B(l, j);
+        else if (transB == Op::Trans)
+            return B(j, l);
+        else
+            return conj( B(j, l) );
+    };
+    impl::gemm_packed( Uplo::General, m, n, k,
+                       alpha, opA, opB, beta, C, ldc );
 
     #undef A
     #undef B
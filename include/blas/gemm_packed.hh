@@ -0,0 +1,262 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#ifndef BLAS_GEMM_PACKED_HH
+#define BLAS_GEMM_PACKED_HH
+
+#include "blas/util.hh"
+
+#include <algorithm>
+#include <vector>
+
+#ifdef _OPENMP
+    #include <omp.h>
+#endif
+
+namespace blas {
+namespace impl {
+
+//------------------------------------------------------------------------------
+// Micro-tile of the generic micro-kernel is gemm_mr-by-gemm_nr.
+// Accumulator columns are gemm_mr contiguous elements, which compilers
+// vectorize for float and double.
+const int64_t gemm_mr = 8;
+const int64_t gemm_nr = 4;
+
+// Problems with fewer multiply-adds run on a single thread.
+const int64_t gemm_parallel_min = 64*64*64;
+
+//------------------------------------------------------------------------------
+/// Block sizes for gemm_packed: op(A) is packed in mc-by-kc blocks,
+/// op(B) in kc-by-nc blocks. Triangular routines use nb-by-nb
+/// diagonal blocks.
+struct GemmBlocking {
+    int64_t mc, nc, kc, nb;
+};
+
+//------------------------------------------------------------------------------
+/// @return block sizes for scalar_t, from cpu_caches(): a gemm_mr-by-kc
+/// micro-panel of A plus a kc-by-gemm_nr micro-panel of B fill half of L1;
+/// an mc-by-kc block of A, half of L2; a kc-by-nc block of B, half of L3.
+template <typename scalar_t>
+GemmBlocking gemm_blocking()
+{
+    const CPUCaches& caches = cpu_caches();
+    int64_t size = sizeof( scalar_t );
+
+    GemmBlocking blocking;
+    blocking.kc = int64_t( caches.l1d / 2 ) / ((gemm_mr + gemm_nr) * size);
+    blocking.kc = std::max( int64_t( 16 ), std::min( blocking.kc, int64_t( 1024 ) ) );
+
+    blocking.mc = int64_t( caches.l2 / 2 ) / (blocking.kc * size);
+    blocking.mc = std::min( blocking.mc, int64_t( 4096 ) ) / gemm_mr * gemm_mr;
+    blocking.mc = std::max( blocking.mc, gemm_mr );
+
+    blocking.nc = int64_t( caches.l3 / 2 ) / (blocking.kc * size);
+    blocking.nc = std::min( blocking.nc, int64_t( 4096 ) ) / gemm_nr * gemm_nr;
+    blocking.nc = std::max( blocking.nc, gemm_nr );
+
+    blocking.nb = std::min( int64_t( 64 ), blocking.mc );
+    return blocking;
+}
+
+//------------------------------------------------------------------------------
+/// Packs rows [i0, i0 + mr) and columns [l0, l0 + kb) of op(A)
+/// into a micro-panel Ap, stored gemm_mr elements per column,
+/// with rows mr <= i < gemm_mr set to zero.
+template <typename scalar_t, typename OpA>
+void gemm_pack_a(
+    OpA const& opA, int64_t i0, int64_t mr, int64_t l0, int64_t kb,
+    scalar_t* Ap )
+{
+    const scalar_t zero = 0;
+    for (int64_t l = 0; l < kb; ++l) {
+        for (int64_t i = 0; i < mr; ++i)
+            Ap[ i ] = opA( i0 + i, l0 + l );
+        for (int64_t i = mr; i < gemm_mr; ++i)
+            Ap[ i ] = zero;
+        Ap += gemm_mr;
+    }
+}
+
+//------------------------------------------------------------------------------
+/// Packs rows [l0, l0 + kb) and columns [j0, j0 + nr) of alpha op(B)
+/// into a micro-panel Bp, stored gemm_nr elements per row,
+/// with columns nr <= j < gemm_nr set to zero.
+template <typename scalar_t, typename OpB>
+void gemm_pack_b(
+    scalar_t alpha,
+    OpB const& opB, int64_t l0, int64_t kb, int64_t j0, int64_t nr,
+    scalar_t* Bp )
+{
+    const scalar_t zero = 0;
+    for (int64_t l = 0; l < kb; ++l) {
+        for (int64_t j = 0; j < nr; ++j)
+            Bp[ j ] = alpha * opB( l0 + l, j0 + j );
+        for (int64_t j = nr; j < gemm_nr; ++j)
+            Bp[ j ] = zero;
+        Bp += gemm_nr;
+    }
+}
+
+//------------------------------------------------------------------------------
+/// Micro-kernel: multiplies packed micro-panels, Ap (gemm_mr-by-kb) times
+/// Bp (kb-by-gemm_nr), and updates the mr-by-nr tile of C at (i0, j0).
+/// If first, C = beta C + Ap Bp, otherwise C += Ap Bp.
+/// Only the uplo part of C is updated (Uplo::General for all of C).
+template <typename scalar_t, typename TC>
+void gemm_micro(
+    int64_t kb, scalar_t const* Ap, scalar_t const* Bp,
+    bool first, scalar_t beta,
+    blas::Uplo uplo, int64_t i0, int64_t mr, int64_t j0, int64_t nr,
+    TC* C, int64_t ldc )
+{
+    const scalar_t zero = 0;
+
+    scalar_t acc[ gemm_mr * gemm_nr ];
+    for (int64_t t = 0; t < gemm_mr * gemm_nr; ++t)
+        acc[ t ] = zero;
+
+    for (int64_t l = 0; l < kb; ++l) {
+        for (int64_t j = 0; j < gemm_nr; ++j) {
+            scalar_t b = Bp[ j ];
+            for (int64_t i = 0; i < gemm_mr; ++i)
+                acc[ i + j*gemm_mr ] += Ap[ i ] * b;
+        }
+        Ap += gemm_mr;
+        Bp += gemm_nr;
+    }
+
+    for (int64_t j = 0; j < nr; ++j) {
+        for (int64_t i = 0; i < mr; ++i) {
+            if ((uplo == Uplo::Lower && i0 + i < j0 + j)
+                || (uplo == Uplo::Upper && i0 + i > j0 + j))
+                continue;
+            TC& c = C[ (i0 + i) + (j0 + j)*ldc ];
+            if (! first)
+                c += acc[ i + j*gemm_mr ];
+            else if (beta == zero)
+                c = acc[ i + j*gemm_mr ];
+            else
+                c = beta*scalar_t( c ) + acc[ i + j*gemm_mr ];
+        }
+    }
+}
+
+//------------------------------------------------------------------------------
+/// Generic packed, cache-blocked matrix-matrix multiply:
+/// \[
+///     C = \alpha op(A) op(B) + \beta C,
+/// \]
+/// with C an m-by-n column-major matrix. op(A) (m-by-k) and op(B) (k-by-n)
+/// are given by element functors, opA( i, l ) and opB( l, j ),
+/// which apply any transpose, conjugation, symmetry, or triangular
+/// structure, so gemm, symm, syrk, trmm, etc. share the packing.
+///
+/// Blocks of op(A) and op(B) are packed into contiguous micro-panels
+/// (BLIS-style loop order; blocks from gemm_blocking), then
+/// gemm_mr-by-gemm_nr tiles of C are computed in parallel with OpenMP,
+/// if the problem has at least gemm_parallel_min multiply-adds.
+///
+/// If uplo is Lower or Upper, only that triangle of C is updated,
+/// and tiles entirely outside it are skipped, as in syrk.
+/// If beta is zero, C need not be set on input.
+/// Assumes m, n, k > 0.
+/// @ingroup gemm_internal
+///
+template <typename scalar_t, typename OpA, typename OpB, typename TC>
+void gemm_packed(
+    blas::Uplo uplo,
+    int64_t m, int64_t n, int64_t k,
+    scalar_t alpha,
+    OpA const& opA,
+    OpB const& opB,
+    scalar_t beta,
+    TC* C, int64_t ldc )
+{
+    static const GemmBlocking blocking = gemm_blocking<scalar_t>();
+
+    // Shrink blocks for small matrices, to allocate only what's used.
+    int64_t mc = std::min( blocking.mc, (m + gemm_mr - 1) / gemm_mr * gemm_mr );
+    int64_t nc = std::min( blocking.nc, (n + gemm_nr - 1) / gemm_nr * gemm_nr );
+    int64_t kc = std::min( blocking.kc, k );
+
+    std::vector<scalar_t> Apack( mc * kc );
+    std::vector<scalar_t> Bpack( kc * nc );
+
+    // Each of nthreads threads packs and computes its share of panels
+    // and tiles, cyclically. Barriers are needed only with multiple
+    // threads; the serial path has no OpenMP constructs, so it is safe
+    // inside an application's parallel region.
+    auto loops = [&]( int nthreads, int tid ) {
+        auto barrier = [nthreads]() {
+            #ifdef _OPENMP
+                if (nthreads > 1) {
+                    #pragma omp barrier
+                }
+            #endif
+        };
+
+        for (int64_t jc = 0; jc < n; jc += nc) {
+            int64_t nb = std::min( nc, n - jc );
+            int64_t ntiles_n = (nb + gemm_nr - 1) / gemm_nr;
+
+            for (int64_t pc = 0; pc < k; pc += kc) {
+                int64_t kb = std::min( kc, k - pc );
+                bool first = (pc == 0);
+
+                for (int64_t t = tid; t < ntiles_n; t += nthreads) {
+                    int64_t jr = t * gemm_nr;
+                    gemm_pack_b( alpha, opB, pc, kb, jc + jr,
+                                 std::min( gemm_nr, nb - jr ),
+                                 &Bpack[ jr*kb ] );
+                }
+
+                for (int64_t ic = 0; ic < m; ic += mc) {
+                    int64_t mb = std::min( mc, m - ic );
+                    int64_t ntiles_m = (mb + gemm_mr - 1) / gemm_mr;
+
+                    for (int64_t t = tid; t < ntiles_m; t += nthreads) {
+                        int64_t ir = t * gemm_mr;
+                        gemm_pack_a( opA, ic + ir, std::min( gemm_mr, mb - ir ),
+                                     pc, kb, &Apack[ ir*kb ] );
+                    }
+                    barrier();  // packed A and B complete
+
+                    for (int64_t t = tid; t < ntiles_m * ntiles_n; t += nthreads) {
+                        int64_t ir = (t % ntiles_m) * gemm_mr;
+                        int64_t jr = (t / ntiles_m) * gemm_nr;
+                        int64_t i0 = ic + ir;
+                        int64_t j0 = jc + jr;
+                        int64_t mr = std::min( gemm_mr, mb - ir );
+                        int64_t nr = std::min( gemm_nr, nb - jr );
+                        // skip tiles outside the uplo triangle
+                        if ((uplo == Uplo::Lower && i0 + mr - 1 < j0)
+                            || (uplo == Uplo::Upper && i0 > j0 + nr - 1))
+                            continue;
+                        gemm_micro( kb, &Apack[ ir*kb ], &Bpack[ jr*kb ],
+                                    first, beta, uplo, i0, mr, j0, nr,
+                                    C, ldc );
+                    }
+                    barrier();  // done with packed A (and B)
+                }
+            }
+        }
+    };
+
+    #ifdef _OPENMP
+        if (m * n * k >= gemm_parallel_min) {
+            #pragma omp parallel
+            loops( omp_get_num_threads(), omp_get_thread_num() );
+            return;
+        }
+    #endif
+    loops( 1, 0 );
+}
+
+}  // namespace impl
+}  // namespace blas
+
+#endif        //  #ifndef BLAS_GEMM_PACKED_HH
@@ -7,6 +7,7 @@
 #define BLAS_HER2K_HH
 
 #include "blas/util.hh"
+#include "blas/gemm_packed.hh"
 #include "blas/syr2k.hh"
 
 #include <limits>
@@ -25,7 +26,8 @@ namespace blas {
 /// where alpha and beta are scalars, C is an n-by-n Hermitian matrix,
 /// and A and B are n-by-k or k-by-n matrices.
 ///
-/// Generic implementation for arbitrary data types.
+/// Generic implementation for arbitrary data types,
+/// using the packed multiply of gemm; see impl::gemm_packed.
 ///
 /// @param[in] layout
 ///     Matrix storage, Layout::ColMajor or Layout::RowMajor.
@@ -205,91 +207,28 @@ void her2k(
     }
 
     // alpha != zero
-    if (trans == Op::NoTrans) {
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-
-                for (int64_t i = 0; i < j; ++i)
-                    C(i, j) *= beta;
-                C(j, j) = beta * real( C(j, j) );
-
-                for (int64_t l = 0; l < k; ++l) {
-
-                    scalar_t alpha_conj_Bjl = alpha*conj( B(j, l) );
-                    scalar_t conj_alpha_Ajl = conj( alpha*A(j, l) );
-
-                    for (int64_t i = 0; i < j; ++i) {
-                        C(i, j) += A(i, l)*alpha_conj_Bjl
-                                   + B(i, l)*conj_alpha_Ajl;
-                    }
-                    C(j, j) += 2 * real( A(j, l) * alpha_conj_Bjl );
-                }
-            }
-        }
-        else { // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-
-                C(j, j) = beta * real( C(j, j) );
-                for (int64_t i = j+1; i < n; ++i)
-                    C(i, j) *= beta;
-
-                for (int64_t l = 0; l < k; ++l) {
-
-                    scalar_t alpha_conj_Bjl = alpha*conj( B(j, l) );
-                    scalar_t conj_alpha_Ajl = conj( alpha*A(j, l) );
-
-                    C(j, j) += 2 * real( A(j, l) * alpha_conj_Bjl );
-                    for (int64_t i = j+1; i < n; ++i) {
-                        C(i, j) += A(i, l) * alpha_conj_Bjl
-                                   + B(i, l) * conj_alpha_Ajl;
-                    }
-                }
-            }
-        }
-    }
-    else { // trans == Op::ConjTrans
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i <= j; ++i) {
-
-                    scalar_t sum1 = zero;
-                    scalar_t sum2 = zero;
-                    for (int64_t l = 0; l < k; ++l) {
-                        sum1 += conj( A(l, i) ) * B(l, j);
-                        sum2 += conj( B(l, i) ) * A(l, j);
-                    }
-
-                    C(i, j) = (i < j)
-                              ? alpha*sum1 + conj(alpha)*sum2 + beta*C(i, j)
-                              : real( alpha*sum1 + conj(alpha)*sum2 )
-                              + beta*real( C(i, j) );
-                }
-
-            }
-        }
-        else {
-            // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = j; i < n; ++i) {
-
-                    scalar_t sum1 = zero;
-                    scalar_t sum2 = zero;
-                    for (int64_t l = 0; l < k; ++l) {
-                        sum1 += conj( A(l, i) ) * B(l, j);
-                        sum2 += conj( B(l, i) ) * A(l, j);
-                    }
-
-                    C(i, j) = (i > j)
-                              ? alpha*sum1 + conj(alpha)*sum2 + beta*C(i, j)
-                              : real( alpha*sum1 + conj(alpha)*sum2 )
-                              + beta*real( C(i, j) );
-                }
-
-            }
-        }
-    }
+    // [ op(A) op(B) ] [ alpha op(B)  conj(alpha) op(A) ]^H, as one product
+    // with inner dimension 2k, computing the upper (or General) or
+    // lower triangle
+    auto opAB = [&]( int64_t i, int64_t l ) -> scalar_t {
+        if (l < k)
+            return (trans == Op::NoTrans) ? A(i, l) : conj( A(l, i) );
+        l -= k;
+        return (trans == Op::NoTrans) ? B(i, l) : conj( B(l, i) );
+    };
+    auto opBAH = [&]( int64_t l, int64_t j ) -> scalar_t {
+        if (l < k)
+            return alpha * ((trans == Op::NoTrans) ? conj( B(j, l) ) : B(l, j));
+        l -= k;
+        return conj( alpha ) * ((trans == Op::NoTrans) ? conj( A(j, l) ) : A(l, j));
+    };
+    impl::gemm_packed( (uplo == Uplo::Lower ? Uplo::Lower : Uplo::Upper),
+                       n, n, 2*k, one, opAB, opBAH, scalar_t( beta ),
+                       C, ldc );
+
+    // diagonal is real
+    for (int64_t j = 0; j < n; ++j)
+        C(j, j) = real( C(j, j) );
 
     if (uplo == Uplo::General) {
         for (int64_t j = 0; j < n; ++j) {
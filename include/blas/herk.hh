@@ -7,6 +7,7 @@
 #define BLAS_HERK_HH
 
 #include "blas/util.hh"
+#include "blas/gemm_packed.hh"
 #include "blas/syrk.hh"
 
 #include <limits>
@@ -25,7 +26,8 @@ namespace blas {
 /// where alpha and beta are real scalars, C is an n-by-n Hermitian matrix,
 /// and A is an n-by-k or k-by-n matrix.
 ///
-/// Generic implementation for arbitrary data types.
+/// Generic implementation for arbitrary data types,
+/// using the packed multiply of gemm; see impl::gemm_packed.
 ///
 /// @param[in] layout
 ///     Matrix storage, Layout::ColMajor or Layout::RowMajor.
@@ -191,78 +193,20 @@ void herk(
     }
 
     // alpha != zero
-    if (trans == Op::NoTrans) {
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-
-                for (int64_t i = 0; i < j; ++i)
-                    C(i, j) *= beta;
-                C(j, j) = beta * real( C(j, j) );
-
-                for (int64_t l = 0; l < k; ++l) {
-
-                    scalar_t alpha_conj_Ajl = alpha*conj( A(j, l) );
-
-                    for (int64_t i = 0; i < j; ++i)
-                        C(i, j) += A(i, l)*alpha_conj_Ajl;
-                    C(j, j) += real( A(j, l) * alpha_conj_Ajl );
-                }
-            }
-        }
-        else { // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-
-                C(j, j) = beta * real( C(j, j) );
-                for (int64_t i = j+1; i < n; ++i)
-                    C(i, j) *= beta;
-
-                for (int64_t l = 0; l < k; ++l) {
-
-                    scalar_t alpha_conj_Ajl = alpha*conj( A(j, l) );
-
-                    C(j, j) += real( A(j, l) * alpha_conj_Ajl );
-                    for (int64_t i = j+1; i < n; ++i) {
-                        C(i, j) += A(i, l) * alpha_conj_Ajl;
-                    }
-                }
-            }
-        }
-    }
-    else { // trans == Op::ConjTrans
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < j; ++i) {
-                    scalar_t sum = szero;
-                    for (int64_t l = 0; l < k; ++l)
-                        sum += conj( A(l, i) ) * A(l, j);
-                    C(i, j) = alpha*sum + beta*C(i, j);
-                }
-                real_t sum = zero;
-                for (int64_t l = 0; l < k; ++l)
-                    sum += real(A(l, j)) * real(A(l, j))
-                           + imag(A(l, j)) * imag(A(l, j));
-                C(j, j) = alpha*sum + beta*real( C(j, j) );
-            }
-        }
-        else {
-            // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = j+1; i < n; ++i) {
-                    scalar_t sum = szero;
-                    for (int64_t l = 0; l < k; ++l)
-                        sum += conj( A(l, i) ) * A(l, j);
-                    C(i, j) = alpha*sum + beta*C(i, j);
-                }
-                real_t sum = zero;
-                for (int64_t l = 0; l < k; ++l)
-                    sum += real(A(l, j)) * real(A(l, j))
-                           + imag(A(l, j)) * imag(A(l, j));
-                C(j, j) = alpha*sum + beta*real( C(j, j) );
-            }
-        }
-    }
+    // op(A) op(A)^H, computing the upper (or General) or lower triangle
+    auto opA = [&]( int64_t i, int64_t l ) -> scalar_t {
+        return (trans == Op::NoTrans) ? A(i, l) : conj( A(l, i) );
+    };
+    auto opAH = [&]( int64_t l, int64_t j ) -> scalar_t {
+        return (trans == Op::NoTrans) ? conj( A(j, l) ) : A(l, j);
+    };
+    impl::gemm_packed( (uplo == Uplo::Lower ? Uplo::Lower : Uplo::Upper),
+                       n, n, k, scalar_t( alpha ), opA, opAH, scalar_t( beta ),
+                       C, ldc );
+
+    // diagonal is real
+    for (int64_t j = 0; j < n; ++j)
+        C(j, j) = real( C(j, j) );
 
     if (uplo == Uplo::General) {
         for (int64_t j = 0; j < n; ++j) {
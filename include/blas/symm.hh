@@ -7,6 +7,7 @@
 #define BLAS_SYMM_HH
 
 #include "blas/util.hh"
+#include "blas/gemm_packed.hh"
 
 #include <limits>
 
@@ -24,7 +25,8 @@ namespace blas {
 /// where alpha and beta are scalars, A is an m-by-m or n-by-n symmetric matrix,
 /// and B and C are m-by-n matrices.
 ///
-/// Generic implementation for arbitrary data types.
+/// Generic implementation for arbitrary data types,
+/// using the packed multiply of gemm; see impl::gemm_packed.
 ///
 /// @param[in] layout
 ///     Matrix storage, Layout::ColMajor or Layout::RowMajor.
@@ -146,91 +148,23 @@ void symm(
     }
 
     // alpha != zero
+    // symmetric A, stored in the upper (or General) or lower triangle
+    auto sym_A = [&]( int64_t i, int64_t l ) -> scalar_t {
+        if ((uplo == Uplo::Lower) == (i >= l))
+            return A(i, l);
+        else
+            return A(l, i);
+    };
+    auto get_B = [&]( int64_t i, int64_t j ) -> scalar_t {
+        return B(i, j);
+    };
     if (side == Side::Left) {
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i < m; ++i) {
-
-                    scalar_t alpha_Bij = alpha*B(i, j);
-                    scalar_t sum = zero;
-
-                    for (int64_t k = 0; k < i; ++k) {
-                        C(k, j) += A(k, i) * alpha_Bij;
-                        sum += A(k, i) * B(k, j);
-                    }
-                    C(i, j) =
-                        beta * C(i, j)
-                        + A(i, i) * alpha_Bij
-                        + alpha * sum;
-                }
-            }
-        }
-        else {
-            // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = m-1; i >= 0; --i) {
-
-                    scalar_t alpha_Bij = alpha*B(i, j);
-                    scalar_t sum = zero;
-
-                    for (int64_t k = i+1; k < m; ++k) {
-                        C(k, j) += A(k, i) * alpha_Bij;
-                        sum += A(k, i) * B(k, j);
-                    }
-                    C(i, j) =
-                        beta * C(i, j)
-                        + A(i, i) * alpha_Bij
-                        + alpha * sum;
-                }
-            }
-        }
+        impl::gemm_packed( Uplo::General, m, n, m,
+                           alpha, sym_A, get_B, beta, C, ldc );
     }
     else { // side == Side::Right
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-
-                scalar_t alpha_Akj = alpha * A(j, j);
-
-                for (int64_t i = 0; i < m; ++i)
-                    C(i, j) = beta * C(i, j) + B(i, j) * alpha_Akj;
-
-                for (int64_t k = 0; k < j; ++k) {
-                    alpha_Akj = alpha*A(k, j);
-                    for (int64_t i = 0; i < m; ++i)
-                        C(i, j) += B(i, k) * alpha_Akj;
-                }
-
-                for (int64_t k = j+1; k < n; ++k) {
-                    alpha_Akj = alpha * A(j, k);
-                    for (int64_t i = 0; i < m; ++i)
-                        C(i, j) += B(i, k) * alpha_Akj;
-                }
-            }
-        }
-        else {
-            // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-
-                scalar_t alpha_Akj = alpha * A(j, j);
-
-                for (int64_t i = 0; i < m; ++i)
-                    C(i, j) = beta * C(i, j) + B(i, j) * alpha_Akj;
-
-                for (int64_t k = 0; k < j; ++k) {
-                    alpha_Akj = alpha * A(j, k);
-                    for (int64_t i = 0; i < m; ++i)
-                        C(i, j) += B(i, k) * alpha_Akj;
-                }
-
-                for (int64_t k = j+1; k < n; ++k) {
-                    alpha_Akj = alpha*A(k, j);
-                    for (int64_t i = 0; i < m; ++i)
-                        C(i, j) += B(i, k) * alpha_Akj;
-                }
-            }
-        }
+        impl::gemm_packed( Uplo::General, m, n, n,
+                           alpha, get_B, sym_A, beta, C, ldc );
     }
 
     #undef A
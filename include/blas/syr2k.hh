@@ -7,6 +7,7 @@
 #define BLAS_SYR2K_HH
 
 #include "blas/util.hh"
+#include "blas/gemm_packed.hh"
 
 #include <limits>
 
@@ -24,7 +25,8 @@ namespace blas {
 /// where alpha and beta are scalars, C is an n-by-n symmetric matrix,
 /// and A and B are n-by-k or k-by-n matrices.
 ///
-/// Generic implementation for arbitrary data types.
+/// Generic implementation for arbitrary data types,
+/// using the packed multiply of gemm; see impl::gemm_packed.
 ///
 /// @param[in] layout
 ///     Matrix storage, Layout::ColMajor or Layout::RowMajor.
@@ -198,66 +200,22 @@ void syr2k(
     }
 
     // alpha != zero
-    if (trans == Op::NoTrans) {
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-
-                for (int64_t i = 0; i <= j; ++i)
-                    C(i, j) *= beta;
-
-                for (int64_t l = 0; l < k; ++l) {
-                    scalar_t alpha_Bjl = alpha*B(j, l);
-                    scalar_t alpha_Ajl = alpha*A(j, l);
-                    for (int64_t i = 0; i <= j; ++i)
-                        C(i, j) += A(i, l)*alpha_Bjl + B(i, l)*alpha_Ajl;
-                }
-            }
-        }
-        else { // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-
-                for (int64_t i = j; i < n; ++i)
-                    C(i, j) *= beta;
-
-                for (int64_t l = 0; l < k; ++l) {
-                    scalar_t alpha_Bjl = alpha*B(j, l);
-                    scalar_t alpha_Ajl = alpha*A(j, l);
-                    for (int64_t i = j; i < n; ++i)
-                        C(i, j) += A(i, l)*alpha_Bjl + B(i, l)*alpha_Ajl;
-                }
-            }
-        }
-    }
-    else { // trans == Op::Trans
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i <= j; ++i) {
-                    scalar_t sum1 = zero;
-                    scalar_t sum2 = zero;
-                    for (int64_t l = 0; l < k; ++l) {
-                        sum1 += A(l, i) * B(l, j);
-                        sum2 += B(l, i) * A(l, j);
-                    }
-                    C(i, j) = alpha*sum1 + alpha*sum2 + beta*C(i, j);
-                }
-            }
-        }
-        else { // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = j; i < n; ++i) {
-                    scalar_t sum1 = zero;
-                    scalar_t sum2 = zero;
-                    for (int64_t l = 0; l < k; ++l) {
-                        sum1 +=  A(l, i) * B(l, j);
-                        sum2 +=  B(l, i) * A(l, j);
-                    }
-                    C(i, j) = alpha*sum1 + alpha*sum2 + beta*C(i, j);
-                }
-            }
-        }
-    }
+    // [ op(A) op(B) ] [ op(B) op(A) ]^T, as one product with inner
+    // dimension 2k, computing the upper (or General) or lower triangle
+    auto opAB = [&]( int64_t i, int64_t l ) -> scalar_t {
+        if (l < k)
+            return (trans == Op::NoTrans) ? A(i, l) : A(l, i);
+        l -= k;
+        return (trans == Op::NoTrans) ? B(i, l) : B(l, i);
+    };
+    auto opBAT = [&]( int64_t l, int64_t j ) -> scalar_t {
+        if (l < k)
+            return (trans == Op::NoTrans) ? B(j, l) : B(l, j);
+        l -= k;
+        return (trans == Op::NoTrans) ? A(j, l) : A(l, j);
+    };
+    impl::gemm_packed( (uplo == Uplo::Lower ? Uplo::Lower : Uplo::Upper),
+                       n, n, 2*k, alpha, opAB, opBAT, beta, C, ldc );
 
     if (uplo == Uplo::General) {
         for (int64_t j = 0; j < n; ++j) {
@@ -7,6 +7,7 @@
 #define BLAS_SYRK_HH
 
 #include "blas/util.hh"
+#include "blas/gemm_packed.hh"
 
 #include <limits>
 
@@ -24,7 +25,8 @@ namespace blas {
 /// where alpha and beta are scalars, C is an n-by-n symmetric matrix,
 /// and A is an n-by-k or k-by-n matrix.
 ///
-/// Generic implementation for arbitrary data types.
+/// Generic implementation for arbitrary data types,
+/// using the packed multiply of gemm; see impl::gemm_packed.
 ///
 /// @param[in] layout
 ///     Matrix storage, Layout::ColMajor or Layout::RowMajor.
@@ -182,59 +184,15 @@ void syrk(
     }
 
     // alpha != zero
-    if (trans == Op::NoTrans) {
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-
-                for (int64_t i = 0; i <= j; ++i)
-                    C(i, j) *= beta;
-
-                for (int64_t l = 0; l < k; ++l) {
-                    scalar_t alpha_Ajl = alpha*A(j, l);
-                    for (int64_t i = 0; i <= j; ++i)
-                        C(i, j) += A(i, l)*alpha_Ajl;
-                }
-            }
-        }
-        else { // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-
-                for (int64_t i = j; i < n; ++i)
-                    C(i, j) *= beta;
-
-                for (int64_t l = 0; l < k; ++l) {
-                    scalar_t alpha_Ajl = alpha*A(j, l);
-                    for (int64_t i = j; i < n; ++i)
-                        C(i, j) += A(i, l)*alpha_Ajl;
-                }
-            }
-        }
-    }
-    else { // trans == Op::Trans
-        if (uplo != Uplo::Lower) {
-            // uplo == Uplo::Upper or uplo == Uplo::General
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = 0; i <= j; ++i) {
-                    scalar_t sum = zero;
-                    for (int64_t l = 0; l < k; ++l)
-                        sum += A(l, i) * A(l, j);
-                    C(i, j) = alpha*sum + beta*C(i, j);
-                }
-            }
-        }
-        else { // uplo == Uplo::Lower
-            for (int64_t j = 0; j < n; ++j) {
-                for (int64_t i = j; i < n; ++i) {
-                    scalar_t sum = zero;
-                    for (int64_t l = 0; l < k; ++l) {
-                        sum +=  A(l, i) * A(l, j);
-                    }
-                    C(i, j) = alpha*sum + beta*C(i, j);
-                }
-            }
-        }
-    }
+    // op(A) op(A)^T, computing the upper (or General) or lower triangle
+    auto opA = [&]( int64_t i, int64_t l ) -> scalar_t {
+        return (trans == Op::NoTrans) ? A(i, l) : A(l, i);
+    };
+    auto opAT = [&]( int64_t l, int64_t j ) -> scalar_t {
+        return (trans == Op::NoTrans) ? A(j, l) : A(l, j);
+    };
+    impl::gemm_packed( (uplo == Uplo::Lower ? Uplo::Lower : Uplo::Upper),
+                       n, n, k, alpha, opA, opAT, beta, C, ldc );
 
     if (uplo == Uplo::General) {
         for (int64_t j = 0; j < n; ++j) {
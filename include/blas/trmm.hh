@@ -7,6 +7,7 @@
 #define BLAS_TRMM_HH
 
 #include "blas/util.hh"
+#include "blas/gemm_packed.hh"
 
 #include <limits>
 
@@ -28,7 +29,8 @@ namespace blas {
 /// B is an m-by-n matrix, and A is an m-by-m or n-by-n, unit or non-unit,
 /// upper or lower triangular matrix.
 ///
-/// Generic implementation for arbitrary data types.
+/// Generic implementation for arbitrary data types. For large A, blocked:
+/// off-diagonal blocks use the packed multiply of gemm (impl::gemm_packed).
 ///
 /// @param[in] layout
 ///     Matrix storage, Layout::ColMajor or Layout::RowMajor.
@@ -149,6 +151,69 @@ void trmm(
         return;
     }
 
+    // Large A: blocked. Diagonal blocks of op(A) use the loops below,
+    // via recursion; the remaining products use impl::gemm_packed.
+    // Blocks are updated in the order that leaves the blocks
+    // they read from unchanged.
+    const int64_t nb = impl::gemm_blocking<scalar_t>().nb;
+    if ((side == Side::Left ? m : n) > nb) {
+        const scalar_t one = 1;
+        // op(A)( i, l )
+        auto opA = [&]( int64_t i, int64_t l ) -> scalar_t {
+            if (trans == Op::NoTrans)
+                return A(i, l);
+            else if (trans == Op::Trans)
+                return A(l, i);
+            else
+                return conj( A(l, i) );
+        };
+        // op(A) is upper triangular
+        bool upper = ((uplo == Uplo::Upper) == (trans == Op::NoTrans));
+        if (side == Side::Left) {
+            // B = alpha op(A) B, by block rows [i0, i1):
+            // B_i = alpha (op(A)_ii B_i + sum_l op(A)_il B_l),
+            // upper: l > i, going down; lower: l < i, going up.
+            for (int64_t ii = 0; ii < m; ii += nb) {
+                int64_t i0 = upper ? ii : std::max( m - ii - nb, int64_t( 0 ) );
+                int64_t i1 = upper ? std::min( ii + nb, m ) : m - ii;
+                int64_t l0 = upper ? i1 : 0;
+                int64_t l1 = upper ? m  : i0;
+                blas::trmm<TA, TB>(
+                    Layout::ColMajor, side, uplo, trans, diag, i1 - i0, n,
+                    alpha, &A(i0, i0), lda, &B(i0, 0), ldb );
+                if (l1 > l0) {
+                    impl::gemm_packed(
+                        Uplo::General, i1 - i0, n, l1 - l0, alpha,
+                        [&]( int64_t i, int64_t l ) { return opA( i0 + i, l0 + l ); },
+                        [&]( int64_t l, int64_t j ) -> scalar_t { return B(l0 + l, j); },
+                        one, &B(i0, 0), ldb );
+                }
+            }
+        }
+        else { // side == Side::Right
+            // B = alpha B op(A), by block columns [j0, j1):
+            // B_j = alpha (B_j op(A)_jj + sum_l B_l op(A)_lj),
+            // upper: l < j, going left; lower: l > j, going right.
+            for (int64_t jj = 0; jj < n; jj += nb) {
+                int64_t j0 = upper ? std::max( n - jj - nb, int64_t( 0 ) ) : jj;
+                int64_t j1 = upper ? n - jj : std::min( jj + nb, n );
+                int64_t l0 = upper ? 0  : j1;
+                int64_t l1 = upper ? j0 : n;
+                blas::trmm<TA, TB>(
+                    Layout::ColMajor, side, uplo, trans, diag, m, j1 - j0,
+                    alpha, &A(j0, j0), lda, &B(0, j0), ldb );
+                if (l1 > l0) {
+                    impl::gemm_packed(
+                        Uplo::General, m, j1 - j0, l1 - l0, alpha,
+                        [&]( int64_t i, int64_t l ) -> scalar_t { return B(i, l0 + l); },
+                        [&]( int64_t l, int64_t j ) { return opA( l0 + l, j0 + j ); },
+                        one, &B(0, j0), ldb );
+                }
+            }
+        }
+        return;
+    }
+
     // alpha != zero
     if (side == Side::Left) {
         if (trans == Op::NoTrans) {
@@ -7,6 +7,7 @@
 #define BLAS_TRSM_HH
 
 #include "blas/util.hh"
+#include "blas/gemm_packed.hh"
 
 #include <limits>
 
@@ -32,7 +33,8 @@ namespace blas {
 /// routine. Such tests must be performed before calling this routine.
 /// @see latrs for a more numerically robust implementation.
 ///
-/// Generic implementation for arbitrary data types.
+/// Generic implementation for arbitrary data types. For large A, blocked:
+/// off-diagonal blocks use the packed multiply of gemm (impl::gemm_packed).
 ///
 /// @param[in] layout
 ///     Matrix storage, Layout::ColMajor or Layout::RowMajor.
@@ -154,6 +156,72 @@ void trsm(
         return;
     }
 
+    // Large A: blocked. Diagonal blocks of op(A) use the loops below,
+    // via recursion; the updates use impl::gemm_packed.
+    // Blocks are solved in the order that their updates need.
+    const int64_t nb = impl::gemm_blocking<scalar_t>().nb;
+    if ((side == Side::Left ? m : n) > nb) {
+        const scalar_t one = 1;
+        // op(A)( i, l )
+        auto opA = [&]( int64_t i, int64_t l ) -> scalar_t {
+            if (trans == Op::NoTrans)
+                return A(i, l);
+            else if (trans == Op::Trans)
+                return A(l, i);
+            else
+                return conj( A(l, i) );
+        };
+        // op(A) is upper triangular
+        bool upper = ((uplo == Uplo::Upper) == (trans == Op::NoTrans));
+        if (side == Side::Left) {
+            // op(A) X = alpha B, by block rows [i0, i1):
+            // op(A)_ii X_i = alpha B_i - sum_l op(A)_il X_l,
+            // lower: l < i, going down; upper: l > i, going up.
+            for (int64_t ii = 0; ii < m; ii += nb) {
+                int64_t i0 = upper ? std::max( m - ii - nb, int64_t( 0 ) ) : ii;
+                int64_t i1 = upper ? m - ii : std::min( ii + nb, m );
+                int64_t l0 = upper ? i1 : 0;
+                int64_t l1 = upper ? m  : i0;
+                scalar_t alpha_ii = alpha;
+                if (l1 > l0) {
+                    impl::gemm_packed(
+                        Uplo::General, i1 - i0, n, l1 - l0, -one,
+                        [&]( int64_t i, int64_t l ) { return opA( i0 + i, l0 + l ); },
+                        [&]( int64_t l, int64_t j ) -> scalar_t { return B(l0 + l, j); },
+                        alpha, &B(i0, 0), ldb );
+                    alpha_ii = one;
+                }
+                blas::trsm<TA, TB>(
+                    Layout::ColMajor, side, uplo, trans, diag, i1 - i0, n,
+                    alpha_ii, &A(i0, i0), lda, &B(i0, 0), ldb );
+            }
+        }
+        else { // side == Side::Right
+            // X op(A) = alpha B, by block columns [j0, j1):
+            // X_j op(A)_jj = alpha B_j - sum_l X_l op(A)_lj,
+            // upper: l < j, going right; lower: l > j, going left.
+            for (int64_t jj = 0; jj < n; jj += nb) {
+                int64_t j0 = upper ? jj : std::max( n - jj - nb, int64_t( 0 ) );
+                int64_t j1 = upper ? std::min( jj + nb, n ) : n - jj;
+                int64_t l0 = upper ? 0  : j1;
+                int64_t l1 = upper ? j0 : n;
+                scalar_t alpha_jj = alpha;
+                if (l1 > l0) {
+                    impl::gemm_packed(
+                        Uplo::General, m, j1 - j0, l1 - l0, -one,
+                        [&]( int64_t i, int64_t l ) -> scalar_t { return B(i, l0 + l); },
+                        [&]( int64_t l, int64_t j ) { return opA( l0 + l, j0 + j ); },
+                        alpha, &B(0, j0), ldb );
+                    alpha_jj = one;
+                }
+                blas::trsm<TA, TB>(
+                    Layout::ColMajor, side, uplo, trans, diag, m, j1 - j0,
+                    alpha_jj, &A(j0, j0), lda, &B(0, j0), ldb );
+            }
+        }
+        return;
+    }
+
     // alpha != zero
     if (side == Side::Left) {
         if (trans == Op::NoTrans) {
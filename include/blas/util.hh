@@ -487,6 +487,18 @@ inline const real_t root_max()
     return sqrt( safe_max<real_t>() * ulp<real_t>() );
 }
 
+//------------------------------------------------------------------------------
+/// Data cache sizes, in bytes, of the CPU that the code is running on;
+/// see cpu_caches(). Used to size the blocks of the generic
+/// Level 3 BLAS templates, e.g., blas::gemm< TA, TB, TC >.
+struct CPUCaches {
+    size_t l1d = 32*1024;       ///< L1 data cache, per core
+    size_t l2  = 256*1024;      ///< L2 cache, per core
+    size_t l3  = 8*1024*1024;   ///< L3 (last level) cache, shared
+};
+
+const CPUCaches& cpu_caches();
+
 //==============================================================================
 namespace internal {
 
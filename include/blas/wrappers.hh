@@ -1115,9 +1115,237 @@ namespace batch {
 //==============================================================================
 // Level 1 Batch BLAS
 
+//------------------------------------------------------------------------------
+// batch axpy
+void axpy(
+    std::vector<int64_t>    const& n,
+    std::vector<float >     const& alpha,
+    std::vector<float*>     const& xarray, std::vector<int64_t> const& incx,
+    std::vector<float*>     const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void axpy(
+    std::vector<int64_t>    const& n,
+    std::vector<double >    const& alpha,
+    std::vector<double*>    const& xarray, std::vector<int64_t> const& incx,
+    std::vector<double*>    const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void axpy(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<float>  > const& alpha,
+    std::vector< std::complex<float>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<float>* > const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void axpy(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<double>  > const& alpha,
+    std::vector< std::complex<double>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<double>* > const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+//------------------------------------------------------------------------------
+// batch dot
+void dot(
+    std::vector<int64_t>    const& n,
+    std::vector<float*>     const& xarray, std::vector<int64_t> const& incx,
+    std::vector<float*>     const& yarray, std::vector<int64_t> const& incy,
+    std::vector<float*>     const& result,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void dot(
+    std::vector<int64_t>    const& n,
+    std::vector<double*>    const& xarray, std::vector<int64_t> const& incx,
+    std::vector<double*>    const& yarray, std::vector<int64_t> const& incy,
+    std::vector<double*>    const& result,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void dot(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<float>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<float>* > const& yarray, std::vector<int64_t> const& incy,
+    std::vector< std::complex<float>* > const& result,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void dot(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<double>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<double>* > const& yarray, std::vector<int64_t> const& incy,
+    std::vector< std::complex<double>* > const& result,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+//------------------------------------------------------------------------------
+// batch nrm2
+void nrm2(
+    std::vector<int64_t>    const& n,
+    std::vector<float*>     const& xarray, std::vector<int64_t> const& incx,
+    std::vector<float*>     const& result,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void nrm2(
+    std::vector<int64_t>    const& n,
+    std::vector<double*>    const& xarray, std::vector<int64_t> const& incx,
+    std::vector<double*>    const& result,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void nrm2(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<float>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector<float*>     const& result,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void nrm2(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<double>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector<double*>    const& result,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+//------------------------------------------------------------------------------
+// batch scal
+void scal(
+    std::vector<int64_t>    const& n,
+    std::vector<float >     const& alpha,
+    std::vector<float*>     const& xarray, std::vector<int64_t> const& incx,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void scal(
+    std::vector<int64_t>    const& n,
+    std::vector<double >    const& alpha,
+    std::vector<double*>    const& xarray, std::vector<int64_t> const& incx,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void scal(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<float>  > const& alpha,
+    std::vector< std::complex<float>* > const& xarray, std::vector<int64_t> const& incx,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void scal(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<double>  > const& alpha,
+    std::vector< std::complex<double>* > const& xarray, std::vector<int64_t> const& incx,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
 //==============================================================================
 // Level 2 Batch BLAS
 
+//------------------------------------------------------------------------------
+// batch gemv
+void gemv(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& trans,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector<float >     const& alpha,
+    std::vector<float*>     const& Aarray, std::vector<int64_t> const& lda,
+    std::vector<float*>     const& xarray, std::vector<int64_t> const& incx,
+    std::vector<float >     const& beta,
+    std::vector<float*>     const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void gemv(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& trans,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector<double >    const& alpha,
+    std::vector<double*>    const& Aarray, std::vector<int64_t> const& lda,
+    std::vector<double*>    const& xarray, std::vector<int64_t> const& incx,
+    std::vector<double >    const& beta,
+    std::vector<double*>    const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void gemv(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& trans,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<float>  > const& alpha,
+    std::vector< std::complex<float>* > const& Aarray, std::vector<int64_t> const& lda,
+    std::vector< std::complex<float>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<float>  > const& beta,
+    std::vector< std::complex<float>* > const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void gemv(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& trans,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<double>  > const& alpha,
+    std::vector< std::complex<double>* > const& Aarray, std::vector<int64_t> const& lda,
+    std::vector< std::complex<double>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<double>  > const& beta,
+    std::vector< std::complex<double>* > const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+//------------------------------------------------------------------------------
+// batch ger
+void ger(
+    blas::Layout layout,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector<float >     const& alpha,
+    std::vector<float*>     const& xarray, std::vector<int64_t> const& incx,
+    std::vector<float*>     const& yarray, std::vector<int64_t> const& incy,
+    std::vector<float*>     const& Aarray, std::vector<int64_t> const& lda,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void ger(
+    blas::Layout layout,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector<double >    const& alpha,
+    std::vector<double*>    const& xarray, std::vector<int64_t> const& incx,
+    std::vector<double*>    const& yarray, std::vector<int64_t> const& incy,
+    std::vector<double*>    const& Aarray, std::vector<int64_t> const& lda,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void ger(
+    blas::Layout layout,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<float>  > const& alpha,
+    std::vector< std::complex<float>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<float>* > const& yarray, std::vector<int64_t> const& incy,
+    std::vector< std::complex<float>* > const& Aarray, std::vector<int64_t> const& lda,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
+void ger(
+    blas::Layout layout,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<double>  > const& alpha,
+    std::vector< std::complex<double>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<double>* > const& yarray, std::vector<int64_t> const& incy,
+    std::vector< std::complex<double>* > const& Aarray, std::vector<int64_t> const& lda,
+    size_t batch_size,
+    std::vector<int64_t>& info );
+
 //==============================================================================
 // Level 3 Batch BLAS
 
@@ -1183,6 +1411,56 @@ void gemm(
     size_t batch_size,
     std::vector<int64_t>& info );
 
+//------------------------------------------------------------------------------
+// strided batch gemm: A_i = A + i*strideA, etc.
+void gemm_strided(
+    blas::Layout layout,
+    blas::Op transA,
+    blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    float alpha,
+    float const* A, int64_t lda, int64_t strideA,
+    float const* B, int64_t ldb, int64_t strideB,
+    float beta,
+    float*       C, int64_t ldc, int64_t strideC,
+    size_t batch_size );
+
+void gemm_strided(
+    blas::Layout layout,
+    blas::Op transA,
+    blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    double alpha,
+    double const* A, int64_t lda, int64_t strideA,
+    double const* B, int64_t ldb, int64_t strideB,
+    double beta,
+    double*       C, int64_t ldc, int64_t strideC,
+    size_t batch_size );
+
+void gemm_strided(
+    blas::Layout layout,
+    blas::Op transA,
+    blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    std::complex<float> alpha,
+    std::complex<float> const* A, int64_t lda, int64_t strideA,
+    std::complex<float> const* B, int64_t ldb, int64_t strideB,
+    std::complex<float> beta,
+    std::complex<float>*       C, int64_t ldc, int64_t strideC,
+    size_t batch_size );
+
+void gemm_strided(
+    blas::Layout layout,
+    blas::Op transA,
+    blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    std::complex<double> alpha,
+    std::complex<double> const* A, int64_t lda, int64_t strideA,
+    std::complex<double> const* B, int64_t ldb, int64_t strideB,
+    std::complex<double> beta,
+    std::complex<double>*       C, int64_t ldc, int64_t strideC,
+    size_t batch_size );
+
 //------------------------------------------------------------------------------
 // batch hemm
 void hemm(
@@ -1639,5 +1917,55 @@ void trsm(
     size_t batch_size,
     std::vector<int64_t>& info );
 
+//------------------------------------------------------------------------------
+// strided batch trsm: A_i = A + i*strideA, etc.
+void trsm_strided(
+    blas::Layout layout,
+    blas::Side side,
+    blas::Uplo uplo,
+    blas::Op trans,
+    blas::Diag diag,
+    int64_t m, int64_t n,
+    float alpha,
+    float const* A, int64_t lda, int64_t strideA,
+    float*       B, int64_t ldb, int64_t strideB,
+    size_t batch_size );
+
+void trsm_strided(
+    blas::Layout layout,
+    blas::Side side,
+    blas::Uplo uplo,
+    blas::Op trans,
+    blas::Diag diag,
+    int64_t m, int64_t n,
+    double alpha,
+    double const* A, int64_t lda, int64_t strideA,
+    double*       B, int64_t ldb, int64_t strideB,
+    size_t batch_size );
+
+void trsm_strided(
+    blas::Layout layout,
+    blas::Side side,
+    blas::Uplo uplo,
+    blas::Op trans,
+    blas::Diag diag,
+    int64_t m, int64_t n,
+    std::complex<float> alpha,
+    std::complex<float> const* A, int64_t lda, int64_t strideA,
+    std::complex<float>*       B, int64_t ldb, int64_t strideB,
+    size_t batch_size );
+
+void trsm_strided(
+    blas::Layout layout,
+    blas::Side side,
+    blas::Uplo uplo,
+    blas::Op trans,
+    blas::Diag diag,
+    int64_t m, int64_t n,
+    std::complex<double> alpha,
+    std::complex<double> const* A, int64_t lda, int64_t strideA,
+    std::complex<double>*       B, int64_t ldb, int64_t strideB,
+    size_t batch_size );
+
 }  // namespace batch
 }  // namespace blas
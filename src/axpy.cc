@@ -68,6 +68,26 @@ inline void axpy(
                 (blas_complex_double*) y, &incy );
 }
 
+//------------------------------------------------------------------------------
+/// Small-size kernel, for n <= small_size(), where the fixed overhead
+/// of calling the vendor BLAS dominates.
+/// @ingroup axpy_internal
+template <typename scalar_t>
+void axpy_small(
+    int64_t n,
+    scalar_t alpha,
+    scalar_t const* x, int64_t incx,
+    scalar_t*       y, int64_t incy )
+{
+    int64_t ix = (incx > 0 ? 0 : (-n + 1)*incx);
+    int64_t iy = (incy > 0 ? 0 : (-n + 1)*incy);
+    for (int64_t i = 0; i < n; ++i) {
+        y[ iy ] += alpha * x[ ix ];
+        ix += incx;
+        iy += incy;
+    }
+}
+
 }  // namespace internal
 
 //==============================================================================
@@ -85,11 +105,20 @@ void axpy(
     scalar_t const* x, int64_t incx,
     scalar_t*       y, int64_t incy )
 {
+    internal::Trace trace( "axpy", internal::trace_type<scalar_t>(), ' ', n );
+
     // check arguments
     blas_error_if( n < 0 );      // standard BLAS returns, doesn't fail
     blas_error_if( incx == 0 );  // standard BLAS doesn't detect inc[xy] == 0
     blas_error_if( incy == 0 );
 
+    // small sizes: skip the vendor BLAS call overhead
+    if (n <= small_size()) {
+        if (alpha != scalar_t( 0 ))
+            internal::axpy_small( n, alpha, x, incx, y, incy );
+        return;
+    }
+
     // convert arguments
     blas_int n_    = to_blas_int( n );
     blas_int incx_ = to_blas_int( incx );
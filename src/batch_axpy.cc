@@ -0,0 +1,147 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "blas/batch_common.hh"
+#include "blas.hh"
+#include "blas/flops.hh"
+#include "blas_internal.hh"
+
+#include <limits>
+
+namespace blas {
+
+//==============================================================================
+namespace impl {
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched version.
+/// Mid-level templated wrapper checks and converts arguments,
+/// then makes individual routine calls, scheduled by internal::batch_run.
+/// @ingroup axpy_internal
+///
+template <typename scalar_t>
+void axpy(
+    std::vector<int64_t>    const& n,
+    std::vector<scalar_t >  const& alpha,
+    std::vector<scalar_t*>  const& xarray, std::vector<int64_t> const& incx,
+    std::vector<scalar_t*>  const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    internal::Trace trace( "batch::axpy", internal::trace_type<scalar_t>(),
+                           ' ', internal::trace_first( n ), 0, 0, batch_size );
+
+    blas_error_if( batch_size < 0 );
+    blas_error_if( info.size() != 0
+                   && info.size() != 1
+                   && info.size() != batch_size );
+    if (info.size() > 0) {
+        // perform error checking
+        blas::batch::axpy_check(
+            n, alpha, xarray, incx, yarray, incy, batch_size, info );
+    }
+
+    if (blas::batch::is_uniform( n, incx, incy, alpha )) {
+        // Uniform batch: extract parameters once;
+        // the per-item loop extracts only pointers.
+        int64_t    n_      = n[ 0 ];
+        int64_t    incx_   = incx[ 0 ];
+        int64_t    incy_   = incy[ 0 ];
+        scalar_t   alpha_  = alpha[ 0 ];
+        internal::batch_run_uniform(
+            batch_size, Gflop<scalar_t>::axpy( n_ ),
+            [&]( size_t i ) {
+                scalar_t*  x_      = blas::batch::extract( xarray, i );
+                scalar_t*  y_      = blas::batch::extract( yarray, i );
+                blas::axpy( n_, alpha_, x_, incx_, y_, incy_ );
+            } );
+        return;
+    }
+
+    // Items are memory bound, so all run in parallel unless huge.
+    internal::batch_run(
+        batch_size,
+        [&]( size_t i ) {
+            return Gflop<scalar_t>::axpy( blas::batch::extract( n, i ) );
+        },
+        [&]( size_t i ) {
+            int64_t    n_      = blas::batch::extract( n,      i );
+            int64_t    incx_   = blas::batch::extract( incx,   i );
+            int64_t    incy_   = blas::batch::extract( incy,   i );
+            scalar_t   alpha_  = blas::batch::extract( alpha,  i );
+            scalar_t*  x_      = blas::batch::extract( xarray, i );
+            scalar_t*  y_      = blas::batch::extract( yarray, i );
+            blas::axpy( n_, alpha_, x_, incx_, y_, incy_ );
+        } );
+}
+
+}  // namespace impl
+
+//==============================================================================
+// High-level overloaded wrappers call mid-level templated wrapper.
+namespace batch {
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched, float version.
+/// @ingroup axpy
+void axpy(
+    std::vector<int64_t>    const& n,
+    std::vector<float >     const& alpha,
+    std::vector<float*>     const& xarray, std::vector<int64_t> const& incx,
+    std::vector<float*>     const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    impl::axpy( n, alpha, xarray, incx, yarray, incy,
+                batch_size, info );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched, double version.
+/// @ingroup axpy
+void axpy(
+    std::vector<int64_t>    const& n,
+    std::vector<double >    const& alpha,
+    std::vector<double*>    const& xarray, std::vector<int64_t> const& incx,
+    std::vector<double*>    const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    impl::axpy( n, alpha, xarray, incx, yarray, incy,
+                batch_size, info );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched, complex<float> version.
+/// @ingroup axpy
+void axpy(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<float>  > const& alpha,
+    std::vector< std::complex<float>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<float>* > const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    impl::axpy( n, alpha, xarray, incx, yarray, incy,
+                batch_size, info );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched, complex<double> version.
+/// @ingroup axpy
+void axpy(
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<double>  > const& alpha,
+    std::vector< std::complex<double>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<double>* > const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    impl::axpy( n, alpha, xarray, incx, yarray, incy,
+                batch_size, info );
+}
+
+}  // namespace batch
+}  // namespace blas
@@ -5,18 +5,307 @@
 
 #include "blas/batch_common.hh"
 #include "blas.hh"
+#include "blas/flops.hh"
+#include "blas_internal.hh"
 
+#include <cstring>
 #include <limits>
+#include <map>
+#include <tuple>
+
+#ifdef BLAS_HAVE_CBLAS_GEMM_BATCH
+//------------------------------------------------------------------------------
+// Group batched gemm in MKL and OpenBLAS. Declared here rather than including
+// cblas.h, since not every cblas.h declares them. CBLAS enums are passed as
+// int; integers are MKL_INT or blasint, which match blas_int.
+extern "C" {
+
+void cblas_sgemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    float const* alpha,
+    float const** A, blas_int const* lda,
+    float const** B, blas_int const* ldb,
+    float const* beta,
+    float** C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size );
+
+void cblas_dgemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    double const* alpha,
+    double const** A, blas_int const* lda,
+    double const** B, blas_int const* ldb,
+    double const* beta,
+    double** C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size );
+
+void cblas_cgemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    void const* alpha,
+    void const** A, blas_int const* lda,
+    void const** B, blas_int const* ldb,
+    void const* beta,
+    void** C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size );
+
+void cblas_zgemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    void const* alpha,
+    void const** A, blas_int const* lda,
+    void const** B, blas_int const* ldb,
+    void const* beta,
+    void** C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size );
+
+}  // extern "C"
+#endif
 
 namespace blas {
 
+#ifdef BLAS_HAVE_CBLAS_GEMM_BATCH
+//==============================================================================
+namespace internal {
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS batched gemm, float version.
+/// @ingroup gemm_internal
+inline void gemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    float const* alpha,
+    float* const* A, blas_int const* lda,
+    float* const* B, blas_int const* ldb,
+    float const* beta,
+    float* const* C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size )
+{
+    cblas_sgemm_batch( layout, transA, transB, m, n, k,
+                       alpha, (float const**) A, lda,
+                              (float const**) B, ldb,
+                       beta,  (float**) C, ldc,
+                       group_count, group_size );
+}
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS batched gemm, double version.
+/// @ingroup gemm_internal
+inline void gemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    double const* alpha,
+    double* const* A, blas_int const* lda,
+    double* const* B, blas_int const* ldb,
+    double const* beta,
+    double* const* C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size )
+{
+    cblas_dgemm_batch( layout, transA, transB, m, n, k,
+                       alpha, (double const**) A, lda,
+                              (double const**) B, ldb,
+                       beta,  (double**) C, ldc,
+                       group_count, group_size );
+}
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS batched gemm, complex<float> version.
+/// @ingroup gemm_internal
+inline void gemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    std::complex<float> const* alpha,
+    std::complex<float>* const* A, blas_int const* lda,
+    std::complex<float>* const* B, blas_int const* ldb,
+    std::complex<float> const* beta,
+    std::complex<float>* const* C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size )
+{
+    cblas_cgemm_batch( layout, transA, transB, m, n, k,
+                       alpha, (void const**) A, lda,
+                              (void const**) B, ldb,
+                       beta,  (void**) C, ldc,
+                       group_count, group_size );
+}
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS batched gemm, complex<double> version.
+/// @ingroup gemm_internal
+inline void gemm_batch(
+    int layout, int const* transA, int const* transB,
+    blas_int const* m, blas_int const* n, blas_int const* k,
+    std::complex<double> const* alpha,
+    std::complex<double>* const* A, blas_int const* lda,
+    std::complex<double>* const* B, blas_int const* ldb,
+    std::complex<double> const* beta,
+    std::complex<double>* const* C, blas_int const* ldc,
+    blas_int group_count, blas_int const* group_size )
+{
+    cblas_zgemm_batch( layout, transA, transB, m, n, k,
+                       alpha, (void const**) A, lda,
+                              (void const**) B, ldb,
+                       beta,  (void**) C, ldc,
+                       group_count, group_size );
+}
+
+//------------------------------------------------------------------------------
+/// @return bit pattern of x, to group scalars in a std::map. Unlike
+/// comparing values, this is a strict weak ordering even with NaN.
+template <typename real_t>
+uint64_t scalar_bits( real_t x )
+{
+    static_assert( sizeof(real_t) <= sizeof(uint64_t), "real_t too large" );
+    uint64_t bits = 0;
+    std::memcpy( &bits, &x, sizeof(real_t) );
+    return bits;
+}
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched version using CBLAS batched gemm.
+/// Groups items with identical parameters, as the device group batch
+/// routine expects, then makes one vendor call for all groups.
+/// Items in a group keep their relative order.
+/// @ingroup gemm_internal
+///
+template <typename scalar_t>
+void gemm_batch(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& transA,
+    std::vector<blas::Op>   const& transB,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector<int64_t>    const& k,
+    std::vector<scalar_t >  const& alpha,
+    std::vector<scalar_t*>  const& Aarray, std::vector<int64_t> const& lda,
+    std::vector<scalar_t*>  const& Barray, std::vector<int64_t> const& ldb,
+    std::vector<scalar_t >  const& beta,
+    std::vector<scalar_t*>  const& Carray, std::vector<int64_t> const& ldc,
+    size_t batch_size )
+{
+    using real_t = blas::real_type<scalar_t>;
+
+    blas_error_if( layout != Layout::ColMajor &&
+                   layout != Layout::RowMajor );
+
+    // Group parameters, ordered for std::map; scalars as bit patterns.
+    using Key = std::tuple< blas::Op, blas::Op,
+                            int64_t, int64_t, int64_t,
+                            int64_t, int64_t, int64_t,
+                            uint64_t, uint64_t, uint64_t, uint64_t >;
+
+    // Index of each item's group; group_index[ i ] < group_count.
+    std::vector<size_t> group_index( batch_size, 0 );
+    std::vector<size_t> group_first;  // first item in each group
+    bool uniform = transA.size() == 1 && transB.size() == 1
+                   && m.size()   == 1 && n.size()     == 1 && k.size() == 1
+                   && lda.size() == 1 && ldb.size()   == 1 && ldc.size() == 1
+                   && alpha.size() == 1 && beta.size() == 1;
+    if (uniform) {
+        group_first.push_back( 0 );
+    }
+    else {
+        std::map<Key, size_t> groups;
+        for (size_t i = 0; i < batch_size; ++i) {
+            scalar_t alpha_ = blas::batch::extract( alpha, i );
+            scalar_t beta_  = blas::batch::extract( beta,  i );
+            Key key( blas::batch::extract( transA, i ),
+                     blas::batch::extract( transB, i ),
+                     blas::batch::extract( m,      i ),
+                     blas::batch::extract( n,      i ),
+                     blas::batch::extract( k,      i ),
+                     blas::batch::extract( lda,    i ),
+                     blas::batch::extract( ldb,    i ),
+                     blas::batch::extract( ldc,    i ),
+                     scalar_bits( real_t( std::real( alpha_ ) ) ),
+                     scalar_bits( real_t( std::imag( alpha_ ) ) ),
+                     scalar_bits( real_t( std::real( beta_  ) ) ),
+                     scalar_bits( real_t( std::imag( beta_  ) ) ) );
+            auto iter = groups.insert( { key, group_first.size() } ).first;
+            if (iter->second == group_first.size())
+                group_first.push_back( i );
+            group_index[ i ] = iter->second;
+        }
+    }
+    size_t group_count = group_first.size();
+
+    // Parameters per group.
+    std::vector<int>      transA_( group_count ), transB_( group_count );
+    std::vector<blas_int> m_  ( group_count ), n_  ( group_count ),
+                          k_  ( group_count ), lda_( group_count ),
+                          ldb_( group_count ), ldc_( group_count ),
+                          group_size( group_count, 0 );
+    std::vector<scalar_t> alpha_( group_count ), beta_( group_count );
+    bool colmajor = (layout == Layout::ColMajor);
+    for (size_t g = 0; g < group_count; ++g) {
+        size_t i = group_first[ g ];
+        blas::Op tA  = blas::batch::extract( transA, i );
+        blas::Op tB  = blas::batch::extract( transB, i );
+        int64_t  mg  = blas::batch::extract( m,   i );
+        int64_t  ng  = blas::batch::extract( n,   i );
+        int64_t  kg  = blas::batch::extract( k,   i );
+        int64_t  lda_g = blas::batch::extract( lda, i );
+        int64_t  ldb_g = blas::batch::extract( ldb, i );
+        int64_t  ldc_g = blas::batch::extract( ldc, i );
+
+        // Check arguments as blas::gemm does, since the vendor's
+        // error handler would abort instead of throwing.
+        blas_error_if( mg < 0 );
+        blas_error_if( ng < 0 );
+        blas_error_if( kg < 0 );
+        blas_error_if( lda_g < ((tA == Op::NoTrans) == colmajor ? mg : kg) );
+        blas_error_if( ldb_g < ((tB == Op::NoTrans) == colmajor ? kg : ng) );
+        blas_error_if( ldc_g < (colmajor ? mg : ng) );
+
+        transA_[ g ] = op2cblas( tA );
+        transB_[ g ] = op2cblas( tB );
+        m_  [ g ] = to_blas_int( mg );
+        n_  [ g ] = to_blas_int( ng );
+        k_  [ g ] = to_blas_int( kg );
+        lda_[ g ] = to_blas_int( lda_g );
+        ldb_[ g ] = to_blas_int( ldb_g );
+        ldc_[ g ] = to_blas_int( ldc_g );
+        alpha_[ g ] = blas::batch::extract( alpha, i );
+        beta_ [ g ] = blas::batch::extract( beta,  i );
+    }
+    for (size_t i = 0; i < batch_size; ++i) {
+        group_size[ group_index[ i ] ] += 1;
+    }
+
+    // Arrays of pointers, ordered by group.
+    std::vector<size_t> offset( group_count, 0 );
+    for (size_t g = 1; g < group_count; ++g) {
+        offset[ g ] = offset[ g-1 ] + group_size[ g-1 ];
+    }
+    std::vector<scalar_t*> A( batch_size ), B( batch_size ), C( batch_size );
+    for (size_t i = 0; i < batch_size; ++i) {
+        size_t j = offset[ group_index[ i ] ]++;
+        A[ j ] = blas::batch::extract( Aarray, i );
+        B[ j ] = blas::batch::extract( Barray, i );
+        C[ j ] = blas::batch::extract( Carray, i );
+    }
+
+    int layout_ = (layout == Layout::RowMajor ? 101    // CblasRowMajor
+                                              : 102);  // CblasColMajor
+    gemm_batch( layout_, transA_.data(), transB_.data(),
+                m_.data(), n_.data(), k_.data(),
+                alpha_.data(), A.data(), lda_.data(),
+                               B.data(), ldb_.data(),
+                beta_.data(),  C.data(), ldc_.data(),
+                to_blas_int( group_count ), group_size.data() );
+}
+
+}  // namespace internal
+#endif // BLAS_HAVE_CBLAS_GEMM_BATCH
+
 //==============================================================================
 namespace impl {
 
 //------------------------------------------------------------------------------
 /// CPU, variable-size batched version.
 /// Mid-level templated wrapper checks and converts arguments,
-/// then makes individual routine calls in parallel.
+/// then calls the vendor's batched gemm, if available,
+/// otherwise makes individual routine calls, scheduled by internal::batch_run.
 /// @ingroup gemm_internal
 ///
 template <typename scalar_t>
@@ -35,6 +324,12 @@ void gemm(
     size_t batch_size,
     std::vector<int64_t>& info )
 {
+    internal::Trace trace( "batch::gemm", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), internal::trace_first( m ), internal::trace_first( n ),
+                           internal::trace_first( k ), batch_size,
+                           op2char( internal::trace_first( transA ) ),
+                           op2char( internal::trace_first( transB ) ) );
+
     blas_error_if( batch_size < 0 );
     blas_error_if( info.size() != 0
                    && info.size() != 1
@@ -46,25 +341,70 @@ void gemm(
             alpha, Aarray, lda, Barray, ldb, beta, Carray, ldc,
             batch_size, info );
     }
+    if (batch_size == 0)
+        return;
 
-    #pragma omp parallel for schedule( dynamic )
-    for (size_t i = 0; i < batch_size; ++i) {
-        blas::Op   transA_ = blas::batch::extract( transA, i );
-        blas::Op   transB_ = blas::batch::extract( transB, i );
-        int64_t    m_      = blas::batch::extract( m,      i );
-        int64_t    n_      = blas::batch::extract( n,      i );
-        int64_t    k_      = blas::batch::extract( k,      i );
-        int64_t    lda_    = blas::batch::extract( lda,    i );
-        int64_t    ldb_    = blas::batch::extract( ldb,    i );
-        int64_t    ldc_    = blas::batch::extract( ldc,    i );
-        scalar_t   alpha_  = blas::batch::extract( alpha,  i );
-        scalar_t   beta_   = blas::batch::extract( beta,   i );
-        scalar_t*  A_      = blas::batch::extract( Aarray, i );
-        scalar_t*  B_      = blas::batch::extract( Barray, i );
-        scalar_t*  C_      = blas::batch::extract( Carray, i );
-        blas::gemm( layout, transA_, transB_, m_, n_, k_,
-                    alpha_, A_, lda_, B_, ldb_, beta_,  C_, ldc_ );
-    }
+    #ifdef BLAS_HAVE_CBLAS_GEMM_BATCH
+        // The vendor schedules items and threads; batch::Policy and
+        // PinBlasThreads don't apply.
+        internal::gemm_batch(
+            layout, transA, transB, m, n, k,
+            alpha, Aarray, lda, Barray, ldb, beta, Carray, ldc,
+            batch_size );
+    #else
+        if (blas::batch::is_uniform( transA, transB, m, n, k,
+                                     lda, ldb, ldc, alpha, beta )) {
+            // Uniform batch: extract parameters once;
+            // the per-item loop extracts only pointers.
+            blas::Op   transA_ = transA[ 0 ];
+            blas::Op   transB_ = transB[ 0 ];
+            int64_t    m_      = m[ 0 ];
+            int64_t    n_      = n[ 0 ];
+            int64_t    k_      = k[ 0 ];
+            int64_t    lda_    = lda[ 0 ];
+            int64_t    ldb_    = ldb[ 0 ];
+            int64_t    ldc_    = ldc[ 0 ];
+            scalar_t   alpha_  = alpha[ 0 ];
+            scalar_t   beta_   = beta[ 0 ];
+            internal::batch_run_uniform(
+                batch_size, Gflop<scalar_t>::gemm( m_, n_, k_ ),
+                [&]( size_t i ) {
+                    scalar_t*  A_      = blas::batch::extract( Aarray, i );
+                    scalar_t*  B_      = blas::batch::extract( Barray, i );
+                    scalar_t*  C_      = blas::batch::extract( Carray, i );
+                    blas::gemm( layout, transA_, transB_, m_, n_, k_,
+                                alpha_, A_, lda_, B_, ldb_, beta_,  C_, ldc_ );
+                } );
+            return;
+        }
+
+        // Large items run one at a time with all BLAS threads;
+        // small items run in parallel, largest first.
+        internal::batch_run(
+            batch_size,
+            [&]( size_t i ) {
+                return Gflop<scalar_t>::gemm( blas::batch::extract( m, i ),
+                                              blas::batch::extract( n, i ),
+                                              blas::batch::extract( k, i ) );
+            },
+            [&]( size_t i ) {
+                blas::Op   transA_ = blas::batch::extract( transA, i );
+                blas::Op   transB_ = blas::batch::extract( transB, i );
+                int64_t    m_      = blas::batch::extract( m,      i );
+                int64_t    n_      = blas::batch::extract( n,      i );
+                int64_t    k_      = blas::batch::extract( k,      i );
+                int64_t    lda_    = blas::batch::extract( lda,    i );
+                int64_t    ldb_    = blas::batch::extract( ldb,    i );
+                int64_t    ldc_    = blas::batch::extract( ldc,    i );
+                scalar_t   alpha_  = blas::batch::extract( alpha,  i );
+                scalar_t   beta_   = blas::batch::extract( beta,   i );
+                scalar_t*  A_      = blas::batch::extract( Aarray, i );
+                scalar_t*  B_      = blas::batch::extract( Barray, i );
+                scalar_t*  C_      = blas::batch::extract( Carray, i );
+                blas::gemm( layout, transA_, transB_, m_, n_, k_,
+                            alpha_, A_, lda_, B_, ldb_, beta_,  C_, ldc_ );
+            } );
+    #endif
 }
 
 }  // namespace impl
@@ -0,0 +1,332 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "blas.hh"
+#include "blas/flops.hh"
+#include "blas_internal.hh"
+
+#include <limits>
+
+#ifdef BLAS_HAVE_CBLAS_GEMM_BATCH_STRIDED
+//------------------------------------------------------------------------------
+// Strided batched gemm in MKL. Declared here rather than including cblas.h;
+// see batch_gemm.cc.
+extern "C" {
+
+void cblas_sgemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    float alpha,
+    float const* A, blas_int lda, blas_int strideA,
+    float const* B, blas_int ldb, blas_int strideB,
+    float beta,
+    float*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size );
+
+void cblas_dgemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    double alpha,
+    double const* A, blas_int lda, blas_int strideA,
+    double const* B, blas_int ldb, blas_int strideB,
+    double beta,
+    double*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size );
+
+void cblas_cgemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    void const* alpha,
+    void const* A, blas_int lda, blas_int strideA,
+    void const* B, blas_int ldb, blas_int strideB,
+    void const* beta,
+    void*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size );
+
+void cblas_zgemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    void const* alpha,
+    void const* A, blas_int lda, blas_int strideA,
+    void const* B, blas_int ldb, blas_int strideB,
+    void const* beta,
+    void*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size );
+
+}  // extern "C"
+#endif
+
+namespace blas {
+
+#ifdef BLAS_HAVE_CBLAS_GEMM_BATCH_STRIDED
+//==============================================================================
+namespace internal {
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS strided batched gemm, float version.
+/// @ingroup gemm_internal
+inline void gemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    float alpha,
+    float const* A, blas_int lda, blas_int strideA,
+    float const* B, blas_int ldb, blas_int strideB,
+    float beta,
+    float*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size )
+{
+    cblas_sgemm_batch_strided( layout, transA, transB, m, n, k,
+                               alpha, A, lda, strideA, B, ldb, strideB,
+                               beta,  C, ldc, strideC, batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS strided batched gemm, double version.
+/// @ingroup gemm_internal
+inline void gemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    double alpha,
+    double const* A, blas_int lda, blas_int strideA,
+    double const* B, blas_int ldb, blas_int strideB,
+    double beta,
+    double*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size )
+{
+    cblas_dgemm_batch_strided( layout, transA, transB, m, n, k,
+                               alpha, A, lda, strideA, B, ldb, strideB,
+                               beta,  C, ldc, strideC, batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS strided batched gemm,
+/// complex<float> version.
+/// @ingroup gemm_internal
+inline void gemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    std::complex<float> alpha,
+    std::complex<float> const* A, blas_int lda, blas_int strideA,
+    std::complex<float> const* B, blas_int ldb, blas_int strideB,
+    std::complex<float> beta,
+    std::complex<float>*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size )
+{
+    cblas_cgemm_batch_strided( layout, transA, transB, m, n, k,
+                               &alpha, A, lda, strideA, B, ldb, strideB,
+                               &beta,  C, ldc, strideC, batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS strided batched gemm,
+/// complex<double> version.
+/// @ingroup gemm_internal
+inline void gemm_batch_strided(
+    int layout, int transA, int transB,
+    blas_int m, blas_int n, blas_int k,
+    std::complex<double> alpha,
+    std::complex<double> const* A, blas_int lda, blas_int strideA,
+    std::complex<double> const* B, blas_int ldb, blas_int strideB,
+    std::complex<double> beta,
+    std::complex<double>*       C, blas_int ldc, blas_int strideC,
+    blas_int batch_size )
+{
+    cblas_zgemm_batch_strided( layout, transA, transB, m, n, k,
+                               &alpha, A, lda, strideA, B, ldb, strideB,
+                               &beta,  C, ldc, strideC, batch_size );
+}
+
+}  // namespace internal
+#endif // BLAS_HAVE_CBLAS_GEMM_BATCH_STRIDED
+
+//==============================================================================
+namespace impl {
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched version.
+/// Mid-level templated wrapper checks and converts arguments,
+/// then calls the vendor's strided batched gemm, if available,
+/// otherwise makes individual routine calls, scheduled by
+/// internal::batch_run_uniform.
+/// @ingroup gemm_internal
+///
+template <typename scalar_t>
+void gemm_strided(
+    blas::Layout layout,
+    blas::Op transA,
+    blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    scalar_t alpha,
+    scalar_t const* A, int64_t lda, int64_t strideA,
+    scalar_t const* B, int64_t ldb, int64_t strideB,
+    scalar_t beta,
+    scalar_t*       C, int64_t ldc, int64_t strideC,
+    size_t batch_size )
+{
+    internal::Trace trace( "batch::gemm_strided", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), m, n, k, batch_size,
+                           op2char( transA ), op2char( transB ) );
+
+    // check arguments
+    blas_error_if( layout != Layout::ColMajor &&
+                   layout != Layout::RowMajor );
+    blas_error_if( transA != Op::NoTrans &&
+                   transA != Op::Trans &&
+                   transA != Op::ConjTrans );
+    blas_error_if( transB != Op::NoTrans &&
+                   transB != Op::Trans &&
+                   transB != Op::ConjTrans );
+    blas_error_if( m < 0 );
+    blas_error_if( n < 0 );
+    blas_error_if( k < 0 );
+
+    bool colmajor = (layout == Layout::ColMajor);
+    blas_error_if( lda < ((transA == Op::NoTrans) == colmajor ? m : k) );
+    blas_error_if( ldb < ((transB == Op::NoTrans) == colmajor ? k : n) );
+    blas_error_if( ldc < (colmajor ? m : n) );
+
+    // A and B may be shared (stride 0); C items must not overlap.
+    blas_error_if( strideA < 0 );
+    blas_error_if( strideB < 0 );
+    blas_error_if( batch_size > 1 && strideC < ldc * (colmajor ? n : m) );
+
+    if (batch_size == 0)
+        return;
+
+    #ifdef BLAS_HAVE_CBLAS_GEMM_BATCH_STRIDED
+        int layout_ = (colmajor ? 102 : 101);  // CblasColMajor, CblasRowMajor
+        internal::gemm_batch_strided(
+            layout_, internal::op2cblas( transA ), internal::op2cblas( transB ),
+            to_blas_int( m ), to_blas_int( n ), to_blas_int( k ),
+            alpha, A, to_blas_int( lda ), to_blas_int( strideA ),
+                   B, to_blas_int( ldb ), to_blas_int( strideB ),
+            beta,  C, to_blas_int( ldc ), to_blas_int( strideC ),
+            to_blas_int( batch_size ) );
+    #else
+        internal::batch_run_uniform(
+            batch_size, Gflop<scalar_t>::gemm( m, n, k ),
+            [&]( size_t i ) {
+                blas::gemm( layout, transA, transB, m, n, k,
+                            alpha, A + i*strideA, lda,
+                                   B + i*strideB, ldb,
+                            beta,  C + i*strideC, ldc );
+            } );
+    #endif
+}
+
+}  // namespace impl
+
+//==============================================================================
+// High-level overloaded wrappers call mid-level templated wrapper.
+namespace batch {
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched general matrix-matrix multiply:
+/// \[
+///     C_i = \alpha op(A_i) \times op(B_i) + \beta C_i,
+/// \]
+/// for $i = 0, \dots, batch\_size - 1$, where
+/// $A_i = A + i \cdot strideA$, $B_i = B + i \cdot strideB$, and
+/// $C_i = C + i \cdot strideC$. All items share the same parameters,
+/// so no pointer arrays are needed. Arguments are as in blas::gemm,
+/// with additionally:
+///
+/// @param[in] strideA
+///     Distance between consecutive A_i, in elements. strideA >= 0;
+///     0 uses the same A for all items. Likewise strideB.
+///
+/// @param[in] strideC
+///     Distance between consecutive C_i, in elements. If batch_size > 1,
+///     strideC >= ldc*n (col-major) or ldc*m (row-major), so the C_i
+///     don't overlap.
+///
+/// @param[in] batch_size
+///     Number of items.
+///
+/// Uses the vendor's strided batched gemm (cblas_?gemm_batch_strided in MKL)
+/// if configure found it (BLAS_HAVE_CBLAS_GEMM_BATCH_STRIDED).
+/// Throws blas::Error on invalid arguments.
+///
+/// float version.
+/// @ingroup gemm
+void gemm_strided(
+    blas::Layout layout,
+    blas::Op transA,
+    blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    float alpha,
+    float const* A, int64_t lda, int64_t strideA,
+    float const* B, int64_t ldb, int64_t strideB,
+    float beta,
+    float*       C, int64_t ldc, int64_t strideC,
+    size_t batch_size )
+{
+    impl::gemm_strided( layout, transA, transB, m, n, k,
+                        alpha, A, lda, strideA, B, ldb, strideB,
+                        beta,  C, ldc, strideC, batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched, double version.
+/// @ingroup gemm
+void gemm_strided(
+    blas::Layout layout,
+    blas::Op transA,
+    blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    double alpha,
+    double const* A, int64_t lda, int64_t strideA,
+    double const* B, int64_t ldb, int64_t strideB,
+    double beta,
+    double*       C, int64_t ldc, int64_t strideC,
+    size_t batch_size )
+{
+    impl::gemm_strided( layout, transA, transB, m, n, k,
+                        alpha, A, lda, strideA, B, ldb, strideB,
+                        beta,  C, ldc, strideC, batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched, complex<float> version.
+/// @ingroup gemm
+void gemm_strided(
+    blas::Layout layout,
+    blas::Op transA,
+    blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    std::complex<float> alpha,
+    std::complex<float> const* A, int64_t lda, int64_t strideA,
+    std::complex<float> const* B, int64_t ldb, int64_t strideB,
+    std::complex<float> beta,
+    std::complex<float>*       C, int64_t ldc, int64_t strideC,
+    size_t batch_size )
+{
+    impl::gemm_strided( layout, transA, transB, m, n, k,
+                        alpha, A, lda, strideA, B, ldb, strideB,
+                        beta,  C, ldc, strideC, batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched, complex<double> version.
+/// @ingroup gemm
+void gemm_strided(
+    blas::Layout layout,
+    blas::Op transA,
+    blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    std::complex<double> alpha,
+    std::complex<double> const* A, int64_t lda, int64_t strideA,
+    std::complex<double> const* B, int64_t ldb, int64_t strideB,
+    std::complex<double> beta,
+    std::complex<double>*       C, int64_t ldc, int64_t strideC,
+    size_t batch_size )
+{
+    impl::gemm_strided( layout, transA, transB, m, n, k,
+                        alpha, A, lda, strideA, B, ldb, strideB,
+                        beta,  C, ldc, strideC, batch_size );
+}
+
+}  // namespace batch
+}  // namespace blas
@@ -0,0 +1,199 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "blas/batch_common.hh"
+#include "blas.hh"
+#include "blas/flops.hh"
+#include "blas_internal.hh"
+
+#include <limits>
+
+namespace blas {
+
+//==============================================================================
+namespace impl {
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched version.
+/// Mid-level templated wrapper checks and converts arguments,
+/// then makes individual routine calls, scheduled by internal::batch_run.
+/// @ingroup gemv_internal
+///
+template <typename scalar_t>
+void gemv(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& trans,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector<scalar_t >  const& alpha,
+    std::vector<scalar_t*>  const& Aarray, std::vector<int64_t> const& lda,
+    std::vector<scalar_t*>  const& xarray, std::vector<int64_t> const& incx,
+    std::vector<scalar_t >  const& beta,
+    std::vector<scalar_t*>  const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    internal::Trace trace( "batch::gemv", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), internal::trace_first( m ),
+                           internal::trace_first( n ), 0, batch_size,
+                           op2char( internal::trace_first( trans ) ) );
+
+    blas_error_if( batch_size < 0 );
+    blas_error_if( info.size() != 0
+                   && info.size() != 1
+                   && info.size() != batch_size );
+    if (info.size() > 0) {
+        // perform error checking
+        blas::batch::gemv_check(
+            layout, trans, m, n, alpha, Aarray, lda, xarray, incx,
+            beta, yarray, incy, batch_size, info );
+    }
+
+    if (blas::batch::is_uniform( trans, m, n, lda, incx, incy, alpha, beta )) {
+        // Uniform batch: extract parameters once;
+        // the per-item loop extracts only pointers.
+        blas::Op   trans_  = trans[ 0 ];
+        int64_t    m_      = m[ 0 ];
+        int64_t    n_      = n[ 0 ];
+        int64_t    lda_    = lda[ 0 ];
+        int64_t    incx_   = incx[ 0 ];
+        int64_t    incy_   = incy[ 0 ];
+        scalar_t   alpha_  = alpha[ 0 ];
+        scalar_t   beta_   = beta[ 0 ];
+        internal::batch_run_uniform(
+            batch_size, Gflop<scalar_t>::gemv( m_, n_ ),
+            [&]( size_t i ) {
+                scalar_t*  A_      = blas::batch::extract( Aarray, i );
+                scalar_t*  x_      = blas::batch::extract( xarray, i );
+                scalar_t*  y_      = blas::batch::extract( yarray, i );
+                blas::gemv( layout, trans_, m_, n_,
+                            alpha_, A_, lda_, x_, incx_,
+                            beta_, y_, incy_ );
+            } );
+        return;
+    }
+
+    // Large items run one at a time with all BLAS threads;
+    // small items run in parallel, largest first.
+    internal::batch_run(
+        batch_size,
+        [&]( size_t i ) {
+            return Gflop<scalar_t>::gemv( blas::batch::extract( m, i ),
+                                          blas::batch::extract( n, i ) );
+        },
+        [&]( size_t i ) {
+            blas::Op   trans_  = blas::batch::extract( trans,  i );
+            int64_t    m_      = blas::batch::extract( m,      i );
+            int64_t    n_      = blas::batch::extract( n,      i );
+            int64_t    lda_    = blas::batch::extract( lda,    i );
+            int64_t    incx_   = blas::batch::extract( incx,   i );
+            int64_t    incy_   = blas::batch::extract( incy,   i );
+            scalar_t   alpha_  = blas::batch::extract( alpha,  i );
+            scalar_t   beta_   = blas::batch::extract( beta,   i );
+            scalar_t*  A_      = blas::batch::extract( Aarray, i );
+            scalar_t*  x_      = blas::batch::extract( xarray, i );
+            scalar_t*  y_      = blas::batch::extract( yarray, i );
+            blas::gemv( layout, trans_, m_, n_,
+                        alpha_, A_, lda_, x_, incx_,
+                        beta_, y_, incy_ );
+        } );
+}
+
+}  // namespace impl
+
+//==============================================================================
+// High-level overloaded wrappers call mid-level templated wrapper.
+namespace batch {
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched, float version.
+/// @ingroup gemv
+void gemv(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& trans,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector<float >     const& alpha,
+    std::vector<float*>     const& Aarray, std::vector<int64_t> const& lda,
+    std::vector<float*>     const& xarray, std::vector<int64_t> const& incx,
+    std::vector<float >     const& beta,
+    std::vector<float*>     const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    impl::gemv( layout, trans, m, n,
+                alpha, Aarray, lda, xarray, incx,
+                beta, yarray, incy,
+                batch_size, info );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched, double version.
+/// @ingroup gemv
+void gemv(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& trans,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector<double >    const& alpha,
+    std::vector<double*>    const& Aarray, std::vector<int64_t> const& lda,
+    std::vector<double*>    const& xarray, std::vector<int64_t> const& incx,
+    std::vector<double >    const& beta,
+    std::vector<double*>    const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    impl::gemv( layout, trans, m, n,
+                alpha, Aarray, lda, xarray, incx,
+                beta, yarray, incy,
+                batch_size, info );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched, complex<float> version.
+/// @ingroup gemv
+void gemv(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& trans,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<float>  > const& alpha,
+    std::vector< std::complex<float>* > const& Aarray, std::vector<int64_t> const& lda,
+    std::vector< std::complex<float>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<float>  > const& beta,
+    std::vector< std::complex<float>* > const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    impl::gemv( layout, trans, m, n,
+                alpha, Aarray, lda, xarray, incx,
+                beta, yarray, incy,
+                batch_size, info );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, variable-size batched, complex<double> version.
+/// @ingroup gemv
+void gemv(
+    blas::Layout layout,
+    std::vector<blas::Op>   const& trans,
+    std::vector<int64_t>    const& m,
+    std::vector<int64_t>    const& n,
+    std::vector< std::complex<double>  > const& alpha,
+    std::vector< std::complex<double>* > const& Aarray, std::vector<int64_t> const& lda,
+    std::vector< std::complex<double>* > const& xarray, std::vector<int64_t> const& incx,
+    std::vector< std::complex<double>  > const& beta,
+    std::vector< std::complex<double>* > const& yarray, std::vector<int64_t> const& incy,
+    size_t batch_size,
+    std::vector<int64_t>& info )
+{
+    impl::gemv( layout, trans, m, n,
+                alpha, Aarray, lda, xarray, incx,
+                beta, yarray, incy,
+                batch_size, info );
+}
+
+}  // namespace batch
+}  // namespace blas
@@ -5,6 +5,8 @@
 
 #include "blas/batch_common.hh"
 #include "blas.hh"
+#include "blas/flops.hh"
+#include "blas_internal.hh"
 
 #include <limits>
 
@@ -16,7 +18,7 @@ namespace impl {
 //------------------------------------------------------------------------------
 /// CPU, variable-size batched version.
 /// Mid-level templated wrapper checks and converts arguments,
-/// then makes individual routine calls in parallel.
+/// then makes individual routine calls, scheduled by internal::batch_run.
 /// @ingroup hemm_internal
 ///
 template <typename scalar_t>
@@ -34,6 +36,12 @@ void hemm(
     size_t batch_size,
     std::vector<int64_t>& info )
 {
+    internal::Trace trace( "batch::hemm", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), internal::trace_first( m ),
+                           internal::trace_first( n ), 0, batch_size,
+                           side2char( internal::trace_first( side ) ),
+                           uplo2char( internal::trace_first( uplo ) ) );
+
     blas_error_if( batch_size < 0 );
     blas_error_if( info.size() != 0
                    && info.size() != 1
@@ -46,23 +54,55 @@ void hemm(
             batch_size, info );
     }
 
-    #pragma omp parallel for schedule( dynamic )
-    for (size_t i = 0; i < batch_size; ++i) {
-        blas::Side side_   = blas::batch::extract( side,   i );
-        blas::Uplo uplo_   = blas::batch::extract( uplo,   i );
-        int64_t    m_      = blas::batch::extract( m,      i );
-        int64_t    n_      = blas::batch::extract( n,      i );
-        int64_t    lda_    = blas::batch::extract( lda,    i );
-        int64_t    ldb_    = blas::batch::extract( ldb,    i );
-        int64_t    ldc_    = blas::batch::extract( ldc,    i );
-        scalar_t   alpha_  = blas::batch::extract( alpha,  i );
-        scalar_t   beta_   = blas::batch::extract( beta,   i );
-        scalar_t*  A_      = blas::batch::extract( Aarray, i );
-        scalar_t*  B_      = blas::batch::extract( Barray, i );
-        scalar_t*  C_      = blas::batch::extract( Carray, i );
-        blas::hemm( layout, side_, uplo_, m_, n_,
-                    alpha_, A_, lda_, B_, ldb_, beta_,  C_, ldc_ );
+    if (blas::batch::is_uniform( side, uplo, m, n, lda, ldb, ldc, alpha, beta )) {
+        // Uniform batch: extract parameters once;
+        // the per-item loop extracts only pointers.
+        blas::Side side_   = side[ 0 ];
+        blas::Uplo uplo_   = uplo[ 0 ];
+        int64_t    m_      = m[ 0 ];
+        int64_t    n_      = n[ 0 ];
+        int64_t    lda_    = lda[ 0 ];
+        int64_t    ldb_    = ldb[ 0 ];
+        int64_t    ldc_    = ldc[ 0 ];
+        scalar_t   alpha_  = alpha[ 0 ];
+        scalar_t   beta_   = beta[ 0 ];
+        internal::batch_run_uniform(
+            batch_size, Gflop<scalar_t>::hemm( side_, m_, n_ ),
+            [&]( size_t i ) {
+                scalar_t*  A_      = blas::batch::extract( Aarray, i );
+                scalar_t*  B_      = blas::batch::extract( Barray, i );
+                scalar_t*  C_      = blas::batch::extract( Carray, i );
+                blas::hemm( layout, side_, uplo_, m_, n_,
+                            alpha_, A_, lda_, B_, ldb_, beta_,  C_, ldc_ );
+            } );
+        return;
     }
+
+    // Large items run one at a time with all BLAS threads;
+    // small items run in parallel, largest first.
+    internal::batch_run(
+        batch_size,
+        [&]( size_t i ) {
+            return Gflop<scalar_t>::hemm( blas::batch::extract( side, i ),
+                                          blas::batch::extract( m, i ),
+                                          blas::batch::extract( n, i ) );
+        },
+        [&]( size_t i ) {
+            blas::Side side_   = blas::batch::extract( side,   i );
+            blas::Uplo uplo_   = blas::batch::extract( uplo,   i );
+            int64_t    m_      = blas::batch::extract( m,      i );
+            int64_t    n_      = blas::batch::extract( n,      i );
+            int64_t    lda_    = blas::batch::extract( lda,    i );
+            int64_t    ldb_    = blas::batch::extract( ldb,    i );
+            int64_t    ldc_    = blas::batch::extract( ldc,    i );
+            scalar_t   alpha_  = blas::batch::extract( alpha,  i );
+            scalar_t   beta_   = blas::batch::extract( beta,   i );
+            scalar_t*  A_      = blas::batch::extract( Aarray, i );
+            scalar_t*  B_      = blas::batch::extract( Barray, i );
+            scalar_t*  C_      = blas::batch::extract( Carray, i );
+            blas::hemm( layout, side_, uplo_, m_, n_,
+                        alpha_, A_, lda_, B_, ldb_, beta_,  C_, ldc_ );
+        } );
 }
 
 }  // namespace impl
@@ -0,0 +1,180 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "blas.hh"
+#include "blas_internal.hh"
+
+#include <cstdlib>
+#include <limits>
+#include <mutex>
+
+namespace blas {
+namespace internal {
+
+//------------------------------------------------------------------------------
+/// @return whether the BLAS library is threaded, so batch routines run
+/// large items one at a time and limit BLAS to one thread for small items.
+/// Uses configure's BLAS_THREADING probe if available (see defines.h);
+/// otherwise, as in CMake builds, asks MKL or OpenBLAS at runtime.
+/// Other libraries are assumed sequential.
+///
+bool blas_threaded()
+{
+    static bool threaded = []() {
+        #if defined( BLAS_PIN_INNER_THREADS )
+            return true;
+        #elif defined( BLAS_THREADING )
+            // configure found sequential BLAS, or no OpenMP to pin inside.
+            return false;
+        #elif defined( BLAS_HAVE_MKL )
+            return MKL_Get_Max_Threads() > 1;
+        #elif defined( BLAS_HAVE_OPENBLAS )
+            return openblas_get_parallel() != 0;
+        #else
+            return false;
+        #endif
+    }();
+    return threaded;
+}
+
+namespace {
+
+// Process-wide pin shared by all PinBlasThreads.
+std::mutex pin_mutex;
+int pin_count = 0;          ///< number of active pins
+int pin_saved_threads = 0;  ///< BLAS threads before the first pin
+
+}  // namespace
+
+//------------------------------------------------------------------------------
+/// Takes the process-wide pin of threaded BLAS to one thread; see
+/// PinBlasThreads. The first active pin saves the number of BLAS threads
+/// and sets it to 1.
+///
+/// @return true if BLAS was pinned, so unpin_blas_threads() must be called;
+///     false if BLAS can't or needn't be pinned.
+///
+bool pin_blas_threads()
+{
+    #if defined( _OPENMP ) \
+        && (defined( BLAS_HAVE_MKL ) || defined( BLAS_HAVE_OPENBLAS ))
+        if (! blas_threaded())
+            return false;
+        #if ! defined( BLAS_HAVE_MKL )
+            // With OpenMP, openblas_set_num_threads would set
+            // omp_set_num_threads, serializing BLAS++'s own loop.
+            if (openblas_get_parallel() != 1)  // not pthreads
+                return false;
+        #endif
+
+        std::lock_guard< std::mutex > lock( pin_mutex );
+        if (pin_count++ == 0) {
+            #if defined( BLAS_HAVE_MKL )
+                pin_saved_threads = MKL_Get_Max_Threads();
+                MKL_Set_Num_Threads( 1 );
+            #else
+                pin_saved_threads = openblas_get_num_threads();
+                openblas_set_num_threads( 1 );
+            #endif
+        }
+        return true;
+    #else
+        return false;
+    #endif
+}
+
+//------------------------------------------------------------------------------
+/// Releases a pin taken by pin_blas_threads(). The last active pin
+/// restores the number of BLAS threads saved by the first one.
+///
+void unpin_blas_threads()
+{
+    #if defined( _OPENMP ) \
+        && (defined( BLAS_HAVE_MKL ) || defined( BLAS_HAVE_OPENBLAS ))
+        std::lock_guard< std::mutex > lock( pin_mutex );
+        if (--pin_count == 0) {
+            #if defined( BLAS_HAVE_MKL )
+                MKL_Set_Num_Threads( pin_saved_threads );
+            #else
+                openblas_set_num_threads( pin_saved_threads );
+            #endif
+        }
+    #endif
+}
+
+}  // namespace internal
+
+namespace batch {
+
+namespace {
+
+//------------------------------------------------------------------------------
+/// @return default policy, overridden by environment variables
+///     BLASPP_BATCH_LARGE_GFLOP    Policy::large_gflop, e.g., 0.5 or inf;
+///     BLASPP_BATCH_SORT           Policy::sort, 0 or 1.
+Policy default_policy()
+{
+    Policy policy;
+    if (internal::blas_threaded())
+        policy.large_gflop = 0.25;
+
+    const char* env = std::getenv( "BLASPP_BATCH_LARGE_GFLOP" );
+    if (env && env[ 0 ]) {
+        char* end;
+        double value = std::strtod( env, &end );
+        if (*end == '\0' && value >= 0)
+            policy.large_gflop = value;
+    }
+
+    env = std::getenv( "BLASPP_BATCH_SORT" );
+    if (env && env[ 0 ])
+        policy.sort = (std::atoi( env ) != 0);
+
+    return policy;
+}
+
+//------------------------------------------------------------------------------
+Policy& policy_()
+{
+    static Policy policy = default_policy();
+    return policy;
+}
+
+}  // namespace
+
+//------------------------------------------------------------------------------
+/// @return current scheduling policy for CPU batch routines.
+/// On first use, it is initialized from the environment; see set_policy().
+/// Batch routines that call a vendor batched routine, such as batch::gemm
+/// with cblas_?gemm_batch, ignore the policy; see Policy.
+///
+const Policy& get_policy()
+{
+    return policy_();
+}
+
+//------------------------------------------------------------------------------
+/// Sets the scheduling policy for CPU batch routines, e.g.,
+/// blas::batch::gemm. Not thread safe: don't call while batch routines
+/// are running in other threads.
+///
+/// The initial policy can also be set with environment variables:
+///     BLASPP_BATCH_LARGE_GFLOP    Policy::large_gflop, e.g., 0.5 or inf;
+///     BLASPP_BATCH_SORT           Policy::sort, 0 or 1.
+///
+/// Ex: run every item in parallel, as a plain OpenMP loop would:
+///     blas::batch::Policy policy = blas::batch::get_policy();
+///     policy.large_gflop = std::numeric_limits<double>::infinity();
+///     policy.sort = false;
+///     blas::batch::set_policy( policy );
+///
+void set_policy( const Policy& policy )
+{
+    blas_error_if( ! (policy.large_gflop >= 0) );
+    policy_() = policy;
+}
+
+}  // namespace batch
+}  // namespace blas
@@ -0,0 +1,318 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "blas.hh"
+#include "blas/flops.hh"
+#include "blas_internal.hh"
+
+#include <limits>
+
+#ifdef BLAS_HAVE_CBLAS_TRSM_BATCH_STRIDED
+//------------------------------------------------------------------------------
+// Strided batched trsm in MKL. Declared here rather than including cblas.h;
+// see batch_gemm.cc.
+extern "C" {
+
+void cblas_strsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    float alpha,
+    float const* A, blas_int lda, blas_int strideA,
+    float*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size );
+
+void cblas_dtrsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    double alpha,
+    double const* A, blas_int lda, blas_int strideA,
+    double*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size );
+
+void cblas_ctrsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    void const* alpha,
+    void const* A, blas_int lda, blas_int strideA,
+    void*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size );
+
+void cblas_ztrsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    void const* alpha,
+    void const* A, blas_int lda, blas_int strideA,
+    void*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size );
+
+}  // extern "C"
+#endif
+
+namespace blas {
+
+#ifdef BLAS_HAVE_CBLAS_TRSM_BATCH_STRIDED
+//==============================================================================
+namespace internal {
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS strided batched trsm, float version.
+/// @ingroup trsm_internal
+inline void trsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    float alpha,
+    float const* A, blas_int lda, blas_int strideA,
+    float*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size )
+{
+    cblas_strsm_batch_strided( layout, side, uplo, trans, diag, m, n,
+                               alpha, A, lda, strideA, B, ldb, strideB,
+                               batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS strided batched trsm, double version.
+/// @ingroup trsm_internal
+inline void trsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    double alpha,
+    double const* A, blas_int lda, blas_int strideA,
+    double*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size )
+{
+    cblas_dtrsm_batch_strided( layout, side, uplo, trans, diag, m, n,
+                               alpha, A, lda, strideA, B, ldb, strideB,
+                               batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS strided batched trsm,
+/// complex<float> version.
+/// @ingroup trsm_internal
+inline void trsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    std::complex<float> alpha,
+    std::complex<float> const* A, blas_int lda, blas_int strideA,
+    std::complex<float>*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size )
+{
+    cblas_ctrsm_batch_strided( layout, side, uplo, trans, diag, m, n,
+                               &alpha, A, lda, strideA, B, ldb, strideB,
+                               batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// Low-level overload wrapper calls CBLAS strided batched trsm,
+/// complex<double> version.
+/// @ingroup trsm_internal
+inline void trsm_batch_strided(
+    int layout, int side, int uplo, int trans, int diag,
+    blas_int m, blas_int n,
+    std::complex<double> alpha,
+    std::complex<double> const* A, blas_int lda, blas_int strideA,
+    std::complex<double>*       B, blas_int ldb, blas_int strideB,
+    blas_int batch_size )
+{
+    cblas_ztrsm_batch_strided( layout, side, uplo, trans, diag, m, n,
+                               &alpha, A, lda, strideA, B, ldb, strideB,
+                               batch_size );
+}
+
+}  // namespace internal
+#endif // BLAS_HAVE_CBLAS_TRSM_BATCH_STRIDED
+
+//==============================================================================
+namespace impl {
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched version.
+/// Mid-level templated wrapper checks and converts arguments,
+/// then calls the vendor's strided batched trsm, if available,
+/// otherwise makes individual routine calls, scheduled by
+/// internal::batch_run_uniform.
+/// @ingroup trsm_internal
+///
+template <typename scalar_t>
+void trsm_strided(
+    blas::Layout layout,
+    blas::Side side,
+    blas::Uplo uplo,
+    blas::Op trans,
+    blas::Diag diag,
+    int64_t m, int64_t n,
+    scalar_t alpha,
+    scalar_t const* A, int64_t lda, int64_t strideA,
+    scalar_t*       B, int64_t ldb, int64_t strideB,
+    size_t batch_size )
+{
+    internal::Trace trace( "batch::trsm_strided", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), m, n, 0, batch_size,
+                           side2char( side ), uplo2char( uplo ),
+                           op2char( trans ), diag2char( diag ) );
+
+    // check arguments
+    blas_error_if( layout != Layout::ColMajor &&
+                   layout != Layout::RowMajor );
+    blas_error_if( side != Side::Left &&
+                   side != Side::Right );
+    blas_error_if( uplo != Uplo::Lower &&
+                   uplo != Uplo::Upper );
+    blas_error_if( trans != Op::NoTrans &&
+                   trans != Op::Trans &&
+                   trans != Op::ConjTrans );
+    blas_error_if( diag != Diag::NonUnit &&
+                   diag != Diag::Unit );
+    blas_error_if( m < 0 );
+    blas_error_if( n < 0 );
+
+    bool colmajor = (layout == Layout::ColMajor);
+    blas_error_if( lda < (side == Side::Left ? m : n) );
+    blas_error_if( ldb < (colmajor ? m : n) );
+
+    // A may be shared (stride 0); B items must not overlap.
+    blas_error_if( strideA < 0 );
+    blas_error_if( batch_size > 1 && strideB < ldb * (colmajor ? n : m) );
+
+    if (batch_size == 0)
+        return;
+
+    #ifdef BLAS_HAVE_CBLAS_TRSM_BATCH_STRIDED
+        int layout_ = (colmajor ? 102 : 101);  // CblasColMajor, CblasRowMajor
+        internal::trsm_batch_strided(
+            layout_, internal::side2cblas( side ), internal::uplo2cblas( uplo ),
+            internal::op2cblas( trans ), internal::diag2cblas( diag ),
+            to_blas_int( m ), to_blas_int( n ),
+            alpha, A, to_blas_int( lda ), to_blas_int( strideA ),
+                   B, to_blas_int( ldb ), to_blas_int( strideB ),
+            to_blas_int( batch_size ) );
+    #else
+        internal::batch_run_uniform(
+            batch_size, Gflop<scalar_t>::trsm( side, m, n ),
+            [&]( size_t i ) {
+                blas::trsm( layout, side, uplo, trans, diag, m, n,
+                            alpha, A + i*strideA, lda,
+                                   B + i*strideB, ldb );
+            } );
+    #endif
+}
+
+}  // namespace impl
+
+//==============================================================================
+// High-level overloaded wrappers call mid-level templated wrapper.
+namespace batch {
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched triangular solve with multiple right-hand sides:
+/// \[
+///     op(A_i) X_i = \alpha B_i,
+///     \;\text{ or }\;
+///     X_i op(A_i) = \alpha B_i,
+/// \]
+/// for $i = 0, \dots, batch\_size - 1$, where
+/// $A_i = A + i \cdot strideA$ and $B_i = B + i \cdot strideB$.
+/// $X_i$ overwrites $B_i$. All items share the same parameters,
+/// so no pointer arrays are needed. Arguments are as in blas::trsm,
+/// with additionally:
+///
+/// @param[in] strideA
+///     Distance between consecutive A_i, in elements. strideA >= 0;
+///     0 uses the same A for all items.
+///
+/// @param[in] strideB
+///     Distance between consecutive B_i, in elements. If batch_size > 1,
+///     strideB >= ldb*n (col-major) or ldb*m (row-major), so the B_i
+///     don't overlap.
+///
+/// @param[in] batch_size
+///     Number of items.
+///
+/// Uses the vendor's strided batched trsm (cblas_?trsm_batch_strided in MKL)
+/// if configure found it (BLAS_HAVE_CBLAS_TRSM_BATCH_STRIDED).
+/// Throws blas::Error on invalid arguments.
+///
+/// float version.
+/// @ingroup trsm
+void trsm_strided(
+    blas::Layout layout,
+    blas::Side side,
+    blas::Uplo uplo,
+    blas::Op trans,
+    blas::Diag diag,
+    int64_t m, int64_t n,
+    float alpha,
+    float const* A, int64_t lda, int64_t strideA,
+    float*       B, int64_t ldb, int64_t strideB,
+    size_t batch_size )
+{
+    impl::trsm_strided( layout, side, uplo, trans, diag, m, n,
+                        alpha, A, lda, strideA, B, ldb, strideB,
+                        batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched, double version.
+/// @ingroup trsm
+void trsm_strided(
+    blas::Layout layout,
+    blas::Side side,
+    blas::Uplo uplo,
+    blas::Op trans,
+    blas::Diag diag,
+    int64_t m, int64_t n,
+    double alpha,
+    double const* A, int64_t lda, int64_t strideA,
+    double*       B, int64_t ldb, int64_t strideB,
+    size_t batch_size )
+{
+    impl::trsm_strided( layout, side, uplo, trans, diag, m, n,
+                        alpha, A, lda, strideA, B, ldb, strideB,
+                        batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched, complex<float> version.
+/// @ingroup trsm
+void trsm_strided(
+    blas::Layout layout,
+    blas::Side side,
+    blas::Uplo uplo,
+    blas::Op trans,
+    blas::Diag diag,
+    int64_t m, int64_t n,
+    std::complex<float> alpha,
+    std::complex<float> const* A, int64_t lda, int64_t strideA,
+    std::complex<float>*       B, int64_t ldb, int64_t strideB,
+    size_t batch_size )
+{
+    impl::trsm_strided( layout, side, uplo, trans, diag, m, n,
+                        alpha, A, lda, strideA, B, ldb, strideB,
+                        batch_size );
+}
+
+//------------------------------------------------------------------------------
+/// CPU, strided batched, complex<double> version.
+/// @ingroup trsm
+void trsm_strided(
+    blas::Layout layout,
+    blas::Side side,
+    blas::Uplo uplo,
+    blas::Op trans,
+    blas::Diag diag,
+    int64_t m, int64_t n,
+    std::complex<double> alpha,
+    std::complex<double> const* A, int64_t lda, int64_t strideA,
+    std::complex<double>*       B, int64_t ldb, int64_t strideB,
+    size_t batch_size )
+{
+    impl::trsm_strided( layout, side, uplo, trans, diag, m, n,
+                        alpha, A, lda, strideA, B, ldb, strideB,
+                        batch_size );
+}
+
+}  // namespace batch
+}  // namespace blas
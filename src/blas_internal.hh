@@ -6,7 +6,27 @@
 #ifndef BLAS_INTERNAL_HH
 #define BLAS_INTERNAL_HH
 
+#include "blas/config.h"
 #include "blas/util.hh"
+#include "blas.hh"
+#include "trace.hh"
+
+#include <algorithm>
+#include <vector>
+
+//------------------------------------------------------------------------------
+// Thread control of threaded BLAS libraries, for internal::blas_threaded
+// and internal::PinBlasThreads.
+extern "C" {
+    #if defined( BLAS_HAVE_MKL )
+        int  MKL_Get_Max_Threads();
+        void MKL_Set_Num_Threads( int num_threads );
+    #elif defined( BLAS_HAVE_OPENBLAS )
+        int  openblas_get_parallel();
+        int  openblas_get_num_threads();
+        void openblas_set_num_threads( int num_threads );
+    #endif
+}
 
 namespace blas {
 
@@ -31,6 +51,204 @@ inline blas_int to_blas_int_( int64_t x, const char* x_str )
 ///
 #define to_blas_int( x ) to_blas_int_( x, #x )
 
+namespace internal {
+
+//------------------------------------------------------------------------------
+// Conversions to CBLAS enum values, for vendor CBLAS extensions such as
+// batched gemm, which BLAS++ declares itself rather than including cblas.h.
+
+/// @return CBLAS_TRANSPOSE value of op.
+inline int op2cblas( blas::Op op )
+{
+    switch (op) {
+        case Op::NoTrans:   return 111;  // CblasNoTrans
+        case Op::Trans:     return 112;  // CblasTrans
+        case Op::ConjTrans: return 113;  // CblasConjTrans
+        default: throw Error( "unknown op" );
+    }
+}
+
+/// @return CBLAS_UPLO value of uplo.
+inline int uplo2cblas( blas::Uplo uplo )
+{
+    switch (uplo) {
+        case Uplo::Upper: return 121;  // CblasUpper
+        case Uplo::Lower: return 122;  // CblasLower
+        default: throw Error( "unknown uplo" );
+    }
+}
+
+/// @return CBLAS_DIAG value of diag.
+inline int diag2cblas( blas::Diag diag )
+{
+    switch (diag) {
+        case Diag::NonUnit: return 131;  // CblasNonUnit
+        case Diag::Unit:    return 132;  // CblasUnit
+        default: throw Error( "unknown diag" );
+    }
+}
+
+/// @return CBLAS_SIDE value of side.
+inline int side2cblas( blas::Side side )
+{
+    switch (side) {
+        case Side::Left:  return 141;  // CblasLeft
+        case Side::Right: return 142;  // CblasRight
+        default: throw Error( "unknown side" );
+    }
+}
+
+bool blas_threaded();
+bool pin_blas_threads();
+void unpin_blas_threads();
+
+//------------------------------------------------------------------------------
+/// Limits a threaded BLAS library to one thread while in scope, so BLAS calls
+/// inside BLAS++'s own OpenMP parallel regions, such as batch routines,
+/// don't oversubscribe cores.
+///
+/// Active with OpenMP if BLAS is threaded (see blas_threaded), with
+/// MKL or pthreads OpenBLAS, whose number of threads BLAS++ can set;
+/// otherwise, this does nothing. OpenMP-threaded BLAS using the same OpenMP
+/// runtime as BLAS++ is already sequential in nested parallel regions.
+///
+/// The number of threads is global, so all pins share one process-wide pin,
+/// counted under a mutex: the first pin saves the number of threads and
+/// sets it to 1; the last one destroyed restores it. Hence pins in
+/// concurrent threads can't restore a stale value. The pin also affects
+/// BLAS calls from other application threads while any pin is in scope.
+///
+/// Ex:
+///     internal::PinBlasThreads pin;
+///     #pragma omp parallel for
+///     for (...) { blas::gemm( ... ); }
+///
+class PinBlasThreads
+{
+public:
+    PinBlasThreads():
+        active_( pin_blas_threads() )
+    {}
+
+    ~PinBlasThreads()
+    {
+        if (active_)
+            unpin_blas_threads();
+    }
+
+    // Not copyable.
+    PinBlasThreads( PinBlasThreads const& ) = delete;
+    PinBlasThreads& operator = ( PinBlasThreads const& ) = delete;
+
+private:
+    bool active_;
+};
+
+//------------------------------------------------------------------------------
+/// Runs a CPU batch of independent items, scheduled by their cost in flops,
+/// following blas::batch::get_policy():
+/// - large items, with at least policy.large_gflop, run one after another,
+///   so each uses all threads of a threaded BLAS;
+/// - small items run in an OpenMP parallel loop, with BLAS limited to one
+///   thread (see PinBlasThreads), longest first if policy.sort is set.
+///
+/// Traced calls in func are flagged as nested (see TraceNest).
+///
+/// @param[in] batch_size
+///     Number of items.
+///
+/// @param[in] gflop
+///     Function gflop( i ) returns the cost of item i, in Gflop,
+///     e.g., from blas::Gflop in blas/flops.hh.
+///
+/// @param[in] func
+///     Function func( i ) computes item i. Called concurrently from
+///     multiple threads.
+///
+/// Ex:
+///     internal::batch_run(
+///         batch_size,
+///         [&]( size_t i ) { return Gflop<scalar_t>::gemm( m[i], n[i], k[i] ); },
+///         [&]( size_t i ) { blas::gemm( ... ); } );
+///
+template <typename GflopFunc, typename Func>
+void batch_run( size_t batch_size, GflopFunc gflop, Func func )
+{
+    const blas::batch::Policy& policy = blas::batch::get_policy();
+
+    std::vector<double> cost( batch_size );
+    std::vector<size_t> large, small;
+    small.reserve( batch_size );
+    for (size_t i = 0; i < batch_size; ++i) {
+        cost[ i ] = gflop( i );
+        if (cost[ i ] >= policy.large_gflop)
+            large.push_back( i );
+        else
+            small.push_back( i );
+    }
+
+    for (size_t i : large) {
+        func( i );
+    }
+
+    if (policy.sort) {
+        std::stable_sort( small.begin(), small.end(),
+                          [&cost]( size_t i, size_t j ) {
+                              return cost[ i ] > cost[ j ];
+                          } );
+    }
+
+    // Limit threaded BLAS to one thread inside the parallel loop.
+    PinBlasThreads pin;
+
+    size_t nsmall = small.size();
+    #pragma omp parallel for schedule( dynamic )
+    for (size_t j = 0; j < nsmall; ++j) {
+        TraceNest nest;
+        func( small[ j ] );
+    }
+}
+
+//------------------------------------------------------------------------------
+/// Runs a uniform CPU batch, whose items all have the same parameters and
+/// cost, following blas::batch::get_policy(). If gflop is at least
+/// policy.large_gflop, items run one after another, each using all BLAS
+/// threads; otherwise, items are divided statically among OpenMP threads,
+/// with BLAS limited to one thread. Unlike batch_run, this doesn't compute
+/// or sort per-item costs.
+///
+/// @param[in] batch_size
+///     Number of items.
+///
+/// @param[in] gflop
+///     Cost of each item, in Gflop.
+///
+/// @param[in] func
+///     Function func( i ) computes item i. Called concurrently from
+///     multiple threads.
+///
+template <typename Func>
+void batch_run_uniform( size_t batch_size, double gflop, Func func )
+{
+    if (gflop >= blas::batch::get_policy().large_gflop) {
+        for (size_t i = 0; i < batch_size; ++i) {
+            func( i );
+        }
+        return;
+    }
+
+    // Limit threaded BLAS to one thread inside the parallel loop.
+    PinBlasThreads pin;
+
+    #pragma omp parallel for schedule( static )
+    for (size_t i = 0; i < batch_size; ++i) {
+        TraceNest nest;
+        func( i );
+    }
+}
+
+}  // namespace internal
+
 }  // namespace blas
 
 #endif // BLAS_INTERNAL_HH
@@ -0,0 +1,135 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "blas.hh"
+
+#if (defined( __x86_64__ ) || defined( __i386__ )) \
+    && (defined( __GNUC__ ) || defined( __clang__ ))
+    #define BLAS_CPUID
+    #include <cpuid.h>
+#endif
+
+#if defined( __APPLE__ )
+    #include <sys/sysctl.h>
+#elif defined( __unix__ )
+    #include <unistd.h>
+#endif
+
+namespace blas {
+
+namespace {
+
+#ifdef BLAS_CPUID
+//------------------------------------------------------------------------------
+/// @return extended control register XCR0, which indicates which register
+/// states the OS saves on context switches, i.e., which ISAs it enables.
+/// Requires OSXSAVE.
+uint64_t xgetbv0()
+{
+    uint32_t eax, edx;
+    __asm__ volatile ( "xgetbv" : "=a"(eax), "=d"(edx) : "c"(0) );
+    return (uint64_t( edx ) << 32) | eax;
+}
+#endif
+
+//------------------------------------------------------------------------------
+/// Queries the CPU with cpuid. Each feature requires both CPU support
+/// and OS support, i.e., the OS saves its registers (XCR0).
+CPUFeatures query_cpu_features()
+{
+    CPUFeatures features;
+
+    #ifdef BLAS_CPUID
+        unsigned eax, ebx, ecx, edx;
+        if (! __get_cpuid( 1, &eax, &ebx, &ecx, &edx ))
+            return features;
+
+        features.sse42 = (ecx >> 20) & 1;
+
+        // AVX registers require OSXSAVE (ecx bit 27) and
+        // XCR0 SSE and AVX state (bits 1, 2).
+        bool osxsave = (ecx >> 27) & 1;
+        uint64_t xcr0 = osxsave ? xgetbv0() : 0;
+        bool os_avx    = (xcr0 & 0x6) == 0x6;
+        bool os_avx512 = os_avx && (xcr0 & 0xe0) == 0xe0;    // opmask, ZMM
+        bool os_amx    = (xcr0 & 0x60000) == 0x60000;        // XTILECFG, XTILEDATA
+
+        if (! __get_cpuid_count( 7, 0, &eax, &ebx, &ecx, &edx ))
+            return features;
+
+        features.avx2       = os_avx    && ((ebx >>  5) & 1);
+        features.avx512f    = os_avx512 && ((ebx >> 16) & 1);
+        features.avx512fp16 = os_avx512 && ((edx >> 23) & 1);
+        features.amx        = os_amx    && ((edx >> 24) & 1);
+    #endif
+
+    return features;
+}
+
+//------------------------------------------------------------------------------
+/// Queries cache sizes from the OS: sysconf on Linux (glibc),
+/// sysctl on macOS. Sizes that can't be queried keep the defaults
+/// in CPUCaches.
+CPUCaches query_cpu_caches()
+{
+    CPUCaches caches;
+
+    #if defined( __APPLE__ )
+        auto query = []( const char* name, size_t* size ) {
+            int64_t value = 0;
+            size_t len = sizeof( value );
+            if (sysctlbyname( name, &value, &len, nullptr, 0 ) == 0
+                && value > 0)
+                *size = size_t( value );
+        };
+        query( "hw.l1dcachesize", &caches.l1d );
+        query( "hw.l2cachesize",  &caches.l2  );
+        query( "hw.l3cachesize",  &caches.l3  );
+
+    #elif defined( _SC_LEVEL1_DCACHE_SIZE )
+        auto query = []( int name, size_t* size ) {
+            long value = sysconf( name );
+            if (value > 0)
+                *size = size_t( value );
+        };
+        query( _SC_LEVEL1_DCACHE_SIZE, &caches.l1d );
+        query( _SC_LEVEL2_CACHE_SIZE,  &caches.l2  );
+        query( _SC_LEVEL3_CACHE_SIZE,  &caches.l3  );
+    #endif
+
+    return caches;
+}
+
+}  // namespace
+
+//------------------------------------------------------------------------------
+/// @return vector instruction sets supported by the CPU and operating
+/// system that the code is running on, which may differ from the build
+/// host described by BLAS_HOST_* in blas/defines.h.
+/// Applications can use this at startup to choose precisions and
+/// kernel paths. Detected once on first call; on non-x86 CPUs, or with
+/// compilers other than GCC-compatible ones, all features are false.
+///
+/// On Linux, using AMX additionally requires the process to request
+/// permission with arch_prctl( ARCH_REQ_XCOMP_PERM, XFEATURE_XTILEDATA ).
+///
+const CPUFeatures& cpu_features()
+{
+    static const CPUFeatures features = query_cpu_features();
+    return features;
+}
+
+//------------------------------------------------------------------------------
+/// @return data cache sizes of the CPU that the code is running on.
+/// Detected once on first call; where the OS doesn't report a size,
+/// the CPUCaches default is used.
+///
+const CPUCaches& cpu_caches()
+{
+    static const CPUCaches caches = query_cpu_caches();
+    return caches;
+}
+
+}  // namespace blas
@@ -38,9 +38,6 @@ void gemm(
     std::vector<int64_t>& info,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     size_t batch_size = 0;
     size_t group_count = group_size.size();
     if (group_count == 0)
@@ -92,9 +89,8 @@ void gemm(
     scalar_t** dCarray = dBarray + max_chunk;
 
     // If we have only one group, no need to fork.
+    // Each chunk forks after copying its pointers on the default stream.
     bool do_fork = group_count > 1;
-    if (do_fork)
-        queue.fork();
 
     size_t grp_begin = 0;  // First group in this chunk.
     size_t ptr_begin = 0;  // First [ABC]array pointer in this chunk.
@@ -193,7 +189,6 @@ void gemm(
             grp_begin = grp_end;
         ptr_begin += chunk_size;
     }
-#endif
 }
 
 }  // namespace impl
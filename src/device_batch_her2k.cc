@@ -34,9 +34,6 @@ void her2k(
     std::vector<int64_t>& info,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     using real_t = real_type<scalar_t>;
 
     blas_error_if( layout != Layout::ColMajor && layout != Layout::RowMajor );
@@ -74,7 +71,6 @@ void her2k(
         queue.revolve();
     }
     queue.join();
-#endif
 }
 
 }  // namespace impl
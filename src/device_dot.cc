@@ -28,9 +28,6 @@ void dot(
     scalar_t* result,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     // check arguments
     blas_error_if( n < 0 );      // standard BLAS returns, doesn't fail
     blas_error_if( incx == 0 );  // standard BLAS doesn't detect inc[xy] == 0
@@ -62,7 +59,6 @@ void dot(
     #else // other devices (CUDA/HIP)
         internal::dot( n_, x, incx_, y, incy_, result, queue );
     #endif
-#endif
 }
 
 //------------------------------------------------------------------------------
@@ -79,9 +75,6 @@ void dotu(
     scalar_t* result,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     // check arguments
     blas_error_if( n < 0 );      // standard BLAS returns, doesn't fail
     blas_error_if( incx == 0 );  // standard BLAS doesn't detect inc[xy] == 0
@@ -113,7 +106,6 @@ void dotu(
     #else // other devices (CUDA/HIP)
         internal::dotu( n_, x, incx_, y, incy_, result, queue );
     #endif
-#endif
 }
 
 }  // namespace impl
@@ -32,9 +32,6 @@ void gemm(
     scalar_t*       C, int64_t ldc,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -95,7 +92,6 @@ void gemm(
         internal::gemm( transA, transB, m_, n_, k_,
                         alpha, A, lda_, B, ldb_, beta, C, ldc_, queue );
     }
-#endif
 }
 
 }  // namespace impl
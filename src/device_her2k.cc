@@ -32,9 +32,6 @@ void her2k(
     scalar_t*       C, int64_t ldc,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -75,7 +72,6 @@ void her2k(
     // call low-level wrapper
     internal::her2k( uplo, trans, n_, k_,
                      alpha, A, lda_, B, ldb_, beta, C, ldc_, queue );
-#endif
 }
 
 }  // namespace impl
@@ -30,9 +30,6 @@ void herk(
     scalar_t*       C, int64_t ldc,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -68,7 +65,6 @@ void herk(
     // call low-level wrapper
     internal::herk( uplo, trans, n_, k_,
                     alpha, A, lda_, beta, C, ldc_, queue );
-#endif
 }
 
 }  // namespace impl
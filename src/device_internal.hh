@@ -290,7 +290,31 @@ inline void stream_wait_event(
     blas_dev_call( hipStreamWaitEvent( stream, event, flags ) );
 }
 
-#endif  // BLAS_HAVE_ROCBLAS
+//==============================================================================
+// Host streams and events, without GPU; see src/host_queue.cc.
+// Same semantics as their CUDA counterparts.
+
+#elif defined( BLAS_HAVE_HOST_QUEUE )
+
+internal::HostStream* stream_create();
+
+internal::HostStream* stream_create( int device );
+
+void stream_destroy( internal::HostStream* stream );
+
+void stream_synchronize( internal::HostStream* stream );
+
+internal::HostEvent* event_create();
+
+void event_destroy( internal::HostEvent* event );
+
+void event_record( internal::HostEvent* event, internal::HostStream* stream );
+
+void stream_wait_event(
+    internal::HostStream* stream, internal::HostEvent* event,
+    unsigned int flags );
+
+#endif  // BLAS_HAVE_HOST_QUEUE
 
 namespace internal {
 
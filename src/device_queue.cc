@@ -15,6 +15,7 @@ namespace blas {
 /// Default constructor.
 /// For CUDA and ROCm, creates a Queue on the current device.
 /// For SYCL, throws an error.
+/// Without GPU, creates a host Queue on device 0.
 /// todo: SYCL has a default device, how to use it?
 Queue::Queue()
   : work_( nullptr ),
@@ -29,6 +30,15 @@ Queue::Queue()
         own_handle_        ( true ),
         own_default_stream_( true )
         // todo device_( get_device() )
+
+    #elif defined( BLAS_HAVE_HOST_QUEUE )
+        ,
+        streams_ { stream_create() },  // remaining streams are null
+        events_  { nullptr },  // all events are null
+        num_active_streams_( 1 ),
+        current_stream_index_( 0 ),
+        own_default_stream_( true ),
+        device_( 0 )
     #endif
 {
     #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
@@ -73,7 +83,11 @@ Queue::Queue( int device )
 
     #else
         // No GPU
-        streams_{ nullptr },
+        streams_ { stream_create( device ) },  // remaining streams are null
+        events_  { nullptr },  // all events are null
+        num_active_streams_( 1 ),
+        current_stream_index_( 0 ),
+        own_default_stream_( true ),
     #endif
     device_( device )
 {}
@@ -182,6 +196,38 @@ Queue::Queue( int device )
         streams_[ 0 ] = stream;
     }
 
+#elif defined( BLAS_HAVE_HOST_QUEUE )
+    // -------------------------------------------------------------------------
+    /// Constructor taking a host stream, e.g., from another queue.
+    /// The user retains ownership of the stream,
+    /// which must exist whenever this queue is used.
+    Queue::Queue( int device, stream_t& stream )
+      : work_( nullptr ),
+        lwork_( 0 ),
+        streams_ { stream },   // remaining streams are null
+        events_  { nullptr },  // all events are null
+        num_active_streams_( 1 ),
+        current_stream_index_( 0 ),
+        own_default_stream_( false ),
+        device_( device )
+    {}
+
+    // -------------------------------------------------------------------------
+    /// Change the host stream used in the BLAS++ queue.
+    /// Tasks executing on the current stream will continue.
+    /// Throws an error if in fork mode.
+    void Queue::set_stream( stream_t& stream )
+    {
+        if (num_active_streams_ > 1)
+            throw blas::Error( "can't set stream in fork mode", __func__ );
+
+        if (own_default_stream_) {
+            stream_destroy( streams_[ 0 ] );
+            own_default_stream_ = false;
+        }
+        streams_[ 0 ] = stream;
+    }
+
 #endif // HAVE_CUBLAS or HAVE_ROCBLAS
 
 // -----------------------------------------------------------------------------
@@ -189,14 +235,17 @@ Queue::Queue( int device )
 Queue::~Queue()
 {
     try {
-        #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+        #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS ) \
+            || defined( BLAS_HAVE_HOST_QUEUE )
             internal_set_device( device_ );
             device_free( work_, *this );
 
-            if (own_handle_) {
-                handle_destroy( handle_ );
-            }
-            handle_ = nullptr;
+            #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+                if (own_handle_) {
+                    handle_destroy( handle_ );
+                }
+                handle_ = nullptr;
+            #endif
 
             if (own_default_stream_) {
                 stream_destroy( streams_[ 0 ] );
@@ -237,7 +286,8 @@ Queue::~Queue()
 /// Synchronize with queue.
 void Queue::sync()
 {
-    #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+    #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS ) \
+        || defined( BLAS_HAVE_HOST_QUEUE )
         for (int i = 0; i < num_active_streams_; ++i) {
             stream_synchronize( streams_[ i ] );
         }
@@ -254,7 +304,8 @@ void Queue::sync()
 /// This function is not nested (you must join after each fork).
 void Queue::fork( int num_streams )
 {
-    #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+    #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS ) \
+        || defined( BLAS_HAVE_HOST_QUEUE )
         if (num_active_streams_ > 1)
             throw blas::Error( "can't nest fork regions", __func__ );
 
@@ -295,7 +346,8 @@ void Queue::fork( int num_streams )
 /// stream. This function is not nested (you must join after each fork).
 void Queue::join()
 {
-    #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+    #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS ) \
+        || defined( BLAS_HAVE_HOST_QUEUE )
         // Make sure dependencies are respected:
         // streams_[ 0 ] waits for all other streams.
         for (int i = 1; i < num_active_streams_; ++i) {
@@ -307,8 +359,10 @@ void Queue::join()
         current_stream_index_ = 0;
         num_active_streams_   = 1;
 
-        // Assign current stream to BLAS handle.
-        handle_set_stream( handle_, streams_[ current_stream_index_ ] );
+        #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+            // Assign current stream to BLAS handle.
+            handle_set_stream( handle_, streams_[ current_stream_index_ ] );
+        #endif
 
     #elif defined( BLAS_HAVE_SYCL )
         // todo: see possible implementations for sycl
@@ -321,12 +375,15 @@ void Queue::join()
 /// In join mode, no effect.
 void Queue::revolve()
 {
-    #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+    #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS ) \
+        || defined( BLAS_HAVE_HOST_QUEUE )
         // Choose the next-in-line stream.
         current_stream_index_ = (current_stream_index_ + 1) % num_active_streams_;
 
-        // Assign current stream to BLAS handle.
-        handle_set_stream( handle_, streams_[ current_stream_index_ ] );
+        #if defined( BLAS_HAVE_CUBLAS ) || defined( BLAS_HAVE_ROCBLAS )
+            // Assign current stream to BLAS handle.
+            handle_set_stream( handle_, streams_[ current_stream_index_ ] );
+        #endif
 
     #elif defined( BLAS_HAVE_SYCL )
         // todo: see possible implementations for sycl
@@ -32,9 +32,6 @@ void symm(
     scalar_t*       C, int64_t ldc,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -80,7 +77,6 @@ void symm(
     // call low-level wrapper
     internal::symm( side, uplo, m_, n_,
                     alpha, A, lda_, B, ldb_, beta, C, ldc_, queue );
-#endif
 }
 
 }  // namespace impl
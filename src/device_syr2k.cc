@@ -32,9 +32,6 @@ void syr2k(
     scalar_t*       C, int64_t ldc,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -83,7 +80,6 @@ void syr2k(
     // call low-level wrapper
     internal::syr2k( uplo, trans, n_, k_,
                      alpha, A, lda_, B, ldb_, beta, C, ldc_, queue );
-#endif
 }
 
 }  // namespace impl
@@ -31,9 +31,6 @@ void syrk(
     scalar_t*       C, int64_t ldc,
     blas::Queue& queue )
 {
-#ifndef BLAS_HAVE_DEVICE
-    throw blas::Error( "device BLAS not available", __func__ );
-#else
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -77,7 +74,6 @@ void syrk(
     // call low-level wrapper
     internal::syrk( uplo, trans, n_, k_,
                     alpha, A, lda_, beta, C, ldc_, queue );
-#endif
 }
 
 }  // namespace impl
@@ -33,7 +33,7 @@ void set_device( int device )
 
 // -----------------------------------------------------------------------------
 /// Set the current GPU device as needed by the accelerator/gpu.
-/// (CUDA, ROCm only; no-op for SYCL.)
+/// (CUDA, ROCm only; no-op for SYCL and host queues.)
 void internal_set_device( int device )
 {
     #ifdef BLAS_HAVE_CUBLAS
@@ -44,7 +44,7 @@ void internal_set_device( int device )
         blas_dev_call(
             hipSetDevice( device ) );
 
-    #elif defined(BLAS_HAVE_SYCL)
+    #elif defined(BLAS_HAVE_SYCL) || defined(BLAS_HAVE_HOST_QUEUE)
         // skip, no need to throw error since this is an internal function
 
     #else
@@ -80,6 +80,7 @@ void get_device( int *device )
 
 // -----------------------------------------------------------------------------
 /// @return number of GPU devices.
+/// Without GPU support, this is 0, though host queues (Queue) still work.
 int get_device_count()
 {
     device_blas_int dev_count = 0;
@@ -121,7 +122,7 @@ void device_free( void* ptr )
         throw blas::Error( "unsupported function for sycl backend", __func__ );
 
     #else
-        throw blas::Error( "device BLAS not available", __func__ );
+        std::free( ptr );
     #endif
 }
 
@@ -143,6 +144,11 @@ void device_free( void* ptr, blas::Queue &queue )
     #elif defined(BLAS_HAVE_SYCL)
         blas_dev_call(
             sycl::free( ptr, queue.stream() ) );
+
+    #else
+        // Like cudaFree, wait for tasks that may use ptr.
+        queue.sync();
+        std::free( ptr );
     #endif
 }
 
@@ -164,7 +170,7 @@ void host_free_pinned( void* ptr )
         throw blas::Error( "unsupported function for sycl backend", __func__ );
 
     #else
-        throw blas::Error( "device BLAS not available", __func__ );
+        std::free( ptr );
     #endif
 }
 
@@ -185,7 +191,9 @@ void host_free_pinned( void* ptr, blas::Queue &queue )
             sycl::free( ptr, queue.stream() ) );
 
     #else
-        throw blas::Error( "device BLAS not available", __func__ );
+        // Like cudaFreeHost, wait for tasks that may use ptr.
+        queue.sync();
+        std::free( ptr );
     #endif
 }
 
@@ -158,6 +158,8 @@ scalar_t dot(
     scalar_t const* x, int64_t incx,
     scalar_t const* y, int64_t incy )
 {
+    internal::Trace trace( "dot", internal::trace_type<scalar_t>(), ' ', n );
+
     // check arguments
     blas_error_if( n < 0 );      // standard BLAS returns, doesn't fail
     blas_error_if( incx == 0 );  // standard BLAS doesn't detect inc[xy] == 0
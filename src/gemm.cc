@@ -86,6 +86,77 @@ inline void gemm(
                 (blas_complex_double*) C, &ldc );
 }
 
+//------------------------------------------------------------------------------
+/// Small-size kernel, for column-major matrices with m, n, k <= small_size(),
+/// where the fixed overhead of calling the vendor BLAS dominates.
+/// Same semantics as BLAS: if beta is zero, C need not be set on input;
+/// if alpha is zero, A and B are not referenced.
+/// @ingroup gemm_internal
+template <typename scalar_t>
+void gemm_small(
+    blas::Op transA, blas::Op transB,
+    int64_t m, int64_t n, int64_t k,
+    scalar_t alpha,
+    scalar_t const* A, int64_t lda,
+    scalar_t const* B, int64_t ldb,
+    scalar_t beta,
+    scalar_t*       C, int64_t ldc )
+{
+    const scalar_t zero = 0;
+    const scalar_t one  = 1;
+
+    // op(B)(l, j) = B[ l*rsB + j*csB ], conjugated if ConjTrans
+    int64_t rsB = (transB == Op::NoTrans ? 1 : ldb);
+    int64_t csB = (transB == Op::NoTrans ? ldb : 1);
+    bool conjB = (transB == Op::ConjTrans);
+
+    for (int64_t j = 0; j < n; ++j) {
+        scalar_t* Cj = &C[ j*ldc ];
+        if (transA == Op::NoTrans) {
+            // C(:, j) = beta C(:, j) + sum_l A(:, l) alpha op(B)(l, j),
+            // contiguous in i
+            if (beta == zero) {
+                for (int64_t i = 0; i < m; ++i)
+                    Cj[ i ] = zero;
+            }
+            else if (beta != one) {
+                for (int64_t i = 0; i < m; ++i)
+                    Cj[ i ] *= beta;
+            }
+            if (alpha == zero)
+                continue;
+            for (int64_t l = 0; l < k; ++l) {
+                scalar_t b = B[ l*rsB + j*csB ];
+                b = alpha * (conjB ? conj( b ) : b);
+                scalar_t const* Al = &A[ l*lda ];
+                #pragma omp simd
+                for (int64_t i = 0; i < m; ++i)
+                    Cj[ i ] += Al[ i ] * b;
+            }
+        }
+        else {
+            // C(i, j) = alpha sum_l op(A)(i, l) op(B)(l, j) + beta C(i, j),
+            // with op(A)(i, :) contiguous
+            bool conjA = (transA == Op::ConjTrans);
+            for (int64_t i = 0; i < m; ++i) {
+                scalar_t sum = zero;
+                if (alpha != zero) {
+                    scalar_t const* Ai = &A[ i*lda ];
+                    for (int64_t l = 0; l < k; ++l) {
+                        scalar_t a = (conjA ? conj( Ai[ l ] ) : Ai[ l ]);
+                        scalar_t b = B[ l*rsB + j*csB ];
+                        sum += a * (conjB ? conj( b ) : b);
+                    }
+                }
+                if (beta == zero)
+                    Cj[ i ] = alpha*sum;
+                else
+                    Cj[ i ] = alpha*sum + beta*Cj[ i ];
+            }
+        }
+    }
+}
+
 }  // namespace internal
 
 //==============================================================================
@@ -108,6 +179,10 @@ void gemm(
     scalar_t beta,
     scalar_t*       C, int64_t ldc )
 {
+    internal::Trace trace( "gemm", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), m, n, k, 1,
+                           op2char( transA ), op2char( transB ) );
+
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -148,6 +223,23 @@ void gemm(
         blas_error_if( ldc < n );
     }
 
+    // small sizes: skip the vendor BLAS call overhead
+    int64_t small = small_size();
+    if (m <= small && n <= small && k <= small) {
+        if (m == 0 || n == 0)
+            return;
+        if (layout == Layout::RowMajor) {
+            // swap transA <=> transB, m <=> n, B <=> A
+            internal::gemm_small( transB, transA, n, m, k,
+                                  alpha, B, ldb, A, lda, beta, C, ldc );
+        }
+        else {
+            internal::gemm_small( transA, transB, m, n, k,
+                                  alpha, A, lda, B, ldb, beta, C, ldc );
+        }
+        return;
+    }
+
     // convert arguments
     blas_int m_   = to_blas_int( m );
     blas_int n_   = to_blas_int( n );
@@ -86,6 +86,56 @@ inline void gemv(
                 (blas_complex_double*) y, &incy );
 }
 
+//------------------------------------------------------------------------------
+/// Small-size kernel, for m, n <= small_size(), where the fixed overhead
+/// of calling the vendor BLAS dominates. Handles either layout directly,
+/// so RowMajor ConjTrans needs no conjugated copy of x.
+/// Same semantics as BLAS: if beta is zero, y need not be set on input;
+/// if alpha is zero, A and x are not referenced.
+/// @ingroup gemv_internal
+template <typename scalar_t>
+void gemv_small(
+    blas::Layout layout,
+    blas::Op trans,
+    int64_t m, int64_t n,
+    scalar_t alpha,
+    scalar_t const* A, int64_t lda,
+    scalar_t const* x, int64_t incx,
+    scalar_t beta,
+    scalar_t*       y, int64_t incy )
+{
+    const scalar_t zero = 0;
+
+    // A(i, j) = A[ i*rsA + j*csA ]; y = alpha op(A) x + beta y,
+    // with op(A)(i, j) = A[ i*rs + j*cs ], conjugated if ConjTrans
+    int64_t rsA = (layout == Layout::ColMajor ? 1 : lda);
+    int64_t csA = (layout == Layout::ColMajor ? lda : 1);
+    int64_t rs  = (trans == Op::NoTrans ? rsA : csA);
+    int64_t cs  = (trans == Op::NoTrans ? csA : rsA);
+    bool conjA  = (trans == Op::ConjTrans);
+    int64_t leny = (trans == Op::NoTrans ? m : n);
+    int64_t lenx = (trans == Op::NoTrans ? n : m);
+
+    int64_t kx = (incx > 0 ? 0 : (-lenx + 1)*incx);
+    int64_t iy = (incy > 0 ? 0 : (-leny + 1)*incy);
+    for (int64_t i = 0; i < leny; ++i) {
+        scalar_t sum = zero;
+        if (alpha != zero) {
+            int64_t ix = kx;
+            for (int64_t j = 0; j < lenx; ++j) {
+                scalar_t a = A[ i*rs + j*cs ];
+                sum += (conjA ? conj( a ) : a) * x[ ix ];
+                ix += incx;
+            }
+        }
+        if (beta == zero)
+            y[ iy ] = alpha*sum;
+        else
+            y[ iy ] = alpha*sum + beta*y[ iy ];
+        iy += incy;
+    }
+}
+
 }  // namespace internal
 
 //==============================================================================
@@ -107,6 +157,10 @@ void gemv(
     scalar_t beta,
     scalar_t*       y, int64_t incy )
 {
+    internal::Trace trace( "gemv", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), m, n, 0, 1,
+                           op2char( trans ) );
+
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -124,6 +178,16 @@ void gemv(
     blas_error_if( incx == 0 );
     blas_error_if( incy == 0 );
 
+    // small sizes: skip the vendor BLAS call overhead
+    int64_t small = small_size();
+    if (m <= small && n <= small) {
+        if (m == 0 || n == 0)
+            return;
+        internal::gemv_small( layout, trans, m, n,
+                              alpha, A, lda, x, incx, beta, y, incy );
+        return;
+    }
+
     // convert arguments
     blas_int m_    = to_blas_int( m );
     blas_int n_    = to_blas_int( n );
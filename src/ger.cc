@@ -135,6 +135,9 @@ void ger(
     scalar_t const* y, int64_t incy,
     scalar_t*       A, int64_t lda )
 {
+    internal::Trace trace( "ger", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), m, n );
+
     static_assert( is_complex<scalar_t>::value, "complex version" );
 
     // check arguments
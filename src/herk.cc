@@ -73,6 +73,10 @@ void herk(
     real_type<scalar_t> beta,   // note: real
     scalar_t*       C, int64_t ldc )
 {
+    internal::Trace trace( "herk", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), n, n, k, 1,
+                           uplo2char( uplo ), op2char( trans ) );
+
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
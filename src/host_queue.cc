@@ -0,0 +1,406 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "blas/device.hh"
+#include "device_internal.hh"
+
+#ifdef BLAS_HAVE_HOST_QUEUE
+
+#include "blas_internal.hh"
+
+#include <algorithm>
+#include <condition_variable>
+#include <cstdlib>
+#include <deque>
+#include <exception>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#ifdef _OPENMP
+    #include <omp.h>
+#endif
+
+#if defined( BLAS_HAVE_MKL )
+extern "C" {
+    int MKL_Set_Num_Threads_Local( int num_threads );
+}
+#endif
+
+namespace blas {
+namespace internal {
+
+//==============================================================================
+/// Host event, a marker in a stream. Each event_record starts a new
+/// generation, which completes when its stream reaches the marker;
+/// stream_wait_event waits for the generation most recently recorded
+/// at the time of the call, as in CUDA.
+///
+class HostEvent
+{
+public:
+    /// Latest generation recorded, and latest completed.
+    int64_t recorded  = 0;
+    int64_t completed = 0;
+
+    /// Streams parked until the event completes.
+    std::vector< HostStream* > waiters;
+};
+
+//==============================================================================
+/// Host stream, an in-order queue of tasks. At most one pool thread runs
+/// a stream's tasks at a time, so tasks execute in order, while different
+/// streams execute concurrently.
+///
+class HostStream
+{
+public:
+    /// Task: if func is set, runs func;
+    /// otherwise, records (wait = false) or waits for (wait = true)
+    /// the given generation of event.
+    struct Task {
+        std::function<void ()> func;
+        HostEvent* event = nullptr;
+        int64_t generation = 0;
+        bool wait = false;
+    };
+
+    std::deque< Task > tasks;
+
+    /// Whether the stream is ready, running, or parked on an event,
+    /// i.e., has unfinished tasks.
+    bool scheduled = false;
+
+    /// First exception thrown by a task, rethrown by stream_synchronize.
+    std::exception_ptr error;
+};
+
+namespace {
+
+//------------------------------------------------------------------------------
+/// @return number of cores for host queues to use: with OpenMP,
+/// omp_get_max_threads(), which follows OMP_NUM_THREADS; otherwise the
+/// number of hardware threads.
+int num_cores()
+{
+    #ifdef _OPENMP
+        return std::max( 1, omp_get_max_threads() );
+    #else
+        return std::max( 1, int( std::thread::hardware_concurrency() ) );
+    #endif
+}
+
+//------------------------------------------------------------------------------
+/// @return default number of pool threads: environment variable
+/// BLASPP_HOST_QUEUE_THREADS, if set, otherwise num_cores().
+int default_num_threads()
+{
+    const char* env = std::getenv( "BLASPP_HOST_QUEUE_THREADS" );
+    if (env && env[ 0 ]) {
+        int num_threads = std::atoi( env );
+        if (num_threads > 0)
+            return num_threads;
+    }
+    return num_cores();
+}
+
+//==============================================================================
+/// Thread pool executing host streams. Threads take ready streams and run
+/// their tasks until the stream is empty or must wait on an event; then the
+/// stream is parked, without blocking the thread, and made ready again when
+/// the event completes. Hence streams waiting on each other can't deadlock
+/// the pool, whatever its size.
+///
+/// One mutex guards all streams and events; tasks are whole BLAS calls,
+/// so it is rarely contended.
+///
+/// Cores are divided among pool threads, so concurrent tasks don't
+/// oversubscribe them: each pool thread runs OpenMP parallel regions,
+/// such as batch_run, and MKL with num_cores() / (pool threads) threads,
+/// at least 1. If that is 1, each task also holds the process-wide
+/// PinBlasThreads pin, so threaded OpenBLAS, whose number of threads
+/// is global, is limited to one thread while any task is running.
+///
+class HostPool
+{
+public:
+    //----------------------------------------
+    /// @return HostPool singleton, whose threads start on the first call.
+    static HostPool& get()
+    {
+        static HostPool s_pool;
+        return s_pool;
+    }
+
+    //----------------------------------------
+    /// Adds task to the end of stream.
+    void enqueue( HostStream* stream, HostStream::Task&& task )
+    {
+        std::lock_guard< std::mutex > lock( mutex_ );
+        push( stream, std::move( task ) );
+    }
+
+    //----------------------------------------
+    /// Adds a marker for a new generation of event to the end of stream.
+    void record( HostEvent* event, HostStream* stream )
+    {
+        std::lock_guard< std::mutex > lock( mutex_ );
+        HostStream::Task task;
+        task.event = event;
+        task.generation = ++event->recorded;
+        push( stream, std::move( task ) );
+    }
+
+    //----------------------------------------
+    /// Makes stream wait for the event's latest recorded generation,
+    /// unless it has already completed.
+    void wait( HostStream* stream, HostEvent* event )
+    {
+        std::lock_guard< std::mutex > lock( mutex_ );
+        if (event->completed < event->recorded) {
+            HostStream::Task task;
+            task.event = event;
+            task.generation = event->recorded;
+            task.wait = true;
+            push( stream, std::move( task ) );
+        }
+    }
+
+    //----------------------------------------
+    /// Blocks until all tasks in stream finish, then rethrows the first
+    /// exception from its tasks, if any.
+    void synchronize( HostStream* stream )
+    {
+        std::unique_lock< std::mutex > lock( mutex_ );
+        done_cv_.wait( lock, [stream]() { return ! stream->scheduled; } );
+        if (stream->error) {
+            std::exception_ptr error = stream->error;
+            stream->error = nullptr;
+            std::rethrow_exception( error );
+        }
+    }
+
+private:
+    //----------------------------------------
+    HostPool()
+    {
+        int num_threads = default_num_threads();
+        inner_threads_ = std::max( 1, num_cores() / num_threads );
+        for (int i = 0; i < num_threads; ++i) {
+            threads_.emplace_back( [this]() { worker(); } );
+        }
+    }
+
+    //----------------------------------------
+    /// Finishes ready streams, then joins threads.
+    ~HostPool()
+    {
+        {
+            std::lock_guard< std::mutex > lock( mutex_ );
+            stop_ = true;
+        }
+        ready_cv_.notify_all();
+        for (auto& thread : threads_) {
+            thread.join();
+        }
+    }
+
+    // Not copyable.
+    HostPool( HostPool const& ) = delete;
+    HostPool& operator = ( HostPool const& ) = delete;
+
+    //----------------------------------------
+    /// Adds task to stream, and makes the stream ready if it was idle.
+    /// Requires mutex_ held.
+    void push( HostStream* stream, HostStream::Task&& task )
+    {
+        stream->tasks.push_back( std::move( task ) );
+        if (! stream->scheduled) {
+            stream->scheduled = true;
+            ready_.push_back( stream );
+            ready_cv_.notify_one();
+        }
+    }
+
+    //----------------------------------------
+    /// Pool thread: runs ready streams until stopped.
+    void worker()
+    {
+        // Per-thread settings, for parallelism inside this thread's tasks.
+        #ifdef _OPENMP
+            omp_set_num_threads( inner_threads_ );
+        #endif
+        #if defined( BLAS_HAVE_MKL )
+            MKL_Set_Num_Threads_Local( inner_threads_ );
+        #endif
+
+        std::unique_lock< std::mutex > lock( mutex_ );
+        while (true) {
+            ready_cv_.wait( lock, [this]() { return stop_ || ! ready_.empty(); } );
+            if (ready_.empty())
+                return;  // stopped
+            HostStream* stream = ready_.front();
+            ready_.pop_front();
+            run( stream, lock );
+        }
+    }
+
+    //----------------------------------------
+    /// Runs tasks of stream in order, until it is empty or parked on an
+    /// event. Requires mutex_ held in lock, which is released while
+    /// running each task's function.
+    void run( HostStream* stream, std::unique_lock< std::mutex >& lock )
+    {
+        while (! stream->tasks.empty()) {
+            // Only this thread pops, and deque::push_back doesn't
+            // invalidate references, so task stays valid while unlocked.
+            HostStream::Task& task = stream->tasks.front();
+            if (task.func) {
+                std::function<void ()> func = std::move( task.func );
+                std::exception_ptr error;
+                lock.unlock();
+                try {
+                    // With one thread per task, also limit threaded BLAS,
+                    // sharing the process-wide pin (see PinBlasThreads).
+                    std::unique_ptr< PinBlasThreads > pin;
+                    if (inner_threads_ == 1)
+                        pin.reset( new PinBlasThreads );
+                    func();
+                }
+                catch (...) {
+                    error = std::current_exception();
+                }
+                lock.lock();
+                // As in CUDA, keep the first error; later tasks still run.
+                if (error && ! stream->error)
+                    stream->error = error;
+            }
+            else if (task.wait) {
+                if (task.event->completed < task.generation) {
+                    // Park; completing the event makes the stream ready again.
+                    task.event->waiters.push_back( stream );
+                    return;
+                }
+            }
+            else {
+                HostEvent* event = task.event;
+                event->completed = std::max( event->completed, task.generation );
+                for (HostStream* waiter : event->waiters) {
+                    ready_.push_back( waiter );
+                }
+                event->waiters.clear();
+                ready_cv_.notify_all();
+            }
+            stream->tasks.pop_front();
+        }
+        stream->scheduled = false;
+        done_cv_.notify_all();
+    }
+
+    std::mutex mutex_;
+    std::condition_variable ready_cv_;  ///< signals ready_ or stop_ changed
+    std::condition_variable done_cv_;   ///< signals a stream finished
+    std::deque< HostStream* > ready_;
+    std::vector< std::thread > threads_;
+    bool stop_ = false;
+
+    int inner_threads_ = 1;  ///< OpenMP and BLAS threads per pool thread
+};
+
+}  // namespace
+
+//------------------------------------------------------------------------------
+/// Adds task to the end of stream, to run asynchronously on a pool thread
+/// after the stream's previous tasks. Exceptions thrown by task are
+/// rethrown by stream_synchronize (hence Queue::sync).
+///
+void host_enqueue( HostStream* stream, std::function<void ()> task )
+{
+    HostStream::Task t;
+    t.func = std::move( task );
+    HostPool::get().enqueue( stream, std::move( t ) );
+}
+
+//------------------------------------------------------------------------------
+/// Blocks until stream's tasks finish, then rethrows the first exception
+/// from its tasks, if any. Used by device_memcpy to read its source
+/// before returning.
+///
+void host_synchronize( HostStream* stream )
+{
+    HostPool::get().synchronize( stream );
+}
+
+}  // namespace internal
+
+//==============================================================================
+// Light wrappers for host streams and events, counterparts of the CUDA
+// and ROCm wrappers in device_internal.hh.
+
+//------------------------------------------------------------------------------
+internal::HostStream* stream_create()
+{
+    internal::HostPool::get();  // start threads
+    return new internal::HostStream;
+}
+
+//------------------------------------------------------------------------------
+/// Device is ignored; all streams run on the host.
+internal::HostStream* stream_create( int device )
+{
+    return stream_create();
+}
+
+//------------------------------------------------------------------------------
+/// Waits for stream's tasks to finish, then destroys it.
+void stream_destroy( internal::HostStream* stream )
+{
+    try {
+        stream_synchronize( stream );
+    }
+    catch (...) {
+        // Errors are dropped with the stream, as in CUDA.
+    }
+    delete stream;
+}
+
+//------------------------------------------------------------------------------
+void stream_synchronize( internal::HostStream* stream )
+{
+    internal::host_synchronize( stream );
+}
+
+//------------------------------------------------------------------------------
+internal::HostEvent* event_create()
+{
+    return new internal::HostEvent;
+}
+
+//------------------------------------------------------------------------------
+/// The event must not be pending on any stream.
+void event_destroy( internal::HostEvent* event )
+{
+    delete event;
+}
+
+//------------------------------------------------------------------------------
+void event_record( internal::HostEvent* event, internal::HostStream* stream )
+{
+    internal::HostPool::get().record( event, stream );
+}
+
+//------------------------------------------------------------------------------
+/// Flags are ignored.
+void stream_wait_event(
+    internal::HostStream* stream, internal::HostEvent* event,
+    unsigned int flags )
+{
+    internal::HostPool::get().wait( stream, event );
+}
+
+}  // namespace blas
+
+#endif  // BLAS_HAVE_HOST_QUEUE
@@ -0,0 +1,1077 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "device_internal.hh"
+
+#ifdef BLAS_HAVE_HOST_QUEUE
+
+#include "blas_internal.hh"
+#include "blas/flops.hh"
+
+// Host queue versions of the device wrappers, without GPU support.
+// Each enqueues the CPU BLAS routine on the queue's current stream, so it
+// runs asynchronously on the host queue's thread pool; see host_queue.cc.
+// Scalars are captured by value; arrays must remain valid until the task
+// runs, as on a GPU. Results of dot and nrm2 are written to the result
+// pointer when the task runs.
+
+namespace blas {
+namespace internal {
+
+//==============================================================================
+// Level 1 BLAS - Device Interfaces
+
+//------------------------------------------------------------------------------
+// axpy
+//------------------------------------------------------------------------------
+void axpy(
+    device_blas_int n,
+    float alpha,
+    float const* dx, device_blas_int incdx,
+    float *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::axpy( n, alpha, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void axpy(
+    device_blas_int n,
+    double alpha,
+    double const* dx, device_blas_int incdx,
+    double *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::axpy( n, alpha, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void axpy(
+    device_blas_int n,
+    std::complex<float> alpha,
+    std::complex<float> const* dx, device_blas_int incdx,
+    std::complex<float> *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::axpy( n, alpha, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void axpy(
+    device_blas_int n,
+    std::complex<double> alpha,
+    std::complex<double> const* dx, device_blas_int incdx,
+    std::complex<double> *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::axpy( n, alpha, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// dot
+//------------------------------------------------------------------------------
+void dot(
+    device_blas_int n,
+    float const *dx, device_blas_int incdx,
+    float const *dy, device_blas_int incdy,
+    float *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::dot( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void dot(
+    device_blas_int n,
+    double const *dx, device_blas_int incdx,
+    double const *dy, device_blas_int incdy,
+    double *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::dot( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void dot(
+    device_blas_int n,
+    std::complex<float> const *dx, device_blas_int incdx,
+    std::complex<float> const *dy, device_blas_int incdy,
+    std::complex<float> *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::dot( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void dot(
+    device_blas_int n,
+    std::complex<double> const *dx, device_blas_int incdx,
+    std::complex<double> const *dy, device_blas_int incdy,
+    std::complex<double> *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::dot( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// dotu
+//------------------------------------------------------------------------------
+void dotu(
+    device_blas_int n,
+    std::complex<float> const *dx, device_blas_int incdx,
+    std::complex<float> const *dy, device_blas_int incdy,
+    std::complex<float> *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::dotu( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void dotu(
+    device_blas_int n,
+    std::complex<double> const *dx, device_blas_int incdx,
+    std::complex<double> const *dy, device_blas_int incdy,
+    std::complex<double> *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::dotu( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// nrm2
+//------------------------------------------------------------------------------
+void nrm2(
+    device_blas_int n,
+    float const* dx, device_blas_int incdx,
+    float *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::nrm2( n, dx, incdx );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void nrm2(
+    device_blas_int n,
+    double const* dx, device_blas_int incdx,
+    double *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::nrm2( n, dx, incdx );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void nrm2(
+    device_blas_int n,
+    std::complex<float> const* dx, device_blas_int incdx,
+    float *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::nrm2( n, dx, incdx );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void nrm2(
+    device_blas_int n,
+    std::complex<double> const* dx, device_blas_int incdx,
+    double *result,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        *result = blas::nrm2( n, dx, incdx );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// scal
+//------------------------------------------------------------------------------
+void scal(
+    device_blas_int n,
+    float alpha,
+    float *dx, device_blas_int incdx,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::scal( n, alpha, dx, incdx );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void scal(
+    device_blas_int n,
+    double alpha,
+    double *dx, device_blas_int incdx,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::scal( n, alpha, dx, incdx );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void scal(
+    device_blas_int n,
+    std::complex<float> alpha,
+    std::complex<float> *dx, device_blas_int incdx,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::scal( n, alpha, dx, incdx );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void scal(
+    device_blas_int n,
+    std::complex<double> alpha,
+    std::complex<double> *dx, device_blas_int incdx,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::scal( n, alpha, dx, incdx );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// swap
+//------------------------------------------------------------------------------
+void swap(
+    device_blas_int n,
+    float *dx, device_blas_int incdx,
+    float *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::swap( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void swap(
+    device_blas_int n,
+    double *dx, device_blas_int incdx,
+    double *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::swap( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void swap(
+    device_blas_int n,
+    std::complex<float> *dx, device_blas_int incdx,
+    std::complex<float> *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::swap( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void swap(
+    device_blas_int n,
+    std::complex<double> *dx, device_blas_int incdx,
+    std::complex<double> *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::swap( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// copy
+//------------------------------------------------------------------------------
+void copy(
+    device_blas_int n,
+    float const *dx, device_blas_int incdx,
+    float *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::copy( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void copy(
+    device_blas_int n,
+    double const *dx, device_blas_int incdx,
+    double *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::copy( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void copy(
+    device_blas_int n,
+    std::complex<float> const *dx, device_blas_int incdx,
+    std::complex<float> *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::copy( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void copy(
+    device_blas_int n,
+    std::complex<double> const *dx, device_blas_int incdx,
+    std::complex<double> *dy, device_blas_int incdy,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::copy( n, dx, incdx, dy, incdy );
+    } );
+}
+
+//==============================================================================
+// Level 3 BLAS - Device Interfaces
+
+//------------------------------------------------------------------------------
+// gemm
+//------------------------------------------------------------------------------
+void gemm(
+    blas::Op transA, blas::Op transB,
+    device_blas_int m, device_blas_int n, device_blas_int k,
+    float alpha,
+    float const *dA, device_blas_int ldda,
+    float const *dB, device_blas_int lddb,
+    float beta,
+    float       *dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::gemm( Layout::ColMajor, transA, transB, m, n, k,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void gemm(
+    blas::Op transA, blas::Op transB,
+    device_blas_int m, device_blas_int n, device_blas_int k,
+    double alpha,
+    double const *dA, device_blas_int ldda,
+    double const *dB, device_blas_int lddb,
+    double beta,
+    double       *dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::gemm( Layout::ColMajor, transA, transB, m, n, k,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void gemm(
+    blas::Op transA, blas::Op transB,
+    device_blas_int m, device_blas_int n, device_blas_int k,
+    std::complex<float> alpha,
+    std::complex<float> const *dA, device_blas_int ldda,
+    std::complex<float> const *dB, device_blas_int lddb,
+    std::complex<float> beta,
+    std::complex<float>       *dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::gemm( Layout::ColMajor, transA, transB, m, n, k,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void gemm(
+    blas::Op transA, blas::Op transB,
+    device_blas_int m, device_blas_int n, device_blas_int k,
+    std::complex<double> alpha,
+    std::complex<double> const *dA, device_blas_int ldda,
+    std::complex<double> const *dB, device_blas_int lddb,
+    std::complex<double> beta,
+    std::complex<double>       *dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::gemm( Layout::ColMajor, transA, transB, m, n, k,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// trsm
+//------------------------------------------------------------------------------
+void trsm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    float alpha,
+    float const *dA, device_blas_int ldda,
+    float       *dB, device_blas_int lddb,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::trsm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                    alpha, dA, ldda, dB, lddb );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void trsm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    double alpha,
+    double const *dA, device_blas_int ldda,
+    double       *dB, device_blas_int lddb,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::trsm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                    alpha, dA, ldda, dB, lddb );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void trsm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    std::complex<float>  alpha,
+    std::complex<float> const *dA, device_blas_int ldda,
+    std::complex<float>       *dB, device_blas_int lddb,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::trsm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                    alpha, dA, ldda, dB, lddb );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void trsm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    std::complex<double>  alpha,
+    std::complex<double> const *dA, device_blas_int ldda,
+    std::complex<double>       *dB, device_blas_int lddb,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::trsm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                    alpha, dA, ldda, dB, lddb );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// trmm
+//------------------------------------------------------------------------------
+void trmm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    float alpha,
+    float const *dA, device_blas_int ldda,
+    float       *dB, device_blas_int lddb,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::trmm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                    alpha, dA, ldda, dB, lddb );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void trmm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    double alpha,
+    double const *dA, device_blas_int ldda,
+    double       *dB, device_blas_int lddb,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::trmm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                    alpha, dA, ldda, dB, lddb );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void trmm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    std::complex<float>  alpha,
+    std::complex<float> const *dA, device_blas_int ldda,
+    std::complex<float>       *dB, device_blas_int lddb,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::trmm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                    alpha, dA, ldda, dB, lddb );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void trmm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    std::complex<double>  alpha,
+    std::complex<double> const *dA, device_blas_int ldda,
+    std::complex<double>       *dB, device_blas_int lddb,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::trmm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                    alpha, dA, ldda, dB, lddb );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// hemm
+//------------------------------------------------------------------------------
+void hemm(
+    blas::Side side, blas::Uplo uplo,
+    device_blas_int m, device_blas_int n,
+    std::complex<float> alpha,
+    std::complex<float> const *dA, device_blas_int ldda,
+    std::complex<float> const *dB, device_blas_int lddb,
+    std::complex<float>  beta,
+    std::complex<float>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::hemm( Layout::ColMajor, side, uplo, m, n,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void hemm(
+    blas::Side side, blas::Uplo uplo,
+    device_blas_int m, device_blas_int n,
+    std::complex<double> alpha,
+    std::complex<double> const *dA, device_blas_int ldda,
+    std::complex<double> const *dB, device_blas_int lddb,
+    std::complex<double>  beta,
+    std::complex<double>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::hemm( Layout::ColMajor, side, uplo, m, n,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// symm
+//------------------------------------------------------------------------------
+void symm(
+    blas::Side side, blas::Uplo uplo,
+    device_blas_int m, device_blas_int n,
+    float  alpha,
+    float const *dA, device_blas_int ldda,
+    float const *dB, device_blas_int lddb,
+    float  beta,
+    float* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::symm( Layout::ColMajor, side, uplo, m, n,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void symm(
+    blas::Side side, blas::Uplo uplo,
+    device_blas_int m, device_blas_int n,
+    double  alpha,
+    double const *dA, device_blas_int ldda,
+    double const *dB, device_blas_int lddb,
+    double  beta,
+    double* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::symm( Layout::ColMajor, side, uplo, m, n,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void symm(
+    blas::Side side, blas::Uplo uplo,
+    device_blas_int m, device_blas_int n,
+    std::complex<float> alpha,
+    std::complex<float> const *dA, device_blas_int ldda,
+    std::complex<float> const *dB, device_blas_int lddb,
+    std::complex<float>  beta,
+    std::complex<float>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::symm( Layout::ColMajor, side, uplo, m, n,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void symm(
+    blas::Side side, blas::Uplo uplo,
+    device_blas_int m, device_blas_int n,
+    std::complex<double> alpha,
+    std::complex<double> const *dA, device_blas_int ldda,
+    std::complex<double> const *dB, device_blas_int lddb,
+    std::complex<double>  beta,
+    std::complex<double>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::symm( Layout::ColMajor, side, uplo, m, n,
+                    alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// herk
+//------------------------------------------------------------------------------
+void herk(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    float alpha,
+    std::complex<float> const *dA, device_blas_int ldda,
+    float  beta,
+    std::complex<float>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::herk( Layout::ColMajor, uplo, trans, n, k,
+                    alpha, dA, ldda, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void herk(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    double alpha,
+    std::complex<double> const *dA, device_blas_int ldda,
+    double  beta,
+    std::complex<double>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::herk( Layout::ColMajor, uplo, trans, n, k,
+                    alpha, dA, ldda, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// syrk
+//------------------------------------------------------------------------------
+void syrk(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    float alpha,
+    float const *dA, device_blas_int ldda,
+    float  beta,
+    float* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::syrk( Layout::ColMajor, uplo, trans, n, k,
+                    alpha, dA, ldda, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void syrk(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    double alpha,
+    double const *dA, device_blas_int ldda,
+    double  beta,
+    double* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::syrk( Layout::ColMajor, uplo, trans, n, k,
+                    alpha, dA, ldda, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void syrk(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    std::complex<float>  alpha,
+    std::complex<float> const *dA, device_blas_int ldda,
+    std::complex<float>  beta,
+    std::complex<float>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::syrk( Layout::ColMajor, uplo, trans, n, k,
+                    alpha, dA, ldda, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void syrk(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    std::complex<double>  alpha,
+    std::complex<double> const *dA, device_blas_int ldda,
+    std::complex<double>  beta,
+    std::complex<double>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::syrk( Layout::ColMajor, uplo, trans, n, k,
+                    alpha, dA, ldda, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// her2k
+//------------------------------------------------------------------------------
+void her2k(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    std::complex<float>  alpha,
+    std::complex<float> const *dA, device_blas_int ldda,
+    std::complex<float> const *dB, device_blas_int lddb,
+    float  beta,
+    std::complex<float>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::her2k( Layout::ColMajor, uplo, trans, n, k,
+                     alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void her2k(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    std::complex<double>  alpha,
+    std::complex<double> const *dA, device_blas_int ldda,
+    std::complex<double> const *dB, device_blas_int lddb,
+    double  beta,
+    std::complex<double>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::her2k( Layout::ColMajor, uplo, trans, n, k,
+                     alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// syr2k
+//------------------------------------------------------------------------------
+void syr2k(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    float  alpha,
+    float const *dA, device_blas_int ldda,
+    float const *dB, device_blas_int lddb,
+    float  beta,
+    float* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::syr2k( Layout::ColMajor, uplo, trans, n, k,
+                     alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void syr2k(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    double  alpha,
+    double const *dA, device_blas_int ldda,
+    double const *dB, device_blas_int lddb,
+    double  beta,
+    double* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::syr2k( Layout::ColMajor, uplo, trans, n, k,
+                     alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void syr2k(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    std::complex<float>  alpha,
+    std::complex<float> const *dA, device_blas_int ldda,
+    std::complex<float> const *dB, device_blas_int lddb,
+    std::complex<float>  beta,
+    std::complex<float>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::syr2k( Layout::ColMajor, uplo, trans, n, k,
+                     alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void syr2k(
+    blas::Uplo uplo, blas::Op trans,
+    device_blas_int n, device_blas_int k,
+    std::complex<double>  alpha,
+    std::complex<double> const *dA, device_blas_int ldda,
+    std::complex<double> const *dB, device_blas_int lddb,
+    std::complex<double>  beta,
+    std::complex<double>* dC, device_blas_int lddc,
+    blas::Queue& queue )
+{
+    host_enqueue( queue.stream(), [=]() {
+        blas::syr2k( Layout::ColMajor, uplo, trans, n, k,
+                     alpha, dA, ldda, dB, lddb, beta, dC, lddc );
+    } );
+}
+
+//==============================================================================
+// Batch BLAS - Device Interfaces
+
+//------------------------------------------------------------------------------
+// batch_gemm
+//------------------------------------------------------------------------------
+void batch_gemm(
+    blas::Op transA, blas::Op transB,
+    device_blas_int m, device_blas_int n, device_blas_int k,
+    float alpha,
+    float const * const * dAarray, device_blas_int ldda,
+    float const * const * dBarray, device_blas_int lddb,
+    float beta,
+    float** dCarray, device_blas_int lddc,
+    device_blas_int batch_size,
+    blas::Queue& queue )
+{
+    using scalar_t = float;
+
+    host_enqueue( queue.stream(), [=]() {
+        batch_run_uniform(
+            batch_size, Gflop<scalar_t>::gemm( m, n, k ),
+            [=]( size_t i ) {
+                blas::gemm( Layout::ColMajor, transA, transB, m, n, k,
+                            alpha, dAarray[ i ], ldda, dBarray[ i ], lddb,
+                            beta, dCarray[ i ], lddc );
+            } );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void batch_gemm(
+    blas::Op transA, blas::Op transB,
+    device_blas_int m, device_blas_int n, device_blas_int k,
+    double alpha,
+    double const * const * dAarray, device_blas_int ldda,
+    double const * const * dBarray, device_blas_int lddb,
+    double beta,
+    double** dCarray, device_blas_int lddc,
+    device_blas_int batch_size,
+    blas::Queue& queue )
+{
+    using scalar_t = double;
+
+    host_enqueue( queue.stream(), [=]() {
+        batch_run_uniform(
+            batch_size, Gflop<scalar_t>::gemm( m, n, k ),
+            [=]( size_t i ) {
+                blas::gemm( Layout::ColMajor, transA, transB, m, n, k,
+                            alpha, dAarray[ i ], ldda, dBarray[ i ], lddb,
+                            beta, dCarray[ i ], lddc );
+            } );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void batch_gemm(
+    blas::Op transA, blas::Op transB,
+    device_blas_int m, device_blas_int n, device_blas_int k,
+    std::complex<float> alpha,
+    std::complex<float> const * const * dAarray, device_blas_int ldda,
+    std::complex<float> const * const * dBarray, device_blas_int lddb,
+    std::complex<float> beta,
+    std::complex<float>** dCarray, device_blas_int lddc,
+    device_blas_int batch_size,
+    blas::Queue& queue )
+{
+    using scalar_t = std::complex<float>;
+
+    host_enqueue( queue.stream(), [=]() {
+        batch_run_uniform(
+            batch_size, Gflop<scalar_t>::gemm( m, n, k ),
+            [=]( size_t i ) {
+                blas::gemm( Layout::ColMajor, transA, transB, m, n, k,
+                            alpha, dAarray[ i ], ldda, dBarray[ i ], lddb,
+                            beta, dCarray[ i ], lddc );
+            } );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void batch_gemm(
+    blas::Op transA, blas::Op transB,
+    device_blas_int m, device_blas_int n, device_blas_int k,
+    std::complex<double> alpha,
+    std::complex<double> const * const * dAarray, device_blas_int ldda,
+    std::complex<double> const * const * dBarray, device_blas_int lddb,
+    std::complex<double> beta,
+    std::complex<double>** dCarray, device_blas_int lddc,
+    device_blas_int batch_size,
+    blas::Queue& queue )
+{
+    using scalar_t = std::complex<double>;
+
+    host_enqueue( queue.stream(), [=]() {
+        batch_run_uniform(
+            batch_size, Gflop<scalar_t>::gemm( m, n, k ),
+            [=]( size_t i ) {
+                blas::gemm( Layout::ColMajor, transA, transB, m, n, k,
+                            alpha, dAarray[ i ], ldda, dBarray[ i ], lddb,
+                            beta, dCarray[ i ], lddc );
+            } );
+    } );
+}
+
+//------------------------------------------------------------------------------
+// batch_trsm
+//------------------------------------------------------------------------------
+void batch_trsm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    float alpha,
+    float const * const * dAarray, device_blas_int ldda,
+    float const * const * dBarray, device_blas_int lddb,
+    device_blas_int batch_size,
+    blas::Queue& queue )
+{
+    using scalar_t = float;
+
+    host_enqueue( queue.stream(), [=]() {
+        batch_run_uniform(
+            batch_size, Gflop<scalar_t>::trsm( side, m, n ),
+            [=]( size_t i ) {
+                // B is input/output, though declared const, as for A.
+                blas::trsm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                            alpha, dAarray[ i ], ldda,
+                            const_cast< scalar_t* >( dBarray[ i ] ), lddb );
+            } );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void batch_trsm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    double alpha,
+    double const * const * dAarray, device_blas_int ldda,
+    double const * const * dBarray, device_blas_int lddb,
+    device_blas_int batch_size,
+    blas::Queue& queue )
+{
+    using scalar_t = double;
+
+    host_enqueue( queue.stream(), [=]() {
+        batch_run_uniform(
+            batch_size, Gflop<scalar_t>::trsm( side, m, n ),
+            [=]( size_t i ) {
+                // B is input/output, though declared const, as for A.
+                blas::trsm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                            alpha, dAarray[ i ], ldda,
+                            const_cast< scalar_t* >( dBarray[ i ] ), lddb );
+            } );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void batch_trsm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    std::complex<float> alpha,
+    std::complex<float> const * const * dAarray, device_blas_int ldda,
+    std::complex<float> const * const * dBarray, device_blas_int lddb,
+    device_blas_int batch_size,
+    blas::Queue& queue )
+{
+    using scalar_t = std::complex<float>;
+
+    host_enqueue( queue.stream(), [=]() {
+        batch_run_uniform(
+            batch_size, Gflop<scalar_t>::trsm( side, m, n ),
+            [=]( size_t i ) {
+                // B is input/output, though declared const, as for A.
+                blas::trsm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                            alpha, dAarray[ i ], ldda,
+                            const_cast< scalar_t* >( dBarray[ i ] ), lddb );
+            } );
+    } );
+}
+
+//------------------------------------------------------------------------------
+void batch_trsm(
+    blas::Side side, blas::Uplo uplo, blas::Op trans, blas::Diag diag,
+    device_blas_int m, device_blas_int n,
+    std::complex<double> alpha,
+    std::complex<double> const * const * dAarray, device_blas_int ldda,
+    std::complex<double> const * const * dBarray, device_blas_int lddb,
+    device_blas_int batch_size,
+    blas::Queue& queue )
+{
+    using scalar_t = std::complex<double>;
+
+    host_enqueue( queue.stream(), [=]() {
+        batch_run_uniform(
+            batch_size, Gflop<scalar_t>::trsm( side, m, n ),
+            [=]( size_t i ) {
+                // B is input/output, though declared const, as for A.
+                blas::trsm( Layout::ColMajor, side, uplo, trans, diag, m, n,
+                            alpha, dAarray[ i ], ldda,
+                            const_cast< scalar_t* >( dBarray[ i ] ), lddb );
+            } );
+    } );
+}
+
+}  // namespace internal
+}  // namespace blas
+
+#endif  // BLAS_HAVE_HOST_QUEUE
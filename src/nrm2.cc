@@ -69,6 +69,8 @@ real_type<scalar_t> nrm2(
     int64_t n,
     scalar_t const* x, int64_t incx )
 {
+    internal::Trace trace( "nrm2", internal::trace_type<scalar_t>(), ' ', n );
+
     // check arguments
     blas_error_if( n < 0 );      // standard BLAS returns, doesn't fail
     blas_error_if( incx <= 0 );  // standard BLAS returns, doesn't fail
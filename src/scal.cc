@@ -78,6 +78,8 @@ void scal(
     scalar_t alpha,
     scalar_t* x, int64_t incx )
 {
+    internal::Trace trace( "scal", internal::trace_type<scalar_t>(), ' ', n );
+
     // check arguments
     blas_error_if( n < 0 );      // standard BLAS returns, doesn't fail
     blas_error_if( incx <= 0 );  // standard BLAS returns, doesn't fail
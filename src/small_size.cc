@@ -0,0 +1,71 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "blas.hh"
+
+#include <cstdlib>
+
+namespace blas {
+
+namespace {
+
+//------------------------------------------------------------------------------
+/// @return default small size, overridden by environment variable
+///     BLASPP_SMALL_SIZE           e.g., 0 to always call the vendor BLAS.
+/// The default, 4, is where the portable kernels still beat an
+/// AVX-512 OpenBLAS for gemm and gemv in double and complex-double;
+/// builds with wider vectors enabled may gain from a larger size.
+int64_t default_small_size()
+{
+    int64_t size = 4;
+
+    const char* env = std::getenv( "BLASPP_SMALL_SIZE" );
+    if (env && env[ 0 ]) {
+        char* end;
+        long long value = std::strtoll( env, &end, 10 );
+        if (*end == '\0' && value >= 0)
+            size = value;
+    }
+    return size;
+}
+
+//------------------------------------------------------------------------------
+int64_t& small_size_()
+{
+    static int64_t size = default_small_size();
+    return size;
+}
+
+}  // namespace
+
+//------------------------------------------------------------------------------
+/// @return size at or below which host gemm, gemv, and axpy use
+/// built-in kernels instead of the vendor BLAS: gemm if m, n, k <= size;
+/// gemv if m, n <= size; axpy if n <= size.
+/// On first use, it is initialized from the environment; see set_small_size().
+///
+int64_t small_size()
+{
+    return small_size_();
+}
+
+//------------------------------------------------------------------------------
+/// Sets the size at or below which host gemm, gemv, and axpy use
+/// built-in kernels; 0 always calls the vendor BLAS. Not thread safe:
+/// don't call while BLAS++ routines are running in other threads.
+///
+/// The initial size can also be set with environment variable
+///     BLASPP_SMALL_SIZE           e.g., 0 to always call the vendor BLAS.
+///
+/// The test tester's --calls option reports ns per call, to tune it, e.g.:
+///     BLASPP_SMALL_SIZE=0 ./tester --dim 8 --calls 100000 --ref y gemm
+///
+void set_small_size( int64_t size )
+{
+    blas_error_if( size < 0 );
+    small_size_() = size;
+}
+
+}  // namespace blas
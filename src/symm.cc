@@ -112,6 +112,10 @@ void symm(
     scalar_t beta,
     scalar_t*       C, int64_t ldc )
 {
+    internal::Trace trace( "symm", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), m, n, 0, 1,
+                           side2char( side ), uplo2char( uplo ) );
+
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -112,6 +112,10 @@ void syr2k(
     scalar_t beta,
     scalar_t*       C, int64_t ldc )
 {
+    internal::Trace trace( "syr2k", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), n, n, k, 1,
+                           uplo2char( uplo ), op2char( trans ) );
+
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -105,6 +105,10 @@ void syrk(
     scalar_t beta,
     scalar_t*       C, int64_t ldc )
 {
+    internal::Trace trace( "syrk", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), n, n, k, 1,
+                           uplo2char( uplo ), op2char( trans ) );
+
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
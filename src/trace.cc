@@ -0,0 +1,335 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "trace.hh"
+
+#include <algorithm>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <mutex>
+#include <string>
+#include <vector>
+
+#ifdef _WIN32
+    #include <process.h>
+    #define getpid _getpid
+#else
+    #include <unistd.h>
+#endif
+
+namespace blas {
+namespace internal {
+
+namespace {
+
+//------------------------------------------------------------------------------
+/// Ring buffer of one thread's events. Only its thread writes: it stores
+/// an event, then publishes it by incrementing count with release order,
+/// so recording takes no lock. Once full, new events overwrite the oldest.
+struct TraceBuffer {
+    TraceBuffer( int tid_, size_t capacity )
+        : events( capacity ),
+          tid( tid_ )
+    {}
+
+    std::vector< TraceEvent > events;
+    std::atomic< uint64_t > count { 0 };  ///< events recorded, incl. overwritten
+    int tid;                              ///< sequential thread ID, from 1
+};
+
+//------------------------------------------------------------------------------
+/// Global trace state. Buffers are never freed, as threads may record
+/// during exit; the state itself is leaked for the same reason.
+struct TraceState {
+    std::mutex mutex;                     ///< guards buffers
+    std::vector< TraceBuffer* > buffers;
+    std::string filename;                 ///< from $BLASPP_TRACE
+    size_t capacity = 32768;              ///< events per thread
+    int64_t epoch = 0;                    ///< time 0 of the trace
+};
+
+TraceState& trace_state()
+{
+    static TraceState* s_state = new TraceState;
+    return *s_state;
+}
+
+//------------------------------------------------------------------------------
+/// Flushes the trace to $BLASPP_TRACE at exit.
+void trace_atexit()
+{
+    try {
+        blas::trace::flush( nullptr );
+    }
+    catch (std::exception const& ex) {
+        std::fprintf( stderr, "BLAS++ trace: %s\n", ex.what() );
+    }
+}
+
+//------------------------------------------------------------------------------
+/// Initializes the trace state from the environment:
+///     BLASPP_TRACE            file; enables tracing and flushes at exit.
+///     BLASPP_TRACE_EVENTS     events kept per thread; default 32768.
+/// @return whether tracing is initially on.
+bool trace_init()
+{
+    TraceState& state = trace_state();
+    state.epoch = trace_clock();
+
+    const char* env = std::getenv( "BLASPP_TRACE_EVENTS" );
+    if (env && env[ 0 ]) {
+        char* end;
+        long long value = std::strtoll( env, &end, 10 );
+        if (*end == '\0' && value > 0)
+            state.capacity = value;
+    }
+
+    env = std::getenv( "BLASPP_TRACE" );
+    if (env && env[ 0 ]) {
+        state.filename = env;
+        std::atexit( trace_atexit );
+        return true;
+    }
+    return false;
+}
+
+//------------------------------------------------------------------------------
+/// @return new buffer for the calling thread, registered for flush.
+TraceBuffer* trace_new_buffer()
+{
+    TraceState& state = trace_state();
+    std::lock_guard< std::mutex > lock( state.mutex );
+    TraceBuffer* buffer = new TraceBuffer( state.buffers.size() + 1,
+                                           state.capacity );
+    state.buffers.push_back( buffer );
+    return buffer;
+}
+
+//------------------------------------------------------------------------------
+/// Event with its thread ID, for output.
+struct TraceItem {
+    TraceEvent event;
+    int tid;
+};
+
+//------------------------------------------------------------------------------
+/// Writes items as Chrome trace-event JSON, viewable in chrome://tracing
+/// or Perfetto. Times are in microseconds, per the format.
+void write_json(
+    FILE* file, std::vector< TraceItem > const& items,
+    int64_t epoch, uint64_t dropped )
+{
+    int pid = getpid();
+    std::fprintf( file, "{\"traceEvents\":[" );
+    const char* sep = "\n";
+    for (auto const& item : items) {
+        TraceEvent const& e = item.event;
+        char ops[ 5 ];
+        int len = 0;
+        for (int i = 0; i < 4; ++i) {
+            if (e.ops[ i ] != ' ')
+                ops[ len++ ] = e.ops[ i ];
+        }
+        ops[ len ] = '\0';
+        std::fprintf(
+            file,
+            "%s{\"name\":\"%s\",\"cat\":\"blas\",\"ph\":\"X\","
+            "\"pid\":%d,\"tid\":%d,\"ts\":%.3f,\"dur\":%.3f,"
+            "\"args\":{\"type\":\"%c\",\"layout\":\"%c\",\"ops\":\"%s\","
+            "\"m\":%lld,\"n\":%lld,\"k\":%lld,\"batch\":%lld,"
+            "\"nested\":%s}}",
+            sep, e.routine, pid, item.tid,
+            (e.start - epoch) * 1e-3, e.duration * 1e-3,
+            e.type, e.layout, ops,
+            (long long) e.m, (long long) e.n, (long long) e.k,
+            (long long) e.batch, (e.nested ? "true" : "false") );
+        sep = ",\n";
+    }
+    std::fprintf( file, "\n],\n\"displayTimeUnit\":\"ns\",\n"
+                  "\"otherData\":{\"blaspp_version\":%d,\"dropped\":%llu}}\n",
+                  blaspp_version(), (unsigned long long) dropped );
+}
+
+//------------------------------------------------------------------------------
+/// Binary trace: a header, then count fixed-size records, in native
+/// byte order. Times are in ns from the start of the trace.
+struct TraceBinaryHeader {
+    char     magic[ 8 ];     ///< "BLASPPTR", not NUL terminated
+    uint32_t version;        ///< 1
+    uint32_t record_size;    ///< sizeof( TraceBinaryRecord ), 88
+    uint64_t count;          ///< number of records
+    uint64_t dropped;        ///< events overwritten in full ring buffers
+};
+
+struct TraceBinaryRecord {
+    char     routine[ 24 ];  ///< NUL padded
+    int64_t  start;
+    int64_t  duration;
+    int64_t  m, n, k, batch;
+    int32_t  tid;
+    char     type;
+    char     layout;
+    char     ops[ 4 ];
+    uint8_t  nested;
+    uint8_t  pad[ 5 ];
+};
+
+static_assert( sizeof( TraceBinaryHeader ) == 32, "unexpected padding" );
+static_assert( sizeof( TraceBinaryRecord ) == 88, "unexpected padding" );
+
+//------------------------------------------------------------------------------
+/// Writes items in the binary trace format.
+void write_binary(
+    FILE* file, std::vector< TraceItem > const& items,
+    int64_t epoch, uint64_t dropped )
+{
+    TraceBinaryHeader header;
+    std::memcpy( header.magic, "BLASPPTR", 8 );
+    header.version     = 1;
+    header.record_size = sizeof( TraceBinaryRecord );
+    header.count       = items.size();
+    header.dropped     = dropped;
+    std::fwrite( &header, sizeof( header ), 1, file );
+
+    for (auto const& item : items) {
+        TraceEvent const& e = item.event;
+        TraceBinaryRecord record;
+        std::memset( &record, 0, sizeof( record ) );
+        std::strncpy( record.routine, e.routine, sizeof( record.routine ) - 1 );
+        record.start    = e.start - epoch;
+        record.duration = e.duration;
+        record.m        = e.m;
+        record.n        = e.n;
+        record.k        = e.k;
+        record.batch    = e.batch;
+        record.tid      = item.tid;
+        record.type     = e.type;
+        record.layout   = e.layout;
+        std::memcpy( record.ops, e.ops, sizeof( record.ops ) );
+        record.nested   = e.nested;
+        std::fwrite( &record, sizeof( record ), 1, file );
+    }
+}
+
+}  // namespace
+
+std::atomic<bool> trace_on( trace_init() );
+
+thread_local int trace_depth = 0;
+
+//------------------------------------------------------------------------------
+/// Appends event to the calling thread's ring buffer.
+void trace_record( TraceEvent const& event )
+{
+    thread_local TraceBuffer* t_buffer = nullptr;
+    if (t_buffer == nullptr)
+        t_buffer = trace_new_buffer();
+
+    uint64_t count = t_buffer->count.load( std::memory_order_relaxed );
+    t_buffer->events[ count % t_buffer->events.size() ] = event;
+    t_buffer->count.store( count + 1, std::memory_order_release );
+}
+
+}  // namespace internal
+
+namespace trace {
+
+//------------------------------------------------------------------------------
+/// @return whether BLAS++ records host BLAS calls; see set_enabled().
+///
+bool enabled()
+{
+    return internal::trace_on.load( std::memory_order_relaxed );
+}
+
+//------------------------------------------------------------------------------
+/// Turns recording of host BLAS calls on or off. Each call, e.g.,
+/// blas::gemm or blas::batch::trsm, records its routine, type, layout,
+/// ops, dimensions, thread, and duration in a per-thread ring buffer,
+/// which keeps the most recent events; see flush().
+/// Calls inside another traced call, such as batch items, are flagged
+/// as nested. Device routines are not traced, as they only enqueue work.
+///
+/// Tracing can also be enabled with environment variables
+///     BLASPP_TRACE            file to flush to at exit, e.g., trace.json.
+///     BLASPP_TRACE_EVENTS     events kept per thread; default 32768.
+///
+void set_enabled( bool enabled )
+{
+    internal::trace_on.store( enabled, std::memory_order_relaxed );
+}
+
+//------------------------------------------------------------------------------
+/// Writes the events recorded so far, in order of start time, to a file.
+/// If filename ends in ".bin", writes the binary format (see
+/// TraceBinaryHeader in trace.cc); otherwise, Chrome trace-event JSON,
+/// viewable in chrome://tracing or https://ui.perfetto.dev.
+/// Events remain recorded; see clear().
+///
+/// Calls still running in other threads may be missing or garbled,
+/// so flush when no BLAS++ routines are running.
+///
+/// @param[in] filename
+///     File to write. If null or empty, uses $BLASPP_TRACE,
+///     or else blaspp_trace.json.
+///
+void flush( const char* filename )
+{
+    internal::TraceState& state = internal::trace_state();
+
+    std::string name = (filename && filename[ 0 ]) ? filename : state.filename;
+    if (name.empty())
+        name = "blaspp_trace.json";
+
+    // Snapshot buffers; each thread's newest min( count, capacity ) events.
+    std::vector< internal::TraceItem > items;
+    uint64_t dropped = 0;
+    {
+        std::lock_guard< std::mutex > lock( state.mutex );
+        for (auto buffer : state.buffers) {
+            uint64_t count = buffer->count.load( std::memory_order_acquire );
+            uint64_t capacity = buffer->events.size();
+            uint64_t first = (count > capacity ? count - capacity : 0);
+            dropped += first;
+            for (uint64_t i = first; i < count; ++i) {
+                items.push_back( { buffer->events[ i % capacity ],
+                                   buffer->tid } );
+            }
+        }
+    }
+    std::stable_sort( items.begin(), items.end(),
+                      []( internal::TraceItem const& a,
+                          internal::TraceItem const& b ) {
+                          return a.event.start < b.event.start;
+                      } );
+
+    bool binary = name.size() >= 4
+                  && name.compare( name.size() - 4, 4, ".bin" ) == 0;
+    FILE* file = std::fopen( name.c_str(), binary ? "wb" : "w" );
+    blas_error_if_msg( file == nullptr, "can't open trace file %s",
+                       name.c_str() );
+    if (binary)
+        internal::write_binary( file, items, state.epoch, dropped );
+    else
+        internal::write_json( file, items, state.epoch, dropped );
+    std::fclose( file );
+}
+
+//------------------------------------------------------------------------------
+/// Discards all recorded events. Not thread safe: don't call while
+/// BLAS++ routines are running in other threads.
+///
+void clear()
+{
+    internal::TraceState& state = internal::trace_state();
+    std::lock_guard< std::mutex > lock( state.mutex );
+    for (auto buffer : state.buffers) {
+        buffer->count.store( 0, std::memory_order_relaxed );
+    }
+}
+
+}  // namespace trace
+}  // namespace blas
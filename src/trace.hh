@@ -0,0 +1,151 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#ifndef BLAS_TRACE_HH
+#define BLAS_TRACE_HH
+
+#include "blas.hh"
+
+#include <atomic>
+#include <chrono>
+#include <complex>
+#include <vector>
+
+namespace blas {
+namespace internal {
+
+//------------------------------------------------------------------------------
+/// One traced BLAS call; see blas::trace and trace.cc.
+struct TraceEvent {
+    const char* routine;  ///< routine name, a string literal, e.g., "gemm"
+    int64_t start;        ///< start time, ns on the steady clock
+    int64_t duration;     ///< ns
+    int64_t m, n, k;      ///< dimensions, 0 if unused; for batches, of item 0
+    int64_t batch;        ///< batch size; 1 for non-batch routines
+    char type;            ///< 's', 'd', 'c', 'z'
+    char layout;          ///< 'C', 'R', or ' ' for Level 1
+    char ops[ 4 ];        ///< side, uplo, op, diag chars, as used; else ' '
+    bool nested;          ///< inside another traced call, e.g., a batch item
+};
+
+/// Whether tracing is on; see blas::trace::enabled().
+extern std::atomic<bool> trace_on;
+
+/// Depth of traced calls in this thread, to flag nested calls.
+extern thread_local int trace_depth;
+
+void trace_record( TraceEvent const& event );
+
+//------------------------------------------------------------------------------
+/// @return time for trace events, in ns.
+inline int64_t trace_clock()
+{
+    return std::chrono::duration_cast< std::chrono::nanoseconds >(
+        std::chrono::steady_clock::now().time_since_epoch() ).count();
+}
+
+//------------------------------------------------------------------------------
+/// @return type char for trace events, as in BLAS routine names.
+template <typename T> inline char trace_type() { return '?'; }
+template <> inline char trace_type< float  >() { return 's'; }
+template <> inline char trace_type< double >() { return 'd'; }
+template <> inline char trace_type< std::complex<float>  >() { return 'c'; }
+template <> inline char trace_type< std::complex<double> >() { return 'z'; }
+
+//------------------------------------------------------------------------------
+/// @return first element of a batch parameter vector, or T() if empty,
+/// to describe a batch by its first item.
+template <typename T>
+inline T trace_first( std::vector<T> const& vec )
+{
+    return vec.empty() ? T() : vec[ 0 ];
+}
+
+//------------------------------------------------------------------------------
+/// Records the BLAS call in whose scope it lives, if tracing is on.
+/// When tracing is off, this costs one relaxed atomic load.
+/// Enum arguments are passed as chars, e.g., op2char( transA );
+/// unused or zero chars are stored as ' '.
+///
+/// Ex:
+///     internal::Trace trace( "gemm", internal::trace_type<scalar_t>(),
+///                            layout2char( layout ), m, n, k, 1,
+///                            op2char( transA ), op2char( transB ) );
+///
+class Trace
+{
+public:
+    Trace( const char* routine, char type, char layout,
+           int64_t m, int64_t n = 0, int64_t k = 0, int64_t batch = 1,
+           char op1 = ' ', char op2 = ' ', char op3 = ' ', char op4 = ' ' )
+        : active_( trace_on.load( std::memory_order_relaxed ) )
+    {
+        if (active_) {
+            event_.routine  = routine;
+            event_.m        = m;
+            event_.n        = n;
+            event_.k        = k;
+            event_.batch    = batch;
+            event_.type     = type;
+            event_.layout   = layout;
+            event_.ops[ 0 ] = (op1 ? op1 : ' ');
+            event_.ops[ 1 ] = (op2 ? op2 : ' ');
+            event_.ops[ 2 ] = (op3 ? op3 : ' ');
+            event_.ops[ 3 ] = (op4 ? op4 : ' ');
+            event_.nested   = (trace_depth > 0);
+            ++trace_depth;
+            event_.start    = trace_clock();
+        }
+    }
+
+    ~Trace()
+    {
+        if (active_) {
+            event_.duration = trace_clock() - event_.start;
+            --trace_depth;
+            trace_record( event_ );
+        }
+    }
+
+    // Not copyable.
+    Trace( Trace const& ) = delete;
+    Trace& operator = ( Trace const& ) = delete;
+
+private:
+    TraceEvent event_;  // set only if active_
+    bool active_;
+};
+
+//------------------------------------------------------------------------------
+/// Flags traced calls in scope as nested, for batch items running on
+/// other threads than the batch call itself; see batch_run.
+class TraceNest
+{
+public:
+    TraceNest()
+        : active_( trace_on.load( std::memory_order_relaxed ) )
+    {
+        if (active_)
+            ++trace_depth;
+    }
+
+    ~TraceNest()
+    {
+        if (active_)
+            --trace_depth;
+    }
+
+    // Not copyable.
+    TraceNest( TraceNest const& ) = delete;
+    TraceNest& operator = ( TraceNest const& ) = delete;
+
+private:
+    bool active_;
+};
+
+}  // namespace internal
+}  // namespace blas
+
+#endif // BLAS_TRACE_HH
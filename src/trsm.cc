@@ -108,6 +108,11 @@ void trsm(
     scalar_t const* A, int64_t lda,
     scalar_t*       B, int64_t ldb )
 {
+    internal::Trace trace( "trsm", internal::trace_type<scalar_t>(),
+                           layout2char( layout ), m, n, 0, 1,
+                           side2char( side ), uplo2char( uplo ),
+                           op2char( trans ), diag2char( diag ) );
+
     // check arguments
     blas_error_if( layout != Layout::ColMajor &&
                    layout != Layout::RowMajor );
@@ -19,6 +19,38 @@
 #
 # run gemm, gemv with small, medium sizes
 #     ./run_tests.py -s -m gemm gemv
+#
+# Results of passing commands are cached, keyed by a hash of the tester,
+# the BLAS++ library, the command, and the host. Re-running an identical
+# sweep on an unchanged build skips those commands. To force re-running:
+#     ./run_tests.py --no-cache gemm
+#
+# Progress (completed/total, elapsed, ETA) is shown on stderr, as a
+# one-line bar on a TTY or as periodic status lines otherwise.
+# The ETA uses per-command durations recorded in previous runs.
+#
+# Each failed test case is written as a minimal tester command to
+# run_tests_failed.txt. To rerun just those cases:
+#     ./run_tests.py --rerun-failed
+#
+# Commands in the same format can be run without rewriting the file,
+# e.g., a workload from tools/blas_trace.py --replay:
+#     ./run_tests.py --from-file workload.txt
+#
+# Results can be recorded in an SQLite database, to track performance
+# across builds, and queried later:
+#     ./run_tests.py --db results.db --ref n gemm
+#     ./run_tests.py query --db results.db history gemm d 4000 --last 30
+#     ./run_tests.py query --db results.db slowdowns REV1 REV2
+#
+# run_tests can also be imported as a module, to drive the tester from
+# another Python program and consume results as they stream in:
+#     import run_tests
+#     opts = run_tests.parse_args( ['--quick', 'gemm'] )
+#     cmds = run_tests.build_commands( opts )
+#     for result in run_tests.run_commands( opts, cmds ):
+#         if (result['event'] == 'row'):
+#             print( result['routine'], result['row']['gflop/s'] )
 
 from __future__ import print_function
 
@@ -30,6 +62,10 @@ import subprocess
 import xml.etree.ElementTree as ET
 import io
 import time
+import hashlib
+import json
+import platform
+import threading
 
 # ------------------------------------------------------------------------------
 # command line arguments
@@ -43,6 +79,19 @@ group_test.add_argument( '--xml', help='generate report.xml for jenkins' )
 group_test.add_argument( '--dry-run', action='store_true', help='print commands, but do not execute them' )
 group_test.add_argument( '--start',   action='store', help='routine to start with, helpful for restarting', default='' )
 group_test.add_argument( '-x', '--exclude', action='append', help='routines to exclude; repeatable', default=[] )
+group_test.add_argument( '--replay-file', action='store', help='file of failed tests, one minimal tester command each; default=%(default)s', default='run_tests_failed.txt' )
+group_test.add_argument( '--rerun-failed', action='store_true', help='rerun only failed tests from the replay file' )
+group_test.add_argument( '--from-file', action='store', help='run tests from file in replay file format, e.g., from tools/blas_trace.py; the file is not modified' )
+group_test.add_argument( '--db', action='store', help='insert results into SQLite database file; see "query -h"' )
+group_test.add_argument( '--no-progress', action='store_true', help='do not show progress and ETA on stderr' )
+group_test.add_argument( '--progress-interval', action='store', type=float, help='seconds between status lines when stderr is not a TTY; default=%(default)s', default=60 )
+
+group_cache = parser.add_argument_group( 'result cache' )
+group_cache.add_argument( '--no-cache', action='store_true', help='ignore cached results and do not update the cache' )
+group_cache.add_argument( '--cache-dir', action='store', help='default=%(default)s',
+    default=os.path.join( os.path.expanduser( '~' ), '.cache', 'blaspp', 'run_tests' ) )
+group_cache.add_argument( '--cache-max-age', action='store', type=float, help='evict entries older than this many days; default=%(default)s', default=30 )
+group_cache.add_argument( '--cache-max-size', action='store', type=float, help='evict oldest entries when cache exceeds this many MiB; default=%(default)s', default=100 )
 
 group_size = parser.add_argument_group( 'matrix dimensions (default is medium)' )
 group_size.add_argument( '--quick',  action='store_true', help='run quick "sanity check" of few, small tests' )
@@ -61,6 +110,8 @@ categories = [
     group_cat.add_argument( '--blas1', action='store_true', help='run Level 1 BLAS tests' ),
     group_cat.add_argument( '--blas2', action='store_true', help='run Level 2 BLAS tests' ),
     group_cat.add_argument( '--blas3', action='store_true', help='run Level 3 BLAS tests' ),
+    group_cat.add_argument( '--batch-blas1', action='store_true', help='run Level 1 Batch BLAS tests' ),
+    group_cat.add_argument( '--batch-blas2', action='store_true', help='run Level 2 Batch BLAS tests' ),
     group_cat.add_argument( '--batch-blas3', action='store_true', help='run Level 3 Batch BLAS tests' ),
 
     group_cat.add_argument( '--host', action='store_true', help='run all CPU host routines' ),
@@ -97,147 +148,51 @@ group_opt.add_argument( '--check',  action='store', help='default=y', default=''
 group_opt.add_argument( '--ref',    action='store', help='default=y', default='' )  # default in test.cc
 
 parser.add_argument( 'tests', nargs=argparse.REMAINDER )
-opts = parser.parse_args()
-
-for t in opts.tests:
-    if (t.startswith('--')):
-        print( 'Error: option', t, 'must come before any routine names' )
-        print( 'usage:', sys.argv[0], '[options]', '[routines]' )
-        print( '      ', sys.argv[0], '--help' )
-        exit(1)
-
-# by default, run medium sizes
-if (not (opts.quick or opts.xsmall or opts.small or opts.medium or opts.large)):
-    opts.medium = True
-
-# by default, run all shapes
-if (not (opts.square or opts.tall or opts.wide or opts.mnk)):
-    opts.square = True
-    opts.tall   = True
-    opts.wide   = True
-    opts.mnk    = True
-
-# By default, or if specific test routines given, enable all categories
-# to get whichever has the routines.
-if (opts.tests or not any( map( lambda c: opts.__dict__[ c ], categories ))):
-    opts.host   = True
-    opts.device = True
-
-# If --host, run all non-device categories.
-if (opts.host):
-    for c in categories:
-        if (not c.endswith('device')):
-            opts.__dict__[ c ] = True
-
-# If --device, run all device categories.
-if (opts.device):
-    for c in categories:
-        if (c.endswith('_device')):
-            opts.__dict__[ c ] = True
-
-start_routine = opts.start
-
-# ------------------------------------------------------------------------------
-# parameters
-# begin with space to ease concatenation
-
-# if given, use explicit dim
-dim = ' --dim ' + opts.dim if (opts.dim) else ''
-n        = dim
-tall     = dim
-wide     = dim
-mn       = dim
-mnk      = dim
-nk_tall  = dim
-nk_wide  = dim
-nk       = dim
-
-if (not opts.dim):
-    if (opts.quick):
-        n        = ' --dim 100'
-        tall     = ' --dim 100x50'  # 2:1
-        wide     = ' --dim 50x100'  # 1:2
-        mnk      = ' --dim 25x50x75'
-        nk_tall  = ' --dim 1x100x50'  # 2:1
-        nk_wide  = ' --dim 1x50x100'  # 1:2
-        opts.incx  = '1,-1'
-        opts.incy  = '1,-1'
-        opts.batch = '10'
-
-    if (opts.xsmall):
-        n       += ' --dim 10'
-        tall    += ' --dim 20x10'
-        wide    += ' --dim 10x20'
-        mnk     += ' --dim 10x15x20 --dim 15x10x20' \
-                +  ' --dim 10x20x15 --dim 15x20x10' \
-                +  ' --dim 20x10x15 --dim 20x15x10'
-        nk_tall += ' --dim 1x20x10'
-        nk_wide += ' --dim 1x10x20'
-
-    if (opts.small):
-        n       += ' --dim 25:100:25'
-        tall    += ' --dim 50:200:50x25:100:25'  # 2:1
-        wide    += ' --dim 25:100:25x50:200:50'  # 1:2
-        mnk     += ' --dim 25x50x75 --dim 50x25x75' \
-                +  ' --dim 25x75x50 --dim 50x75x25' \
-                +  ' --dim 75x25x50 --dim 75x50x25'
-        nk_tall += ' --dim 1x50:200:50x25:100:25'
-        nk_wide += ' --dim 1x25:100:25x50:200:50'
-
-    if (opts.medium):
-        n       += ' --dim 100:500:100'
-        tall    += ' --dim 200:1000:200x100:500:100'  # 2:1
-        wide    += ' --dim 100:500:100x200:1000:200'  # 1:2
-        mnk     += ' --dim 100x300x600 --dim 300x100x600' \
-                +  ' --dim 100x600x300 --dim 300x600x100' \
-                +  ' --dim 600x100x300 --dim 600x300x100'
-        nk_tall += ' --dim 1x200:1000:200x100:500:100'
-        nk_wide += ' --dim 1x100:500:100x200:1000:200'
-
-    if (opts.large):
-        n       += ' --dim 1000:5000:1000'
-        tall    += ' --dim 2000:10000:2000x1000:5000:1000'  # 2:1
-        wide    += ' --dim 1000:5000:1000x2000:10000:2000'  # 1:2
-        mnk     += ' --dim 1000x3000x6000 --dim 3000x1000x6000' \
-                +  ' --dim 1000x6000x3000 --dim 3000x6000x1000' \
-                +  ' --dim 6000x1000x3000 --dim 6000x3000x1000'
-        nk_tall += ' --dim 1x2000:10000:2000x1000:5000:1000'
-        nk_wide += ' --dim 1x1000:5000:1000x2000:10000:2000'
-
-    mn  = ''
-    nk  = ''
-    if (opts.square):
-        mn = n
-        nk = n
-    if (opts.tall):
-        mn += tall
-        nk += nk_tall
-    if (opts.wide):
-        mn += wide
-        nk += nk_wide
-    if (opts.mnk):
-        mnk = mn + mnk
-    else:
-        mnk = mn
-# end
 
-# BLAS and LAPACK
-dtype  = ' --type '   + opts.type   if (opts.type)   else ''
-layout = ' --layout ' + opts.layout if (opts.layout) else ''
-transA = ' --transA ' + opts.transA if (opts.transA) else ''
-transB = ' --transB ' + opts.transB if (opts.transB) else ''
-trans  = ' --trans '  + opts.trans  if (opts.trans)  else ''
-uplo   = ' --uplo '   + opts.uplo   if (opts.uplo)   else ''
-diag   = ' --diag '   + opts.diag   if (opts.diag)   else ''
-side   = ' --side '   + opts.side   if (opts.side)   else ''
-a      = ' --alpha '  + opts.alpha  if (opts.alpha)  else ''
-ab     = a+' --beta ' + opts.beta   if (opts.beta)   else a
-incx   = ' --incx '   + opts.incx   if (opts.incx)   else ''
-incy   = ' --incy '   + opts.incy   if (opts.incy)   else ''
-batch  = ' --batch '  + opts.batch  if (opts.batch)  else ''
-align  = ' --align '  + opts.align  if (opts.align)  else ''
-check  = ' --check '  + opts.check  if (opts.check)  else ''
-ref    = ' --ref '    + opts.ref    if (opts.ref)    else ''
+# ------------------------------------------------------------------------------
+# Parses command line arguments (default sys.argv[1:]) and fills in defaults.
+# Returns opts.
+def parse_args( argv=None ):
+    opts = parser.parse_args( argv )
+
+    for t in opts.tests:
+        if (t.startswith('--')):
+            print( 'Error: option', t, 'must come before any routine names' )
+            print( 'usage:', sys.argv[0], '[options]', '[routines]' )
+            print( '      ', sys.argv[0], '--help' )
+            exit(1)
+
+    # by default, run medium sizes
+    if (not (opts.quick or opts.xsmall or opts.small or opts.medium or opts.large)):
+        opts.medium = True
+
+    # by default, run all shapes
+    if (not (opts.square or opts.tall or opts.wide or opts.mnk)):
+        opts.square = True
+        opts.tall   = True
+        opts.wide   = True
+        opts.mnk    = True
+
+    # By default, or if specific test routines given, enable all categories
+    # to get whichever has the routines.
+    if (opts.tests or not any( map( lambda c: opts.__dict__[ c ], categories ))):
+        opts.host   = True
+        opts.device = True
+
+    # If --host, run all non-device categories.
+    if (opts.host):
+        for c in categories:
+            if (not c.endswith('device')):
+                opts.__dict__[ c ] = True
+
+    # If --device, run all device categories.
+    if (opts.device):
+        for c in categories:
+            if (c.endswith('_device')):
+                opts.__dict__[ c ] = True
+
+    return opts
+# end
 
 # ------------------------------------------------------------------------------
 # filters a comma separated list csv based on items in list values.
@@ -250,189 +205,1117 @@ def filter_csv( values, csv ):
 # end
 
 # ------------------------------------------------------------------------------
-# limit options to specific values
-dtype_real    = ' --type ' + filter_csv( ('s', 'd'), opts.type )
-dtype_complex = ' --type ' + filter_csv( ('c', 'z'), opts.type )
-dtype_double  = ' --type ' + filter_csv( ('d', 'z'), opts.type )
-
-trans_nt = ' --trans ' + filter_csv( ('n', 't'), opts.trans )
-trans_nc = ' --trans ' + filter_csv( ('n', 'c'), opts.trans )
-
-# positive inc
-incx_pos = ' --incx ' + filter_csv( ('1', '2'), opts.incx )
-incy_pos = ' --incy ' + filter_csv( ('1', '2'), opts.incy )
-
-# ------------------------------------------------------------------------------
-cmds = []
-
-# Level 1
-if (opts.blas1):
-    cmds += [
-    [ 'asum',  dtype      + n + incx_pos ],
-    [ 'axpy',  dtype      + n + incx + incy ],
-    [ 'copy',  dtype      + n + incx + incy ],
-    [ 'dot',   dtype      + n + incx + incy ],
-    [ 'dotu',  dtype      + n + incx + incy ],
-    [ 'iamax', dtype      + n + incx_pos ],
-    [ 'nrm2',  dtype      + n + incx_pos ],
-    [ 'rot',   dtype      + n + incx + incy ],
-    [ 'rotg',  dtype ],
-    [ 'rotm',  dtype_real + n + incx + incy ],
-    [ 'rotmg', dtype_real ],
-    [ 'scal',  dtype      + n + incx_pos ],
-    [ 'swap',  dtype      + n + incx + incy ],
-    ]
-
-if (opts.blas1_device):
-    cmds += [
-    [ 'dev-axpy',  dtype + n + incx + incy ],
-    [ 'dev-dot',   dtype + n + incx + incy ],
-    [ 'dev-dotu',  dtype + n + incx + incy ],
-    [ 'dev-nrm2',  dtype + n + incx_pos    ],
-    [ 'dev-scal',  dtype + n + incx_pos    ],
-    [ 'dev-swap',  dtype + n + incx + incy ],
-    [ 'dev-copy',  dtype + n + incx + incy ],
-    ]
-
-# Level 2
-if (opts.blas2):
-    cmds += [
-    [ 'gemv',  dtype      + layout + align + trans + mn + incx + incy ],
-    [ 'ger',   dtype      + layout + align + mn + incx + incy ],
-    [ 'geru',  dtype      + layout + align + mn + incx + incy ],
-    [ 'hemv',  dtype      + layout + align + uplo + n + incx + incy ],
-    [ 'her',   dtype      + layout + align + uplo + n + incx ],
-    [ 'her2',  dtype      + layout + align + uplo + n + incx + incy ],
-    [ 'symv',  dtype_real + layout + align + uplo + n + incx + incy ], # complex is in lapack++
-    [ 'syr',   dtype_real + layout + align + uplo + n + incx ], # complex is in lapack++
-    [ 'syr2',  dtype      + layout + align + uplo + n + incx + incy ],
-    [ 'trmv',  dtype      + layout + align + uplo + trans + diag + n + incx ],
-    [ 'trsv',  dtype      + layout + align + uplo + trans + diag + n + incx ],
-    ]
-
-# Level 3
-if (opts.blas3):
-    cmds += [
-    [ 'gemm',  dtype         + layout + align + transA + transB + mnk ],
-    [ 'hemm',  dtype         + layout + align + side + uplo + mn ],
-    [ 'symm',  dtype         + layout + align + side + uplo + mn ],
-    [ 'trmm',  dtype         + layout + align + side + uplo + trans + diag + mn ],
-    [ 'trsm',  dtype         + layout + align + side + uplo + trans + diag + mn ],
-    [ 'herk',  dtype_real    + layout + align + uplo + trans    + mn ],
-    [ 'herk',  dtype_complex + layout + align + uplo + trans_nc + mn ],
-    [ 'syrk',  dtype_real    + layout + align + uplo + trans    + mn ],
-    [ 'syrk',  dtype_complex + layout + align + uplo + trans_nt + mn ],
-    [ 'her2k', dtype_real    + layout + align + uplo + trans    + mn ],
-    [ 'her2k', dtype_complex + layout + align + uplo + trans_nc + mn ],
-    [ 'syr2k', dtype_real    + layout + align + uplo + trans    + mn ],
-    [ 'syr2k', dtype_complex + layout + align + uplo + trans_nt + mn ],
-    ]
-
-# Batch Level 3
-if (opts.batch_blas3):
-    cmds += [
-    [ 'batch-gemm',  dtype         + batch + layout + align + transA + transB + mnk ],
-    [ 'batch-hemm',  dtype         + batch + layout + align + side + uplo + mn ],
-    [ 'batch-symm',  dtype         + batch + layout + align + side + uplo + mn ],
-    [ 'batch-trmm',  dtype         + batch + layout + align + side + uplo + trans + diag + mn ],
-    [ 'batch-trsm',  dtype         + batch + layout + align + side + uplo + trans + diag + mn ],
-    [ 'batch-herk',  dtype_real    + batch + layout + align + uplo + trans    + mn ],
-    [ 'batch-herk',  dtype_complex + batch + layout + align + uplo + trans_nc + mn ],
-    [ 'batch-syrk',  dtype_real    + batch + layout + align + uplo + trans    + mn ],
-    [ 'batch-syrk',  dtype_complex + batch + layout + align + uplo + trans_nt + mn ],
-    [ 'batch-her2k', dtype_real    + batch + layout + align + uplo + trans    + mn ],
-    [ 'batch-her2k', dtype_complex + batch + layout + align + uplo + trans_nc + mn ],
-    [ 'batch-syr2k', dtype_real    + batch + layout + align + uplo + trans    + mn ],
-    [ 'batch-syr2k', dtype_complex + batch + layout + align + uplo + trans_nt + mn ],
-    ]
-
-if (opts.blas3_device):
-    cmds += [
-    [ 'dev-gemm',  dtype         + layout + align + transA + transB + mnk ],
-    [ 'schur-gemm',dtype         + align + ' --dim 512x512x32:64:32' + ' --format l,t' ],
-    [ 'dev-hemm',  dtype         + layout + align + side + uplo + mn ],
-    [ 'dev-symm',  dtype         + layout + align + side + uplo + mn ],
-    [ 'dev-trmm',  dtype         + layout + align + side + uplo + trans + diag + mn ],
-    [ 'dev-trsm',  dtype         + layout + align + side + uplo + trans + diag + mn ],
-    [ 'dev-herk',  dtype_real    + layout + align + uplo + trans    + mn ],
-    [ 'dev-herk',  dtype_complex + layout + align + uplo + trans_nc + mn ],
-    [ 'dev-syrk',  dtype_real    + layout + align + uplo + trans    + mn ],
-    [ 'dev-syrk',  dtype_complex + layout + align + uplo + trans_nt + mn ],
-    [ 'dev-her2k', dtype_real    + layout + align + uplo + trans    + mn ],
-    [ 'dev-her2k', dtype_complex + layout + align + uplo + trans_nc + mn ],
-    [ 'dev-syr2k', dtype_real    + layout + align + uplo + trans    + mn ],
-    [ 'dev-syr2k', dtype_complex + layout + align + uplo + trans_nt + mn ],
-    ]
-
-if (opts.batch_blas3_device):
-    cmds += [
-    [ 'dev-batch-gemm',  dtype         + batch + layout + align + transA + transB + mnk ],
-    [ 'dev-batch-hemm',  dtype         + batch + layout + align + side + uplo + mn ],
-    [ 'dev-batch-symm',  dtype         + batch + layout + align + side + uplo + mn ],
-    [ 'dev-batch-trmm',  dtype         + batch + layout + align + side + uplo + trans + diag + mn ],
-    [ 'dev-batch-trsm',  dtype         + batch + layout + align + side + uplo + trans + diag + mn ],
-    [ 'dev-batch-herk',  dtype_real    + batch + layout + align + uplo + trans    + mn ],
-    [ 'dev-batch-herk',  dtype_complex + batch + layout + align + uplo + trans_nc + mn ],
-    [ 'dev-batch-syrk',  dtype_real    + batch + layout + align + uplo + trans    + mn ],
-    [ 'dev-batch-syrk',  dtype_complex + batch + layout + align + uplo + trans_nt + mn ],
-    [ 'dev-batch-her2k', dtype_real    + batch + layout + align + uplo + trans    + mn ],
-    [ 'dev-batch-her2k', dtype_complex + batch + layout + align + uplo + trans_nc + mn ],
-    [ 'dev-batch-syr2k', dtype_real    + batch + layout + align + uplo + trans    + mn ],
-    [ 'dev-batch-syr2k', dtype_complex + batch + layout + align + uplo + trans_nt + mn ],
-    ]
-
-if (opts.aux):
-    cmds += [
-    [ 'memcpy',      dtype + n ],
-    [ 'copy_vector', dtype + n + incx_pos + incy_pos ],
-    [ 'set_vector',  dtype + n + incx_pos + incy_pos ],
-
-    [ 'memcpy_2d',   dtype + mn + align ],
-    [ 'copy_matrix', dtype + mn + align ],
-    [ 'set_matrix',  dtype + mn + align ],
-    ]
-
-# ------------------------------------------------------------------------------
-# When stdout is redirected to file instead of TTY console,
-# and  stderr is still going to a TTY console,
-# print extra summary messages to stderr.
-output_redirected = sys.stderr.isatty() and not sys.stdout.isatty()
-
-# ------------------------------------------------------------------------------
-# if output is redirected, prints to both stderr and stdout;
-# otherwise prints to just stdout.
-def print_tee( *args ):
-    global output_redirected
-    print( *args )
-    if (output_redirected):
-        print( *args, file=sys.stderr )
+# Builds the command plan from opts.
+# Returns list of commands, each a pair of strings: [routine, args].
+# With --quick, this also sets opts.incx, incy, and batch.
+def build_commands( opts ):
+    # ----------------------------------------
+    # parameters
+    # begin with space to ease concatenation
+
+    # if given, use explicit dim
+    dim = ' --dim ' + opts.dim if (opts.dim) else ''
+    n        = dim
+    tall     = dim
+    wide     = dim
+    mn       = dim
+    mnk      = dim
+    nk_tall  = dim
+    nk_wide  = dim
+    nk       = dim
+
+    if (not opts.dim):
+        if (opts.quick):
+            n        = ' --dim 100'
+            tall     = ' --dim 100x50'  # 2:1
+            wide     = ' --dim 50x100'  # 1:2
+            mnk      = ' --dim 25x50x75'
+            nk_tall  = ' --dim 1x100x50'  # 2:1
+            nk_wide  = ' --dim 1x50x100'  # 1:2
+            opts.incx  = '1,-1'
+            opts.incy  = '1,-1'
+            opts.batch = '10'
+
+        if (opts.xsmall):
+            n       += ' --dim 10'
+            tall    += ' --dim 20x10'
+            wide    += ' --dim 10x20'
+            mnk     += ' --dim 10x15x20 --dim 15x10x20' \
+                    +  ' --dim 10x20x15 --dim 15x20x10' \
+                    +  ' --dim 20x10x15 --dim 20x15x10'
+            nk_tall += ' --dim 1x20x10'
+            nk_wide += ' --dim 1x10x20'
+
+        if (opts.small):
+            n       += ' --dim 25:100:25'
+            tall    += ' --dim 50:200:50x25:100:25'  # 2:1
+            wide    += ' --dim 25:100:25x50:200:50'  # 1:2
+            mnk     += ' --dim 25x50x75 --dim 50x25x75' \
+                    +  ' --dim 25x75x50 --dim 50x75x25' \
+                    +  ' --dim 75x25x50 --dim 75x50x25'
+            nk_tall += ' --dim 1x50:200:50x25:100:25'
+            nk_wide += ' --dim 1x25:100:25x50:200:50'
+
+        if (opts.medium):
+            n       += ' --dim 100:500:100'
+            tall    += ' --dim 200:1000:200x100:500:100'  # 2:1
+            wide    += ' --dim 100:500:100x200:1000:200'  # 1:2
+            mnk     += ' --dim 100x300x600 --dim 300x100x600' \
+                    +  ' --dim 100x600x300 --dim 300x600x100' \
+                    +  ' --dim 600x100x300 --dim 600x300x100'
+            nk_tall += ' --dim 1x200:1000:200x100:500:100'
+            nk_wide += ' --dim 1x100:500:100x200:1000:200'
+
+        if (opts.large):
+            n       += ' --dim 1000:5000:1000'
+            tall    += ' --dim 2000:10000:2000x1000:5000:1000'  # 2:1
+            wide    += ' --dim 1000:5000:1000x2000:10000:2000'  # 1:2
+            mnk     += ' --dim 1000x3000x6000 --dim 3000x1000x6000' \
+                    +  ' --dim 1000x6000x3000 --dim 3000x6000x1000' \
+                    +  ' --dim 6000x1000x3000 --dim 6000x3000x1000'
+            nk_tall += ' --dim 1x2000:10000:2000x1000:5000:1000'
+            nk_wide += ' --dim 1x1000:5000:1000x2000:10000:2000'
+
+        mn  = ''
+        nk  = ''
+        if (opts.square):
+            mn = n
+            nk = n
+        if (opts.tall):
+            mn += tall
+            nk += nk_tall
+        if (opts.wide):
+            mn += wide
+            nk += nk_wide
+        if (opts.mnk):
+            mnk = mn + mnk
+        else:
+            mnk = mn
+    # end
+
+    # BLAS and LAPACK
+    dtype  = ' --type '   + opts.type   if (opts.type)   else ''
+    layout = ' --layout ' + opts.layout if (opts.layout) else ''
+    transA = ' --transA ' + opts.transA if (opts.transA) else ''
+    transB = ' --transB ' + opts.transB if (opts.transB) else ''
+    trans  = ' --trans '  + opts.trans  if (opts.trans)  else ''
+    uplo   = ' --uplo '   + opts.uplo   if (opts.uplo)   else ''
+    diag   = ' --diag '   + opts.diag   if (opts.diag)   else ''
+    side   = ' --side '   + opts.side   if (opts.side)   else ''
+    a      = ' --alpha '  + opts.alpha  if (opts.alpha)  else ''
+    ab     = a+' --beta ' + opts.beta   if (opts.beta)   else a
+    incx   = ' --incx '   + opts.incx   if (opts.incx)   else ''
+    incy   = ' --incy '   + opts.incy   if (opts.incy)   else ''
+    batch  = ' --batch '  + opts.batch  if (opts.batch)  else ''
+    align  = ' --align '  + opts.align  if (opts.align)  else ''
+    check  = ' --check '  + opts.check  if (opts.check)  else ''
+    ref    = ' --ref '    + opts.ref    if (opts.ref)    else ''
+
+    # ----------------------------------------
+    # limit options to specific values
+    dtype_real    = ' --type ' + filter_csv( ('s', 'd'), opts.type )
+    dtype_complex = ' --type ' + filter_csv( ('c', 'z'), opts.type )
+    dtype_double  = ' --type ' + filter_csv( ('d', 'z'), opts.type )
+
+    trans_nt = ' --trans ' + filter_csv( ('n', 't'), opts.trans )
+    trans_nc = ' --trans ' + filter_csv( ('n', 'c'), opts.trans )
+
+    # positive inc
+    incx_pos = ' --incx ' + filter_csv( ('1', '2'), opts.incx )
+    incy_pos = ' --incy ' + filter_csv( ('1', '2'), opts.incy )
+
+    # ----------------------------------------
+    cmds = []
+
+    # Level 1
+    if (opts.blas1):
+        cmds += [
+        [ 'asum',  dtype      + n + incx_pos ],
+        [ 'axpy',  dtype      + n + incx + incy ],
+        [ 'copy',  dtype      + n + incx + incy ],
+        [ 'dot',   dtype      + n + incx + incy ],
+        [ 'dotu',  dtype      + n + incx + incy ],
+        [ 'iamax', dtype      + n + incx_pos ],
+        [ 'nrm2',  dtype      + n + incx_pos ],
+        [ 'rot',   dtype      + n + incx + incy ],
+        [ 'rotg',  dtype ],
+        [ 'rotm',  dtype_real + n + incx + incy ],
+        [ 'rotmg', dtype_real ],
+        [ 'scal',  dtype      + n + incx_pos ],
+        [ 'swap',  dtype      + n + incx + incy ],
+        ]
+
+    if (opts.blas1_device):
+        cmds += [
+        [ 'dev-axpy',  dtype + n + incx + incy ],
+        [ 'dev-dot',   dtype + n + incx + incy ],
+        [ 'dev-dotu',  dtype + n + incx + incy ],
+        [ 'dev-nrm2',  dtype + n + incx_pos    ],
+        [ 'dev-scal',  dtype + n + incx_pos    ],
+        [ 'dev-swap',  dtype + n + incx + incy ],
+        [ 'dev-copy',  dtype + n + incx + incy ],
+        ]
+
+    # Level 2
+    if (opts.blas2):
+        cmds += [
+        [ 'gemv',  dtype      + layout + align + trans + mn + incx + incy ],
+        [ 'ger',   dtype      + layout + align + mn + incx + incy ],
+        [ 'geru',  dtype      + layout + align + mn + incx + incy ],
+        [ 'hemv',  dtype      + layout + align + uplo + n + incx + incy ],
+        [ 'her',   dtype      + layout + align + uplo + n + incx ],
+        [ 'her2',  dtype      + layout + align + uplo + n + incx + incy ],
+        [ 'symv',  dtype_real + layout + align + uplo + n + incx + incy ], # complex is in lapack++
+        [ 'syr',   dtype_real + layout + align + uplo + n + incx ], # complex is in lapack++
+        [ 'syr2',  dtype      + layout + align + uplo + n + incx + incy ],
+        [ 'trmv',  dtype      + layout + align + uplo + trans + diag + n + incx ],
+        [ 'trsv',  dtype      + layout + align + uplo + trans + diag + n + incx ],
+        ]
+
+    # Batch Level 1
+    if (opts.batch_blas1):
+        cmds += [
+        [ 'batch-axpy',  dtype + batch + n + incx + incy ],
+        [ 'batch-dot',   dtype + batch + n + incx + incy ],
+        [ 'batch-nrm2',  dtype + batch + n + incx_pos ],
+        [ 'batch-scal',  dtype + batch + n + incx_pos ],
+        ]
+
+    # Batch Level 2
+    if (opts.batch_blas2):
+        cmds += [
+        [ 'batch-gemv',  dtype + batch + layout + align + trans + mn + incx + incy ],
+        [ 'batch-ger',   dtype + batch + layout + align + mn + incx + incy ],
+        ]
+
+    # Level 3
+    if (opts.blas3):
+        cmds += [
+        [ 'gemm',  dtype         + layout + align + transA + transB + mnk ],
+        [ 'hemm',  dtype         + layout + align + side + uplo + mn ],
+        [ 'symm',  dtype         + layout + align + side + uplo + mn ],
+        [ 'trmm',  dtype         + layout + align + side + uplo + trans + diag + mn ],
+        [ 'trsm',  dtype         + layout + align + side + uplo + trans + diag + mn ],
+        [ 'herk',  dtype_real    + layout + align + uplo + trans    + mn ],
+        [ 'herk',  dtype_complex + layout + align + uplo + trans_nc + mn ],
+        [ 'syrk',  dtype_real    + layout + align + uplo + trans    + mn ],
+        [ 'syrk',  dtype_complex + layout + align + uplo + trans_nt + mn ],
+        [ 'her2k', dtype_real    + layout + align + uplo + trans    + mn ],
+        [ 'her2k', dtype_complex + layout + align + uplo + trans_nc + mn ],
+        [ 'syr2k', dtype_real    + layout + align + uplo + trans    + mn ],
+        [ 'syr2k', dtype_complex + layout + align + uplo + trans_nt + mn ],
+        ]
+
+    # Batch Level 3
+    if (opts.batch_blas3):
+        cmds += [
+        [ 'batch-gemm',  dtype         + batch + layout + align + transA + transB + mnk ],
+        [ 'batch-gemm-strided', dtype  + batch + layout + align + transA + transB + mnk ],
+        [ 'batch-hemm',  dtype         + batch + layout + align + side + uplo + mn ],
+        [ 'batch-symm',  dtype         + batch + layout + align + side + uplo + mn ],
+        [ 'batch-trmm',  dtype         + batch + layout + align + side + uplo + trans + diag + mn ],
+        [ 'batch-trsm',  dtype         + batch + layout + align + side + uplo + trans + diag + mn ],
+        [ 'batch-trsm-strided', dtype  + batch + layout + align + side + uplo + trans + diag + mn ],
+        [ 'batch-herk',  dtype_real    + batch + layout + align + uplo + trans    + mn ],
+        [ 'batch-herk',  dtype_complex + batch + layout + align + uplo + trans_nc + mn ],
+        [ 'batch-syrk',  dtype_real    + batch + layout + align + uplo + trans    + mn ],
+        [ 'batch-syrk',  dtype_complex + batch + layout + align + uplo + trans_nt + mn ],
+        [ 'batch-her2k', dtype_real    + batch + layout + align + uplo + trans    + mn ],
+        [ 'batch-her2k', dtype_complex + batch + layout + align + uplo + trans_nc + mn ],
+        [ 'batch-syr2k', dtype_real    + batch + layout + align + uplo + trans    + mn ],
+        [ 'batch-syr2k', dtype_complex + batch + layout + align + uplo + trans_nt + mn ],
+        ]
+
+    if (opts.blas3_device):
+        cmds += [
+        [ 'dev-gemm',  dtype         + layout + align + transA + transB + mnk ],
+        [ 'schur-gemm',dtype         + align + ' --dim 512x512x32:64:32' + ' --format l,t' ],
+        [ 'dev-hemm',  dtype         + layout + align + side + uplo + mn ],
+        [ 'dev-symm',  dtype         + layout + align + side + uplo + mn ],
+        [ 'dev-trmm',  dtype         + layout + align + side + uplo + trans + diag + mn ],
+        [ 'dev-trsm',  dtype         + layout + align + side + uplo + trans + diag + mn ],
+        [ 'dev-herk',  dtype_real    + layout + align + uplo + trans    + mn ],
+        [ 'dev-herk',  dtype_complex + layout + align + uplo + trans_nc + mn ],
+        [ 'dev-syrk',  dtype_real    + layout + align + uplo + trans    + mn ],
+        [ 'dev-syrk',  dtype_complex + layout + align + uplo + trans_nt + mn ],
+        [ 'dev-her2k', dtype_real    + layout + align + uplo + trans    + mn ],
+        [ 'dev-her2k', dtype_complex + layout + align + uplo + trans_nc + mn ],
+        [ 'dev-syr2k', dtype_real    + layout + align + uplo + trans    + mn ],
+        [ 'dev-syr2k', dtype_complex + layout + align + uplo + trans_nt + mn ],
+        ]
+
+    if (opts.batch_blas3_device):
+        cmds += [
+        [ 'dev-batch-gemm',  dtype         + batch + layout + align + transA + transB + mnk ],
+        [ 'dev-batch-hemm',  dtype         + batch + layout + align + side + uplo + mn ],
+        [ 'dev-batch-symm',  dtype         + batch + layout + align + side + uplo + mn ],
+        [ 'dev-batch-trmm',  dtype         + batch + layout + align + side + uplo + trans + diag + mn ],
+        [ 'dev-batch-trsm',  dtype         + batch + layout + align + side + uplo + trans + diag + mn ],
+        [ 'dev-batch-herk',  dtype_real    + batch + layout + align + uplo + trans    + mn ],
+        [ 'dev-batch-herk',  dtype_complex + batch + layout + align + uplo + trans_nc + mn ],
+        [ 'dev-batch-syrk',  dtype_real    + batch + layout + align + uplo + trans    + mn ],
+        [ 'dev-batch-syrk',  dtype_complex + batch + layout + align + uplo + trans_nt + mn ],
+        [ 'dev-batch-her2k', dtype_real    + batch + layout + align + uplo + trans    + mn ],
+        [ 'dev-batch-her2k', dtype_complex + batch + layout + align + uplo + trans_nc + mn ],
+        [ 'dev-batch-syr2k', dtype_real    + batch + layout + align + uplo + trans    + mn ],
+        [ 'dev-batch-syr2k', dtype_complex + batch + layout + align + uplo + trans_nt + mn ],
+        ]
+
+    if (opts.aux):
+        cmds += [
+        [ 'memcpy',      dtype + n ],
+        [ 'copy_vector', dtype + n + incx_pos + incy_pos ],
+        [ 'set_vector',  dtype + n + incx_pos + incy_pos ],
+
+        [ 'memcpy_2d',   dtype + mn + align ],
+        [ 'copy_matrix', dtype + mn + align ],
+        [ 'set_matrix',  dtype + mn + align ],
+        ]
+
+    return cmds
+# end
+
+# ------------------------------------------------------------------------------
+# Selects commands to run from cmds, based on the routines given on the
+# command line, --exclude, and --start.
+# Returns (todo, not_seen): commands to run, and requested routines that
+# don't match any command.
+def select_commands( opts, cmds, echo=None ):
+    run_all = (len( opts.tests ) == 0)
+    start_routine = opts.start
+    seen = set()
+    todo = []
+    for cmd in cmds:
+        if ((run_all or cmd[0] in opts.tests) and cmd[0] not in opts.exclude):
+            if (start_routine and cmd[0] != start_routine):
+                if (echo):
+                    echo( 'skipping', cmd[0] )
+                continue
+            start_routine = None
+
+            seen.add( cmd[0] )
+            todo.append( cmd )
+    # end
+    not_seen = list( filter( lambda x: x not in seen, opts.tests ) )
+    return (todo, not_seen)
+# end
+
+# ------------------------------------------------------------------------------
+# Returns full command line (string) to run cmd = [routine, args].
+def test_command( opts, cmd ):
+    return opts.test +' '+ cmd[1] +' '+ cmd[0]
 # end
 
 # ------------------------------------------------------------------------------
-# cmd is a pair of strings: (function, args)
+# Parses tester output, one line at a time.
+# After the header line (which ends with 'status'), each result row is
+# returned as a dict mapping column names (e.g., 'type', 'm', 'time (s)',
+# 'gflop/s', 'status') to strings. Other lines return None.
+# Column names may contain single spaces ('time (s)'), so the header is
+# split on 2 or more spaces; rows are split on whitespace, with any extra
+# words (e.g., 'no check' or an error message) joined into the last column.
+# Repeated column names get a suffix, e.g., 'time (s)', 'time (s) 2',
+# so no column is lost.
+class RowParser( object ):
+    def __init__( self ):
+        self.columns = None
 
-def run_test( cmd ):
-    cmd = opts.test +' '+ cmd[1] +' '+ cmd[0]
-    print_tee( cmd )
-    if (opts.dry_run):
-        return (None, None)
+    def parse( self, line ):
+        words = line.split()
+        if (words and words[-1] == 'status'):
+            self.columns = []
+            for name in re.split( r'\s{2,}', line.strip() ):
+                unique = name
+                i = 2
+                while (unique in self.columns):
+                    unique = name + ' ' + str( i )
+                    i += 1
+                self.columns.append( unique )
+            return None
+        ncol = len( self.columns ) if (self.columns) else 0
+        if (ncol == 0 or len( words ) < ncol):
+            return None
+        status = ' '.join( words[ ncol-1: ] )
+        if (not re.match( r'(pass|FAILED|no check|skipped)', status )):
+            return None
+        row = dict( zip( self.columns[ :-1 ], words[ :ncol-1 ] ) )
+        row[ self.columns[-1] ] = status
+        return row
+# end
 
-    output = ''
-    p = subprocess.Popen( cmd.split(), stdout=subprocess.PIPE,
+# ------------------------------------------------------------------------------
+# Result cache.
+# Passing results are stored as JSON files in opts.cache_dir, named by a
+# key that hashes the tester binary, the BLAS++ library it links with,
+# the full command line, and a host fingerprint.
+# Benchmarking runs (--ref y, --check n, or --db) always bypass the cache,
+# since their purpose is to measure time, not to verify results.
+
+# ------------------------------------------------------------------------------
+# Returns sha256 hex digest of file's contents.
+def hash_file( filename ):
+    h = hashlib.sha256()
+    with open( filename, 'rb' ) as f:
+        for chunk in iter( lambda: f.read( 1 << 20 ), b'' ):
+            h.update( chunk )
+    return h.hexdigest()
+# end
+
+# ------------------------------------------------------------------------------
+# Returns path of the tester binary in the opts.test command,
+# e.g., ./tester in "mpirun -np 4 ./tester", or None if not found.
+def find_tester( opts ):
+    for arg in reversed( opts.test.split() ):
+        if (os.path.isfile( arg )):
+            return arg
+    return None
+# end
+
+# ------------------------------------------------------------------------------
+# Returns path of the BLAS++ library that tester links with, or None.
+# Uses ldd if available, otherwise looks in ../lib.
+def find_blaspp_lib( tester ):
+    try:
+        out = subprocess.check_output( ['ldd', tester],
                                        stderr=subprocess.STDOUT )
-    p_out = p.stdout
-    if (sys.version_info.major >= 3):
-        p_out = io.TextIOWrapper(p.stdout, encoding='utf-8')
-    # Read unbuffered ("for line in p.stdout" will buffer).
-    for line in iter(p_out.readline, ''):
-        print( line, end='' )
-        output += line
-    err = p.wait()
-    if (err != 0):
-        print_tee( 'FAILED: exit code', err )
-    else:
-        print_tee( 'pass' )
-    return (err, output)
+        s = re.search( r'libblaspp\S*\s+=>\s+(\S+)', out.decode( 'utf-8' ) )
+        if (s and os.path.isfile( s.group(1) )):
+            return s.group(1)
+    except Exception:
+        pass
+    libdir = os.path.join( os.path.dirname( tester ), '..', 'lib' )
+    for ext in ('so', 'dylib', 'a'):
+        lib = os.path.join( libdir, 'libblaspp.' + ext )
+        if (os.path.isfile( lib )):
+            return lib
+    return None
+# end
+
+# ------------------------------------------------------------------------------
+# Returns string identifying this host: name, OS, CPU model, and
+# environment variables that affect which libraries are loaded and how.
+def host_fingerprint():
+    cpu = platform.processor()
+    try:
+        with open( '/proc/cpuinfo' ) as f:
+            s = re.search( r'^model name\s*:\s*(.*)$', f.read(), re.M )
+            if (s):
+                cpu = s.group(1)
+    except Exception:
+        pass
+    env = [ var + '=' + os.environ.get( var, '' )
+            for var in ('LD_LIBRARY_PATH', 'DYLD_LIBRARY_PATH',
+                        'OMP_NUM_THREADS') ]
+    return ' '.join( [platform.node(), platform.platform(), cpu,
+                      str( os.cpu_count() )] + env )
+# end
+
+# ------------------------------------------------------------------------------
+# Tracks completed commands and shows progress with an ETA on stderr.
+# On a TTY, shows a one-line bar that is redrawn after each command;
+# otherwise, prints a plain status line every opts.progress_interval seconds.
+# The ETA sums durations of remaining commands recorded in previous runs,
+# in timings.json in the cache directory; commands without a recorded
+# duration are estimated by the average duration of those with one.
+# Methods lock, so commands may complete in any order or thread.
+class Progress( object ):
+    def __init__( self, opts, enabled=True ):
+        self.opts      = opts
+        self.lock      = threading.Lock()
+        self.enabled   = enabled and not (opts.no_progress or opts.dry_run)
+        self.tty       = sys.stderr.isatty()
+        self.shown     = False
+        self.filename  = os.path.join( opts.cache_dir, 'timings.json' )
+        self.timings   = {}
+        self.remaining = []
+        self.total     = 0
+        self.done      = 0
+        self.start     = time.time()
+        self.last      = self.start
+        try:
+            with open( self.filename ) as f:
+                self.timings = json.load( f )
+        except Exception:
+            pass
+    # end
+
+    # Sets list of commands (strings) to run.
+    def begin( self, cmds ):
+        with self.lock:
+            self.remaining = list( cmds )
+            self.total = len( cmds )
+            self.start = self.last = time.time()
+    # end
+
+    # Records that cmd finished in elapsed seconds, then updates display.
+    # Cached results (elapsed is None) don't update the recorded durations.
+    def finish( self, cmd, elapsed ):
+        with self.lock:
+            if (cmd in self.remaining):
+                self.remaining.remove( cmd )
+            self.done += 1
+            if (elapsed is not None and not self.opts.dry_run):
+                self.timings[ cmd ] = elapsed
+                self.save()
+            self.show()
+    # end
+
+    def save( self ):
+        try:
+            os.makedirs( self.opts.cache_dir, exist_ok=True )
+            tmp = self.filename + '.tmp' + str( os.getpid() )
+            with open( tmp, 'w' ) as f:
+                json.dump( self.timings, f )
+            os.replace( tmp, self.filename )
+        except Exception:
+            pass
+    # end
+
+    # Returns estimated seconds for the remaining commands, or None.
+    def eta( self ):
+        known = [ self.timings[ c ] for c in self.remaining
+                  if c in self.timings ]
+        if (self.timings):
+            avg = sum( self.timings.values() ) / len( self.timings )
+        elif (self.done > 0):
+            avg = (time.time() - self.start) / self.done
+        else:
+            return None
+        return sum( known ) + avg * (len( self.remaining ) - len( known ))
+    # end
+
+    def status( self ):
+        elapsed = time.time() - self.start
+        eta = self.eta()
+        txt = '%d/%d done, elapsed %s, ETA %s' % (
+              self.done, self.total, format_time( elapsed ),
+              format_time( eta ) if (eta is not None) else '?')
+        return txt
+    # end
+
+    def show( self ):
+        if (not self.enabled):
+            return
+        if (self.tty):
+            width = 30
+            fill = int( width * self.done / max( self.total, 1 ) )
+            bar = '[' + '#'*fill + '-'*(width - fill) + '] '
+            sys.stderr.write( '\r\x1b[K' + bar + self.status() )
+            sys.stderr.flush()
+            self.shown = True
+        else:
+            now = time.time()
+            if (now - self.last >= self.opts.progress_interval
+                or self.done == self.total):
+                print( 'progress:', self.status(), file=sys.stderr )
+                sys.stderr.flush()
+                self.last = now
+    # end
+
+    # Erases the bar, before printing other text to the TTY.
+    def clear( self ):
+        if (self.shown):
+            sys.stderr.write( '\r\x1b[K' )
+            sys.stderr.flush()
+            self.shown = False
+    # end
+# end
+
+# ------------------------------------------------------------------------------
+# Formats seconds as h:mm:ss.
+def format_time( seconds ):
+    seconds = int( seconds + 0.5 )
+    return '%d:%02d:%02d' % (seconds // 3600, (seconds // 60) % 60, seconds % 60)
+# end
+
+# ------------------------------------------------------------------------------
+# Runs tester commands, with the result cache and progress display.
+# If echo is true, prints commands, tester output, and pass/fail messages,
+# as the run_tests.py script does; otherwise, it is silent.
+class Runner( object ):
+    def __init__( self, opts, echo=True ):
+        self.opts = opts
+        self.echo = echo
+
+        # When stdout is redirected to file instead of TTY console,
+        # and  stderr is still going to a TTY console,
+        # print extra summary messages to stderr.
+        self.output_redirected = (echo and sys.stderr.isatty()
+                                  and not sys.stdout.isatty())
+
+        self.use_cache = not (opts.no_cache or opts.dry_run or opts.db
+                              or opts.ref == 'y' or opts.check == 'n')
+
+        # Hash of tester, library, and host is computed once per run,
+        # since the build doesn't change during a sweep.
+        self.build_hash = None
+
+        self.progress = Progress( opts, enabled=echo )
+    # end
+
+    # --------------------------------------------------------------------------
+    # if output is redirected, prints to both stderr and stdout;
+    # otherwise prints to just stdout.
+    def print_tee( self, *args ):
+        if (not self.echo):
+            return
+        print( *args )
+        if (self.output_redirected):
+            self.progress.clear()
+            print( *args, file=sys.stderr )
+    # end
+
+    # --------------------------------------------------------------------------
+    def get_build_hash( self ):
+        if (self.build_hash is None):
+            tester = find_tester( self.opts )
+            if (not tester):
+                self.print_tee( 'tester not found; disabling result cache' )
+                self.use_cache = False
+                return None
+            h = hashlib.sha256()
+            h.update( hash_file( tester ).encode() )
+            lib = find_blaspp_lib( tester )
+            if (lib):
+                h.update( hash_file( lib ).encode() )
+            h.update( host_fingerprint().encode() )
+            self.build_hash = h.hexdigest()
+        return self.build_hash
+    # end
+
+    # --------------------------------------------------------------------------
+    # Returns cache filename for the command cmd (string), or None if not caching.
+    def cache_file( self, cmd ):
+        if (not self.use_cache):
+            return None
+        bh = self.get_build_hash()
+        if (bh is None):
+            return None
+        key = hashlib.sha256( (bh + '\n' + cmd).encode() ).hexdigest()
+        return os.path.join( self.opts.cache_dir, key + '.json' )
+    # end
+
+    # --------------------------------------------------------------------------
+    # Returns cached entry (dict with cmd, output, ...) for cmd, or None.
+    def cache_lookup( self, cmd ):
+        filename = self.cache_file( cmd )
+        if (not filename or not os.path.exists( filename )):
+            return None
+        try:
+            with open( filename ) as f:
+                entry = json.load( f )
+        except Exception:
+            return None
+        if (entry.get( 'cmd' ) != cmd or entry.get( 'err' ) != 0):
+            return None
+        return entry
+    # end
+
+    # --------------------------------------------------------------------------
+    # Saves a passing result for cmd in the cache.
+    def cache_store( self, cmd, err, output, elapsed ):
+        filename = self.cache_file( cmd )
+        if (not filename or err != 0):
+            return
+        entry = { 'cmd': cmd, 'err': err, 'output': output,
+                  'elapsed': elapsed, 'created': time.time() }
+        try:
+            os.makedirs( self.opts.cache_dir, exist_ok=True )
+            tmp = filename + '.tmp' + str( os.getpid() )
+            with open( tmp, 'w' ) as f:
+                json.dump( entry, f )
+            os.replace( tmp, filename )
+        except Exception as ex:
+            self.print_tee( 'warning: cannot write cache:', ex )
+    # end
+
+    # --------------------------------------------------------------------------
+    # Evicts cache entries older than opts.cache_max_age days,
+    # then the oldest entries until the cache is within opts.cache_max_size MiB.
+    def cache_evict( self ):
+        opts = self.opts
+        if (not self.use_cache or not os.path.isdir( opts.cache_dir )):
+            return
+        now = time.time()
+        max_age  = opts.cache_max_age * 24 * 3600
+        max_size = opts.cache_max_size * 1024 * 1024
+        entries = []
+        for name in os.listdir( opts.cache_dir ):
+            if (not name.endswith( '.json' ) or name == 'timings.json'):
+                continue
+            path = os.path.join( opts.cache_dir, name )
+            try:
+                st = os.stat( path )
+            except OSError:
+                continue
+            if (now - st.st_mtime > max_age):
+                os.remove( path )
+            else:
+                entries.append( (st.st_mtime, st.st_size, path) )
+        # end
+        total = sum( [x[1] for x in entries] )
+        for (mtime, size, path) in sorted( entries ):
+            if (total <= max_size):
+                break
+            os.remove( path )
+            total -= size
+    # end
+
+    # --------------------------------------------------------------------------
+    # Generator that runs each command in cmds, a list of [routine, args],
+    # yielding dicts as results stream in:
+    #   { 'event': 'start', 'routine': ..., 'cmd': ... }
+    #       before running the command;
+    #   { 'event': 'row', 'routine': ..., 'cmd': ..., 'row': {...},
+    #     'cached': ... }
+    #       for each result row, parsed by RowParser;
+    #   { 'event': 'end', 'routine': ..., 'cmd': ..., 'err': ...,
+    #     'output': ..., 'elapsed': ..., 'cached': ... }
+    #       after the command finishes; err is the exit code.
+    # With --dry-run, end has err = None.
+    def run( self, cmds ):
+        self.cache_evict()
+        self.progress.begin( [ test_command( self.opts, cmd ) for cmd in cmds ] )
+        for cmd in cmds:
+            for result in self.run_test( cmd ):
+                yield result
+        self.progress.clear()
+    # end
+
+    # --------------------------------------------------------------------------
+    # cmd is a pair of strings: (function, args)
+    def run_test( self, cmd ):
+        routine = cmd[0]
+        cmd = test_command( self.opts, cmd )
+        self.progress.clear()
+        self.print_tee( cmd )
+        yield { 'event': 'start', 'routine': routine, 'cmd': cmd }
+
+        end = { 'event': 'end', 'routine': routine, 'cmd': cmd,
+                'err': None, 'output': None, 'elapsed': 0, 'cached': False }
+        if (self.opts.dry_run):
+            yield end
+            return
+
+        parser = RowParser()
+        entry = self.cache_lookup( cmd )
+        if (entry):
+            output = entry['output']
+            if (self.echo):
+                print( output, end='' )
+            for line in output.splitlines():
+                row = parser.parse( line )
+                if (row):
+                    yield { 'event': 'row', 'routine': routine, 'cmd': cmd,
+                            'row': row, 'cached': True }
+            self.print_tee( 'pass (cached, %.2f sec saved)' % entry['elapsed'] )
+            self.progress.finish( cmd, None )
+            end.update( err=0, output=output, cached=True )
+            yield end
+            return
+
+        t = time.time()
+        output = ''
+        p = subprocess.Popen( cmd.split(), stdout=subprocess.PIPE,
+                                           stderr=subprocess.STDOUT )
+        p_out = p.stdout
+        if (sys.version_info.major >= 3):
+            p_out = io.TextIOWrapper(p.stdout, encoding='utf-8')
+        # Read unbuffered ("for line in p.stdout" will buffer).
+        for line in iter(p_out.readline, ''):
+            if (self.echo):
+                print( line, end='' )
+            output += line
+            row = parser.parse( line )
+            if (row):
+                yield { 'event': 'row', 'routine': routine, 'cmd': cmd,
+                        'row': row, 'cached': False }
+        err = p.wait()
+        if (err != 0):
+            self.print_tee( 'FAILED: exit code', err )
+        else:
+            self.print_tee( 'pass' )
+        elapsed = time.time() - t
+        self.cache_store( cmd, err, output, elapsed )
+        self.progress.finish( cmd, elapsed )
+        end.update( err=err, output=output, elapsed=elapsed )
+        yield end
+    # end
+# end
+
+# ------------------------------------------------------------------------------
+# Generator that runs commands in cmds (from build_commands or
+# select_commands) and yields structured results; see Runner.run.
+# By default it is silent, for use from other Python programs.
+def run_commands( opts, cmds, echo=False ):
+    return Runner( opts, echo ).run( cmds )
+# end
+
+# ------------------------------------------------------------------------------
+# Replay of failed tests.
+# Each FAILED row in tester output is turned back into a minimal command
+# that runs just that case, with its type, layout, trans, etc., dim,
+# inc, and alpha/beta. These are written to the replay file
+# (opts.replay_file), one per line as "args routine", which
+# --rerun-failed reads to run just those cases.
+# If a command fails without a FAILED row (e.g., it crashed),
+# the whole command is written instead.
+
+# Columns that are enums, printed as strings (col, notrans, lower, ...)
+# whose first letter is the tester's command line option value.
+replay_enums = ('type', 'layout', 'format', 'side', 'uplo',
+                'trans', 'transA', 'transB', 'diag')
+
+# Columns passed through as-is. Header name => option name.
+replay_values = (('incx', 'incx'), ('incy', 'incy'), ('batch', 'batch'),
+                 ('device', 'device'), ('ptr', 'pointer-mode'),
+                 ('calls', 'calls'))
+
+# Scalars are printed rounded, so use the tester's exact default
+# (pi, e) if the printed value matches it.
+replay_scalar_defaults = { 'alpha': '3.1416', 'beta': '2.7183' }
+
+# ------------------------------------------------------------------------------
+# Returns command [routine, args] to rerun a single row of tester output.
+def replay_command( routine, row ):
+    args = ''
+    for c in replay_enums:
+        if (row.get( c )):
+            args += ' --' + c + ' ' + row[ c ][0]
+    m = row.get( 'm' )
+    n = row.get( 'n' )
+    k = row.get( 'k' )
+    if (m or n or k):
+        # Unused dims are filled in from used ones; the tester ignores them.
+        m = m or n or k
+        n = n or m
+        k = k or n
+        args += ' --dim ' + m + 'x' + n + 'x' + k
+    for c in ('alpha', 'beta'):
+        if (row.get( c ) and row[ c ] != replay_scalar_defaults[ c ]):
+            args += ' --' + c + ' ' + row[ c ]
+    for (c, option) in replay_values:
+        if (row.get( c )):
+            args += ' --' + option + ' ' + row[ c ]
+    return [ routine, args ]
+# end
+
+# ------------------------------------------------------------------------------
+# Writes commands (list of [routine, args]) to the replay file,
+# or removes the file if there are no commands.
+def write_replay( filename, cmds ):
+    if (not cmds):
+        if (os.path.exists( filename )):
+            os.remove( filename )
+        return
+    with open( filename, 'w' ) as f:
+        f.write( '# failed tests from run_tests.py, ' + time.ctime() + '\n' )
+        f.write( '# rerun with: run_tests.py --rerun-failed\n' )
+        for cmd in cmds:
+            f.write( cmd[1].strip() + ' ' + cmd[0] + '\n' )
+# end
+
+# ------------------------------------------------------------------------------
+# Returns commands (list of [routine, args]) read from the replay file.
+def read_replay( filename ):
+    cmds = []
+    with open( filename ) as f:
+        for line in f:
+            words = line.split()
+            if (not words or words[0].startswith( '#' )):
+                continue
+            cmds.append( [ words[-1], ' ' + ' '.join( words[:-1] ) ] )
+    return cmds
+# end
+
+# ------------------------------------------------------------------------------
+# Results database.
+# With --db file, each parsed result row is inserted into an SQLite
+# database, with metadata for the run: git revision, host fingerprint,
+# BLAS library, compiler, and flags from make.inc. Rows replayed from the
+# result cache are not inserted, since they were not measured in this run.
+# See query_main for querying history.
+
+# Output columns; all other columns are input parameters, which form the key
+# that identifies the same test across runs.
+def is_output_column( name ):
+    return (name in ('error', 'error2', 'error3', 'status')
+            or re.search( r'time \(s\)|gflop/s|gbyte/s|ns/call', name ) is not None)
+# end
+
+# ------------------------------------------------------------------------------
+# Returns float value of s, or None if s is not a number (e.g., NA).
+def to_float( s ):
+    try:
+        return float( s )
+    except (TypeError, ValueError):
+        return None
+# end
+
+# ------------------------------------------------------------------------------
+# Returns int value of s, or None if s is not a number.
+def to_int( s ):
+    try:
+        return int( s )
+    except (TypeError, ValueError):
+        return None
+# end
+
+# ------------------------------------------------------------------------------
+# Returns dict of variables (CXX, CXXFLAGS, LDFLAGS, LIBS) in make.inc,
+# or empty dict if there is no make.inc (e.g., CMake builds).
+def read_make_inc( filename ):
+    variables = {}
+    try:
+        with open( filename ) as f:
+            for line in f:
+                s = re.search( r'^(\w+)\s*=\s*(.*?)\s*$', line )
+                if (s):
+                    variables[ s.group(1) ] = s.group(2)
+    except Exception:
+        pass
+    return variables
+# end
+
+# ------------------------------------------------------------------------------
+# Returns dict of metadata describing this run.
+def run_metadata( opts, argv=None ):
+    top = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), '..' )
+    git_rev = ''
+    try:
+        git_rev = subprocess.check_output(
+            ['git', '-C', top, 'rev-parse', 'HEAD'],
+            stderr=subprocess.DEVNULL ).decode( 'utf-8' ).strip()
+        dirty = subprocess.check_output(
+            ['git', '-C', top, 'status', '--porcelain', '-uno'],
+            stderr=subprocess.DEVNULL ).decode( 'utf-8' ).strip()
+        if (dirty):
+            git_rev += '-dirty'
+    except Exception:
+        pass
+
+    make_inc = read_make_inc( os.path.join( top, 'make.inc' ) )
+    cxxflags = make_inc.get( 'CXXFLAGS', '' )
+    libs     = make_inc.get( 'LIBS', '' )
+    blas = libs
+    for (define, vendor) in (('MKL',        'Intel MKL'),
+                             ('OPENBLAS',   'OpenBLAS'),
+                             ('ESSL',       'IBM ESSL'),
+                             ('ACML',       'AMD ACML'),
+                             ('ACCELERATE', 'Apple Accelerate')):
+        if (re.search( r'-DBLAS_HAVE_' + define + r'\b', cxxflags )):
+            blas = vendor
+            break
+
+    if (argv is None):
+        argv = sys.argv
+    return { 'started':  time.time(),
+             'git_rev':  git_rev,
+             'host':     host_fingerprint(),
+             'blas':     blas,
+             'cxx':      make_inc.get( 'CXX', '' ),
+             'cxxflags': cxxflags,
+             'ldflags':  make_inc.get( 'LDFLAGS', '' ),
+             'libs':     libs,
+             'command':  ' '.join( argv ) }
+# end
+
+# ------------------------------------------------------------------------------
+# SQLite database of results.
+# Table runs has one row per run_tests.py invocation, with its metadata.
+# Table results has one row per tester result row, with the routine,
+# type, dims (m, n, k; NULL if not applicable), key (input parameters),
+# time, gflop/s, status, and the full row as JSON.
+class ResultsDB( object ):
+    schema = '''
+        create table if not exists runs (
+            id       integer primary key,
+            started  real,
+            git_rev  text,
+            host     text,
+            blas     text,
+            cxx      text,
+            cxxflags text,
+            ldflags  text,
+            libs     text,
+            command  text
+        );
+        create table if not exists results (
+            run_id   integer references runs( id ),
+            routine  text,
+            type     text,
+            m        integer,
+            n        integer,
+            k        integer,
+            key      text,
+            time     real,
+            gflops   real,
+            gbytes   real,
+            error    real,
+            status   text,
+            row      text
+        );
+        create index if not exists results_routine
+            on results( routine, type, m, n, k );
+        create index if not exists results_run
+            on results( run_id );
+        create index if not exists runs_git_rev
+            on runs( git_rev );
+    '''
+
+    def __init__( self, filename ):
+        # sqlite3 is optional in some Python builds; import only if needed.
+        import sqlite3
+        self.conn = sqlite3.connect( filename )
+        self.conn.executescript( self.schema )
+    # end
+
+    # Inserts metadata (dict from run_metadata) for a new run;
+    # returns its run id.
+    def begin_run( self, meta ):
+        cols = ('started', 'git_rev', 'host', 'blas', 'cxx', 'cxxflags',
+                'ldflags', 'libs', 'command')
+        cur = self.conn.execute(
+            'insert into runs (' + ', '.join( cols ) + ') values ('
+            + ', '.join( ['?'] * len( cols ) ) + ')',
+            [ meta[ c ] for c in cols ] )
+        self.conn.commit()
+        return cur.lastrowid
+    # end
+
+    # Inserts a result row (dict from RowParser) for routine.
+    def insert( self, run_id, routine, row ):
+        key = ' '.join( [ c + '=' + v for (c, v) in row.items()
+                          if not is_output_column( c ) ] )
+        self.conn.execute(
+            'insert into results (run_id, routine, type, m, n, k, key,'
+            ' time, gflops, gbytes, error, status, row)'
+            ' values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (run_id, routine, row.get( 'type' ),
+             to_int( row.get( 'm' ) ), to_int( row.get( 'n' ) ),
+             to_int( row.get( 'k' ) ), key,
+             to_float( row.get( 'time (s)' ) ),
+             to_float( row.get( 'gflop/s' ) ),
+             to_float( row.get( 'gbyte/s' ) ),
+             to_float( row.get( 'error' ) ),
+             row.get( 'status' ), json.dumps( row ) ) )
+    # end
+
+    def commit( self ):
+        self.conn.commit()
+
+    def close( self ):
+        self.conn.close()
+# end
+
+# ------------------------------------------------------------------------------
+# Query results database.
+# Usage:
+#     ./run_tests.py query --db results.db runs [--last N]
+#     ./run_tests.py query --db results.db history gemm [d [4000]] [--last N]
+#     ./run_tests.py query --db results.db slowdowns REV1 REV2 [--top N]
+# history shows results for a routine, optionally limited to a type and
+# dim (n, m x n, or m x n x k), over the last N runs that have them.
+# slowdowns compares the best gflop/s of each test (same routine and input
+# parameters) between runs of two git revisions (or revision prefixes),
+# listing the largest slowdowns first.
+query_parser = argparse.ArgumentParser( prog='run_tests.py query' )
+query_parser.add_argument( '--db', action='store', required=True, help='SQLite results database' )
+query_parser.add_argument( '--host', action='store', help='only runs whose host fingerprint contains this string', default='' )
+query_sub = query_parser.add_subparsers( dest='query' )
+query_sub.required = True
+
+q = query_sub.add_parser( 'runs', help='list recent runs' )
+q.add_argument( '--last', type=int, help='default=%(default)s', default=20 )
+
+q = query_sub.add_parser( 'history', help='results of a routine over recent runs' )
+q.add_argument( 'routine' )
+q.add_argument( 'type', nargs='?', default='' )
+q.add_argument( 'dim',  nargs='?', default='' )
+q.add_argument( '--last', type=int, help='default=%(default)s', default=30 )
+
+q = query_sub.add_parser( 'slowdowns', help='largest slowdowns between two revisions' )
+q.add_argument( 'old_rev' )
+q.add_argument( 'new_rev' )
+q.add_argument( '--top', type=int, help='default=%(default)s', default=20 )
+
+# ------------------------------------------------------------------------------
+def format_float( x, fmt='%.3f' ):
+    return fmt % x if (x is not None) else 'NA'
+# end
+
+# ------------------------------------------------------------------------------
+def query_main( argv ):
+    qopts = query_parser.parse_args( argv )
+    if (not os.path.exists( qopts.db )):
+        print( 'Error: database', qopts.db, 'not found' )
+        return 1
+    db = ResultsDB( qopts.db )
+    host = '%' + qopts.host + '%'
+
+    if (qopts.query == 'runs'):
+        print( '%5s  %-24s  %-12s  %-16s  %s' % ('run', 'started', 'git_rev', 'blas', 'command') )
+        for (run_id, started, git_rev, blas, command) in db.conn.execute(
+                'select id, started, git_rev, blas, command from runs'
+                ' where host like ? order by id desc limit ?',
+                (host, qopts.last) ):
+            print( '%5d  %-24s  %-12s  %-16s  %s' % (
+                   run_id, time.ctime( started ), git_rev[:12], blas[:16], command) )
+
+    elif (qopts.query == 'history'):
+        where = 'routine = ?'
+        args  = [ qopts.routine ]
+        if (qopts.type):
+            where += ' and type = ?'
+            args.append( qopts.type )
+        if (qopts.dim):
+            dims = [ int( d ) for d in qopts.dim.split( 'x' ) ]
+            if (len( dims ) == 1):
+                # square: every dim present equals n
+                dims = dims * 3
+                for c in ('m', 'n', 'k'):
+                    where += ' and (' + c + ' is null or ' + c + ' = ?)'
+            else:
+                for c in ('m', 'n', 'k')[ :len( dims ) ]:
+                    where += ' and ' + c + ' = ?'
+            args += dims
+        sql = ('select run_id, started, git_rev, key, time, gflops, status'
+               ' from results join runs on run_id = runs.id'
+               ' where ' + where + ' and host like ? and run_id in'
+               ' (select distinct run_id from results join runs'
+               '  on run_id = runs.id where ' + where + ' and host like ?'
+               '  order by run_id desc limit ?)'
+               ' order by run_id, key')
+        print( '%5s  %-24s  %-12s  %9s  %12s  %-8s  %s' % (
+               'run', 'started', 'git_rev', 'time (s)', 'gflop/s', 'status', 'params') )
+        for (run_id, started, git_rev, key, t, gflops, status) in db.conn.execute(
+                sql, args + [host] + args + [host, qopts.last] ):
+            print( '%5d  %-24s  %-12s  %9s  %12s  %-8s  %s' % (
+                   run_id, time.ctime( started ), git_rev[:12],
+                   format_float( t ), format_float( gflops ), status, key ) )
+
+    elif (qopts.query == 'slowdowns'):
+        best = ('select routine, key, max( gflops ) as gflops'
+                ' from results join runs on run_id = runs.id'
+                ' where git_rev like ? and host like ? and gflops > 0'
+                ' group by routine, key')
+        sql = ('select old.routine, old.key, old.gflops, new.gflops,'
+               ' new.gflops / old.gflops as ratio'
+               ' from (' + best + ') as old join (' + best + ') as new'
+               ' on old.routine = new.routine and old.key = new.key'
+               ' where new.gflops < old.gflops'
+               ' order by ratio limit ?')
+        print( '%-12s  %12s  %12s  %7s  %s' % (
+               'routine', 'old gflop/s', 'new gflop/s', 'ratio', 'params') )
+        for (routine, key, old, new, ratio) in db.conn.execute(
+                sql, (qopts.old_rev + '%', host, qopts.new_rev + '%', host,
+                      qopts.top) ):
+            print( '%-12s  %12.3f  %12.3f  %7.3f  %s' % (
+                   routine, old, new, ratio, key ) )
+    # end
+
+    db.close()
+    return 0
 # end
 
 # ------------------------------------------------------------------------------
@@ -457,76 +1340,140 @@ def indent_xml( elem, level=0 ):
 
 # ------------------------------------------------------------------------------
 # run each test
+def main( argv=None ):
+    if (argv is None):
+        argv = sys.argv[1:]
+    if (argv and argv[0] == 'query'):
+        return query_main( argv[1:] )
 
-start = time.time()
-print_tee( time.ctime() )
+    opts = parse_args( argv )
+    if (opts.from_file):
+        if (not os.path.exists( opts.from_file )):
+            print( 'Error: file', opts.from_file, 'not found' )
+            return 1
+        cmds = read_replay( opts.from_file )
+    elif (opts.rerun_failed):
+        if (not os.path.exists( opts.replay_file )):
+            print( 'Error: no failed tests to rerun; replay file',
+                   opts.replay_file, 'not found' )
+            return 1
+        cmds = read_replay( opts.replay_file )
+    else:
+        cmds = build_commands( opts )
+    runner = Runner( opts, echo=True )
+    print_tee = runner.print_tee
 
-failed_tests = []
-passed_tests = []
-ntests = len(opts.tests)
-run_all = (ntests == 0)
+    db = None
+    if (opts.db and not opts.dry_run):
+        db = ResultsDB( opts.db )
+        run_id = db.begin_run( run_metadata( opts, [sys.argv[0]] + argv ) )
 
-seen = set()
-for cmd in cmds:
-    if ((run_all or cmd[0] in opts.tests) and cmd[0] not in opts.exclude):
-        if (start_routine and cmd[0] != start_routine):
-            print_tee( 'skipping', cmd[0] )
-            continue
-        start_routine = None
+    start = time.time()
+    print_tee( time.ctime() )
 
-        seen.add( cmd[0] )
-        (err, output) = run_test( cmd )
+    failed_tests = []
+    passed_tests = []
+    ntests = len(opts.tests)
+    replay = []
+    nfailed_rows = 0
+
+    # select commands first, so progress knows the total
+    (todo, not_seen) = select_commands( opts, cmds, print_tee )
+
+    for result in runner.run( todo ):
+        if (result['event'] == 'row'):
+            if (db):
+                db.insert( run_id, result['routine'], result['row'] )
+            if (result['row']['status'].startswith( 'FAILED' )):
+                nfailed_rows += 1
+                cmd = replay_command( result['routine'], result['row'] )
+                if (cmd not in replay):
+                    replay.append( cmd )
+            continue
+        if (result['event'] == 'start'):
+            nfailed_rows = 0
+            continue
+        if (db):
+            db.commit()
+        err = result['err']
         if (err):
-            failed_tests.append( (cmd[0], err, output) )
-        else:
-            passed_tests.append( cmd[0] )
-
-not_seen = list( filter( lambda x: x not in seen, opts.tests ) )
-if (not_seen):
-    print_tee( 'Warning: unknown routines:', ' '.join( not_seen ))
-
-# print summary of failures
-nfailed = len( failed_tests )
-if (nfailed > 0):
-    print_tee( '\n' + str(nfailed) + ' routines FAILED:',
-               ', '.join( [x[0] for x in failed_tests] ) )
-else:
-    print_tee( '\n' + 'All routines passed.' )
-
-# generate jUnit compatible test report
-if opts.xml:
-    print( 'writing XML file', opts.xml )
-    root = ET.Element("testsuites")
-    doc = ET.SubElement(root, "testsuite",
-                        name="blaspp_suite",
-                        tests=str(ntests),
-                        errors="0",
-                        failures=str(nfailed))
-
-    for (test, err, output) in failed_tests:
-        testcase = ET.SubElement(doc, "testcase", name=test)
-
-        failure = ET.SubElement(testcase, "failure")
-        if (err < 0):
-            failure.text = "exit with signal " + str(-err)
+            failed_tests.append( (result['routine'], err, result['output']) )
+            if (nfailed_rows == 0):
+                # no FAILED rows (e.g., crashed); replay whole command
+                cmd = [ result['routine'],
+                        result['cmd'][ len( opts.test ): -len( result['routine'] ) ] ]
+                if (cmd not in replay):
+                    replay.append( cmd )
         else:
-            failure.text = str(err) + " tests failed"
+            passed_tests.append( result['routine'] )
+    # end
 
-        system_out = ET.SubElement(testcase, "system-out")
-        system_out.text = output
+    if (db):
+        db.close()
+        print_tee( 'results in database', opts.db )
+
+    # Rerunning rewrites the replay file with cases that still fail.
+    # Never overwrite the --from-file input.
+    from_replay_file = (opts.from_file
+                        and os.path.abspath( opts.from_file )
+                            == os.path.abspath( opts.replay_file ))
+    if (not opts.dry_run and not from_replay_file
+            and (replay or (opts.rerun_failed and not opts.from_file))):
+        write_replay( opts.replay_file, replay )
+        if (replay):
+            print_tee( 'wrote', len( replay ), 'failed tests to',
+                       opts.replay_file + '; rerun with --rerun-failed' )
+
+    if (not_seen):
+        print_tee( 'Warning: unknown routines:', ' '.join( not_seen ))
+
+    # print summary of failures
+    nfailed = len( failed_tests )
+    if (nfailed > 0):
+        print_tee( '\n' + str(nfailed) + ' routines FAILED:',
+                   ', '.join( [x[0] for x in failed_tests] ) )
+    else:
+        print_tee( '\n' + 'All routines passed.' )
+
+    # generate jUnit compatible test report
+    if opts.xml:
+        print( 'writing XML file', opts.xml )
+        root = ET.Element("testsuites")
+        doc = ET.SubElement(root, "testsuite",
+                            name="blaspp_suite",
+                            tests=str(ntests),
+                            errors="0",
+                            failures=str(nfailed))
+
+        for (test, err, output) in failed_tests:
+            testcase = ET.SubElement(doc, "testcase", name=test)
+
+            failure = ET.SubElement(testcase, "failure")
+            if (err < 0):
+                failure.text = "exit with signal " + str(-err)
+            else:
+                failure.text = str(err) + " tests failed"
+
+            system_out = ET.SubElement(testcase, "system-out")
+            system_out.text = output
+        # end
+
+        for test in passed_tests:
+            testcase = ET.SubElement(doc, 'testcase', name=test)
+            testcase.text = 'PASSED'
+
+        tree = ET.ElementTree(root)
+        indent_xml( root )
+        tree.write( opts.xml )
     # end
 
-    for test in passed_tests:
-        testcase = ET.SubElement(doc, 'testcase', name=test)
-        testcase.text = 'PASSED'
+    elapsed = time.time() - start
+    print_tee( 'Elapsed %.2f sec' % elapsed )
+    print_tee( time.ctime() )
 
-    tree = ET.ElementTree(root)
-    indent_xml( root )
-    tree.write( opts.xml )
+    return nfailed
 # end
 
-elapsed = time.time() - start
-print_tee( 'Elapsed %.2f sec' % elapsed )
-print_tee( time.ctime() )
-
-exit( nfailed )
+# ------------------------------------------------------------------------------
+if (__name__ == '__main__'):
+    exit( main() )
@@ -70,6 +70,12 @@ std::vector< testsweeper::routines_t > routines = {
     { "swap",   test_swap,   Section::blas1   },
     { "",       nullptr,     Section::newline },
 
+    { "batch-axpy",   test_batch_axpy,   Section::blas1   },
+    { "batch-dot",    test_batch_dot,    Section::blas1   },
+    { "batch-nrm2",   test_batch_nrm2,   Section::blas1   },
+    { "batch-scal",   test_batch_scal,   Section::blas1   },
+    { "",             nullptr,           Section::newline },
+
     // Level 2 BLAS
     { "gemv",   test_gemv,   Section::blas2   },
     { "ger",    test_ger,    Section::blas2   },
@@ -90,6 +96,10 @@ std::vector< testsweeper::routines_t > routines = {
     { "trsv",   test_trsv,   Section::blas2   },
     { "",       nullptr,     Section::newline },
 
+    { "batch-gemv",   test_batch_gemv,   Section::blas2   },
+    { "batch-ger",    test_batch_ger,    Section::blas2   },
+    { "",             nullptr,           Section::newline },
+
     // Level 3 BLAS
     { "gemm",   test_gemm,   Section::blas3   },
     { "",       nullptr,     Section::newline },
@@ -109,6 +119,7 @@ std::vector< testsweeper::routines_t > routines = {
     { "",       nullptr,     Section::newline },
 
     { "batch-gemm",   test_batch_gemm,   Section::blas3   },
+    { "batch-gemm-strided", test_batch_gemm_strided, Section::blas3 },
     { "",             nullptr,           Section::newline },
 
     { "batch-hemm",   test_batch_hemm,   Section::blas3   },
@@ -123,6 +134,7 @@ std::vector< testsweeper::routines_t > routines = {
 
     { "batch-trmm",   test_batch_trmm,   Section::blas3   },
     { "batch-trsm",   test_batch_trsm,   Section::blas3   },
+    { "batch-trsm-strided", test_batch_trsm_strided, Section::blas3 },
     { "",              nullptr,          Section::newline },
 
     // Device Level 1 BLAS
@@ -209,6 +221,7 @@ Params::Params():
     repeat    ( "repeat",  0,    ParamType::Value,   1,   1, 1000, "times to repeat each test" ),
     verbose   ( "verbose", 0,    ParamType::Value,   0,   0,   10, "verbose level" ),
     cache     ( "cache",   0,    ParamType::Value,  20,   1, 1024, "total cache size, in MiB" ),
+    calls     ( "calls",   0,    ParamType::Value,   1,   1,  1e9, "calls to time back-to-back, reporting ns per call (for call overhead of tiny sizes)" ),
 
     // ----- routine parameters
     //          name,      w,    type,            def,                    char2enum,         enum2char,         enum2str,         help
@@ -263,6 +276,9 @@ Params::Params():
     ref_gflops( "ref gflop/s",  12, 3, PT_Output, no_data, 0, 0, "reference Gflop/s rate" ),
     ref_gbytes( "ref gbyte/s",  12, 3, PT_Output, no_data, 0, 0, "reference Gbyte/s rate" ),
 
+    ns_call     ( "ns/call",      9, 1, PT_Output, no_data, 0, 0, "time per call, in ns, with --calls" ),
+    ref_ns_call ( "ref ns/call", 12, 1, PT_Output, no_data, 0, 0, "reference time per call, in ns, with --calls" ),
+
     // default -1 means "no check"
     okay      ( "status",              6,    ParamType::Output,  -1,   0,   0, "success indicator" ),
     msg       ( "",       1, ParamType::Output,  "",           "error message" )
@@ -345,6 +361,15 @@ int main( int argc, char** argv )
             throw;
         }
 
+        // show calls and ns/call columns if timing back-to-back calls;
+        // only testers that mark calls accept it
+        if (params.calls() > 1) {
+            params.calls.width( 8 );
+            params.ns_call();
+            if (params.ref() == 'y')
+                params.ref_ns_call();
+        }
+
         // show align column if it has non-default values
         if (params.align.size() != 1 || params.align() != 1) {
             params.align.width( 5 );
@@ -35,6 +35,7 @@ public:
     testsweeper::ParamInt    repeat;
     testsweeper::ParamInt    verbose;
     testsweeper::ParamInt    cache;
+    testsweeper::ParamInt    calls;
 
     // ----- routine parameters
     testsweeper::ParamEnum< testsweeper::DataType > datatype;
@@ -81,6 +82,9 @@ public:
     testsweeper::ParamDouble     ref_gflops;
     testsweeper::ParamDouble     ref_gbytes;
 
+    testsweeper::ParamDouble     ns_call;
+    testsweeper::ParamDouble     ref_ns_call;
+
     testsweeper::ParamOkay       okay;
     testsweeper::ParamString     msg;
 
@@ -179,9 +183,22 @@ void test_syrk  ( Params& params, bool run );
 void test_trmm  ( Params& params, bool run );
 void test_trsm  ( Params& params, bool run );
 
+// -----------------------------------------------------------------------------
+// Level 1 Batch BLAS
+void test_batch_axpy  ( Params& params, bool run );
+void test_batch_dot   ( Params& params, bool run );
+void test_batch_nrm2  ( Params& params, bool run );
+void test_batch_scal  ( Params& params, bool run );
+
+// -----------------------------------------------------------------------------
+// Level 2 Batch BLAS
+void test_batch_gemv  ( Params& params, bool run );
+void test_batch_ger   ( Params& params, bool run );
+
 // -----------------------------------------------------------------------------
 // Level 3 Batch BLAS
 void test_batch_gemm  ( Params& params, bool run );
+void test_batch_gemm_strided ( Params& params, bool run );
 void test_batch_hemm  ( Params& params, bool run );
 void test_batch_her2k ( Params& params, bool run );
 void test_batch_herk  ( Params& params, bool run );
@@ -190,6 +207,7 @@ void test_batch_syr2k ( Params& params, bool run );
 void test_batch_syrk  ( Params& params, bool run );
 void test_batch_trmm  ( Params& params, bool run );
 void test_batch_trsm  ( Params& params, bool run );
+void test_batch_trsm_strided ( Params& params, bool run );
 
 // -----------------------------------------------------------------------------
 // Level 1 GPU BLAS
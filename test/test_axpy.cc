@@ -26,6 +26,7 @@ void test_axpy_work( Params& params, bool run )
     int64_t incx    = params.incx();
     int64_t incy    = params.incy();
     int64_t verbose = params.verbose();
+    int64_t calls   = params.calls();
 
     // mark non-standard output values
     params.gflops();
@@ -134,6 +135,23 @@ void test_axpy_work( Params& params, bool run )
         params.okay() = (error < u);
     }
 
+    if (calls > 1) {
+        // call overhead: back-to-back calls, with data in cache
+        double time_calls = get_wtime();
+        for (int64_t c = 0; c < calls; ++c) {
+            blas::axpy( n, alpha, x, incx, y, incy );
+        }
+        params.ns_call() = (get_wtime() - time_calls) / calls * 1e9;
+
+        if (params.ref() == 'y') {
+            time_calls = get_wtime();
+            for (int64_t c = 0; c < calls; ++c) {
+                cblas_axpy( n, alpha, x, incx, yref, incy );
+            }
+            params.ref_ns_call() = (get_wtime() - time_calls) / calls * 1e9;
+        }
+    }
+
     delete[] x;
     delete[] y;
     delete[] yref;
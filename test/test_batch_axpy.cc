@@ -0,0 +1,157 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "test.hh"
+#include "cblas_wrappers.hh"
+#include "lapack_wrappers.hh"
+#include "blas/flops.hh"
+#include "print_matrix.hh"
+#include "check_gemm.hh"
+template <typename T>
+void test_batch_axpy_work( Params& params, bool run )
+{
+    using namespace testsweeper;
+    using scalar_t = T;
+    using real_t   = blas::real_type< scalar_t >;
+
+    // get & mark input values
+    scalar_t alpha_ = params.alpha();
+    int64_t n_      = params.dim.n();
+    int64_t incx_   = params.incx();
+    int64_t incy_   = params.incy();
+    size_t  batch   = params.batch();
+
+    // mark non-standard output values
+    params.ref_time();
+    params.ref_gflops();
+
+    if (! run)
+        return;
+
+    // ----------
+    // setup
+    size_t size_x = (n_ - 1) * std::abs(incx_) + 1;
+    size_t size_y = (n_ - 1) * std::abs(incy_) + 1;
+    T* x    = new T[ batch * size_x ];
+    T* y    = new T[ batch * size_y ];
+    T* yref = new T[ batch * size_y ];
+    T* y0   = new T[ batch * size_y ];
+
+    // pointer arrays
+    std::vector<T*> xarray( batch );
+    std::vector<T*> yarray( batch );
+
+    for (size_t i = 0; i < batch; ++i) {
+        xarray[i] = x + i * size_x;
+        yarray[i] = y + i * size_y;
+    }
+
+    // info
+    std::vector<int64_t> info( batch );
+
+    // wrap scalar arguments in std::vector
+    std::vector<int64_t>  n(1, n_);
+    std::vector<int64_t>  incx(1, incx_);
+    std::vector<int64_t>  incy(1, incy_);
+    std::vector<scalar_t> alpha(1, alpha_);
+
+    int64_t idist = 1;
+    int iseed[4] = { 0, 0, 0, 1 };
+    lapack_larnv( idist, iseed, batch * size_x, x );
+    lapack_larnv( idist, iseed, batch * size_y, y );
+    lapack_lacpy( "g", size_y, batch, y, size_y, yref, size_y );
+    lapack_lacpy( "g", size_y, batch, y, size_y, y0,   size_y );
+
+    // test error exits
+    assert_throw( blas::batch::axpy( std::vector<int64_t>(1, -1), alpha, xarray, incx,
+                                     yarray, incy, batch, info ), blas::Error );
+    assert_throw( blas::batch::axpy( n, alpha, xarray, std::vector<int64_t>(1, 0),
+                                     yarray, incy, batch, info ), blas::Error );
+
+    // decide error checking mode
+    info.resize( 0 );
+
+    // run test
+    testsweeper::flush_cache( params.cache() );
+    double time = get_wtime();
+    blas::batch::axpy( n, alpha, xarray, incx, yarray, incy, batch, info );
+    time = get_wtime() - time;
+
+    double gflop = batch * blas::Gflop< scalar_t >::axpy( n_ );
+    params.time()   = time;
+    params.gflops() = gflop / time;
+
+    if (params.check() == 'y') {
+        // run reference
+        testsweeper::flush_cache( params.cache() );
+        time = get_wtime();
+        for (size_t s = 0; s < batch; ++s) {
+            cblas_axpy( n_, alpha_, xarray[s], incx_, yref + s * size_y, incy_ );
+        }
+        time = get_wtime() - time;
+
+        params.ref_time()   = time;
+        params.ref_gflops() = gflop / time;
+
+        // maximum component-wise forward error:
+        // | fl(yi) - yi | / (2 |alpha xi| + |y0_i|)
+        real_t error = 0;
+        for (size_t s = 0; s < batch; ++s) {
+            T* xs    = xarray[s];
+            T* ys    = yarray[s];
+            T* yrefs = yref + s * size_y;
+            T* y0s   = y0   + s * size_y;
+            int64_t ix = (incx_ > 0 ? 0 : (-n_ + 1)*incx_);
+            int64_t iy = (incy_ > 0 ? 0 : (-n_ + 1)*incy_);
+            for (int64_t i = 0; i < n_; ++i) {
+                real_t err = std::abs( ys[iy] - yrefs[iy] )
+                           / (2*(std::abs( alpha_ * xs[ix] ) + std::abs( y0s[iy] )));
+                error = std::max( error, err );
+                ix += incx_;
+                iy += incy_;
+            }
+        }
+
+        // complex needs extra factor; see Higham, 2002, sec. 3.6.
+        if (blas::is_complex<scalar_t>::value) {
+            error /= 2*sqrt(2);
+        }
+
+        real_t u = 0.5 * std::numeric_limits< real_t >::epsilon();
+        params.error() = error;
+        params.okay() = (error < u);
+    }
+
+    delete[] x;
+    delete[] y;
+    delete[] yref;
+    delete[] y0;
+}
+
+// -----------------------------------------------------------------------------
+void test_batch_axpy( Params& params, bool run )
+{
+    switch (params.datatype()) {
+        case testsweeper::DataType::Single:
+            test_batch_axpy_work< float >( params, run );
+            break;
+
+        case testsweeper::DataType::Double:
+            test_batch_axpy_work< double >( params, run );
+            break;
+
+        case testsweeper::DataType::SingleComplex:
+            test_batch_axpy_work< std::complex<float> >( params, run );
+            break;
+
+        case testsweeper::DataType::DoubleComplex:
+            test_batch_axpy_work< std::complex<double> >( params, run );
+            break;
+
+        default:
+            throw std::exception();
+            break;
+    }
+}
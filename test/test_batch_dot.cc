@@ -0,0 +1,144 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "test.hh"
+#include "cblas_wrappers.hh"
+#include "lapack_wrappers.hh"
+#include "blas/flops.hh"
+#include "print_matrix.hh"
+#include "check_gemm.hh"
+template <typename T>
+void test_batch_dot_work( Params& params, bool run )
+{
+    using namespace testsweeper;
+    using scalar_t = T;
+    using real_t   = blas::real_type< scalar_t >;
+
+    // get & mark input values
+    int64_t n_      = params.dim.n();
+    int64_t incx_   = params.incx();
+    int64_t incy_   = params.incy();
+    size_t  batch   = params.batch();
+    int64_t verbose = params.verbose();
+
+    // mark non-standard output values
+    params.ref_time();
+    params.ref_gflops();
+
+    if (! run)
+        return;
+
+    // ----------
+    // setup
+    size_t size_x = (n_ - 1) * std::abs(incx_) + 1;
+    size_t size_y = (n_ - 1) * std::abs(incy_) + 1;
+    T* x      = new T[ batch * size_x ];
+    T* y      = new T[ batch * size_y ];
+    T* result = new T[ batch ];
+
+    // pointer arrays
+    std::vector<T*> xarray( batch );
+    std::vector<T*> yarray( batch );
+    std::vector<T*> resultarray( batch );
+
+    for (size_t i = 0; i < batch; ++i) {
+        xarray[i]      = x + i * size_x;
+        yarray[i]      = y + i * size_y;
+        resultarray[i] = result + i;
+    }
+
+    // info
+    std::vector<int64_t> info( batch );
+
+    // wrap scalar arguments in std::vector
+    std::vector<int64_t> n(1, n_);
+    std::vector<int64_t> incx(1, incx_);
+    std::vector<int64_t> incy(1, incy_);
+
+    int64_t idist = 1;
+    int iseed[4] = { 0, 0, 0, 1 };
+    lapack_larnv( idist, iseed, batch * size_x, x );
+    lapack_larnv( idist, iseed, batch * size_y, y );
+
+    // test error exits
+    assert_throw( blas::batch::dot( std::vector<int64_t>(1, -1), xarray, incx,
+                                    yarray, incy, resultarray, batch, info ), blas::Error );
+    assert_throw( blas::batch::dot( n, xarray, incx, yarray, std::vector<int64_t>(1, 0),
+                                    resultarray, batch, info ), blas::Error );
+
+    // decide error checking mode
+    info.resize( 0 );
+
+    // run test
+    testsweeper::flush_cache( params.cache() );
+    double time = get_wtime();
+    blas::batch::dot( n, xarray, incx, yarray, incy, resultarray, batch, info );
+    time = get_wtime() - time;
+
+    double gflop = batch * blas::Gflop< scalar_t >::dot( n_ );
+    params.time()   = time;
+    params.gflops() = gflop / time;
+
+    if (params.check() == 'y') {
+        // run reference
+        T* ref = new T[ batch ];
+        testsweeper::flush_cache( params.cache() );
+        time = get_wtime();
+        for (size_t s = 0; s < batch; ++s) {
+            ref[s] = cblas_dot( n_, xarray[s], incx_, yarray[s], incy_ );
+        }
+        time = get_wtime() - time;
+
+        params.ref_time()   = time;
+        params.ref_gflops() = gflop / time;
+
+        // check error compared to reference
+        // treat result as 1 x 1 matrix; k = n is reduction dimension
+        real_t err, error = 0;
+        bool ok, okay = true;
+        for (size_t s = 0; s < batch; ++s) {
+            real_t Xnorm = cblas_nrm2( n_, xarray[s], std::abs(incx_) );
+            real_t Ynorm = cblas_nrm2( n_, yarray[s], std::abs(incy_) );
+            check_gemm( 1, 1, n_, scalar_t(1), scalar_t(0), Xnorm, Ynorm, real_t(0),
+                        &ref[s], 1, &result[s], 1, verbose, &err, &ok );
+            error = std::max( error, err );
+            okay &= ok;
+        }
+        params.error() = error;
+        params.okay() = okay;
+
+        delete[] ref;
+    }
+
+    delete[] x;
+    delete[] y;
+    delete[] result;
+}
+
+// -----------------------------------------------------------------------------
+void test_batch_dot( Params& params, bool run )
+{
+    switch (params.datatype()) {
+        case testsweeper::DataType::Single:
+            test_batch_dot_work< float >( params, run );
+            break;
+
+        case testsweeper::DataType::Double:
+            test_batch_dot_work< double >( params, run );
+            break;
+
+        case testsweeper::DataType::SingleComplex:
+            test_batch_dot_work< std::complex<float> >( params, run );
+            break;
+
+        case testsweeper::DataType::DoubleComplex:
+            test_batch_dot_work< std::complex<double> >( params, run );
+            break;
+
+        default:
+            throw std::exception();
+            break;
+    }
+}
@@ -0,0 +1,186 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "test.hh"
+#include "cblas_wrappers.hh"
+#include "lapack_wrappers.hh"
+#include "blas/flops.hh"
+#include "print_matrix.hh"
+#include "check_gemm.hh"
+template <typename T>
+void test_batch_gemv_work( Params& params, bool run )
+{
+    using namespace testsweeper;
+    using blas::Op;
+    using blas::Layout;
+    using scalar_t = T;
+    using real_t   = blas::real_type< scalar_t >;
+
+    // get & mark input values
+    blas::Layout layout = params.layout();
+    blas::Op trans_     = params.trans();
+    scalar_t alpha_     = params.alpha();
+    scalar_t beta_      = params.beta();
+    int64_t m_          = params.dim.m();
+    int64_t n_          = params.dim.n();
+    int64_t incx_       = params.incx();
+    int64_t incy_       = params.incy();
+    size_t  batch       = params.batch();
+    int64_t align       = params.align();
+    int64_t verbose     = params.verbose();
+
+    // mark non-standard output values
+    params.ref_time();
+    params.ref_gflops();
+
+    if (! run)
+        return;
+
+    // ----------
+    // setup
+    int64_t Am = (layout == Layout::ColMajor ? m_ : n_);
+    int64_t An = (layout == Layout::ColMajor ? n_ : m_);
+    int64_t Xm = (trans_ == Op::NoTrans ? n_ : m_);
+    int64_t Ym = (trans_ == Op::NoTrans ? m_ : n_);
+    int64_t lda_ = roundup( Am, align );
+    size_t size_A = size_t(lda_)*An;
+    size_t size_x = (Xm - 1) * std::abs(incx_) + 1;
+    size_t size_y = (Ym - 1) * std::abs(incy_) + 1;
+    T* A    = new T[ batch * size_A ];
+    T* x    = new T[ batch * size_x ];
+    T* y    = new T[ batch * size_y ];
+    T* yref = new T[ batch * size_y ];
+
+    // pointer arrays
+    std::vector<T*>    Aarray( batch );
+    std::vector<T*>    xarray( batch );
+    std::vector<T*>    yarray( batch );
+    std::vector<T*> yrefarray( batch );
+
+    for (size_t i = 0; i < batch; ++i) {
+         Aarray[i]   =  A   + i * size_A;
+         xarray[i]   =  x   + i * size_x;
+         yarray[i]   =  y   + i * size_y;
+        yrefarray[i] = yref + i * size_y;
+    }
+
+    // info
+    std::vector<int64_t> info( batch );
+
+    // wrap scalar arguments in std::vector
+    std::vector<blas::Op> trans(1, trans_);
+    std::vector<int64_t>  m(1, m_);
+    std::vector<int64_t>  n(1, n_);
+    std::vector<int64_t>  lda(1, lda_);
+    std::vector<int64_t>  incx(1, incx_);
+    std::vector<int64_t>  incy(1, incy_);
+    std::vector<scalar_t> alpha(1, alpha_);
+    std::vector<scalar_t> beta(1, beta_);
+
+    int64_t idist = 1;
+    int iseed[4] = { 0, 0, 0, 1 };
+    lapack_larnv( idist, iseed, batch * size_A, A );
+    lapack_larnv( idist, iseed, batch * size_x, x );
+    lapack_larnv( idist, iseed, batch * size_y, y );
+    lapack_lacpy( "g", size_y, batch, y, size_y, yref, size_y );
+
+    // norms for error check
+    real_t work[1];
+    real_t* Anorm = new real_t[ batch ];
+    real_t* Xnorm = new real_t[ batch ];
+    real_t* Ynorm = new real_t[ batch ];
+
+    for (size_t s = 0; s < batch; ++s) {
+        Anorm[s] = lapack_lange( "f", Am, An, Aarray[s], lda_, work );
+        Xnorm[s] = cblas_nrm2( Xm, xarray[s], std::abs(incx_) );
+        Ynorm[s] = cblas_nrm2( Ym, yarray[s], std::abs(incy_) );
+    }
+
+    // test error exits
+    assert_throw( blas::batch::gemv( layout, trans, std::vector<int64_t>(1, -1), n,
+                                     alpha, Aarray, lda, xarray, incx,
+                                     beta, yarray, incy, batch, info ), blas::Error );
+    assert_throw( blas::batch::gemv( layout, trans, m, n,
+                                     alpha, Aarray, lda, xarray, incx,
+                                     beta, yarray, std::vector<int64_t>(1, 0),
+                                     batch, info ), blas::Error );
+
+    // decide error checking mode
+    info.resize( 0 );
+
+    // run test
+    testsweeper::flush_cache( params.cache() );
+    double time = get_wtime();
+    blas::batch::gemv( layout, trans, m, n, alpha, Aarray, lda, xarray, incx,
+                       beta, yarray, incy, batch, info );
+    time = get_wtime() - time;
+
+    double gflop = batch * blas::Gflop< scalar_t >::gemv( m_, n_ );
+    params.time()   = time;
+    params.gflops() = gflop / time;
+
+    if (params.check() == 'y') {
+        // run reference
+        testsweeper::flush_cache( params.cache() );
+        time = get_wtime();
+        for (size_t s = 0; s < batch; ++s) {
+            cblas_gemv( cblas_layout_const(layout), cblas_trans_const(trans_),
+                        m_, n_, alpha_, Aarray[s], lda_, xarray[s], incx_,
+                        beta_, yrefarray[s], incy_ );
+        }
+        time = get_wtime() - time;
+
+        params.ref_time()   = time;
+        params.ref_gflops() = gflop / time;
+
+        // check error compared to reference
+        // treat y as 1 x Ym matrix with ld = incy; k = Xm is reduction dimension
+        real_t err, error = 0;
+        bool ok, okay = true;
+        for (size_t s = 0; s < batch; ++s) {
+            check_gemm( 1, Ym, Xm, alpha_, beta_, Anorm[s], Xnorm[s], Ynorm[s],
+                        yrefarray[s], std::abs(incy_), yarray[s], std::abs(incy_),
+                        verbose, &err, &ok );
+            error = std::max( error, err );
+            okay &= ok;
+        }
+        params.error() = error;
+        params.okay() = okay;
+    }
+
+    delete[] A;
+    delete[] x;
+    delete[] y;
+    delete[] yref;
+    delete[] Anorm;
+    delete[] Xnorm;
+    delete[] Ynorm;
+}
+
+// -----------------------------------------------------------------------------
+void test_batch_gemv( Params& params, bool run )
+{
+    switch (params.datatype()) {
+        case testsweeper::DataType::Single:
+            test_batch_gemv_work< float >( params, run );
+            break;
+
+        case testsweeper::DataType::Double:
+            test_batch_gemv_work< double >( params, run );
+            break;
+
+        case testsweeper::DataType::SingleComplex:
+            test_batch_gemv_work< std::complex<float> >( params, run );
+            break;
+
+        case testsweeper::DataType::DoubleComplex:
+            test_batch_gemv_work< std::complex<double> >( params, run );
+            break;
+
+        default:
+            throw std::exception();
+            break;
+    }
+}
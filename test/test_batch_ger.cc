@@ -0,0 +1,176 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "test.hh"
+#include "cblas_wrappers.hh"
+#include "lapack_wrappers.hh"
+#include "blas/flops.hh"
+#include "print_matrix.hh"
+#include "check_gemm.hh"
+template <typename T>
+void test_batch_ger_work( Params& params, bool run )
+{
+    using namespace testsweeper;
+    using blas::Layout;
+    using scalar_t = T;
+    using real_t   = blas::real_type< scalar_t >;
+
+    // get & mark input values
+    blas::Layout layout = params.layout();
+    scalar_t alpha_     = params.alpha();
+    int64_t m_          = params.dim.m();
+    int64_t n_          = params.dim.n();
+    int64_t incx_       = params.incx();
+    int64_t incy_       = params.incy();
+    size_t  batch       = params.batch();
+    int64_t align       = params.align();
+    int64_t verbose     = params.verbose();
+
+    // mark non-standard output values
+    params.ref_time();
+    params.ref_gflops();
+
+    if (! run)
+        return;
+
+    // ----------
+    // setup
+    int64_t Am = (layout == Layout::ColMajor ? m_ : n_);
+    int64_t An = (layout == Layout::ColMajor ? n_ : m_);
+    int64_t lda_ = roundup( Am, align );
+    size_t size_A = size_t(lda_)*An;
+    size_t size_x = (m_ - 1) * std::abs(incx_) + 1;
+    size_t size_y = (n_ - 1) * std::abs(incy_) + 1;
+    T* A    = new T[ batch * size_A ];
+    T* Aref = new T[ batch * size_A ];
+    T* x    = new T[ batch * size_x ];
+    T* y    = new T[ batch * size_y ];
+
+    // pointer arrays
+    std::vector<T*>    Aarray( batch );
+    std::vector<T*> Arefarray( batch );
+    std::vector<T*>    xarray( batch );
+    std::vector<T*>    yarray( batch );
+
+    for (size_t i = 0; i < batch; ++i) {
+         Aarray[i]   =  A   + i * size_A;
+        Arefarray[i] = Aref + i * size_A;
+         xarray[i]   =  x   + i * size_x;
+         yarray[i]   =  y   + i * size_y;
+    }
+
+    // info
+    std::vector<int64_t> info( batch );
+
+    // wrap scalar arguments in std::vector
+    std::vector<int64_t>  m(1, m_);
+    std::vector<int64_t>  n(1, n_);
+    std::vector<int64_t>  lda(1, lda_);
+    std::vector<int64_t>  incx(1, incx_);
+    std::vector<int64_t>  incy(1, incy_);
+    std::vector<scalar_t> alpha(1, alpha_);
+
+    int64_t idist = 1;
+    int iseed[4] = { 0, 0, 0, 1 };
+    lapack_larnv( idist, iseed, batch * size_A, A );
+    lapack_larnv( idist, iseed, batch * size_x, x );
+    lapack_larnv( idist, iseed, batch * size_y, y );
+    lapack_lacpy( "g", size_A, batch, A, size_A, Aref, size_A );
+
+    // norms for error check
+    real_t work[1];
+    real_t* Anorm = new real_t[ batch ];
+    real_t* Xnorm = new real_t[ batch ];
+    real_t* Ynorm = new real_t[ batch ];
+
+    for (size_t s = 0; s < batch; ++s) {
+        Anorm[s] = lapack_lange( "f", Am, An, Aarray[s], lda_, work );
+        Xnorm[s] = cblas_nrm2( m_, xarray[s], std::abs(incx_) );
+        Ynorm[s] = cblas_nrm2( n_, yarray[s], std::abs(incy_) );
+    }
+
+    // test error exits
+    assert_throw( blas::batch::ger( layout, std::vector<int64_t>(1, -1), n, alpha,
+                                    xarray, incx, yarray, incy, Aarray, lda,
+                                    batch, info ), blas::Error );
+    assert_throw( blas::batch::ger( layout, m, n, alpha,
+                                    xarray, std::vector<int64_t>(1, 0), yarray, incy,
+                                    Aarray, lda, batch, info ), blas::Error );
+
+    // decide error checking mode
+    info.resize( 0 );
+
+    // run test
+    testsweeper::flush_cache( params.cache() );
+    double time = get_wtime();
+    blas::batch::ger( layout, m, n, alpha, xarray, incx, yarray, incy,
+                      Aarray, lda, batch, info );
+    time = get_wtime() - time;
+
+    double gflop = batch * blas::Gflop< scalar_t >::ger( m_, n_ );
+    params.time()   = time;
+    params.gflops() = gflop / time;
+
+    if (params.check() == 'y') {
+        // run reference
+        testsweeper::flush_cache( params.cache() );
+        time = get_wtime();
+        for (size_t s = 0; s < batch; ++s) {
+            cblas_ger( cblas_layout_const(layout), m_, n_, alpha_,
+                       xarray[s], incx_, yarray[s], incy_, Arefarray[s], lda_ );
+        }
+        time = get_wtime() - time;
+
+        params.ref_time()   = time;
+        params.ref_gflops() = gflop / time;
+
+        // check error compared to reference
+        // beta = 1
+        real_t err, error = 0;
+        bool ok, okay = true;
+        for (size_t s = 0; s < batch; ++s) {
+            check_gemm( Am, An, 1, alpha_, scalar_t(1), Xnorm[s], Ynorm[s], Anorm[s],
+                        Arefarray[s], lda_, Aarray[s], lda_, verbose, &err, &ok );
+            error = std::max( error, err );
+            okay &= ok;
+        }
+        params.error() = error;
+        params.okay() = okay;
+    }
+
+    delete[] A;
+    delete[] Aref;
+    delete[] x;
+    delete[] y;
+    delete[] Anorm;
+    delete[] Xnorm;
+    delete[] Ynorm;
+}
+
+// -----------------------------------------------------------------------------
+void test_batch_ger( Params& params, bool run )
+{
+    switch (params.datatype()) {
+        case testsweeper::DataType::Single:
+            test_batch_ger_work< float >( params, run );
+            break;
+
+        case testsweeper::DataType::Double:
+            test_batch_ger_work< double >( params, run );
+            break;
+
+        case testsweeper::DataType::SingleComplex:
+            test_batch_ger_work< std::complex<float> >( params, run );
+            break;
+
+        case testsweeper::DataType::DoubleComplex:
+            test_batch_ger_work< std::complex<double> >( params, run );
+            break;
+
+        default:
+            throw std::exception();
+            break;
+    }
+}
@@ -0,0 +1,136 @@
+// Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+// SPDX-License-Identifier: BSD-3-Clause
+// This program is free software: you can redistribute it and/or modify it under
+// the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+#include "test.hh"
+#include "cblas_wrappers.hh"
+#include "lapack_wrappers.hh"
+#include "blas/flops.hh"
+#include "print_matrix.hh"
+#include "check_gemm.hh"
+template <typename T>
+void test_batch_nrm2_work( Params& params, bool run )
+{
+    using namespace testsweeper;
+    using scalar_t = T;
+    using real_t   = blas::real_type< scalar_t >;
+
+    // get & mark input values
+    int64_t n_      = params.dim.n();
+    int64_t incx_   = std::abs( params.incx() );
+    size_t  batch   = params.batch();
+
+    // mark non-standard output values
+    params.ref_time();
+    params.ref_gflops();
+
+    if (! run)
+        return;
+
+    // ----------
+    // setup
+    size_t size_x = (n_ - 1) * incx_ + 1;
+    T*      x      = new T[ batch * size_x ];
+    real_t* result = new real_t[ batch ];
+
+    // pointer arrays
+    std::vector<T*>      xarray( batch );
+    std::vector<real_t*> resultarray( batch );
+
+    for (size_t i = 0; i < batch; ++i) {
+        xarray[i]      = x + i * size_x;
+        resultarray[i] = result + i;
+    }
+
+    // info
+    std::vector<int64_t> info( batch );
+
+    // wrap scalar arguments in std::vector
+    std::vector<int64_t> n(1, n_);
+    std::vector<int64_t> incx(1, incx_);
+
+    int64_t idist = 1;
+    int iseed[4] = { 0, 0, 0, 1 };
+    lapack_larnv( idist, iseed, batch * size_x, x );
+
+    // test error exits
+    assert_throw( blas::batch::nrm2( std::vector<int64_t>(1, -1), xarray, incx,
+                                     resultarray, batch, info ), blas::Error );
+    assert_throw( blas::batch::nrm2( n, xarray, std::vector<int64_t>(1, 0),
+                                     resultarray, batch, info ), blas::Error );
+
+    // decide error checking mode
+    info.resize( 0 );
+
+    // run test
+    testsweeper::flush_cache( params.cache() );
+    double time = get_wtime();
+    blas::batch::nrm2( n, xarray, incx, resultarray, batch, info );
+    time = get_wtime() - time;
+
+    double gflop = batch * blas::Gflop< scalar_t >::nrm2( n_ );
+    params.time()   = time;
+    params.gflops() = gflop / time;
+
+    if (params.check() == 'y') {
+        // run reference
+        real_t* ref = new real_t[ batch ];
+        testsweeper::flush_cache( params.cache() );
+        time = get_wtime();
+        for (size_t s = 0; s < batch; ++s) {
+            ref[s] = cblas_nrm2( n_, xarray[s], incx_ );
+        }
+        time = get_wtime() - time;
+
+        params.ref_time()   = time;
+        params.ref_gflops() = gflop / time;
+
+        // relative forward error
+        real_t error = 0;
+        for (size_t s = 0; s < batch; ++s) {
+            real_t err = std::abs( (ref[s] - result[s]) / (sqrt(n_+1) * ref[s]) );
+            error = std::max( error, err );
+        }
+
+        // complex needs extra factor; see Higham, 2002, sec. 3.6.
+        if (blas::is_complex<scalar_t>::value) {
+            error /= 2*sqrt(2);
+        }
+
+        real_t u = 0.5 * std::numeric_limits< real_t >::epsilon();
+        params.error() = error;
+        params.okay() = (error < u);
+
+        delete[] ref;
+    }
+
+    delete[] x;
+    delete[] result;
+}
+
+// -----------------------------------------------------------------------------
+void test_batch_nrm2( Params& params, bool run )
+{
+    switch (params.datatype()) {
+        case testsweeper::DataType::Single:
+            test_batch_nrm2_work< float >( params, run );
+            break;
+
+        case testsweeper::DataType::Double:
+            test_batch_nrm2_work< double >( params, run );
+            break;
+
+        case testsweeper::DataType::SingleComplex:
+            test_batch_nrm2_work< std::complex<float> >( params, run );
+            break;
+
+        case testsweeper::DataType::DoubleComplex:
+            test_batch_nrm2_work< std::complex<double> >( params, run );
+            break;
+
+        default:
+            throw std::exception();
+            break;
+    }
+}
@@ -39,10 +39,12 @@ void test_copy_device_work( Params& params, bool run )
     if (! run)
         return;
 
-    if (blas::get_device_count() == 0) {
-        params.msg() = "skipping: no GPU devices or no GPU support";
-        return;
-    }
+    #ifdef BLAS_HAVE_DEVICE
+        if (blas::get_device_count() == 0) {
+            params.msg() = "skipping: no GPU devices";
+            return;
+        }
+    #endif
 
     // setup
     size_t size_x = (n - 1) * std::abs(incx) + 1;
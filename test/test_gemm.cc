@@ -33,6 +33,7 @@ void test_gemm_work( Params& params, bool run )
     int64_t k       = params.dim.k();
     int64_t align   = params.align();
     int64_t verbose = params.verbose();
+    int64_t calls   = params.calls();
 
     // mark non-standard output values
     params.gflops();
@@ -164,6 +165,27 @@ void test_gemm_work( Params& params, bool run )
         params.okay() = okay;
     }
 
+    if (calls > 1) {
+        // call overhead: back-to-back calls, with data in cache
+        double time_calls = get_wtime();
+        for (int64_t c = 0; c < calls; ++c) {
+            blas::gemm( layout, transA, transB, m, n, k,
+                        alpha, A, lda, B, ldb, beta, C, ldc );
+        }
+        params.ns_call() = (get_wtime() - time_calls) / calls * 1e9;
+
+        if (params.ref() == 'y') {
+            time_calls = get_wtime();
+            for (int64_t c = 0; c < calls; ++c) {
+                cblas_gemm( cblas_layout_const(layout),
+                            cblas_trans_const(transA),
+                            cblas_trans_const(transB),
+                            m, n, k, alpha, A, lda, B, ldb, beta, Cref, ldc );
+            }
+            params.ref_ns_call() = (get_wtime() - time_calls) / calls * 1e9;
+        }
+    }
+
     delete[] A;
     delete[] B;
     delete[] C;
@@ -33,6 +33,7 @@ void test_gemv_work( Params& params, bool run )
     int64_t incy    = params.incy();
     int64_t align   = params.align();
     int64_t verbose = params.verbose();
+    int64_t calls   = params.calls();
 
     // mark non-standard output values
     params.gflops();
@@ -148,6 +149,24 @@ void test_gemv_work( Params& params, bool run )
         params.okay() = okay;
     }
 
+    if (calls > 1) {
+        // call overhead: back-to-back calls, with data in cache
+        double time_calls = get_wtime();
+        for (int64_t c = 0; c < calls; ++c) {
+            blas::gemv( layout, trans, m, n, alpha, A, lda, x, incx, beta, y, incy );
+        }
+        params.ns_call() = (get_wtime() - time_calls) / calls * 1e9;
+
+        if (params.ref() == 'y') {
+            time_calls = get_wtime();
+            for (int64_t c = 0; c < calls; ++c) {
+                cblas_gemv( cblas_layout_const(layout), cblas_trans_const(trans), m, n,
+                            alpha, A, lda, x, incx, beta, yref, incy );
+            }
+            params.ref_ns_call() = (get_wtime() - time_calls) / calls * 1e9;
+        }
+    }
+
     delete[] A;
     delete[] x;
     delete[] y;
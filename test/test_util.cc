@@ -5,8 +5,15 @@
 
 #include "test.hh"
 #include "../src/device_internal.hh"
+#include "../src/blas_internal.hh"  // BLAS thread control
 
 #include <string>
+#include <fstream>
+#include <sstream>
+#include <iterator>
+#include <set>
+#include <thread>
+#include <chrono>
 
 using testsweeper::get_wtime;
 
@@ -349,6 +356,302 @@ void test_make_scalar()
     require( zx == std::complex<double>( dxr, dxi ) );
 }
 
+// -----------------------------------------------------------------------------
+/// Compares cpu_features() with the flags in /proc/cpuinfo, if available,
+/// which the Linux kernel reports only if the CPU and OS both support them.
+void test_cpu_features()
+{
+    printf( "%s\n", __func__ );
+
+    const blas::CPUFeatures& features = blas::cpu_features();
+    printf( "    sse42 %d, avx2 %d, avx512f %d, avx512fp16 %d, amx %d\n",
+            features.sse42, features.avx2, features.avx512f,
+            features.avx512fp16, features.amx );
+
+    // Repeated calls return the same, cached features.
+    require( &blas::cpu_features() == &features );
+
+    #if defined( __linux__ ) && (defined( __x86_64__ ) || defined( __i386__ ))
+        std::ifstream cpuinfo( "/proc/cpuinfo" );
+        std::string line;
+        while (std::getline( cpuinfo, line )) {
+            if (line.compare( 0, 5, "flags" ) == 0) {
+                std::istringstream words( line.substr( line.find( ':' ) + 1 ) );
+                std::set< std::string > flags{
+                    std::istream_iterator< std::string >( words ),
+                    std::istream_iterator< std::string >() };
+                require( features.sse42      == (flags.count( "sse4_2"      ) > 0) );
+                require( features.avx2       == (flags.count( "avx2"        ) > 0) );
+                require( features.avx512f    == (flags.count( "avx512f"     ) > 0) );
+                require( features.avx512fp16 == (flags.count( "avx512_fp16" ) > 0) );
+                require( features.amx        == (flags.count( "amx_tile"    ) > 0) );
+                break;
+            }
+        }
+    #endif
+}
+
+// -----------------------------------------------------------------------------
+/// Tests get/set_policy for CPU batch routines, and that batch::gemm gives
+/// the same results whether items run as large (all BLAS threads) or small
+/// (in parallel).
+void test_batch_policy()
+{
+    printf( "%s\n", __func__ );
+
+    blas::batch::Policy saved = blas::batch::get_policy();
+    printf( "    large_gflop %.3g, sort %d\n", saved.large_gflop, saved.sort );
+    require( saved.large_gflop >= 0 );
+
+    blas::batch::Policy bad = saved;
+    bad.large_gflop = -1;
+    bool thrown = false;
+    try {
+        blas::batch::set_policy( bad );
+    }
+    catch (blas::Error const& ex) {
+        thrown = true;
+    }
+    require( thrown );
+
+    // Default-constructed policy runs all items in parallel.
+    blas::batch::Policy all_parallel;
+    require( all_parallel.large_gflop
+             == std::numeric_limits<double>::infinity() );
+
+    // Batch of sizes 1, ..., 8. Uses herk, which always goes through
+    // the policy, whereas gemm may call the vendor's batched gemm.
+    int batch = 8;
+    std::vector<int64_t> n( batch );
+    std::vector< std::vector<double> > A( batch ), C1( batch ), C2( batch );
+    std::vector<double*> Ap( batch ), Cp1( batch ), Cp2( batch );
+    for (int i = 0; i < batch; ++i) {
+        n[ i ] = i + 1;
+        A[ i ].resize( n[ i ]*n[ i ] );
+        for (size_t j = 0; j < A[ i ].size(); ++j)
+            A[ i ][ j ] = 1. / (j + i + 1);
+        C1[ i ].assign( n[ i ]*n[ i ], 1. );
+        C2[ i ] = C1[ i ];
+        Ap[ i ]  = A[ i ].data();
+        Cp1[ i ] = C1[ i ].data();
+        Cp2[ i ] = C2[ i ].data();
+    }
+    std::vector<int64_t> info;
+
+    // All items large, then all items small and unsorted.
+    blas::batch::Policy policy = saved;
+    for (int run = 0; run < 2; ++run) {
+        policy.large_gflop = (run == 0 ? 0
+                              : std::numeric_limits<double>::infinity());
+        policy.sort = (run == 0);
+        blas::batch::set_policy( policy );
+        require( blas::batch::get_policy().large_gflop == policy.large_gflop );
+        blas::batch::herk(
+            blas::Layout::ColMajor, {blas::Uplo::Lower}, {blas::Op::NoTrans},
+            n, n, {2.0}, Ap, n, {0.5},
+            (run == 0 ? Cp1 : Cp2), n, batch, info );
+    }
+    blas::batch::set_policy( saved );
+
+    for (int i = 0; i < batch; ++i) {
+        require( C1[ i ] == C2[ i ] );
+    }
+}
+
+// -----------------------------------------------------------------------------
+/// @return number of threads of a threaded BLAS that BLAS++ can query,
+/// otherwise 1.
+int blas_num_threads()
+{
+    #if defined( BLAS_HAVE_MKL )
+        return MKL_Get_Max_Threads();
+    #elif defined( BLAS_HAVE_OPENBLAS )
+        return openblas_get_num_threads();
+    #else
+        return 1;
+    #endif
+}
+
+// -----------------------------------------------------------------------------
+/// Tests that batch routines running concurrently in several threads,
+/// each limiting BLAS to one thread (PinBlasThreads), restore the
+/// original number of BLAS threads afterwards.
+void test_pin_blas_threads()
+{
+    printf( "%s\n", __func__ );
+
+    int threads = blas_num_threads();
+    printf( "    BLAS threads %d\n", threads );
+
+    // Run all items in parallel, so every call pins BLAS.
+    blas::batch::Policy saved = blas::batch::get_policy();
+    blas::batch::Policy all_parallel;
+    blas::batch::set_policy( all_parallel );
+
+    auto run = [] () {
+        int batch = 4, n = 8;
+        std::vector<int64_t> nn( batch, n ), info;
+        std::vector<double> A( batch*n*n, 1. ), B( batch*n*n, 1. ),
+                            C( batch*n*n, 0. );
+        std::vector<double*> Ap( batch ), Bp( batch ), Cp( batch );
+        for (int i = 0; i < batch; ++i) {
+            Ap[ i ] = &A[ i*n*n ];
+            Bp[ i ] = &B[ i*n*n ];
+            Cp[ i ] = &C[ i*n*n ];
+        }
+        for (int iter = 0; iter < 100; ++iter) {
+            blas::batch::gemm(
+                blas::Layout::ColMajor, {blas::Op::NoTrans}, {blas::Op::NoTrans},
+                nn, nn, nn, {1.0}, Ap, nn, Bp, nn, {0.0}, Cp, nn, batch, info );
+            // herk always uses PinBlasThreads, whereas gemm may call
+            // the vendor's batched gemm.
+            blas::batch::herk(
+                blas::Layout::ColMajor, {blas::Uplo::Lower}, {blas::Op::NoTrans},
+                nn, nn, {1.0}, Ap, nn, {0.0}, Cp, nn, batch, info );
+        }
+    };
+    std::thread thread1( run );
+    std::thread thread2( run );
+    thread1.join();
+    thread2.join();
+
+    blas::batch::set_policy( saved );
+    require( blas_num_threads() == threads );
+}
+
+//------------------------------------------------------------------------------
+/// Tests get/set_small_size, and that gemm, gemv, and axpy agree whether
+/// they use the built-in small-size kernels or the vendor BLAS.
+void test_small_size()
+{
+    printf( "%s\n", __func__ );
+
+    int64_t saved = blas::small_size();
+    printf( "    small_size %lld\n", llong( saved ) );
+    require( saved >= 0 );
+
+    bool thrown = false;
+    try {
+        blas::set_small_size( -1 );
+    }
+    catch (blas::Error const& ex) {
+        thrown = true;
+    }
+    require( thrown );
+
+    using blas::Op;
+    using blas::Layout;
+    using zdouble = std::complex<double>;
+    int n = 6, ld = 8;
+    std::vector<zdouble> A( ld*n ), B( ld*n ), x( 2*n );
+    for (int64_t i = 0; i < ld*n; ++i) {
+        A[ i ] = zdouble( 1. / (i + 1), 0.5 / (i + 2) );
+        B[ i ] = zdouble( 0.25 * (i % 5), -1. / (i + 3) );
+    }
+    for (int64_t i = 0; i < 2*n; ++i)
+        x[ i ] = zdouble( 1. / (i + 1), 1. );
+
+    // Transposes and layouts, vendor (size 0), then small kernels.
+    double tol = 10 * std::numeric_limits<double>::epsilon();
+    for (Layout layout : { Layout::ColMajor, Layout::RowMajor }) {
+        for (Op transA : { Op::NoTrans, Op::Trans, Op::ConjTrans }) {
+            for (Op transB : { Op::NoTrans, Op::Trans, Op::ConjTrans }) {
+                std::vector<zdouble> C[ 2 ], y[ 2 ], z[ 2 ];
+                for (int run = 0; run < 2; ++run) {
+                    blas::set_small_size( run == 0 ? 0 : n );
+                    C[ run ].assign( ld*n, zdouble( 1, -1 ) );
+                    y[ run ].assign( 2*n, zdouble( 1, -1 ) );
+                    z[ run ].assign( 2*n, zdouble( 1, -1 ) );
+                    blas::gemm( layout, transA, transB, n, n-1, n-2,
+                                zdouble( 2, 1 ), A.data(), ld, B.data(), ld,
+                                zdouble( 0.5, 0 ), C[ run ].data(), ld );
+                    blas::gemv( layout, transA, n, n-1,
+                                zdouble( 2, 1 ), A.data(), ld, x.data(), -2,
+                                zdouble( 0.5, 0 ), y[ run ].data(), 1 );
+                    blas::axpy( n, zdouble( 2, 1 ), x.data(), 2,
+                                z[ run ].data(), -2 );
+                }
+                for (int64_t i = 0; i < ld*n; ++i)
+                    require( std::abs( C[ 0 ][ i ] - C[ 1 ][ i ] ) < tol * n );
+                for (int64_t i = 0; i < 2*n; ++i) {
+                    require( std::abs( y[ 0 ][ i ] - y[ 1 ][ i ] ) < tol * n );
+                    require( std::abs( z[ 0 ][ i ] - z[ 1 ][ i ] ) < tol );
+                }
+            }
+        }
+    }
+    blas::set_small_size( saved );
+}
+
+//------------------------------------------------------------------------------
+void test_trace()
+{
+    printf( "%s\n", __func__ );
+
+    bool saved = blas::trace::enabled();
+    printf( "    enabled %d\n", saved );
+
+    using blas::Op;
+    using blas::Layout;
+    int n = 4, batch = 3;
+    std::vector<double> A( n*n, 1.0 ), C( batch*n*n, 0.0 );
+    std::vector<double*> Aarray( batch, A.data() ), Carray;
+    for (int i = 0; i < batch; ++i)
+        Carray.push_back( &C[ i*n*n ] );
+    std::vector<int64_t> info;
+
+    blas::trace::set_enabled( true );
+    blas::trace::clear();
+    blas::gemm( Layout::ColMajor, Op::NoTrans, Op::Trans, n, n, n,
+                1.0, A.data(), n, A.data(), n, 0.0, C.data(), n );
+    blas::batch::gemm( Layout::ColMajor, { Op::NoTrans }, { Op::NoTrans },
+                       { n }, { n }, { n }, { 1.0 }, Aarray, { n },
+                       Aarray, { n }, { 0.0 }, Carray, { n }, batch, info );
+    blas::trace::set_enabled( false );
+    blas::gemm( Layout::ColMajor, Op::NoTrans, Op::Trans, n, n, n,
+                1.0, A.data(), n, A.data(), n, 0.0, C.data(), n );
+
+    // JSON has the gemm, the batch, and its items, flagged as nested.
+    const char* json_file = "blaspp_test_trace.json";
+    blas::trace::flush( json_file );
+    std::ifstream json_in( json_file );
+    std::string json( (std::istreambuf_iterator<char>( json_in )),
+                      std::istreambuf_iterator<char>() );
+    json_in.close();
+    std::remove( json_file );
+    auto count = [&json]( std::string const& str ) {
+        int cnt = 0;
+        for (size_t pos = json.find( str ); pos != std::string::npos;
+             pos = json.find( str, pos + 1 ))
+            ++cnt;
+        return cnt;
+    };
+    require( count( "\"name\":\"gemm\"" ) == 1 + batch );
+    require( count( "\"name\":\"batch::gemm\"" ) == 1 );
+    require( count( "\"nested\":true" ) == batch );
+    require( count( "\"ops\":\"NT\",\"m\":4,\"n\":4,\"k\":4" ) == 1 );
+
+    // Binary has a header with the number of records.
+    const char* bin_file = "blaspp_test_trace.bin";
+    blas::trace::flush( bin_file );
+    std::ifstream bin_in( bin_file, std::ios::binary );
+    char magic[ 8 ];
+    uint32_t version, record_size;
+    uint64_t records;
+    bin_in.read( magic, sizeof( magic ) );
+    bin_in.read( (char*) &version, sizeof( version ) );
+    bin_in.read( (char*) &record_size, sizeof( record_size ) );
+    bin_in.read( (char*) &records, sizeof( records ) );
+    bin_in.close();
+    std::remove( bin_file );
+    require( std::string( magic, 8 ) == "BLASPPTR" );
+    require( version == 1 );
+    require( records == uint64_t( 2 + batch ) );
+
+    blas::trace::clear();
+    blas::trace::set_enabled( saved );
+}
+
 //------------------------------------------------------------------------------
 /// Tests low-level wrappers around cuBLAS / rocBLAS functions, and
 /// tests SYCL functions.
@@ -736,9 +1039,11 @@ void test_queue_fork()
 
     printf( "%s\n", __func__ );
 
-    int device_cnt = blas::get_device_count();
-    if (device_cnt == 0)
-        return;
+    #ifdef BLAS_HAVE_DEVICE
+        int device_cnt = blas::get_device_count();
+        if (device_cnt == 0)
+            return;
+    #endif
 
     int dev = 0;
 
@@ -831,6 +1136,68 @@ void test_queue_fork()
     }
 }
 
+// -----------------------------------------------------------------------------
+/// Tests host queues, without GPU: tasks are asynchronous, events order
+/// streams of different queues, and sync rethrows errors from tasks.
+///
+void test_host_queue()
+{
+    printf( "%s\n", __func__ );
+
+    #ifdef BLAS_HAVE_HOST_QUEUE
+        blas::Queue queue1( 0 ), queue2( 0 );
+        int n = 1000;
+        std::vector<double> x( n, 1.0 ), y( n, 0.0 );
+
+        // queue2 copies x to y after queue1 scales x, ordered by an event
+        // recorded after a slow task; the calls themselves don't wait.
+        double t = get_wtime();
+        blas::internal::host_enqueue( queue1.stream(), []() {
+            std::this_thread::sleep_for( std::chrono::milliseconds( 100 ) );
+        } );
+        blas::scal( n, 2.0, x.data(), 1, queue1 );
+        blas::Queue::event_t event = blas::event_create();
+        blas::event_record( event, queue1.stream() );
+        blas::stream_wait_event( queue2.stream(), event, 0 );
+        blas::copy( n, x.data(), 1, y.data(), 1, queue2 );
+        t = get_wtime() - t;
+        printf( "    enqueue %11.3f usec\n", t * 1e6 );
+        require( t < 0.05 );
+
+        queue2.sync();
+        require( y[ 0 ] == 2.0 && y[ n-1 ] == 2.0 );
+        queue1.sync();
+        blas::event_destroy( event );
+
+        // Errors are rethrown once by sync.
+        blas::internal::host_enqueue( queue1.stream(), []() {
+            throw blas::Error( "task error" );
+        } );
+        bool thrown = false;
+        try {
+            queue1.sync();
+        }
+        catch (blas::Error const& ex) {
+            thrown = true;
+        }
+        require( thrown );
+        queue1.sync();
+
+        // device_memcpy reads its source before returning, after earlier
+        // tasks that write it, so the source can be freed right away.
+        blas::scal( n, 2.0, x.data(), 1, queue1 );
+        {
+            std::vector<double> tmp( x.size() );
+            blas::device_memcpy( tmp.data(), x.data(), n, queue1 );
+            require( tmp[ 0 ] == 4.0 && tmp[ n-1 ] == 4.0 );
+            tmp.assign( n, 3.0 );
+            blas::device_memcpy( y.data(), tmp.data(), n, queue1 );
+        }
+        queue1.sync();
+        require( y[ 0 ] == 3.0 && y[ n-1 ] == 3.0 );
+    #endif
+}
+
 // -----------------------------------------------------------------------------
 void test_util( Params& params, bool run )
 {
@@ -854,12 +1221,18 @@ void test_util( Params& params, bool run )
         test_scalar_type();
         test_scalar_type();
         test_make_scalar();
+        test_cpu_features();
+        test_batch_policy();
+        test_pin_blas_threads();
+        test_small_size();
+        test_trace();
 
         // GPU routines
         test_device_routines();
         test_queue();
         test_queue_from_stream();
         test_queue_fork();
+        test_host_queue();
         printf( "\n" );
     }
 
@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2017-2022, University of Tennessee. All rights reserved.
+# SPDX-License-Identifier: BSD-3-Clause
+# This program is free software: you can redistribute it and/or modify it under
+# the terms of the BSD 3-Clause license. See the accompanying LICENSE file.
+
+'''
+Analyzes a trace of BLAS++ calls, written by blas::trace::flush() or by
+running an application with BLASPP_TRACE=trace.json (or trace.bin for
+the binary format).
+
+Reports time by routine and by shape bucket (dimensions rounded up to
+powers of 2), the top shapes by total time, and tiny calls made one at a
+time that could be a blas::batch call, with the estimated savings.
+Calls nested in another traced call, such as batch items, are counted
+only in their parent.
+
+The shape mix can be replayed through the tester, to benchmark BLAS
+backends against the application's workload: --commands prints tester
+command lines; --replay writes them in the replay file format of
+test/run_tests.py, with each shape's call count and share of time as
+comments.
+
+Requires Python >= 3.7.
+
+Example usage:
+    BLASPP_TRACE=trace.json ./app
+    tools/blas_trace.py trace.json
+    tools/blas_trace.py trace.json --top 20 --tiny 16
+    tools/blas_trace.py trace.json --commands --tester ./test/tester
+    tools/blas_trace.py trace.json --replay workload.txt
+    cd test && ./run_tests.py --from-file workload.txt
+
+run_tests.py --from-file leaves the file unchanged, so the same workload
+can be rerun against each backend.
+'''
+
+import sys
+MIN_PYTHON = (3, 7)
+assert sys.version_info >= MIN_PYTHON, "requires Python >= %d.%d" % MIN_PYTHON
+
+import argparse
+import json
+import math
+import struct
+import time
+
+# ------------------------------------------------------------------------------
+# command line arguments
+parser = argparse.ArgumentParser(
+    description='Analyze a BLAS++ call trace (BLASPP_TRACE).' )
+parser.add_argument( 'trace', help='trace file, Chrome JSON or .bin' )
+parser.add_argument( '--top', action='store', type=int, help='number of shapes to show; default=%(default)s', default=10 )
+parser.add_argument( '--tiny', action='store', type=int, help='calls with all dimensions <= tiny are tiny; default=%(default)s', default=32 )
+parser.add_argument( '--min-calls', action='store', type=int, help='flag tiny shapes called at least this many times; default=%(default)s', default=100 )
+parser.add_argument( '--threads', action='store', type=int, help='threads for batching estimates; default is the number of threads in the trace' )
+parser.add_argument( '--commands', action='store_true', help='print tester command lines for the top shapes' )
+parser.add_argument( '--replay', action='store', help='write tester commands for the top shapes to file, for run_tests.py --from-file' )
+parser.add_argument( '--all', action='store_true', help='with --commands or --replay, use all shapes, not only the top ones' )
+parser.add_argument( '--tester', action='store', help='tester for --commands; default=%(default)s', default='./tester' )
+parser.add_argument( '--args', action='store', help='extra tester arguments; default="%(default)s"', default='--check n' )
+
+# ------------------------------------------------------------------------------
+# Trace reading.
+# Each event is a dict with routine, type, layout, ops, m, n, k, batch,
+# nested, tid, start and duration (in seconds). For batches, dimensions
+# and ops are of the first item; for Level 1, the vector length is m.
+
+# Binary format, see src/trace.cc: header, then fixed-size records,
+# in native byte order.
+bin_header = struct.Struct( '=8sIIQQ' )
+bin_record = struct.Struct( '=24s6qicc4sB5x' )
+
+# ------------------------------------------------------------------------------
+# Returns list of events in a binary trace.
+def read_binary( filename ):
+    with open( filename, 'rb' ) as f:
+        data = f.read()
+    (magic, version, record_size, count, dropped) \
+        = bin_header.unpack_from( data, 0 )
+    if (magic != b'BLASPPTR' or version != 1
+            or record_size != bin_record.size):
+        raise Exception( filename + ': not a BLAS++ binary trace, version 1' )
+    if (dropped):
+        print( 'Warning:', dropped, 'events were dropped; increase BLASPP_TRACE_EVENTS' )
+    events = []
+    offset = bin_header.size
+    for i in range( count ):
+        (routine, start, duration, m, n, k, batch, tid,
+         dtype, layout, ops, nested) = bin_record.unpack_from( data, offset )
+        offset += record_size
+        events.append( {
+            'routine':  routine.rstrip( b'\0' ).decode(),
+            'type':     dtype.decode(),
+            'layout':   layout.decode(),
+            'ops':      ops.decode().replace( ' ', '' ),
+            'm': m, 'n': n, 'k': k, 'batch': batch,
+            'nested':   bool( nested ),
+            'tid':      tid,
+            'start':    start * 1e-9,
+            'duration': duration * 1e-9,
+        } )
+    return events
+# end
+
+# ------------------------------------------------------------------------------
+# Returns list of events in a Chrome trace-event JSON trace.
+# Non-BLAS events, e.g., from merging with other traces, are skipped.
+def read_json( filename ):
+    with open( filename ) as f:
+        data = json.load( f )
+    dropped = data.get( 'otherData', {} ).get( 'dropped', 0 )
+    if (dropped):
+        print( 'Warning:', dropped, 'events were dropped; increase BLASPP_TRACE_EVENTS' )
+    events = []
+    for e in data.get( 'traceEvents', [] ):
+        if (e.get( 'cat' ) != 'blas' or e.get( 'ph' ) != 'X'):
+            continue
+        args = e['args']
+        events.append( {
+            'routine':  e['name'],
+            'type':     args['type'],
+            'layout':   args['layout'],
+            'ops':      args['ops'],
+            'm': args['m'], 'n': args['n'], 'k': args['k'],
+            'batch':    args['batch'],
+            'nested':   args['nested'],
+            'tid':      e['tid'],
+            'start':    e['ts'] * 1e-6,
+            'duration': e['dur'] * 1e-6,
+        } )
+    return events
+# end
+
+# ------------------------------------------------------------------------------
+def read_trace( filename ):
+    if (filename.endswith( '.bin' )):
+        return read_binary( filename )
+    else:
+        return read_json( filename )
+# end
+
+# ------------------------------------------------------------------------------
+# Flops and shapes.
+
+# Returns base name of routine, e.g., gemm for batch::gemm_strided.
+def base_routine( routine ):
+    name = routine.replace( 'batch::', '' )
+    return name.replace( '_strided', '' )
+# end
+
+# ------------------------------------------------------------------------------
+# Returns flops of one item of event e, counting a complex multiply-add
+# as 4 real ones, which is close enough to rank shapes.
+def item_flops( e ):
+    name = base_routine( e['routine'] )
+    (m, n, k) = (e['m'], e['n'], e['k'])
+    side = e['ops'][:1]
+    if (name == 'gemm'):
+        flops = 2*m*n*k
+    elif (name in ('symm', 'hemm')):
+        flops = 2*m*m*n if (side == 'L') else 2*m*n*n
+    elif (name in ('syrk', 'herk')):
+        flops = k*n*(n + 1)
+    elif (name in ('syr2k', 'her2k')):
+        flops = 2*k*n*n
+    elif (name in ('trmm', 'trsm')):
+        flops = m*m*n if (side == 'L') else m*n*n
+    elif (name in ('gemv', 'ger')):
+        flops = 2*m*n
+    elif (name in ('axpy', 'dot', 'nrm2')):
+        flops = 2*m
+    elif (name == 'scal'):
+        flops = m
+    else:
+        flops = 0
+    if (e['type'] in ('c', 'z')):
+        flops *= 4
+    return flops
+# end
+
+# ------------------------------------------------------------------------------
+# Returns x rounded up to a power of 2, or 0.
+def bucket( x ):
+    return 0 if (x <= 0) else 2**math.ceil( math.log2( x ) )
+# end
+
+# ------------------------------------------------------------------------------
+# Returns key of the exact shape of event e.
+def shape_key( e ):
+    return (e['routine'], e['type'], e['layout'], e['ops'],
+            e['m'], e['n'], e['k'], e['batch'])
+# end
+
+# ------------------------------------------------------------------------------
+# Returns key of the shape bucket of event e.
+def bucket_key( e ):
+    return (e['routine'], e['type'], e['layout'], e['ops'],
+            bucket( e['m'] ), bucket( e['n'] ), bucket( e['k'] ))
+# end
+
+# ------------------------------------------------------------------------------
+# Returns shape string, e.g., dgemm C NT 8x8x8, with batch size if > 1.
+def shape_str( key ):
+    (routine, dtype, layout, ops, m, n, k) = key[:7]
+    if (routine.startswith( 'batch::' )):
+        name = 'batch::' + dtype + routine[ len( 'batch::' ): ]
+    else:
+        name = dtype + routine
+    dims = 'x'.join( str( d ) for d in (m, n, k) if (d) ) or '0'
+    s = '%-22s %s %-4s %s' % (name, layout, ops or '-', dims)
+    if (len( key ) > 7 and key[7] > 1):
+        s += ' batch ' + str( key[7] )
+    return s
+# end
+
+# ------------------------------------------------------------------------------
+# Aggregation.
+
+# ------------------------------------------------------------------------------
+# Groups events by key_func.
+# Returns list of groups, by decreasing total time, each a dict with
+# key, calls, items, time, and flops.
+def aggregate( events, key_func ):
+    groups = {}
+    for e in events:
+        key = key_func( e )
+        g = groups.get( key )
+        if (g is None):
+            g = { 'key': key, 'calls': 0, 'items': 0, 'time': 0.0, 'flops': 0 }
+            groups[ key ] = g
+        g['calls'] += 1
+        g['items'] += e['batch']
+        g['time']  += e['duration']
+        g['flops'] += item_flops( e ) * e['batch']
+    return sorted( groups.values(), key=lambda g: -g['time'] )
+# end
+
+# ------------------------------------------------------------------------------
+def gflops( g ):
+    return g['flops'] / g['time'] * 1e-9 if (g['time'] > 0) else 0
+# end
+
+# ------------------------------------------------------------------------------
+# Prints table of groups, with name_func( key ) naming each group.
+def print_groups( title, groups, total, name_func, top=None ):
+    print( '\n' + title )
+    print( '%-44s %10s %12s %7s %10s %9s' % (
+           'shape', 'calls', 'time (s)', '%', 'us/call', 'gflop/s') )
+    for g in groups[ :top ]:
+        print( '%-44s %10d %12.6f %6.2f%% %10.3f %9.3f' % (
+               name_func( g['key'] ), g['calls'], g['time'],
+               100 * g['time'] / total if (total > 0) else 0,
+               1e6 * g['time'] / g['calls'], gflops( g )) )
+    if (top is not None and len( groups ) > top):
+        print( '... %d more' % (len( groups ) - top) )
+# end
+
+# ------------------------------------------------------------------------------
+# Routines that have a blas::batch version.
+batch_routines = ('axpy', 'dot', 'nrm2', 'scal', 'gemv', 'ger',
+                  'gemm', 'hemm', 'symm', 'herk', 'syrk', 'her2k', 'syr2k',
+                  'trmm', 'trsm')
+
+# ------------------------------------------------------------------------------
+# Finds tiny shapes called one at a time, at least opts.min_calls times,
+# that could be one blas::batch call. All are flagged, whatever the
+# estimated savings.
+# Returns list of candidates by decreasing estimated savings, then time,
+# each a dict with group, estimated batched time, and how it was estimated.
+#
+# If the trace has batch calls of the same routine, type, layout, ops, and
+# item shape, their measured time per item is used. Otherwise, the
+# estimate assumes the calls run perfectly in parallel on `threads`
+# threads, an upper bound on the savings.
+def batching_candidates( events, opts, threads ):
+    # time per item of batch calls, by item shape
+    per_item = {}
+    for g in aggregate( [ e for e in events
+                          if (e['routine'].startswith( 'batch::' )) ],
+                        lambda e: (base_routine( e['routine'] ),)
+                                  + shape_key( e )[1:7] ):
+        per_item[ g['key'] ] = g['time'] / g['items']
+
+    candidates = []
+    singles = [ e for e in events
+                if (e['routine'] in batch_routines
+                    and max( e['m'], e['n'], e['k'] ) <= opts.tiny) ]
+    for g in aggregate( singles, shape_key ):
+        if (g['calls'] < opts.min_calls):
+            continue
+        key = g['key'][:7]
+        if (key in per_item):
+            batched = min( per_item[ key ] * g['calls'], g['time'] )
+            how = 'measured'
+        else:
+            batched = g['time'] / threads
+            how = 'threads=%d' % (threads)
+        candidates.append( { 'group': g, 'batched': batched, 'how': how } )
+    return sorted( candidates, key=lambda c: (c['batched'] - c['group']['time'],
+                                              -c['group']['time']) )
+# end
+
+# ------------------------------------------------------------------------------
+# Tester commands.
+
+# Tester options for ops chars, by routine.
+tester_ops = {
+    'gemm':  ('transA', 'transB'),
+    'symm':  ('side', 'uplo'),
+    'hemm':  ('side', 'uplo'),
+    'syrk':  ('uplo', 'trans'),
+    'herk':  ('uplo', 'trans'),
+    'syr2k': ('uplo', 'trans'),
+    'her2k': ('uplo', 'trans'),
+    'trmm':  ('side', 'uplo', 'trans', 'diag'),
+    'trsm':  ('side', 'uplo', 'trans', 'diag'),
+    'gemv':  ('trans',),
+}
+
+# ------------------------------------------------------------------------------
+# Returns tester command [routine, args] for an exact shape key,
+# e.g., batch::gemm_strided => batch-gemm-strided.
+def tester_command( key, extra ):
+    (routine, dtype, layout, ops, m, n, k, batch) = key
+    name = routine.replace( 'batch::', 'batch-' ).replace( '_', '-' )
+    args = ' --type ' + dtype
+    if (layout in ('C', 'R')):
+        args += ' --layout ' + layout.lower()
+    for (option, op) in zip( tester_ops.get( base_routine( routine ), () ), ops ):
+        args += ' --' + option + ' ' + op.lower()
+    if (layout not in ('C', 'R')):
+        # Level 1: vector length is m
+        args += ' --dim ' + str( m )
+    else:
+        # Unused dims are filled in from used ones; the tester ignores them.
+        m = m or n or k
+        n = n or m
+        k = k or n
+        args += ' --dim %dx%dx%d' % (m, n, k)
+    if (routine.startswith( 'batch::' )):
+        args += ' --batch ' + str( batch )
+    if (extra):
+        args += ' ' + extra
+    return [ name, args ]
+# end
+
+# ------------------------------------------------------------------------------
+# Writes commands for groups to filename, in run_tests.py's replay file
+# format: one "args routine" line per command, with comments.
+def write_replay( filename, groups, total, extra ):
+    with open( filename, 'w' ) as f:
+        f.write( '# BLAS++ trace shapes from blas_trace.py, ' + time.ctime() + '\n' )
+        f.write( '# run with: run_tests.py --from-file ' + filename + '\n' )
+        for g in groups:
+            (name, args) = tester_command( g['key'], extra )
+            f.write( '# %d calls, %.6f s, %.2f%% of time\n' % (
+                     g['calls'], g['time'],
+                     100 * g['time'] / total if (total > 0) else 0) )
+            f.write( args.strip() + ' ' + name + '\n' )
+# end
+
+# ------------------------------------------------------------------------------
+def main( argv=None ):
+    opts = parser.parse_args( argv )
+    events = read_trace( opts.trace )
+
+    # Nested calls are already in their parent's time.
+    top_events = [ e for e in events if (not e['nested']) ]
+    total = sum( e['duration'] for e in top_events )
+    threads = len( set( e['tid'] for e in events ) )
+    print( '%s: %d calls (%d nested), %d threads, %.6f s total' % (
+           opts.trace, len( top_events ), len( events ) - len( top_events ),
+           threads, total) )
+
+    print_groups( 'Time by routine', aggregate(
+                      top_events, lambda e: (e['routine'], e['type']) ),
+                  total, lambda key: key[1] + ' ' + key[0] )
+    print_groups( 'Top shape buckets (dimensions rounded up to powers of 2)',
+                  aggregate( top_events, bucket_key ),
+                  total, shape_str, opts.top )
+    shapes = aggregate( top_events, shape_key )
+    print_groups( 'Top shapes', shapes, total, shape_str, opts.top )
+
+    # By default, estimate with the threads the traced application used,
+    # not this machine's CPU count.
+    est_threads = opts.threads or threads
+    candidates = batching_candidates( top_events, opts, est_threads )
+    print( '\nTiny calls made one at a time (all dims <= %d, >= %d calls),'
+           ' candidates for blas::batch' % (opts.tiny, opts.min_calls) )
+    if (candidates):
+        print( '%-44s %10s %12s %12s %12s  %s' % (
+               'shape', 'calls', 'time (s)', 'batched (s)', 'saved (s)',
+               'estimate') )
+        for c in candidates[ :opts.top ]:
+            g = c['group']
+            print( '%-44s %10d %12.6f %12.6f %12.6f  %s' % (
+                   shape_str( g['key'] ), g['calls'], g['time'],
+                   c['batched'], g['time'] - c['batched'], c['how']) )
+        saved = sum( c['group']['time'] - c['batched'] for c in candidates )
+        print( 'Estimated savings from batching: %.6f s, %.2f%% of time' % (
+               saved, 100 * saved / total if (total > 0) else 0) )
+        if (est_threads == 1 and opts.threads is None):
+            print( 'The trace has 1 thread, so unmeasured savings are 0;'
+                   ' use --threads to estimate for more threads.' )
+    else:
+        print( 'none' )
+
+    selected = shapes if (opts.all) else shapes[ :opts.top ]
+    if (opts.commands):
+        print( '\nTester commands' )
+        for g in selected:
+            (name, args) = tester_command( g['key'], opts.args )
+            print( opts.tester + args + ' ' + name )
+
+    if (opts.replay):
+        write_replay( opts.replay, selected, total, opts.args )
+        print( '\nwrote', len( selected ), 'commands to', opts.replay )
+
+    return 0
+# end
+
+# ------------------------------------------------------------------------------
+if (__name__ == '__main__'):
+    sys.exit( main() )